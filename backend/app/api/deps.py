@@ -3,6 +3,7 @@ from ..core.analyzer import get_analyzer, LevelAnalyzer
 from ..core.generator import get_generator, LevelGenerator
 from ..core.simulator import get_simulator, LevelSimulator
 from ..clients.gboost import get_gboost_client, GBoostClient
+from ..clients.gboost_mirror import get_gboost_mirror, GBoostMirror
 
 
 def get_level_analyzer() -> LevelAnalyzer:
@@ -23,3 +24,8 @@ def get_level_simulator() -> LevelSimulator:
 def get_gboost() -> GBoostClient:
     """Dependency for GBoost client."""
     return get_gboost_client()
+
+
+def get_gboost_board_mirror() -> GBoostMirror:
+    """Dependency for the local GBoost board mirror."""
+    return get_gboost_mirror()
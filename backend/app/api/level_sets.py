@@ -0,0 +1,18 @@
+"""Stored level sets shared by the routes.
+
+Each set is a directory ``storage/level_sets/<set_id>/`` with one
+``level_<n>.json`` per level and a ``metadata.json`` written last.
+"""
+from pathlib import Path
+from typing import List, Tuple
+
+LEVEL_SETS_DIR = Path(__file__).parent.parent / "storage" / "level_sets"
+LEVEL_SETS_DIR.mkdir(parents=True, exist_ok=True)
+
+
+def level_files(set_dir: Path) -> List[Path]:
+    """Level files of a set in level order (level_1000 after level_999)."""
+    def index(path: Path) -> Tuple[int, str]:
+        suffix = path.stem.rsplit("_", 1)[-1]
+        return (int(suffix) if suffix.isdigit() else 0, path.name)
+    return sorted(set_dir.glob("level_*.json"), key=index)
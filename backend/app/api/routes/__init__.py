@@ -1,13 +1,10 @@
 """API routes package.
 
 This package contains all API route handlers for the application.
+Route modules are imported explicitly by ``app.main`` (or on first attribute
+access here), so importing one router does not load all the others.
 """
-from . import analyze
-from . import generate
-from . import gboost
-from . import assess
-from . import simulate
-from . import leveling
+import importlib
 
 __all__ = [
     "analyze",
@@ -17,3 +14,9 @@ __all__ = [
     "simulate",
     "leveling",
 ]
+
+
+def __getattr__(name: str):
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return importlib.import_module(f".{name}", __name__)
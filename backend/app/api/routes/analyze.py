@@ -1,8 +1,12 @@
 """Level analysis API routes."""
+import asyncio
+import json
+import logging
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from fastapi import APIRouter, Depends, HTTPException
-from typing import List, Dict, Any
+from fastapi.responses import StreamingResponse
+from typing import AsyncIterator, List, Dict, Any, Set, Tuple
 
 from ...models.schemas import (
     AnalyzeRequest,
@@ -10,6 +14,7 @@ from ...models.schemas import (
     BatchAnalyzeRequest,
     BatchAnalyzeResponse,
     BatchAnalyzeResultItem,
+    BatchAnalyzeTableResponse,
     AutoPlayRequest,
     AutoPlayResponse,
     BotClearStats,
@@ -19,10 +24,22 @@ from ...models.schemas import (
 )
 from ...models.bot_profile import BotType, get_profile, PREDEFINED_PROFILES
 from ...core.analyzer import LevelAnalyzer
-from ...core.bot_simulator import BotSimulator
-from ..deps import get_level_analyzer
+from ...core.batch_analyzer import BatchAnalysis, analyze_batch
+from ...core.bot_simulator import BotSimulator, PROCESS_POOL_WORKERS, _get_process_pool, _simulate_bot_process
+from ...core.simulation_cost import (
+    allocate_iterations,
+    cost_key,
+    effective_parallelism,
+    get_cost_sample_log,
+    get_simulation_cost_model,
+)
+from ...clients.gboost_mirror import GBoostMirror
+from ..deps import get_level_analyzer, get_gboost_board_mirror
+from ..level_sets import LEVEL_SETS_DIR, level_files
+from ..streaming import encode_ndjson
 
 router = APIRouter(prefix="/api", tags=["analyze"])
+logger = logging.getLogger(__name__)
 
 # Base bot target clear rates (for target_difficulty=0.5)
 BASE_TARGET_CLEAR_RATES = {
@@ -315,52 +332,102 @@ async def analyze_level(
 @router.post("/levels/batch-analyze", response_model=BatchAnalyzeResponse)
 async def batch_analyze_levels(
     request: BatchAnalyzeRequest,
-    analyzer: LevelAnalyzer = Depends(get_level_analyzer),
+    mirror: GBoostMirror = Depends(get_gboost_board_mirror),
 ) -> BatchAnalyzeResponse:
     """
     Analyze multiple levels in batch.
 
+    With ``board_id`` and ``level_ids`` the levels come from the local
+    GBoost board mirror; levels missing from it are fetched concurrently.
+    The whole set is analyzed at once by ``analyze_batch``.
+
     Args:
-        request: BatchAnalyzeRequest with levels or level_ids.
-        analyzer: LevelAnalyzer dependency.
+        request: BatchAnalyzeRequest with levels, set_id or level_ids.
+        mirror: GBoostMirror dependency.
 
     Returns:
         BatchAnalyzeResponse with results for each level.
     """
+    batch = await _run_batch_analysis(request, mirror)
+
     results: List[BatchAnalyzeResultItem] = []
+    for i, level_id in enumerate(batch.level_ids):
+        if i in batch.errors:
+            results.append(BatchAnalyzeResultItem(
+                level_id=level_id,
+                score=0,
+                grade="?",
+                metrics={"error": batch.errors[i]},
+            ))
+            continue
+        results.append(BatchAnalyzeResultItem(
+            level_id=level_id,
+            score=batch.scores[i],
+            grade=batch.grades[i],
+            metrics=batch.metrics(i).to_dict(),
+        ))
+
+    return BatchAnalyzeResponse(results=results)
+
+
+@router.post("/levels/batch-analyze/table", response_model=BatchAnalyzeTableResponse)
+async def batch_analyze_table(
+    request: BatchAnalyzeRequest,
+    mirror: GBoostMirror = Depends(get_gboost_board_mirror),
+) -> BatchAnalyzeTableResponse:
+    """
+    Analyze a whole level set into a compact table.
+
+    One row per level with its score, grade, tile/layer/goal counts,
+    layer blocking, gimmick counts and per-layer tile occupancy.
+
+    Args:
+        request: BatchAnalyzeRequest with levels, set_id or level_ids.
+        mirror: GBoostMirror dependency.
+
+    Returns:
+        BatchAnalyzeTableResponse with columns, rows and grade counts.
+    """
+    start_time = time.time()
+    batch = await _run_batch_analysis(request, mirror)
+    table = batch.to_table()
+    return BatchAnalyzeTableResponse(
+        columns=table["columns"],
+        rows=table["rows"],
+        grade_counts=batch.grade_counts(),
+        errors=table["errors"],
+        execution_time_ms=int((time.time() - start_time) * 1000),
+    )
+
 
+async def _run_batch_analysis(request: BatchAnalyzeRequest, mirror: GBoostMirror) -> BatchAnalysis:
+    """Analyze the uploaded levels, a stored level set or GBoost board levels."""
+    missing: List[str] = []
     if request.levels:
-        # Analyze provided level JSONs
-        for i, level_json in enumerate(request.levels):
-            try:
-                report = analyzer.analyze(level_json)
-                results.append(BatchAnalyzeResultItem(
-                    level_id=f"level_{i}",
-                    score=report.score,
-                    grade=report.grade.value,
-                    metrics=report.metrics.to_dict(),
-                ))
-            except Exception as e:
-                results.append(BatchAnalyzeResultItem(
-                    level_id=f"level_{i}",
-                    score=0,
-                    grade="?",
-                    metrics={"error": str(e)},
-                ))
+        level_ids = [f"level_{i}" for i in range(len(request.levels))]
+        levels = request.levels
+    elif request.set_id:
+        items = await asyncio.to_thread(_load_level_set_items, request.set_id)
+        level_ids = [item["level_id"] for item in items]
+        levels = [item["level_json"] for item in items]
     elif request.level_ids and request.board_id:
-        # TODO: Load levels from GBoost and analyze
-        # This would require async loading from GBoost client
-        raise HTTPException(
-            status_code=501,
-            detail="Loading levels from GBoost in batch is not yet implemented"
-        )
+        if not mirror.client.is_configured:
+            raise HTTPException(status_code=503, detail="GBoost client not configured")
+
+        board_levels = await mirror.get_levels(request.board_id, request.level_ids)
+        level_ids = list(board_levels)
+        missing = [level_id for level_id, level_json in board_levels.items() if level_json is None]
+        levels = [level_json or {} for level_json in board_levels.values()]
     else:
         raise HTTPException(
             status_code=400,
-            detail="Either 'levels' or 'level_ids' with 'board_id' must be provided"
+            detail="Either 'levels', 'set_id' or 'level_ids' with 'board_id' must be provided"
         )
 
-    return BatchAnalyzeResponse(results=results)
+    batch = await asyncio.to_thread(analyze_batch, levels, level_ids)
+    for level_id in missing:
+        batch.mark_failed(level_ids.index(level_id), f"Level '{level_id}' not found in board '{request.board_id}'")
+    return batch
 
 
 def _calculate_max_moves(level_json: Dict[str, Any]) -> int:
@@ -677,6 +744,113 @@ def analyze_autoplay(
         raise HTTPException(status_code=400, detail=f"AutoPlay analysis failed: {str(e)}")
 
 
+def _prepare_verification(
+    level_item: dict,
+    use_core_bots_only: bool,
+    analyzer: LevelAnalyzer,
+) -> Dict[str, Any]:
+    """Static analysis, targets and bot selection for one level to verify."""
+    level_json = level_item["level_json"]
+    level_id = level_item.get("level_id") or f"level_{id(level_json) % 10000}"
+    target_difficulty = level_item.get("target_difficulty")
+
+    # Static analysis first
+    static_report = analyzer.analyze(level_json)
+
+    # Determine target difficulty
+    if target_difficulty is None:
+        target_difficulty = static_report.score / 100.0
+
+    # Select bot profiles
+    if use_core_bots_only:
+        profiles = ["casual", "average", "expert"]
+    else:
+        profiles = list(BASE_TARGET_CLEAR_RATES.keys())
+
+    return {
+        "level_id": level_id,
+        "level_json": level_json,
+        "target_difficulty": target_difficulty,
+        "static_grade": static_report.grade.value,
+        # [v15.34] Use adjusted target rates that account for gimmick combinations
+        "target_rates": calculate_adjusted_target_rates(target_difficulty, level_json),
+        "profiles": profiles,
+        "max_moves": _calculate_max_moves(level_json),
+    }
+
+
+def _finish_verification(
+    prepared: Dict[str, Any],
+    actual_rates: Dict[str, float],
+    tolerance: float,
+) -> BatchVerifyResultItem:
+    """Compare simulated clear rates with the level's targets."""
+    profiles = prepared["profiles"]
+    target_rates = prepared["target_rates"]
+    target_difficulty = prepared["target_difficulty"]
+    issues = []
+
+    # Calculate gaps
+    gaps = []
+    for profile_name in profiles:
+        target = target_rates.get(profile_name, 0.5)
+        actual = actual_rates.get(profile_name, 0.0)
+        gap = abs(target - actual) * 100
+        gaps.append(gap)
+
+        # Check for critical issues
+        if actual == 0.0:
+            issues.append(f"{profile_name}: 클리어율 0% (클리어 불가)")
+        elif gap > tolerance * 2:
+            issues.append(f"{profile_name}: 목표 대비 {gap:.1f}%p 차이")
+
+    avg_gap = sum(gaps) / len(gaps) if gaps else 0
+    max_gap = max(gaps) if gaps else 0
+
+    # Calculate match score (100 - avg_gap, clamped to 0-100)
+    match_score = max(0, min(100, 100 - avg_gap))
+
+    # [v15.32] Dynamic tolerance adjustment for hard levels
+    # Hard levels (target_difficulty >= 0.7) have inherently more variance
+    # due to complex gimmick combinations, so tolerance is expanded by 1.3x
+    effective_tolerance = tolerance
+    if target_difficulty >= 0.7:
+        effective_tolerance = tolerance * 1.3  # 15% → 19.5%
+    elif target_difficulty >= 0.5:
+        # Gradual increase for medium-hard levels
+        t = (target_difficulty - 0.5) / 0.2  # 0 at 0.5, 1 at 0.7
+        effective_tolerance = tolerance * (1.0 + t * 0.3)  # 15% → 19.5%
+
+    # Determine if passed
+    passed = max_gap <= effective_tolerance and all(r > 0 for r in actual_rates.values())
+
+    return BatchVerifyResultItem(
+        level_id=prepared["level_id"],
+        passed=passed,
+        bot_clear_rates={p: actual_rates[p] for p in profiles if p in actual_rates},
+        target_clear_rates={p: target_rates.get(p, 0.5) for p in profiles},
+        avg_gap=round(avg_gap, 2),
+        max_gap=round(max_gap, 2),
+        match_score=round(match_score, 2),
+        static_grade=prepared["static_grade"],
+        issues=issues,
+    )
+
+
+def _failed_verification(level_id: str, error: Exception) -> BatchVerifyResultItem:
+    return BatchVerifyResultItem(
+        level_id=level_id,
+        passed=False,
+        bot_clear_rates={},
+        target_clear_rates={},
+        avg_gap=100.0,
+        max_gap=100.0,
+        match_score=0.0,
+        static_grade="?",
+        issues=[f"검증 실패: {str(error)}"],
+    )
+
+
 def _verify_single_level(
     level_item: dict,
     iterations: int,
@@ -686,7 +860,7 @@ def _verify_single_level(
     fast_mode: bool = True,
     early_termination: bool = True,
 ) -> BatchVerifyResultItem:
-    """Verify a single level with bot simulation.
+    """Verify a single level with bot simulation in this process.
 
     Args:
         level_item: Level data with level_json, level_id, target_difficulty
@@ -699,179 +873,298 @@ def _verify_single_level(
     """
     level_json = level_item["level_json"]
     level_id = level_item.get("level_id") or f"level_{id(level_json) % 10000}"
-    target_difficulty = level_item.get("target_difficulty")
-
-    issues = []
 
     try:
-        # Static analysis first
-        static_report = analyzer.analyze(level_json)
-        static_grade = static_report.grade.value
-
-        # Determine target difficulty
-        if target_difficulty is None:
-            target_difficulty = static_report.score / 100.0
-
-        # [v15.34] Use adjusted target rates that account for gimmick combinations
-        target_rates = calculate_adjusted_target_rates(target_difficulty, level_json)
-
-        # Select bot profiles
-        if use_core_bots_only:
-            profiles = ["casual", "average", "expert"]
-        else:
-            profiles = list(BASE_TARGET_CLEAR_RATES.keys())
-
-        # Calculate max moves
-        max_moves = _calculate_max_moves(level_json)
-
-        # Run simulations with optimizations
-        # Note: Don't use parallel bot execution here since level-level parallelism is already in place
-        # ProcessPoolExecutor overhead exceeds benefit when already parallelizing at level level
+        prepared = _prepare_verification(level_item, use_core_bots_only, analyzer)
         simulator = BotSimulator()
         actual_rates = {}
 
-        for profile_name in profiles:
+        for profile_name in prepared["profiles"]:
             # Use fast verification profile if fast_mode is enabled
             profile = get_profile(profile_name, fast_mode=fast_mode)
             result = simulator.simulate_with_profile(
                 level_json=level_json,
                 profile=profile,
                 iterations=iterations,
-                max_moves=max_moves,
+                max_moves=prepared["max_moves"],
                 seed=None,
                 early_termination=early_termination,
             )
             actual_rates[profile_name] = result.clear_rate
 
-        # Calculate gaps
-        gaps = []
-        for profile_name in profiles:
-            target = target_rates.get(profile_name, 0.5)
-            actual = actual_rates.get(profile_name, 0.0)
-            gap = abs(target - actual) * 100
-            gaps.append(gap)
-
-            # Check for critical issues
-            if actual == 0.0:
-                issues.append(f"{profile_name}: 클리어율 0% (클리어 불가)")
-            elif gap > tolerance * 2:
-                issues.append(f"{profile_name}: 목표 대비 {gap:.1f}%p 차이")
-
-        avg_gap = sum(gaps) / len(gaps) if gaps else 0
-        max_gap = max(gaps) if gaps else 0
-
-        # Calculate match score (100 - avg_gap, clamped to 0-100)
-        match_score = max(0, min(100, 100 - avg_gap))
-
-        # [v15.32] Dynamic tolerance adjustment for hard levels
-        # Hard levels (target_difficulty >= 0.7) have inherently more variance
-        # due to complex gimmick combinations, so tolerance is expanded by 1.3x
-        effective_tolerance = tolerance
-        if target_difficulty >= 0.7:
-            effective_tolerance = tolerance * 1.3  # 15% → 19.5%
-        elif target_difficulty >= 0.5:
-            # Gradual increase for medium-hard levels
-            t = (target_difficulty - 0.5) / 0.2  # 0 at 0.5, 1 at 0.7
-            effective_tolerance = tolerance * (1.0 + t * 0.3)  # 15% → 19.5%
-
-        # Determine if passed
-        passed = max_gap <= effective_tolerance and all(r > 0 for r in actual_rates.values())
-
-        return BatchVerifyResultItem(
-            level_id=level_id,
-            passed=passed,
-            bot_clear_rates=actual_rates,
-            target_clear_rates={p: target_rates.get(p, 0.5) for p in profiles},
-            avg_gap=round(avg_gap, 2),
-            max_gap=round(max_gap, 2),
-            match_score=round(match_score, 2),
-            static_grade=static_grade,
-            issues=issues,
-        )
+        return _finish_verification(prepared, actual_rates, tolerance)
 
     except Exception as e:
-        return BatchVerifyResultItem(
-            level_id=level_id,
-            passed=False,
-            bot_clear_rates={},
-            target_clear_rates={},
-            avg_gap=100.0,
-            max_gap=100.0,
-            match_score=0.0,
-            static_grade="?",
-            issues=[f"검증 실패: {str(e)}"],
+        return _failed_verification(level_id, e)
+
+
+def _stored_level_item(level_json: Dict[str, Any], level_id: str) -> Dict[str, Any]:
+    """Batch verification item for a stored level (target from its target_difficulty)."""
+    target_difficulty = level_json.get("target_difficulty")
+    return {
+        "level_json": level_json,
+        "level_id": level_id,
+        "target_difficulty": min(1.0, max(0.0, target_difficulty)) if target_difficulty is not None else None,
+    }
+
+
+def _load_level_set_items(set_id: str) -> List[Dict[str, Any]]:
+    """Levels of a stored level set as batch verification items (blocking file reads)."""
+    set_dir = LEVEL_SETS_DIR / set_id
+    if not set_dir.is_dir():
+        raise HTTPException(status_code=404, detail=f"Level set {set_id} not found")
+
+    items = []
+    for level_file in level_files(set_dir):
+        with open(level_file, 'r', encoding='utf-8') as f:
+            level_json = json.load(f)
+        items.append(_stored_level_item(level_json, level_file.stem))
+    return items
+
+
+async def _load_board_items(
+    board_id: str, level_ids: List[str], mirror: GBoostMirror
+) -> List[Dict[str, Any]]:
+    """Levels of a GBoost board (via the local mirror) as batch verification items."""
+    if not mirror.client.is_configured:
+        raise HTTPException(status_code=503, detail="GBoost client not configured")
+
+    levels = await mirror.get_levels(board_id, level_ids)
+    missing = [level_id for level_id, level_json in levels.items() if level_json is None]
+    if missing:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Levels not found in board '{board_id}': {', '.join(missing[:10])}",
         )
+    return [_stored_level_item(level_json, level_id) for level_id, level_json in levels.items()]
+
+
+async def _batch_verify_items(request: BatchVerifyRequest, mirror: GBoostMirror) -> List[Dict[str, Any]]:
+    """Levels to verify: the stored set or GBoost board levels if given, else the uploaded levels."""
+    if request.set_id:
+        items = await asyncio.to_thread(_load_level_set_items, request.set_id)
+    elif request.board_id and request.level_ids:
+        items = await _load_board_items(request.board_id, request.level_ids, mirror)
+    else:
+        items = [level_item.model_dump() for level_item in request.levels]
+    if not items:
+        raise HTTPException(status_code=400, detail="No levels provided")
+    return items
+
+
+def _plan_batch_iterations(
+    prepared: Dict[int, Dict[str, Any]],
+    request: BatchVerifyRequest,
+) -> Dict[Tuple[int, str], int]:
+    """Iterations per (level index, bot) for the request's simulation budget.
+
+    Without a budget every bot of every level runs ``request.iterations``.
+    """
+    if not request.simulation_budget_ms:
+        return {
+            (index, profile_name): request.iterations
+            for index, level in prepared.items() for profile_name in level["profiles"]
+        }
+
+    cost_model = get_simulation_cost_model()
+    cost_ms: Dict[Tuple[int, str], float] = {}
+    clear_rates: Dict[Tuple[int, str], float] = {}
+    for index, level in prepared.items():
+        keys = {cost_key(p, request.fast_mode): p for p in level["profiles"]}
+        costs = cost_model.predict(level["level_json"], list(keys), max_moves=level["max_moves"])
+        for key, profile_name in keys.items():
+            cost_ms[(index, profile_name)] = costs[key]
+            clear_rates[(index, profile_name)] = level["target_rates"].get(profile_name, 0.5)
+
+    plan = allocate_iterations(
+        cost_ms,
+        request.simulation_budget_ms,
+        clear_rates=clear_rates,
+        parallelism=effective_parallelism(PROCESS_POOL_WORKERS),
+        min_iterations=3,
+        max_iterations=100,
+    )
+    logger.info(f"[SIM_BUDGET] batch of {len(prepared)} levels: budget={request.simulation_budget_ms}ms, "
+                f"predicted={plan.predicted_wall_ms:.0f}ms")
+    return plan.iterations
+
+
+async def _iter_batch_verify(
+    items: List[Dict[str, Any]],
+    request: BatchVerifyRequest,
+    analyzer: LevelAnalyzer,
+) -> AsyncIterator[Tuple[int, BatchVerifyResultItem]]:
+    """Verify levels on the shared process pool, yielding (index, result) as each level completes.
+
+    Every (level, bot) pair is a separate pool task, so one level's bots run
+    in parallel and levels are not serialized behind each other. Levels are
+    analyzed one at a time in a worker thread (keeping the event loop free)
+    and, without a simulation budget, submitted as soon as they are
+    analyzed, so early levels finish (and stream) while later ones are still
+    being prepared. A budget needs every level's cost up front, so budgeted
+    batches are planned and submitted once all levels are analyzed.
+    """
+    loop = asyncio.get_running_loop()
+    pool = _get_process_pool()
+    budgeted = bool(request.simulation_budget_ms)
+
+    async def run(index: int, profile_name: str, args):
+        try:
+            result = await loop.run_in_executor(pool, _simulate_bot_process, args)
+            return index, profile_name, result, None
+        except Exception as e:
+            return index, profile_name, None, e
+
+    async def prepare(index: int):
+        try:
+            level = await loop.run_in_executor(
+                None, _prepare_verification, items[index], request.use_core_bots_only, analyzer
+            )
+            return index, level, None
+        except Exception as e:
+            return index, None, e
+
+    prepared: Dict[int, Dict[str, Any]] = {}
+    pending_bots: Dict[int, int] = {}
+    actual_rates: Dict[int, Dict[str, float]] = {}
+    timings: Dict[int, Dict[str, tuple]] = {}
+    errors: Dict[int, Exception] = {}
+    tasks: Set[asyncio.Future] = set()
+
+    def submit(iterations: Dict[Tuple[int, str], int]) -> None:
+        for (index, profile_name), count in iterations.items():
+            level = prepared[index]
+            args = (level["level_json"], profile_name, count, level["max_moves"],
+                    None, request.fast_mode, request.early_termination)
+            tasks.add(asyncio.ensure_future(run(index, profile_name, args)))
+
+    next_index = 0
+    preparing = None
+    planned = not budgeted
+    try:
+        while True:
+            if preparing is None and next_index < len(items):
+                preparing = asyncio.ensure_future(prepare(next_index))
+                next_index += 1
+            elif preparing is None and not planned:
+                submit(await loop.run_in_executor(None, _plan_batch_iterations, prepared, request))
+                planned = True
+
+            waiting = (tasks | {preparing}) if preparing is not None else tasks
+            if not waiting:
+                break
+            done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+
+            for future in done:
+                if future is preparing:
+                    preparing = None
+                    index, level, error = future.result()
+                    if error is not None:
+                        item = items[index]
+                        level_id = item.get("level_id") or f"level_{id(item['level_json']) % 10000}"
+                        yield index, _failed_verification(level_id, error)
+                        continue
+                    prepared[index] = level
+                    pending_bots[index] = len(level["profiles"])
+                    actual_rates[index] = {}
+                    timings[index] = {}
+                    if not budgeted:
+                        submit(_plan_batch_iterations({index: level}, request))
+                    continue
+
+                tasks.discard(future)
+                index, profile_name, result, error = future.result()
+                if error is not None:
+                    errors.setdefault(index, error)
+                else:
+                    actual_rates[index][profile_name] = result.clear_rate
+                    timings[index][cost_key(profile_name, request.fast_mode)] = (result.iterations, result.elapsed_ms)
+                pending_bots[index] -= 1
+                if pending_bots[index] == 0:
+                    try:
+                        get_cost_sample_log().append(prepared[index]["level_json"], timings[index], prepared[index]["max_moves"])
+                    except OSError as e:
+                        logger.warning(f"[SIM_BUDGET] Could not log timing sample: {e}")
+                    if index in errors:
+                        yield index, _failed_verification(prepared[index]["level_id"], errors[index])
+                    else:
+                        yield index, _finish_verification(prepared[index], actual_rates[index], request.tolerance)
+    finally:
+        # Client went away: drop work that has not started yet
+        for task in tasks:
+            task.cancel()
+        if preparing is not None:
+            preparing.cancel()
+
+
+def _batch_verify_summary(results: List[BatchVerifyResultItem], start_time: float) -> Dict[str, Any]:
+    passed_count = sum(1 for r in results if r.passed)
+    return {
+        "total_levels": len(results),
+        "passed_count": passed_count,
+        "failed_count": len(results) - passed_count,
+        "pass_rate": passed_count / len(results) if results else 0,
+        "execution_time_ms": int((time.time() - start_time) * 1000),
+    }
 
 
 @router.post("/analyze/batch-verify", response_model=BatchVerifyResponse)
-def batch_verify_levels(
+async def batch_verify_levels(
     request: BatchVerifyRequest,
     analyzer: LevelAnalyzer = Depends(get_level_analyzer),
+    mirror: GBoostMirror = Depends(get_gboost_board_mirror),
 ) -> BatchVerifyResponse:
     """
     Batch verify multiple levels using bot simulation.
 
     Use this endpoint for post-generation validation when levels are generated
-    with simulation_iterations=0 (fast generation mode).
+    with simulation_iterations=0 (fast generation mode). Pass ``set_id`` to
+    verify a stored level set, or ``board_id`` and ``level_ids`` to verify
+    GBoost board levels (from the local mirror), instead of uploading the levels.
 
     Args:
-        request: BatchVerifyRequest with list of levels and verification parameters
+        request: BatchVerifyRequest with list of levels (or set_id / board levels) and verification parameters
         analyzer: LevelAnalyzer dependency
+        mirror: GBoostMirror dependency
 
     Returns:
-        BatchVerifyResponse with verification results for each level
+        BatchVerifyResponse with verification results for each level, in request order
     """
     start_time = time.time()
+    items = await _batch_verify_items(request, mirror)
 
-    if not request.levels:
-        raise HTTPException(status_code=400, detail="No levels provided")
+    indexed_results = [item async for item in _iter_batch_verify(items, request, analyzer)]
+    indexed_results.sort(key=lambda item: item[0])
+    results = [result for _, result in indexed_results]
 
-    results = []
-
-    # Process levels in parallel with optimizations
-    fast_mode = getattr(request, 'fast_mode', True)
-    early_termination = getattr(request, 'early_termination', True)
-
-    with ThreadPoolExecutor(max_workers=min(4, len(request.levels))) as executor:
-        futures = {
-            executor.submit(
-                _verify_single_level,
-                level_item.model_dump(),
-                request.iterations,
-                request.tolerance,
-                request.use_core_bots_only,
-                analyzer,
-                fast_mode,
-                early_termination,
-            ): i
-            for i, level_item in enumerate(request.levels)
-        }
+    return BatchVerifyResponse(results=results, **_batch_verify_summary(results, start_time))
 
-        for future in as_completed(futures):
-            try:
-                result = future.result()
-                results.append(result)
-            except Exception as e:
-                idx = futures[future]
-                results.append(BatchVerifyResultItem(
-                    level_id=f"level_{idx}",
-                    passed=False,
-                    issues=[f"처리 오류: {str(e)}"],
-                ))
 
-    # Sort by original order (using level_id)
-    results.sort(key=lambda x: int(x.level_id.split("_")[-1]) if x.level_id.split("_")[-1].isdigit() else 0)
+@router.post("/analyze/batch-verify/stream")
+async def batch_verify_levels_stream(
+    request: BatchVerifyRequest,
+    analyzer: LevelAnalyzer = Depends(get_level_analyzer),
+    mirror: GBoostMirror = Depends(get_gboost_board_mirror),
+):
+    """
+    Batch verify levels, streaming each result as NDJSON as soon as its bots finish.
 
-    passed_count = sum(1 for r in results if r.passed)
-    failed_count = len(results) - passed_count
+    Emits one ``{"type": "result", "index": ..., "result": {...}}`` line per
+    level in completion order, then a ``{"type": "summary", ...}`` line with
+    the same totals as the buffered endpoint.
+    """
+    items = await _batch_verify_items(request, mirror)
 
-    execution_time_ms = int((time.time() - start_time) * 1000)
+    async def events() -> AsyncIterator[str]:
+        start_time = time.time()
+        results = []
+        try:
+            async for index, result in _iter_batch_verify(items, request, analyzer):
+                results.append(result)
+                yield encode_ndjson("result", {"index": index, "result": result.model_dump()})
+        except Exception as e:
+            yield encode_ndjson("error", {"detail": str(e)})
+            return
+        yield encode_ndjson("summary", _batch_verify_summary(results, start_time))
 
-    return BatchVerifyResponse(
-        results=results,
-        total_levels=len(results),
-        passed_count=passed_count,
-        failed_count=failed_count,
-        pass_rate=passed_count / len(results) if results else 0,
-        execution_time_ms=execution_time_ms,
-    )
+    return StreamingResponse(events(), media_type="application/x-ndjson")
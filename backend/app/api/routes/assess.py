@@ -117,6 +117,7 @@ async def assess_multibot(request: MultiBotAssessRequest):
             team=team,
             max_moves=request.max_moves,
             parallel=True,
+            common_random_numbers=request.common_random_numbers,
         )
 
         # Convert to response model
@@ -144,6 +145,7 @@ async def assess_multibot(request: MultiBotAssessRequest):
             recommended_moves=result.recommended_moves,
             difficulty_variance=result.difficulty_variance,
             analysis_summary=result.analysis_summary,
+            paired_differences=result.paired_differences,
         )
 
     except HTTPException:
@@ -1,18 +1,12 @@
 """GBoost integration API routes."""
+import asyncio
 import base64
-import io
 import json
 import time
 from pathlib import Path
 from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File, Form
 from pydantic import BaseModel
-from typing import Optional
-
-try:
-    from PIL import Image, ImageDraw
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
+from typing import List, Optional
 
 from ...models.schemas import (
     GBoostSaveRequest,
@@ -23,9 +17,15 @@ from ...models.schemas import (
     UploadLocalToGBoostRequest,
     UploadLocalToGBoostResponse,
     UploadProgressItem,
+    ThumbnailBatchRequest,
+    ThumbnailBatchItem,
+    ThumbnailBatchResponse,
 )
 from ...clients.gboost import GBoostClient, get_gboost_client, update_gboost_client
-from ..deps import get_gboost
+from ...clients.gboost_mirror import GBoostMirror
+from ...core.thumbnails import get_thumbnail, get_thumbnail_cache, render_thumbnails
+from ..deps import get_gboost, get_gboost_board_mirror
+from ..level_sets import LEVEL_SETS_DIR, level_files
 
 # Local levels directory (same as in simulate.py)
 LOCAL_LEVELS_DIR = Path(__file__).parent.parent.parent / "storage" / "local_levels"
@@ -113,6 +113,7 @@ async def save_level_to_gboost(
     level_id: str,
     request: GBoostSaveRequest,
     client: GBoostClient = Depends(get_gboost),
+    mirror: GBoostMirror = Depends(get_gboost_board_mirror),
 ) -> GBoostSaveResponse:
     """
     Save a level to GBoost server.
@@ -124,6 +125,7 @@ async def save_level_to_gboost(
         level_id: Level identifier.
         request: Level data to save.
         client: GBoostClient dependency.
+        mirror: GBoostMirror dependency (the saved level is dropped from it).
 
     Returns:
         GBoostSaveResponse with success status and timestamp.
@@ -147,10 +149,11 @@ async def save_level_to_gboost(
             status_code=500,
             detail=result.get("error", "Failed to save level"),
         )
+    await mirror.invalidate(board_id, level_id)
 
     # Generate and upload thumbnail
     thumbnail_msg = ""
-    thumbnail_data = _generate_thumbnail(original_level_json, size=192)
+    thumbnail_data = get_thumbnail(original_level_json, size=192)
     if thumbnail_data:
         thumb_result = await client.save_thumbnail(
             board_id,
@@ -174,26 +177,26 @@ async def save_level_to_gboost(
 async def load_level_from_gboost(
     board_id: str,
     level_id: str,
-    client: GBoostClient = Depends(get_gboost),
+    mirror: GBoostMirror = Depends(get_gboost_board_mirror),
 ) -> GBoostLoadResponse:
     """
-    Load a level from GBoost server.
+    Load a level from GBoost server (served from the local mirror while it is fresh).
 
     Args:
         board_id: Board identifier.
         level_id: Level identifier.
-        client: GBoostClient dependency.
+        mirror: GBoostMirror dependency.
 
     Returns:
         GBoostLoadResponse with level data and metadata.
     """
-    if not client.is_configured:
+    if not mirror.client.is_configured:
         raise HTTPException(
             status_code=503,
             detail="GBoost client not configured",
         )
 
-    result = await client.load_level(board_id, level_id)
+    result = await mirror.load_level(board_id, level_id)
 
     if result is None:
         raise HTTPException(
@@ -212,27 +215,32 @@ async def list_levels_from_gboost(
     board_id: str,
     prefix: str = Query(default="level_", description="Level ID prefix filter"),
     limit: int = Query(default=100, ge=1, le=1000, description="Maximum results"),
-    client: GBoostClient = Depends(get_gboost),
+    refresh: bool = Query(default=False, description="Sync the board mirror even if it is fresh"),
+    mirror: GBoostMirror = Depends(get_gboost_board_mirror),
 ) -> GBoostListResponse:
     """
     List levels from GBoost server.
 
+    The listing comes from the local board mirror, which is synced
+    incrementally when older than ``gboost_mirror_max_age`` (or on ``refresh``).
+
     Args:
         board_id: Board identifier.
         prefix: Filter by level ID prefix.
         limit: Maximum number of results.
-        client: GBoostClient dependency.
+        refresh: Force a mirror sync first.
+        mirror: GBoostMirror dependency.
 
     Returns:
         GBoostListResponse with list of levels.
     """
-    if not client.is_configured:
+    if not mirror.client.is_configured:
         raise HTTPException(
             status_code=503,
             detail="GBoost client not configured",
         )
 
-    levels = await client.list_levels(board_id, prefix, limit)
+    levels = await mirror.list_levels(board_id, prefix, limit, refresh=refresh)
 
     return GBoostListResponse(
         levels=[
@@ -246,11 +254,44 @@ async def list_levels_from_gboost(
     )
 
 
+@router.post("/mirror/{board_id}/sync")
+async def sync_board_mirror(
+    board_id: str,
+    mirror: GBoostMirror = Depends(get_gboost_board_mirror),
+):
+    """
+    Sync the local mirror of a board now.
+
+    Args:
+        board_id: Board identifier.
+        mirror: GBoostMirror dependency.
+
+    Returns:
+        Sync statistics (levels, unchanged, updated, removed, timings).
+    """
+    if not mirror.client.is_configured:
+        raise HTTPException(
+            status_code=503,
+            detail="GBoost client not configured",
+        )
+
+    stats = await mirror.sync_board(board_id)
+
+    if stats is None:
+        raise HTTPException(
+            status_code=502,
+            detail=f"Failed to download board '{board_id}' from GBoost",
+        )
+
+    return {"board_id": board_id, **stats}
+
+
 @router.delete("/{board_id}/{level_id}")
 async def delete_level_from_gboost(
     board_id: str,
     level_id: str,
     client: GBoostClient = Depends(get_gboost),
+    mirror: GBoostMirror = Depends(get_gboost_board_mirror),
 ):
     """
     Delete a level from GBoost server.
@@ -259,6 +300,7 @@ async def delete_level_from_gboost(
         board_id: Board identifier.
         level_id: Level identifier.
         client: GBoostClient dependency.
+        mirror: GBoostMirror dependency (the level is dropped from it).
 
     Returns:
         Success status.
@@ -276,6 +318,7 @@ async def delete_level_from_gboost(
             status_code=500,
             detail=f"Failed to delete level '{level_id}'",
         )
+    await mirror.invalidate(board_id, level_id)
 
     return {
         "success": True,
@@ -467,344 +510,110 @@ def _count_tiles_in_level(level_data: dict) -> int:
     return total
 
 
-# Tile color mapping for thumbnail generation (fallback)
-TILE_COLORS = {
-    "t0": (148, 163, 184),   # slate
-    "t1": (248, 113, 113),   # red
-    "t2": (248, 113, 113),   # red
-    "t3": (74, 222, 128),    # green
-    "t4": (74, 222, 128),    # green
-    "t5": (96, 165, 250),    # blue
-    "t6": (192, 132, 252),   # purple
-    "t7": (120, 113, 108),   # stone
-    "t8": (120, 113, 108),   # stone
-    "t9": (87, 83, 78),      # stone dark
-    "t10": (250, 204, 21),   # yellow
-    "t11": (251, 146, 60),   # orange
-    "t12": (244, 114, 182),  # pink
-    "t13": (34, 211, 238),   # cyan
-    "t14": (34, 211, 238),   # cyan
-    "t15": (167, 139, 250),  # violet
-}
-
-# Tile image paths (relative to frontend/public)
-TILE_IMAGES = {
-    "t0": "tiles/skin0/s0_t0.png",
-    "t1": "tiles/skin0/s0_t1.png",
-    "t2": "tiles/skin0/s0_t2.png",
-    "t3": "tiles/skin0/s0_t3.png",
-    "t4": "tiles/skin0/s0_t4.png",
-    "t5": "tiles/skin0/s0_t5.png",
-    "t6": "tiles/skin0/s0_t6.png",
-    "t7": "tiles/skin0/s0_t7.png",
-    "t8": "tiles/skin0/s0_t8.png",
-    "t9": "tiles/skin0/s0_t9.png",
-    "t10": "tiles/skin0/s0_t10.png",
-    "t11": "tiles/skin0/s0_t11.png",
-    "t12": "tiles/skin0/s0_t12.png",
-    "t13": "tiles/skin0/s0_t13.png",
-    "t14": "tiles/skin0/s0_t14.png",
-    "t15": "tiles/skin0/s0_t15.png",
-    "craft_s": "tiles/special/tile_craft.png",
-    "craft_e": "tiles/special/tile_craft.png",
-    "craft_w": "tiles/special/tile_craft.png",
-    "craft_n": "tiles/special/tile_craft.png",
-    "stack_s": "tiles/special/stack_s.png",
-    "stack_e": "tiles/special/stack_e.png",
-    "stack_w": "tiles/special/stack_w.png",
-    "stack_n": "tiles/special/stack_n.png",
-    "stack_ne": "tiles/special/stack_ne.png",
-    "stack_nw": "tiles/special/stack_nw.png",
-    "stack_se": "tiles/special/stack_se.png",
-    "stack_sw": "tiles/special/stack_sw.png",
-}
-
-# Special attribute overlay images
-SPECIAL_IMAGES = {
-    "chain": "tiles/special/tile_chain.png",
-    "frog": "tiles/special/frog.png",
-    "link": "tiles/special/tile_link.png",
-    "link_n": "tiles/special/tile_link_n.png",
-    "link_s": "tiles/special/tile_link_s.png",
-    "link_e": "tiles/special/tile_link_e.png",
-    "link_w": "tiles/special/tile_link_w.png",
-    "ice_1": "tiles/special/tile_ice_1.png",
-    "ice_2": "tiles/special/tile_ice_2.png",
-    "ice_3": "tiles/special/tile_ice_3.png",
-    "ice": "tiles/special/tile_ice_1.png",
-    "grass": "tiles/special/tile_grass.png",
-    "grass_1": "tiles/special/tile_grass.png",
-    "grass_2": "tiles/special/tile_grass.png",
-    "bomb": "tiles/special/bomb.png",
-    "unknown": "tiles/special/tile_unknown.png",
-    "curtain": "tiles/special/curtain_close.png",
-    "curtain_open": "tiles/special/curtain_open.png",
-    "curtain_close": "tiles/special/curtain_close.png",
-    "teleport": "tiles/special/teleport.png",
-}
-
-# Cache for loaded images
-_image_cache: dict = {}
-
-
-def _get_tile_assets_path() -> Path:
-    """Get the path to tile assets (frontend/public)."""
-    # Try relative paths from backend
-    backend_dir = Path(__file__).parent.parent.parent.parent  # app/api/routes -> backend
-    candidates = [
-        backend_dir.parent / "frontend" / "public",  # ../frontend/public
-        backend_dir.parent / "frontend" / "dist",    # ../frontend/dist (built)
-        Path("/Users/casualdev/TileMatchAutoLevel/frontend/public"),  # Absolute fallback
-    ]
-    for path in candidates:
-        if path.exists() and (path / "tiles").exists():
-            return path
-    return candidates[0]  # Default
-
-
-def _load_tile_image(image_path: str, tile_size: int) -> Optional[Image.Image]:
-    """Load and cache a tile image, resized to tile_size."""
-    cache_key = f"{image_path}_{tile_size}"
-    if cache_key in _image_cache:
-        return _image_cache[cache_key]
-
-    try:
-        assets_path = _get_tile_assets_path()
-        full_path = assets_path / image_path
-
-        if not full_path.exists():
-            return None
-
-        img = Image.open(full_path).convert("RGBA")
-        img = img.resize((tile_size, tile_size), Image.Resampling.LANCZOS)
-        _image_cache[cache_key] = img
-        return img
-    except Exception as e:
-        print(f"Failed to load tile image {image_path}: {e}")
-        return None
+def _extract_local_level_json(local_data: dict) -> Optional[dict]:
+    """Level JSON of a local_levels file, or None if the format is unknown."""
+    # Format 1: {level_data: {...}, metadata: {...}}
+    # Format 2: {layer: N, ...} (flat)
+    if "level_data" in local_data and isinstance(local_data["level_data"], dict):
+        level_json = local_data["level_data"]
+        # Handle double-nesting
+        if "level_data" in level_json and isinstance(level_json["level_data"], dict):
+            level_json = level_json["level_data"]
+        return level_json
+    if "layer" in local_data:
+        return local_data
+    return None
+
+
+def _read_local_levels(level_ids: List[str]) -> List[tuple]:
+    """(level_id, level_json) for the readable local levels among level_ids."""
+    levels = []
+    for level_id in level_ids:
+        try:
+            with open(LOCAL_LEVELS_DIR / f"{level_id}.json", 'r', encoding='utf-8') as f:
+                level_json = _extract_local_level_json(json.load(f))
+        except (OSError, ValueError):
+            continue
+        if level_json is not None:
+            levels.append((level_id, level_json))
+    return levels
+
+
+def _read_level_set(set_id: str) -> List[tuple]:
+    """(level file ID, level_json) for every level of a stored set, in level order."""
+    set_dir = LEVEL_SETS_DIR / set_id
+    if not (set_dir / "metadata.json").exists():
+        raise HTTPException(status_code=404, detail=f"Level set {set_id} not found")
+    levels = []
+    for level_file in level_files(set_dir):
+        try:
+            with open(level_file, 'r', encoding='utf-8') as f:
+                levels.append((level_file.stem, json.load(f)))
+        except (OSError, ValueError):
+            continue
+    return levels
 
 
-def _generate_thumbnail(level_data: dict, size: int = 192) -> Optional[bytes]:
+@router.post("/thumbnail-batch", response_model=ThumbnailBatchResponse)
+async def render_thumbnail_batch(request: ThumbnailBatchRequest) -> ThumbnailBatchResponse:
     """
-    Generate a PNG thumbnail for the level using actual tile images.
-    Shows all layers with offset for depth effect.
+    Render thumbnails for a whole level set (or a list of local levels).
+
+    Unchanged levels are served from the on-disk thumbnail cache; the rest
+    are rendered across the thumbnail process pool and added to the cache.
 
     Args:
-        level_data: Level JSON data.
-        size: Output image size (square).
+        request: Level set ID or local level IDs, and the thumbnail size.
 
     Returns:
-        PNG bytes or None if generation fails.
+        ThumbnailBatchResponse with per-level thumbnails in request order.
     """
-    if not PIL_AVAILABLE:
-        return None
-
-    try:
-        # Calculate tile bounds (only render used area)
-        num_layers = level_data.get("layer", 8)
-        min_x, max_x = float('inf'), float('-inf')
-        min_y, max_y = float('inf'), float('-inf')
-
-        # Collect tiles from all layers with layer info
-        tiles_by_layer: list[list[tuple]] = [[] for _ in range(num_layers)]
-
-        for i in range(num_layers):
-            layer_key = f"layer_{i}"
-            layer_data = level_data.get(layer_key, {})
-            tiles = layer_data.get("tiles", {})
-
-            for pos, tile_data in tiles.items():
-                if not isinstance(tile_data, list) or len(tile_data) == 0:
-                    continue
-
-                parts = pos.split("_")
-                if len(parts) != 2:
-                    continue
-
-                try:
-                    y, x = int(parts[0]), int(parts[1])
-                    min_x = min(min_x, x)
-                    max_x = max(max_x, x)
-                    min_y = min(min_y, y)
-                    max_y = max(max_y, y)
-                    tiles_by_layer[i].append((x, y, tile_data, i))  # Include layer index
-                except ValueError:
-                    continue
-
-        if min_x == float('inf'):
-            return None
-
-        # Calculate dimensions with layer offset
-        used_width = max_x - min_x + 1
-        used_height = max_y - min_y + 1
-
-        # Layer offset for 3D stacking effect (pixels per layer)
-        layer_offset = 3
-
-        # Render at larger size for quality, then resize
-        render_size = max(size * 2, 256)
-        tile_size = render_size // max(used_width, used_height)
-
-        # Add extra space for layer offsets
-        total_offset = layer_offset * (num_layers - 1)
-        canvas_width = used_width * tile_size + total_offset
-        canvas_height = used_height * tile_size + total_offset
-
-        # Create RGBA image for proper alpha compositing
-        image = Image.new("RGBA", (canvas_width, canvas_height), (31, 41, 55, 255))  # gray-800
-
-        # Draw tiles layer by layer (lower layers first, with offset)
-        for layer_idx, layer_tiles in enumerate(tiles_by_layer):
-            # Calculate layer offset (lower layers offset more to bottom-right)
-            layer_x_offset = (num_layers - 1 - layer_idx) * layer_offset
-            layer_y_offset = (num_layers - 1 - layer_idx) * layer_offset
-
-            # Calculate brightness for this layer (lower = dimmer)
-            if num_layers > 1:
-                brightness = 0.5 + 0.5 * (layer_idx / (num_layers - 1))
-            else:
-                brightness = 1.0
-
-            for x, y, tile_data, _ in layer_tiles:
-                rel_x = x - min_x
-                rel_y = y - min_y
-                px = rel_x * tile_size + layer_x_offset
-                py = rel_y * tile_size + layer_y_offset
-
-                tile_type = tile_data[0] if len(tile_data) > 0 else ""
-                attribute = tile_data[1] if len(tile_data) > 1 else ""
-
-                # Draw t0 as background for non-t0 tiles (like the game does)
-                # t0 is the base tile background image
-                t0_bg_img = _load_tile_image(TILE_IMAGES.get("t0", ""), tile_size)
-
-                if t0_bg_img and tile_type != "t0":
-                    # Apply brightness to background
-                    if brightness < 1.0:
-                        t0_bg = t0_bg_img.copy()
-                        from PIL import ImageEnhance
-                        enhancer = ImageEnhance.Brightness(t0_bg)
-                        t0_bg = enhancer.enhance(brightness)
-                    else:
-                        t0_bg = t0_bg_img
-                    image.paste(t0_bg, (px, py), t0_bg)
-                elif not t0_bg_img:
-                    # Fallback: draw colored rectangle if t0 image not available
-                    if tile_type.startswith("craft_"):
-                        bg_color = (16, 185, 129)  # emerald
-                    elif tile_type.startswith("stack_"):
-                        bg_color = (139, 92, 246)  # violet
-                    else:
-                        bg_color = TILE_COLORS.get(tile_type, (107, 114, 128))
-                    bg_color = tuple(int(c * brightness) for c in bg_color)
-                    draw = ImageDraw.Draw(image)
-                    draw.rectangle([px, py, px + tile_size - 1, py + tile_size - 1], fill=(*bg_color, 255))
-
-                # Try to load actual tile image
-                tile_img = None
-                if tile_type in TILE_IMAGES:
-                    tile_img = _load_tile_image(TILE_IMAGES[tile_type], tile_size)
-
-                if tile_img:
-                    # Apply brightness to tile image
-                    if brightness < 1.0:
-                        tile_img = tile_img.copy()
-                        from PIL import ImageEnhance
-                        enhancer = ImageEnhance.Brightness(tile_img)
-                        tile_img = enhancer.enhance(brightness)
-
-                    # Paste tile image with alpha
-                    image.paste(tile_img, (px, py), tile_img)
-
-                # Draw direction arrow for craft tiles
-                if tile_type.startswith("craft_"):
-                    direction = tile_type.split("_")[1] if "_" in tile_type else "s"
-                    draw = ImageDraw.Draw(image)
-
-                    # Arrow parameters - purple color, centered
-                    arrow_color = (180, 80, 255, 255)  # Purple
-                    outline_color = (120, 40, 180, 255)  # Dark purple outline
-                    center_x = px + tile_size // 2
-                    center_y = py + tile_size // 2
-                    arrow_size = tile_size // 4  # Smaller for better centering
-
-                    # Calculate arrow points based on direction (centered)
-                    if direction == "s":  # South (down)
-                        points = [
-                            (center_x, center_y + arrow_size),  # Tip
-                            (center_x - arrow_size, center_y - arrow_size // 2),
-                            (center_x + arrow_size, center_y - arrow_size // 2),
-                        ]
-                    elif direction == "n":  # North (up)
-                        points = [
-                            (center_x, center_y - arrow_size),  # Tip
-                            (center_x - arrow_size, center_y + arrow_size // 2),
-                            (center_x + arrow_size, center_y + arrow_size // 2),
-                        ]
-                    elif direction == "e":  # East (right)
-                        points = [
-                            (center_x + arrow_size, center_y),  # Tip
-                            (center_x - arrow_size // 2, center_y - arrow_size),
-                            (center_x - arrow_size // 2, center_y + arrow_size),
-                        ]
-                    elif direction == "w":  # West (left)
-                        points = [
-                            (center_x - arrow_size, center_y),  # Tip
-                            (center_x + arrow_size // 2, center_y - arrow_size),
-                            (center_x + arrow_size // 2, center_y + arrow_size),
-                        ]
-                    else:
-                        points = None
-
-                    if points:
-                        # Draw outline first
-                        draw.polygon(points, outline=outline_color)
-                        # Draw filled arrow
-                        draw.polygon(points, fill=arrow_color)
-
-                # Add attribute overlay if present
-                if attribute and attribute in SPECIAL_IMAGES:
-                    attr_img = _load_tile_image(SPECIAL_IMAGES[attribute], tile_size)
-                    if attr_img:
-                        # Apply slight transparency to overlay
-                        overlay = attr_img.copy()
-                        # Make overlay semi-transparent
-                        overlay.putalpha(Image.eval(overlay.split()[3], lambda a: int(a * 0.8)))
-                        image.paste(overlay, (px, py), overlay)
-
-        # Resize to target size with high quality
-        final_image = Image.new("RGBA", (size, size), (31, 41, 55, 255))
-
-        # Scale and center
-        scale = min(size / canvas_width, size / canvas_height)
-        scaled_width = int(canvas_width * scale)
-        scaled_height = int(canvas_height * scale)
-        offset_x = (size - scaled_width) // 2
-        offset_y = (size - scaled_height) // 2
-
-        scaled = image.resize((scaled_width, scaled_height), Image.Resampling.LANCZOS)
-        final_image.paste(scaled, (offset_x, offset_y), scaled)
-
-        # Convert to RGB for PNG (no alpha needed for final output)
-        final_rgb = Image.new("RGB", (size, size), (31, 41, 55))
-        final_rgb.paste(final_image, mask=final_image.split()[3] if final_image.mode == 'RGBA' else None)
-
-        # Convert to PNG bytes
-        buffer = io.BytesIO()
-        final_rgb.save(buffer, format="PNG", optimize=True)
-        return buffer.getvalue()
+    start_time = time.time()
+    if request.set_id:
+        levels = _read_level_set(request.set_id)
+        requested = [level_id for level_id, _ in levels]
+    else:
+        levels = _read_local_levels(request.level_ids)
+        requested = request.level_ids
+    if not requested:
+        raise HTTPException(status_code=400, detail="No levels to render")
+
+    cache = get_thumbnail_cache()
+    rendered = await asyncio.get_running_loop().run_in_executor(
+        None, lambda: list(render_thumbnails(levels, size=request.size, cache=cache))
+    )
+    by_id = {level_id: (png, cached) for level_id, png, cached in rendered}
 
-    except Exception as e:
-        print(f"Thumbnail generation error: {e}")
-        import traceback
-        traceback.print_exc()
-        return None
+    results = []
+    for level_id in requested:
+        if level_id not in by_id:
+            results.append(ThumbnailBatchItem(level_id=level_id, error="Level not found or unreadable"))
+            continue
+        png, cached = by_id[level_id]
+        results.append(ThumbnailBatchItem(
+            level_id=level_id,
+            cached=cached,
+            png_base64=base64.b64encode(png).decode("ascii") if png and request.include_png else None,
+            error=None if png else "Nothing to render",
+        ))
+
+    failed = sum(1 for item in results if item.error)
+    cached_count = sum(1 for item in results if item.cached)
+    return ThumbnailBatchResponse(
+        total=len(requested),
+        rendered=len(requested) - failed - cached_count,
+        cached=cached_count,
+        failed=failed,
+        elapsed_ms=round((time.time() - start_time) * 1000, 1),
+        results=results,
+    )
 
 
 @router.post("/upload-local", response_model=UploadLocalToGBoostResponse)
 async def upload_local_to_gboost(
     request: UploadLocalToGBoostRequest,
     client: GBoostClient = Depends(get_gboost),
+    mirror: GBoostMirror = Depends(get_gboost_board_mirror),
 ) -> UploadLocalToGBoostResponse:
     """
     Upload local levels to GBoost server.
@@ -812,6 +621,7 @@ async def upload_local_to_gboost(
     Args:
         request: Upload configuration with level IDs and options.
         client: GBoostClient dependency.
+        mirror: GBoostMirror dependency (uploaded levels are dropped from it).
 
     Returns:
         UploadLocalToGBoostResponse with per-level results.
@@ -827,6 +637,14 @@ async def upload_local_to_gboost(
     failed = 0
     skipped = 0
 
+    if len(request.level_ids) > 1:
+        # Render missing thumbnails for the whole upload across the pool up front;
+        # the per-level get_thumbnail below then reads them from the disk cache
+        levels = _read_local_levels(request.level_ids)
+        await asyncio.get_running_loop().run_in_executor(
+            None, lambda: list(render_thumbnails(levels, size=192))
+        )
+
     for idx, level_id in enumerate(request.level_ids):
         # Determine target ID based on rename strategy
         if request.rename_strategy == "sequential":
@@ -861,17 +679,8 @@ async def upload_local_to_gboost(
             failed += 1
             continue
 
-        # Extract level_data from local storage format
-        # Format 1: {level_data: {...}, metadata: {...}}
-        # Format 2: {layer: N, ...} (flat)
-        if "level_data" in local_data and isinstance(local_data["level_data"], dict):
-            level_json = local_data["level_data"]
-            # Handle double-nesting
-            if "level_data" in level_json and isinstance(level_json["level_data"], dict):
-                level_json = level_json["level_data"]
-        elif "layer" in local_data:
-            level_json = local_data
-        else:
+        level_json = _extract_local_level_json(local_data)
+        if level_json is None:
             results.append(UploadProgressItem(
                 level_id=level_id,
                 target_id=target_id,
@@ -904,9 +713,11 @@ async def upload_local_to_gboost(
         result = await client.save_level(request.board_id, target_id, level_json)
 
         if result.get("success"):
+            await mirror.invalidate(request.board_id, target_id)
+
             # Generate and upload thumbnail
             thumbnail_msg = ""
-            thumbnail_data = _generate_thumbnail(original_level_json, size=192)
+            thumbnail_data = get_thumbnail(original_level_json, size=192)
             if thumbnail_data:
                 thumb_result = await client.save_thumbnail(
                     request.board_id,
@@ -21,7 +21,15 @@ from ...models.schemas import (
 from ...models.level import GenerationParams, LayerTileConfig, LayerObstacleConfig, LayerPatternConfig
 from ...core.generator import LevelGenerator, get_tile_types_for_level
 from ...core.simulator import LevelSimulator
-from ...core.bot_simulator import BotSimulator
+from ...core.bot_simulator import BotSimulator, _simulate_single_bot
+from ...core.clear_rate_surrogate import get_clear_rate_surrogate, get_surrogate_sample_log
+from ...core.common_random_numbers import new_crn_seed, paired_difference
+from ...core.simulation_cost import (
+    allocate_iterations,
+    effective_parallelism,
+    get_cost_sample_log,
+    get_simulation_cost_model,
+)
 from ...models.bot_profile import BotType, get_profile
 from ...models.gimmick_profile import (
     select_gimmicks_for_difficulty,
@@ -38,6 +46,7 @@ import random
 # Enables true CPU parallelism (bypasses GIL) even with single uvicorn worker
 # ============================================================
 _bot_process_pool: ProcessPoolExecutor | None = None
+BOT_POOL_WORKERS = 3
 
 def _get_bot_pool() -> ProcessPoolExecutor:
     """Get or create the module-level ProcessPoolExecutor for bot simulations.
@@ -48,28 +57,12 @@ def _get_bot_pool() -> ProcessPoolExecutor:
     """
     global _bot_process_pool
     if _bot_process_pool is None:
-        workers = 3
+        workers = BOT_POOL_WORKERS
         _bot_process_pool = ProcessPoolExecutor(max_workers=workers)
         logger.info(f"[BOT_POOL] Created ProcessPoolExecutor with {workers} workers (PID={os.getpid()})")
     return _bot_process_pool
 
 
-def _simulate_single_bot(args: Tuple[str, dict, int, int]) -> Tuple[str, float]:
-    """
-    Top-level function for ProcessPoolExecutor (must be picklable).
-    Runs a single bot simulation in a separate process for true CPU parallelism.
-    """
-    bot_type_value, level_json, iterations, max_moves = args
-    from ...core.bot_simulator import BotSimulator
-    from ...models.bot_profile import BotType, get_profile
-    simulator = BotSimulator()
-    profile = get_profile(BotType(bot_type_value))
-    result = simulator.simulate_with_profile(
-        level_json, profile, iterations=iterations, max_moves=max_moves,
-    )
-    return bot_type_value, result.clear_rate
-
-
 def resolve_symmetry_mode(symmetry_mode: str | None, allow_none: bool = False) -> str:
     """
     Resolve symmetry mode.
@@ -1258,6 +1251,10 @@ def simulate_level(
             level_json=request.level_json,
             iterations=request.iterations,
             strategy=request.strategy,
+            seed=request.seed,
+            parallel=True,
+            early_termination=request.early_termination,
+            ci_half_width=request.ci_half_width,
         )
 
         # Calculate difficulty estimate from clear rate
@@ -1270,6 +1267,9 @@ def simulate_level(
             min_moves=result.min_moves,
             max_moves=result.max_moves,
             difficulty_estimate=difficulty_estimate,
+            iterations=result.iterations,
+            clear_rate_ci=list(result.clear_rate_ci) if result.clear_rate_ci else None,
+            early_terminated=result.early_terminated,
         )
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Simulation failed: {str(e)}")
@@ -1353,7 +1353,8 @@ def generate_validated_level(
         )
 
     # Skip bot simulator initialization if simulation is disabled
-    skip_simulation = (request.simulation_iterations == 0)
+    # A simulation budget turns simulation on even with simulation_iterations=0
+    skip_simulation = (request.simulation_iterations == 0 and not request.simulation_budget_ms)
     bot_simulator = None if skip_simulation else BotSimulator()
 
     # Import analyzer for static analysis (only used once at the end)
@@ -1384,6 +1385,18 @@ def generate_validated_level(
     initial_exploration_iterations = min(15, effective_iterations)
     full_iterations = effective_iterations  # 정밀 검증용 원본값 보존
 
+    # With a wall-clock budget, iterations per bot come from the simulation
+    # cost model instead of the difficulty bands above
+    cost_model = get_simulation_cost_model() if request.simulation_budget_ms and not skip_simulation else None
+    simulation_spent_ms = 0.0
+    best_bot_iterations: Dict[str, int] = {}
+
+    # Common random numbers: every candidate plays iteration i with the same
+    # draws, so the best candidate is picked on paired outcomes, not noise
+    crn_seed = (request.crn_seed or new_crn_seed()) if request.common_random_numbers else None
+    best_cleared_runs: Dict[str, List[bool]] = {}
+    best_paired_differences = None
+
     # OPTIMIZATION: Early exit threshold - stop if match is good enough
     # [v15] 등급별 차등화된 Early Exit 문턱 (속도 최적화)
     # S/A등급: 높은 문턱 (빠른 수렴 가능)
@@ -1433,6 +1446,15 @@ def generate_validated_level(
     best_gaps = (100.0, 100.0)
     best_max_moves = 50
 
+    # Clear-rate surrogate: rank several candidates per attempt by predicted
+    # clear rates and simulate only the best one (needs a trained model)
+    surrogate = None
+    if not skip_simulation and request.surrogate_candidates > 1:
+        surrogate = get_clear_rate_surrogate()
+    surrogate_rejected = 0
+    best_predicted_rates = None
+    best_surrogate_error = None
+
     # Adaptive parameters for retry
     # [v14] 레벨 번호 기반 레이어 수 결정 (get_gboost_style_layer_config 우선)
     # 난이도 기반 조정은 레벨 설정 범위 내에서만 적용
@@ -1750,6 +1772,9 @@ def generate_validated_level(
     max_grid_size = 9  # Maximum grid dimension
 
     for attempt in range(1, effective_max_retries + 1):
+        if cost_model is not None and best_result is not None and simulation_spent_ms >= request.simulation_budget_ms:
+            logger.info(f"[SIM_BUDGET] budget of {request.simulation_budget_ms}ms spent after {attempt - 1} attempts")
+            break
         try:
             # Adjust internal target difficulty based on previous results
             adjusted_difficulty = min(1.0, max(0.0, request.target_difficulty + difficulty_offset))
@@ -1800,29 +1825,79 @@ def generate_validated_level(
                 skip_deadlock_check=request.skip_deadlock_check,
             )
 
-            result = generator.generate(params)
-            level_json = result.level_json
-
-            # Calculate total tiles including internal tiles in stack/craft containers
-            # This is crucial for setting correct max_moves
-            total_tiles = calculate_total_tiles(level_json)
-
-            # Apply max_moves based on moves_ratio (key for high difficulty)
-            # For high difficulty targets, use tighter moves ratio
-            # max_moves should always be >= total_tiles to ensure level is clearable
-            original_max_moves = level_json.get("max_moves", 50)
-            ratio_based_moves = max(total_tiles, int(total_tiles * moves_ratio * max_moves_modifier))
-            modified_max_moves = max(total_tiles, min(original_max_moves, ratio_based_moves))
-            level_json["max_moves"] = modified_max_moves
-            level_json["target_difficulty"] = effective_difficulty  # Store actual difficulty used
-            # Mark tutorial levels with the gimmick being introduced
-            if tutorial_gimmick:
-                level_json["tutorial_gimmick"] = tutorial_gimmick
-            # Store actual symmetry mode and pattern type used (not request value)
-            level_json["symmetry_mode"] = actual_symmetry
-            # Use local pattern_type variable (may be overridden for special shape levels)
-            if pattern_type:
-                level_json["pattern_type"] = pattern_type
+            # Scoring target and bot selection (depend only on the request)
+            # Use scoring_difficulty (original difficulty) when provided (regeneration case)
+            # Otherwise use target_difficulty (normal generation case)
+            # This ensures regeneration match_score is always against the ORIGINAL difficulty target,
+            # even when target_difficulty has been adjusted by the binary search algorithm
+            scoring_diff = request.scoring_difficulty if request.scoring_difficulty is not None else request.target_difficulty
+
+            # Adaptive bot selection based on difficulty for faster validation:
+            # - Low difficulty (<=0.4): Skip Expert/Optimal (they're overkill)
+            # - Medium difficulty (<=0.7): Skip Optimal
+            # - High difficulty (>0.7): All bots for comprehensive validation
+            if request.use_core_bots_only:
+                bot_types = [BotType.CASUAL, BotType.AVERAGE, BotType.EXPERT]
+            elif request.target_difficulty <= 0.4:
+                # Low difficulty: Novice/Casual/Average sufficient (Expert/Optimal too slow)
+                bot_types = [BotType.NOVICE, BotType.CASUAL, BotType.AVERAGE]
+            elif request.target_difficulty <= 0.7:
+                # Medium difficulty: Include Expert, skip Optimal
+                bot_types = [BotType.NOVICE, BotType.CASUAL, BotType.AVERAGE, BotType.EXPERT]
+            else:
+                # High difficulty: Full validation with all bots
+                bot_types = [BotType.NOVICE, BotType.CASUAL, BotType.AVERAGE, BotType.EXPERT, BotType.OPTIMAL]
+            bot_type_names = {bt.value for bt in bot_types}
+
+            # SURROGATE PRE-SCREENING: generate several candidates and keep the one whose
+            # predicted clear rates match the target best; the others are rejected unsimulated
+            candidate_count = request.surrogate_candidates if surrogate is not None else 1
+            predicted_rates = None
+            best_candidate = None
+            for candidate_index in range(candidate_count):
+                result = generator.generate(params)
+                level_json = result.level_json
+
+                # Calculate total tiles including internal tiles in stack/craft containers
+                # This is crucial for setting correct max_moves
+                total_tiles = calculate_total_tiles(level_json)
+
+                # Apply max_moves based on moves_ratio (key for high difficulty)
+                # For high difficulty targets, use tighter moves ratio
+                # max_moves should always be >= total_tiles to ensure level is clearable
+                original_max_moves = level_json.get("max_moves", 50)
+                ratio_based_moves = max(total_tiles, int(total_tiles * moves_ratio * max_moves_modifier))
+                modified_max_moves = max(total_tiles, min(original_max_moves, ratio_based_moves))
+                level_json["max_moves"] = modified_max_moves
+                level_json["target_difficulty"] = effective_difficulty  # Store actual difficulty used
+                # Mark tutorial levels with the gimmick being introduced
+                if tutorial_gimmick:
+                    level_json["tutorial_gimmick"] = tutorial_gimmick
+                # Store actual symmetry mode and pattern type used (not request value)
+                level_json["symmetry_mode"] = actual_symmetry
+                # Use local pattern_type variable (may be overridden for special shape levels)
+                if pattern_type:
+                    level_json["pattern_type"] = pattern_type
+
+                if surrogate is None:
+                    break
+                candidate_rates = surrogate.predict(level_json)
+                candidate_targets = calculate_adjusted_target_rates(scoring_diff, level_json)
+                candidate_score, _, _ = calculate_match_score(
+                    candidate_rates,
+                    {k: v for k, v in candidate_targets.items() if k in bot_type_names},
+                    request.target_difficulty,
+                )
+                if best_candidate is None or candidate_score > best_candidate[0]:
+                    best_candidate = (candidate_score, result, level_json, modified_max_moves, candidate_rates)
+                if candidate_score >= EARLY_EXIT_THRESHOLD:
+                    break
+
+            if best_candidate is not None:
+                predicted_score, result, level_json, modified_max_moves, predicted_rates = best_candidate
+                surrogate_rejected += candidate_index
+                logger.info(f"[SURROGATE] attempt={attempt}, kept 1 of {candidate_index + 1} candidates "
+                           f"(predicted score={predicted_score:.1f})")
 
             # FAST PATH: Skip bot simulation entirely when simulation is disabled
             if skip_simulation:
@@ -1843,51 +1918,76 @@ def generate_validated_level(
                 )
 
             # Calculate target rates for match_score calculation
-            # Use scoring_difficulty (original difficulty) when provided (regeneration case)
-            # Otherwise use target_difficulty (normal generation case)
-            # This ensures regeneration match_score is always against the ORIGINAL difficulty target,
-            # even when target_difficulty has been adjusted by the binary search algorithm
             # [v15.34] Use adjusted target rates that account for gimmick combinations
-            scoring_diff = request.scoring_difficulty if request.scoring_difficulty is not None else request.target_difficulty
             all_target_rates = calculate_adjusted_target_rates(scoring_diff, level_json)
-
-            # OPTIMIZATION: Run bot simulations in PARALLEL
-            # Adaptive bot selection based on difficulty for faster validation:
-            # - Low difficulty (<=0.4): Skip Expert/Optimal (they're overkill)
-            # - Medium difficulty (<=0.7): Skip Optimal
-            # - High difficulty (>0.7): All bots for comprehensive validation
             actual_rates = {}
-            if request.use_core_bots_only:
-                bot_types = [BotType.CASUAL, BotType.AVERAGE, BotType.EXPERT]
-            elif request.target_difficulty <= 0.4:
-                # Low difficulty: Novice/Casual/Average sufficient (Expert/Optimal too slow)
-                bot_types = [BotType.NOVICE, BotType.CASUAL, BotType.AVERAGE]
-            elif request.target_difficulty <= 0.7:
-                # Medium difficulty: Include Expert, skip Optimal
-                bot_types = [BotType.NOVICE, BotType.CASUAL, BotType.AVERAGE, BotType.EXPERT]
-            else:
-                # High difficulty: Full validation with all bots
-                bot_types = [BotType.NOVICE, BotType.CASUAL, BotType.AVERAGE, BotType.EXPERT, BotType.OPTIMAL]
 
             # Filter target rates to only include simulated bot types
-            bot_type_names = {bt.value for bt in bot_types}
             target_rates = {k: v for k, v in all_target_rates.items() if k in bot_type_names}
 
             # Run bot simulations in PARALLEL using ProcessPoolExecutor
             # True CPU parallelism (separate processes, no GIL)
             pool = _get_bot_pool()
+            if cost_model is not None:
+                # Split what is left of the budget evenly over the remaining attempts
+                attempt_budget_ms = (request.simulation_budget_ms - simulation_spent_ms) / (effective_max_retries - attempt + 1)
+                plan = allocate_iterations(
+                    cost_model.predict(level_json, list(bot_type_names), max_moves=modified_max_moves),
+                    attempt_budget_ms,
+                    clear_rates=predicted_rates or target_rates,
+                    parallelism=effective_parallelism(BOT_POOL_WORKERS),
+                    min_iterations=3,
+                    max_iterations=100,
+                )
+                bot_iterations = plan.iterations
+                current_iterations = min(bot_iterations.values())
+                logger.info(f"[SIM_BUDGET] attempt={attempt}, budget={attempt_budget_ms:.0f}ms, "
+                            f"predicted={plan.predicted_wall_ms:.0f}ms, iterations={bot_iterations}")
+            else:
+                bot_iterations = {bt.value: current_iterations for bt in bot_types}
             sim_args = [
-                (bt.value, level_json, current_iterations, modified_max_moves)
+                (bt.value, level_json, bot_iterations[bt.value], modified_max_moves, crn_seed)
                 for bt in bot_types
             ]
+            simulation_start = time.perf_counter()
+            timings = {}
+            cleared_runs = {}
             futures = [pool.submit(_simulate_single_bot, args) for args in sim_args]
             for future in as_completed(futures):
-                bot_name, clear_rate = future.result()
+                bot_name, clear_rate, elapsed_ms, runs = future.result()
                 actual_rates[bot_name] = clear_rate
+                timings[bot_name] = (bot_iterations[bot_name], elapsed_ms)
+                cleared_runs[bot_name] = runs
+            simulation_spent_ms += (time.perf_counter() - simulation_start) * 1000
+            try:
+                get_cost_sample_log().append(level_json, timings, modified_max_moves)
+            except OSError as e:
+                logger.warning(f"[SIM_BUDGET] Could not log timing sample: {e}")
+
+            # Report surrogate error and log the outcome as a training sample
+            surrogate_error = None
+            if predicted_rates is not None:
+                surrogate_error = surrogate.record_outcome(predicted_rates, actual_rates)
+                logger.info(f"[SURROGATE] attempt={attempt}, prediction MAE={surrogate_error:.3f}")
+            try:
+                get_surrogate_sample_log().append(level_json, actual_rates, current_iterations, predicted_rates)
+            except OSError as e:
+                logger.warning(f"[SURROGATE] Could not log training sample: {e}")
 
             # Calculate match score
             match_score, avg_gap, max_gap = calculate_match_score(actual_rates, target_rates, request.target_difficulty)
 
+            paired_differences = None
+            if crn_seed is not None and best_cleared_runs:
+                paired_differences = {
+                    bot: paired_difference(runs, best_cleared_runs[bot]).to_dict()
+                    for bot, runs in cleared_runs.items() if bot in best_cleared_runs
+                }
+                logger.info(f"[CRN] attempt={attempt}, vs best: " + ", ".join(
+                    f"{bot}={d['mean_difference']:+.3f}±{d['std_error']:.3f}"
+                    for bot, d in paired_differences.items()
+                ))
+
             # Track best result
             if match_score > best_match_score:
                 best_match_score = match_score
@@ -1906,6 +2006,11 @@ def generate_validated_level(
                 best_target_rates = target_rates.copy()  # Store target rates for response
                 best_gaps = (avg_gap, max_gap)
                 best_max_moves = modified_max_moves
+                best_predicted_rates = predicted_rates
+                best_surrogate_error = surrogate_error
+                best_bot_iterations = bot_iterations
+                best_cleared_runs = cleared_runs
+                best_paired_differences = paired_differences
 
             # OPTIMIZATION: Adaptive iteration reduction for subsequent attempts
             # [v15] full_iterations 기반으로 조정 (current_iterations는 탐색 모드 전용)
@@ -1934,6 +2039,11 @@ def generate_validated_level(
                     avg_gap=avg_gap,
                     max_gap=max_gap,
                     match_score=match_score,
+                    predicted_clear_rates=predicted_rates,
+                    surrogate_error=surrogate_error,
+                    surrogate_rejected=surrogate_rejected,
+                    crn_seed=crn_seed,
+                    paired_differences=paired_differences,
                 )
 
             # [v15.32] Dynamic tolerance adjustment for hard levels
@@ -1961,6 +2071,11 @@ def generate_validated_level(
                     avg_gap=avg_gap,
                     max_gap=max_gap,
                     match_score=match_score,
+                    predicted_clear_rates=predicted_rates,
+                    surrogate_error=surrogate_error,
+                    surrogate_rejected=surrogate_rejected,
+                    crn_seed=crn_seed,
+                    paired_differences=paired_differences,
                 )
 
             # Calculate gap direction (positive = level too easy)
@@ -2280,14 +2395,17 @@ def generate_validated_level(
 
                     # Run bot simulations on reshuffled level
                     reshuffle_rates = {}
+                    reshuffle_iterations = best_bot_iterations if cost_model is not None else {}
+                    reshuffle_runs = {}
                     reshuffle_sim_args = [
-                        (bt.value, reshuffled_level, effective_iterations, best_max_moves)
+                        (bt.value, reshuffled_level, reshuffle_iterations.get(bt.value, effective_iterations), best_max_moves, crn_seed)
                         for bt in bot_types
                     ]
                     reshuffle_futures = [pool.submit(_simulate_single_bot, args) for args in reshuffle_sim_args]
                     for future in as_completed(reshuffle_futures):
-                        bot_name, clear_rate = future.result()
+                        bot_name, clear_rate, _, runs = future.result()
                         reshuffle_rates[bot_name] = clear_rate
+                        reshuffle_runs[bot_name] = runs
 
                     reshuffle_score, reshuffle_avg_gap, reshuffle_max_gap = calculate_match_score(
                         reshuffle_rates, target_rates, request.target_difficulty
@@ -2299,6 +2417,14 @@ def generate_validated_level(
                         best_result.level_json = reshuffled_level
                         best_actual_rates = reshuffle_rates.copy()
                         best_gaps = (reshuffle_avg_gap, reshuffle_max_gap)
+                        best_predicted_rates = None
+                        best_surrogate_error = None
+                        if crn_seed is not None:
+                            best_paired_differences = {
+                                bot: paired_difference(runs, best_cleared_runs[bot]).to_dict()
+                                for bot, runs in reshuffle_runs.items() if bot in best_cleared_runs
+                            }
+                            best_cleared_runs = reshuffle_runs
 
                         # Early exit if excellent
                         if reshuffle_score >= EARLY_EXIT_THRESHOLD:
@@ -2316,6 +2442,9 @@ def generate_validated_level(
                                 avg_gap=reshuffle_avg_gap,
                                 max_gap=reshuffle_max_gap,
                                 match_score=reshuffle_score,
+                                surrogate_rejected=surrogate_rejected,
+                                crn_seed=crn_seed,
+                                paired_differences=best_paired_differences,
                             )
 
         except Exception as e:
@@ -2378,9 +2507,56 @@ def generate_validated_level(
         avg_gap=best_gaps[0],
         max_gap=best_gaps[1],
         match_score=best_match_score,
+        predicted_clear_rates=best_predicted_rates,
+        surrogate_error=best_surrogate_error,
+        surrogate_rejected=surrogate_rejected,
+        crn_seed=crn_seed,
+        paired_differences=best_paired_differences,
     )
 
 
+@router.get("/generate/surrogate")
+def get_surrogate_status() -> Dict[str, Any]:
+    """
+    Status of the clear-rate surrogate used to pre-screen validated generation.
+
+    Reports the held-out error measured at training time and the error of
+    predictions checked against simulation since the model was loaded.
+    Retrain with ``scripts/train_clear_rate_surrogate.py``.
+    """
+    surrogate = get_clear_rate_surrogate()
+    sample_log = get_surrogate_sample_log()
+    if surrogate is None:
+        return {"trained": False, "samples_path": str(sample_log.path)}
+    return {
+        "trained": True,
+        "trained_at": surrogate.trained_at,
+        "sample_count": surrogate.sample_count,
+        "bots": list(surrogate.weights),
+        "holdout_error": surrogate.metrics,
+        "online_error": surrogate.online_error(),
+        "samples_path": str(sample_log.path),
+    }
+
+
+@router.get("/generate/simulation-cost")
+def get_simulation_cost_status() -> Dict[str, Any]:
+    """
+    Status of the cost model that turns ``simulation_budget_ms`` into iterations per bot.
+
+    Reports the held-out relative error of the predicted per-iteration cost
+    per bot profile. Recalibrate with ``scripts/calibrate_simulation_cost.py``.
+    """
+    model = get_simulation_cost_model()
+    return {
+        "calibrated_at": model.trained_at,
+        "sample_count": model.sample_count,
+        "profiles": list(model.weights),
+        "holdout_error": model.metrics,
+        "samples_path": str(get_cost_sample_log().path),
+    }
+
+
 @router.post("/generate/enhance", response_model=EnhanceLevelResponse)
 def enhance_level(
     request: EnhanceLevelRequest,
@@ -2425,7 +2601,7 @@ def enhance_level(
         futures = [pool.submit(_simulate_single_bot, args) for args in sim_args]
         rates: Dict[str, float] = {}
         for future in as_completed(futures):
-            bot_name, clear_rate = future.result()
+            bot_name, clear_rate, _, _ = future.result()
             rates[bot_name] = clear_rate
         return rates
 
@@ -1,14 +1,17 @@
 """Visual simulation API routes for level playback visualization."""
+import asyncio
 import random
 import time
 import json
 import os
+import zlib
 from pathlib import Path
 from datetime import datetime
 from copy import deepcopy
-from typing import Dict, List, Any, Optional, Set, Tuple
+from typing import AsyncIterator, Dict, List, Any, Optional, Set, Tuple
 from dataclasses import dataclass, field
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 
 from ...models.schemas import (
     VisualSimulationRequest,
@@ -18,21 +21,28 @@ from ...models.schemas import (
     VisualGameState,
     ErrorResponse,
 )
-from ...models.bot_profile import BotType, get_profile, PREDEFINED_PROFILES
+from ...models.bot_profile import BotProfile, BotType, get_profile, PREDEFINED_PROFILES
 from ...core.bot_simulator import (
     BotSimulator,
     GameState,
     TileState,
     TileEffectType,
     Move,
-    TileDistributor,
+    MoveObserver,
+    _get_process_pool,
+    _simulate_bot_process,
 )
+from ...core.benchmark_store import get_benchmark_store
+from ...core.replay import encode_replay
+from ...core.similarity_index import DEFAULT_SIMILARITY_THRESHOLD, LevelSimilarityIndex
 from ...models.benchmark_level import (
     DifficultyTier,
     get_benchmark_level_by_id,
     get_benchmark_set,
     BenchmarkLevel,
 )
+from ..level_sets import LEVEL_SETS_DIR, level_files
+from ..streaming import encode_ndjson, encode_sse
 
 
 router = APIRouter(prefix="/api/simulate", tags=["Visual Simulation"])
@@ -65,11 +75,7 @@ DECISION_REASONS = {
     "effect_clear": "기믹 해제 우선",
 }
 
-# Matchable tile types (same as bot_simulator)
-# Note: t0 is a random tile placeholder that gets converted to t1-t15
-MATCHABLE_TYPES = {f"t{i}" for i in range(1, 16)} | {"t16"}
-# Random tile pool for t0 conversion
-RANDOM_TILE_POOL = [f"t{i}" for i in range(1, 16)]
+# Goal tile types counted from level JSON for the playback board
 GOAL_TYPES = {"craft_s", "stack_s"}
 
 
@@ -81,99 +87,172 @@ class DockTileInfo:
     position: str  # Original board position
 
 
-class VisualSimulator:
-    """Simulator for visual playback with move history.
+LINK_EFFECTS = (
+    TileEffectType.LINK_EAST, TileEffectType.LINK_WEST,
+    TileEffectType.LINK_SOUTH, TileEffectType.LINK_NORTH,
+)
 
-    Uses the same game rules as BotSimulator:
-    - 7-slot dock queue system
-    - 3-tile consecutive matching
-    - Layer blocking (upper tiles block lower tiles)
-    - Obstacle mechanics (ice, chain, grass, link, frog, bomb, curtain, teleport)
+
+def _unpicked_states(state: GameState, tracked: Dict[str, Any]) -> Dict[str, Any]:
+    """Entries of a gimmick tracking dict (layerIdx_x_y keys) whose tile is still on the board."""
+    states: Dict[str, Any] = {}
+    for key, value in tracked.items():
+        parts = key.split('_')
+        if len(parts) >= 3:
+            tile = state.tiles.get(int(parts[0]), {}).get(f"{parts[1]}_{parts[2]}")
+            if tile is not None and not tile.picked:
+                states[key] = value
+    return states
+
+
+class VisualMoveRecorder(MoveObserver):
+    """Records every move of a BotSimulator game as VisualBotMove for playback.
+
+    The game itself is played by BotSimulator._play_game; this observer only
+    adds what the frontend needs: decision reasons, the board positions of
+    matched tiles and the gimmick states after each move.
     """
 
-    # Default tile count for t0 distribution (matches bot_simulator)
-    DEFAULT_USE_TILE_COUNT = 6
+    def __init__(self, profile: BotProfile, rng: random.Random):
+        self._profile = profile
+        self._rng = rng  # Decision reasons only, never the game's own streams
+        self.moves: List[VisualBotMove] = []
+        self.total_score = 0.0
+        self.initial_goals: Dict[str, int] = {}
+        # Dock tiles with their original board positions
+        self._dock_tile_infos: List[DockTileInfo] = []
+        self._reason = ""
+
+    def on_game_start(self, state: GameState) -> None:
+        self.initial_goals = dict(state.goals_remaining)
+
+    def before_move(self, state: GameState, move: Move, moves: List[Move], solved: bool) -> None:
+        if solved:
+            self._reason = DECISION_REASONS["lookahead"]
+        else:
+            self._reason = self._determine_decision_reason(move, moves, self._profile)
+
+    def after_move(self, state: GameState, move: Move, tiles_cleared: int) -> None:
+        score_gained = tiles_cleared * 10.0
+        self.total_score += score_gained
+
+        # Track matched positions (original board positions of matched tiles)
+        matched_positions: List[str] = []
+        # The picked tile and its linked tiles enter the dock in this order;
+        # a third tile of a type matches the two oldest of that type
+        entering = [(move.layer_idx, move.position, move.tile_type)]
+        for linked_layer_idx, linked_pos in move.linked_tiles:
+            linked_tile = state.tiles.get(linked_layer_idx, {}).get(linked_pos)
+            if linked_tile:
+                entering.append((linked_layer_idx, linked_pos, linked_tile.tile_type))
+
+        for index, (layer_idx, position, tile_type) in enumerate(entering):
+            same_type_in_dock = [dt for dt in self._dock_tile_infos if dt.tile_type == tile_type]
+            # The picked tile's own match is known from the engine; linked tiles are predicted
+            matched = tiles_cleared >= 3 if index == 0 else len(same_type_in_dock) >= 2
+            if matched:
+                for dt in same_type_in_dock[:2]:
+                    matched_positions.append(f"{dt.layer_idx}_{dt.position}")
+                    self._dock_tile_infos.remove(dt)
+            else:
+                self._dock_tile_infos.append(DockTileInfo(tile_type, layer_idx, position))
+
+        # Gimmick states after the move (layerIdx_x_y keys), from unpicked tiles only
+        frog_positions_after: List[str] = []
+        ice_states_after: Dict[str, int] = {}
+        chain_states_after: Dict[str, bool] = {}
+        grass_states_after: Dict[str, int] = {}
+        link_states_after: Dict[str, List[str]] = {}
+        teleport_states_after: Dict[str, str] = {}
+        for layer_idx, layer in state.tiles.items():
+            for pos, tile in layer.items():
+                key = f"{layer_idx}_{pos}"
+                if tile.on_frog:
+                    frog_positions_after.append(key)
+                if tile.picked:
+                    continue
+                effect = tile.effect_type
+                if effect == TileEffectType.ICE:
+                    ice_states_after[key] = tile.remaining
+                elif effect == TileEffectType.CHAIN:
+                    chain_states_after[key] = tile.unlocked
+                elif effect == TileEffectType.GRASS:
+                    grass_states_after[key] = tile.remaining
+                elif effect in LINK_EFFECTS:
+                    link_states_after[key] = [tile.linked_pos] if tile.linked_pos else []
+                elif effect == TileEffectType.TELEPORT:
+                    teleport_states_after[key] = tile.tile_type
+
+        self.moves.append(VisualBotMove(
+            move_number=len(self.moves) + 1,
+            layer_idx=move.layer_idx,
+            position=move.position,
+            tile_type=move.tile_type,
+            linked_positions=[f"{layer_idx}_{pos}" for layer_idx, pos in move.linked_tiles],
+            matched_positions=matched_positions,
+            tiles_cleared=tiles_cleared,
+            goals_after=dict(state.goals_remaining),
+            score_gained=score_gained,
+            decision_reason=self._reason,
+            dock_after=[dt.tile_type for dt in state.dock_tiles],
+            frog_positions_after=frog_positions_after,
+            bomb_states_after=_unpicked_states(state, state.bomb_tiles),
+            curtain_states_after=_unpicked_states(state, state.curtain_tiles),
+            ice_states_after=ice_states_after,
+            chain_states_after=chain_states_after,
+            grass_states_after=grass_states_after,
+            link_states_after=link_states_after,
+            teleport_states_after=teleport_states_after,
+            teleport_click_count_after=state.teleport_click_count,
+            # Permanent type changes from teleport shuffle
+            tile_type_overrides=dict(state.tile_type_overrides),
+        ))
 
-    def __init__(self):
-        self._rng = random.Random()
-        # Re-use core simulation logic from BotSimulator
-        self._core = BotSimulator()
+    def _determine_decision_reason(
+        self, selected: Move, all_moves: List[Move], profile: Any
+    ) -> str:
+        """Determine the reason for the bot's decision."""
+        if not all_moves:
+            return DECISION_REASONS["random"]
 
-    def get_t0_assignments(
-        self, level_json: Dict[str, Any], seed: Optional[int] = None
-    ) -> Dict[Tuple[int, str], str]:
-        """Get t0 tile assignments for visualization.
+        # Check if this was a mistake (not the best move)
+        sorted_moves = sorted(all_moves, key=lambda m: m.score, reverse=True)
+        if selected != sorted_moves[0]:
+            if self._rng.random() < profile.mistake_rate:
+                return DECISION_REASONS["mistake"]
 
-        Returns a mapping of (layer_idx, pos) -> converted tile type.
-        Uses TileDistributor for exact in-game matching.
-        """
-        if seed is not None:
-            self._rng.seed(seed)
+        # Check for specific strategic reasons
+        if selected.will_match:
+            return DECISION_REASONS["greedy_match"]
 
-        num_layers = level_json.get("layer", 8)
-        rand_seed = level_json.get("randSeed", 0)
-        use_tile_count = level_json.get("useTileCount", self.DEFAULT_USE_TILE_COUNT)
-        if use_tile_count <= 0:
-            use_tile_count = self.DEFAULT_USE_TILE_COUNT
+        if selected.attribute and selected.attribute != "none":
+            effect_type = selected.attribute
+            if effect_type in ("chain", "ice", "grass"):
+                return DECISION_REASONS["effect_clear"]
+            elif effect_type == "frog":
+                return DECISION_REASONS["greedy_chain"]
 
-        # Get additional level settings for exact matching
-        shuffle_tile = level_json.get("xShuffleTile", 0)
-        type_imbalance = level_json.get("xTypeImbalance", 0)
-        unlock_tile = level_json.get("xUnlockTile", 0)
+        if selected.layer_idx >= 5:
+            return DECISION_REASONS["greedy_blocking"]
 
-        # Collect all t0 tiles and existing tile counts (for GetToAddIndexList)
-        t0_tiles: List[Tuple[int, str]] = []
-        existing_tile_counts: Dict[str, int] = {}
+        if selected.match_count == 2:
+            return DECISION_REASONS["dock_safety"]
 
-        for layer_idx in range(num_layers):
-            layer_key = f"layer_{layer_idx}"
-            layer_data = level_json.get(layer_key, {})
-            layer_tiles = layer_data.get("tiles", {})
+        return DECISION_REASONS["greedy_goal"]
 
-            for pos, tile_data in layer_tiles.items():
-                if isinstance(tile_data, list) and tile_data:
-                    tile_type = tile_data[0]
-                    if tile_type == "t0":
-                        t0_tiles.append((layer_idx, pos))
-                    elif isinstance(tile_type, str) and tile_type.startswith("t") and tile_type[1:].isdigit():
-                        # Regular t1~t15 tile - count for GetToAddIndexList
-                        tile_num = int(tile_type[1:])
-                        if 1 <= tile_num <= 15:
-                            existing_tile_counts[tile_type] = existing_tile_counts.get(tile_type, 0) + 1
-                    elif tile_type == "key":
-                        existing_tile_counts["key"] = existing_tile_counts.get("key", 0) + 1
-
-        if not t0_tiles:
-            return {}
-
-        # Detect tile type offset from existing tiles
-        tile_type_offset = 0
-        if existing_tile_counts:
-            t_types = [t for t in existing_tile_counts.keys() if t.startswith("t") and t[1:].isdigit()]
-            if t_types:
-                min_tile_num = min(int(t[1:]) for t in t_types)
-                if min_tile_num > use_tile_count:
-                    tile_type_offset = min_tile_num - 1
-
-        # Use TileDistributor for exact in-game matching
-        assignments = TileDistributor.assign_t0_tiles(
-            t0_count=len(t0_tiles),
-            use_tile_count=use_tile_count,
-            rand_seed=rand_seed,
-            shuffle_tile=shuffle_tile,
-            type_imbalance=type_imbalance,
-            unlock_tile=unlock_tile,
-            tile_type_offset=tile_type_offset,
-            existing_tile_counts=existing_tile_counts
-        )
 
-        # Build mapping
-        result: Dict[Tuple[int, str], str] = {}
-        for i, (layer_idx, pos) in enumerate(t0_tiles):
-            if i < len(assignments):
-                result[(layer_idx, pos)] = assignments[i]
+class VisualSimulator:
+    """Simulator for visual playback with move history.
 
-        return result
+    Games are played by BotSimulator itself (same rules, bot behavior and
+    endgame solver as the assessments); VisualMoveRecorder hooks into them
+    to record each move.
+    """
+
+    def __init__(self):
+        # Decision reasons for the recorded moves
+        self._rng = random.Random()
+        self._core = BotSimulator()
 
     def simulate_bot(
         self,
@@ -209,15 +288,13 @@ class VisualSimulator:
 
         # Initialize game state using core logic (uses _core._rng for tile types)
         state = self._core._create_initial_state(level_json, max_moves)
+        self._core._precompute_blocking_map(state)
 
         # Now set bot behavior seed (for move selection randomness)
         # IMPORTANT: Only set self._rng for bot behavior, NOT _core._rng
         # _core._rng was used for tile type generation and should not be changed
         if seed is not None:
             self._rng.seed(seed)
-        moves: List[VisualBotMove] = []
-        move_number = 0
-        total_score = 0.0
 
         # Extract stack/craft tile types from initialized state
         # This ensures frontend visualization uses the same types as simulation
@@ -252,273 +329,27 @@ class VisualSimulator:
                 # This matches in-game display order where top tile is shown/picked first
                 stack_craft_types_map[craft_box_key] = tile_types[::-1]
 
-        # Extract tile type assignments from initialized state
-        # This ensures frontend visualization uses the exact same types as simulation
-        t0_assignments: Dict[Tuple[int, str], str] = {}
-        for layer_idx, layer_tiles in state.tiles.items():
-            for pos, tile_state in layer_tiles.items():
-                # All tiles in state.tiles already have their resolved types
-                # We need to track all tiles (originally t0 or not) for consistency
-                t0_assignments[(layer_idx, pos)] = tile_state.tile_type
-
-        # Store initial goals for calculating completed goals
-        initial_goals = dict(state.goals_remaining)
-
-        # Track dock tiles with their original board positions
-        dock_tile_infos: List[DockTileInfo] = []
-
-        # Play game
-        while not self._is_game_over(state):
-            available_moves = self._core._get_available_moves(state)
-            if not available_moves:
-                state.failed = True
-                break
-
-            # Score moves based on bot profile
-            for move in available_moves:
-                move.score = self._core._score_move_with_profile(move, state, profile)
-
-            # Select move based on bot behavior
-            selected_move = self._core._select_move_with_profile(available_moves, state, profile)
-            if selected_move is None:
-                state.failed = True
-                break
-
-            move_number += 1
-
-            # Determine decision reason
-            reason = self._determine_decision_reason(selected_move, available_moves, profile)
-
-            # Store the current tile's board position before applying move
-            current_tile_info = DockTileInfo(
-                tile_type=selected_move.tile_type,
-                layer_idx=selected_move.layer_idx,
-                position=selected_move.position,
-            )
-
-            # Check dock state before move for match prediction
-            dock_count_before = sum(
-                1 for dt in dock_tile_infos if dt.tile_type == selected_move.tile_type
-            )
-            will_match = dock_count_before >= 2
-
-            # Capture exposed bomb positions BEFORE applying the move
-            # This is important: bomb countdown should only decrease for bombs that were
-            # already exposed before this move, not bombs that become exposed by this move
-            exposed_bombs_before_move = set()
-            for bomb_key in state.bomb_tiles.keys():
-                # Parse layerIdx_x_y format (e.g., "0_1_2" -> layer_idx=0, pos="1_2")
-                parts = bomb_key.split('_')
-                if len(parts) >= 3:
-                    layer_idx = int(parts[0])
-                    pos = f"{parts[1]}_{parts[2]}"
-                    layer = state.tiles.get(layer_idx, {})
-                    if pos in layer and not layer[pos].picked:
-                        bomb_tile = layer[pos]
-                        if not self._core._is_blocked_by_upper(state, bomb_tile):
-                            exposed_bombs_before_move.add(bomb_key)
-
-            # Capture exposed curtain positions BEFORE applying the move
-            # Curtains that become exposed by this move should NOT toggle yet
-            # OPTIMIZED: Use curtain_tiles dict instead of iterating all tiles
-            exposed_curtains_before_move = set()
-            for curtain_key in state.curtain_tiles.keys():
-                parts = curtain_key.split('_')
-                if len(parts) >= 3:
-                    layer_idx = int(parts[0])
-                    pos = f"{parts[1]}_{parts[2]}"
-                    layer = state.tiles.get(layer_idx, {})
-                    if pos in layer and not layer[pos].picked:
-                        if not self._core._is_blocked_by_upper(state, layer[pos]):
-                            exposed_curtains_before_move.add((layer_idx, pos))
-
-            # Apply move (tile gets picked and added to dock)
-            tiles_cleared = self._core._apply_move(state, selected_move)
-            score_gained = tiles_cleared * 10.0
-            total_score += score_gained
-
-            # Track matched positions (original board positions of matched tiles)
-            matched_positions: List[str] = []
-
-            if tiles_cleared >= 3:
-                # 3 tiles were matched and removed from dock
-                # Find the other 2 tiles of same type that were in dock
-                same_type_in_dock = [
-                    dt for dt in dock_tile_infos if dt.tile_type == selected_move.tile_type
-                ]
-                # Take the first 2 (oldest) tiles of same type
-                for dt in same_type_in_dock[:2]:
-                    matched_positions.append(f"{dt.layer_idx}_{dt.position}")
-                    dock_tile_infos.remove(dt)
-                # The current tile is also matched (already removed from board by _apply_move)
-            else:
-                # No match - add current tile to dock tracking
-                dock_tile_infos.append(current_tile_info)
-
-            # Also track linked tiles in dock_tile_infos for match tracking
-            for linked_layer_idx, linked_pos in selected_move.linked_tiles:
-                # Find the linked tile in state to get its tile_type
-                linked_tile = state.tiles.get(linked_layer_idx, {}).get(linked_pos)
-                if linked_tile:
-                    linked_tile_info = DockTileInfo(
-                        tile_type=linked_tile.tile_type,
-                        layer_idx=linked_layer_idx,
-                        position=linked_pos,
-                    )
-                    # Check if match would occur with linked tile
-                    linked_dock_count = sum(
-                        1 for dt in dock_tile_infos if dt.tile_type == linked_tile.tile_type
-                    )
-                    if linked_dock_count >= 2:
-                        # Linked tile causes a match - remove matching tiles
-                        same_type_in_dock = [
-                            dt for dt in dock_tile_infos if dt.tile_type == linked_tile.tile_type
-                        ]
-                        for dt in same_type_in_dock[:2]:
-                            matched_positions.append(f"{dt.layer_idx}_{dt.position}")
-                            dock_tile_infos.remove(dt)
-                    else:
-                        dock_tile_infos.append(linked_tile_info)
-
-            # Process move effects (bomb, frog, curtain, teleport)
-            self._core._process_move_effects(state, exposed_bombs_before_move, exposed_curtains_before_move)
-            state.moves_used += 1
-
-            # Get current dock state from actual state (includes linked tiles)
-            dock_after = [dt.tile_type for dt in state.dock_tiles]
-
-            # Get frog positions after move (layerIdx_x_y format)
-            # Search all layers for tiles with on_frog=True
-            frog_positions_after: List[str] = []
-            for layer_idx, layer in state.tiles.items():
-                for pos, tile in layer.items():
-                    if tile.effect_data.get("on_frog", False):
-                        frog_positions_after.append(f"{layer_idx}_{pos}")
-
-            # Get bomb states after move (layerIdx_x_y -> remaining count)
-            # OPTIMIZED: Use bomb_tiles tracking dict
-            bomb_states_after: Dict[str, int] = {}
-            for bomb_key, remaining in state.bomb_tiles.items():
-                parts = bomb_key.split('_')
-                if len(parts) >= 3:
-                    layer_idx = int(parts[0])
-                    pos = f"{parts[1]}_{parts[2]}"
-                    layer = state.tiles.get(layer_idx, {})
-                    if pos in layer and not layer[pos].picked:
-                        bomb_states_after[bomb_key] = remaining
-
-            # Get curtain states after move (layerIdx_x_y -> is_open)
-            # OPTIMIZED: Use curtain_tiles tracking dict
-            curtain_states_after: Dict[str, bool] = {}
-            for curtain_key, is_open in state.curtain_tiles.items():
-                parts = curtain_key.split('_')
-                if len(parts) >= 3:
-                    layer_idx = int(parts[0])
-                    pos = f"{parts[1]}_{parts[2]}"
-                    layer = state.tiles.get(layer_idx, {})
-                    if pos in layer and not layer[pos].picked:
-                        curtain_states_after[curtain_key] = is_open
-
-            # Get ice states after move (layerIdx_x_y -> remaining layers 1-3)
-            # Note: bot_simulator uses "remaining" field for ice (initialized to 3)
-            ice_states_after: Dict[str, int] = {}
-            for layer_idx, layer in state.tiles.items():
-                for pos, tile in layer.items():
-                    if tile.effect_type == TileEffectType.ICE and not tile.picked:
-                        ice_remaining = tile.effect_data.get("remaining", 3)
-                        ice_states_after[f"{layer_idx}_{pos}"] = ice_remaining
-
-            # Get chain states after move (layerIdx_x_y -> unlocked)
-            chain_states_after: Dict[str, bool] = {}
-            for layer_idx, layer in state.tiles.items():
-                for pos, tile in layer.items():
-                    if tile.effect_type == TileEffectType.CHAIN and not tile.picked:
-                        unlocked = tile.effect_data.get("unlocked", False)
-                        chain_states_after[f"{layer_idx}_{pos}"] = unlocked
-
-            # Get grass states after move (layerIdx_x_y -> remaining layers 1-2)
-            # Note: bot_simulator uses "remaining" field for grass (initialized to 2)
-            grass_states_after: Dict[str, int] = {}
-            for layer_idx, layer in state.tiles.items():
-                for pos, tile in layer.items():
-                    if tile.effect_type == TileEffectType.GRASS and not tile.picked:
-                        grass_remaining = tile.effect_data.get("remaining", 2)
-                        grass_states_after[f"{layer_idx}_{pos}"] = grass_remaining
-
-            # Get link states after move (layerIdx_x_y -> list of connected position keys)
-            link_states_after: Dict[str, List[str]] = {}
-            for layer_idx, layer in state.tiles.items():
-                for pos, tile in layer.items():
-                    if tile.effect_type in (TileEffectType.LINK_EAST, TileEffectType.LINK_WEST,
-                                            TileEffectType.LINK_SOUTH, TileEffectType.LINK_NORTH) and not tile.picked:
-                        # Get linked positions from effect_data
-                        linked_positions = tile.effect_data.get("linked_positions", [])
-                        link_states_after[f"{layer_idx}_{pos}"] = linked_positions
-
-            # Get teleport states after move (position -> tile_type mapping for shuffle visualization)
-            teleport_states_after: Dict[str, str] = {}
-            for layer_idx, layer in state.tiles.items():
-                for pos, tile in layer.items():
-                    if tile.effect_type == TileEffectType.TELEPORT and not tile.picked:
-                        teleport_states_after[f"{layer_idx}_{pos}"] = tile.tile_type
-            teleport_click_count_after = state.teleport_click_count
-
-            # Convert linked_tiles to linked_positions format (layerIdx_x_y)
-            linked_positions_formatted = [
-                f"{layer_idx}_{pos}" for layer_idx, pos in selected_move.linked_tiles
-            ]
+        # Tile types of every board tile (t0 resolved by TileDistributor) from the
+        # initialized state, so the frontend shows exactly the simulated types
+        t0_assignments: Dict[Tuple[int, str], str] = {
+            (layer_idx, pos): tile_state.tile_type
+            for layer_idx, layer_tiles in state.tiles.items()
+            for pos, tile_state in layer_tiles.items()
+        }
 
-            # Get tile type overrides (permanent type changes from teleport shuffle)
-            tile_type_overrides = dict(state.tile_type_overrides)
-
-            # Record move
-            moves.append(VisualBotMove(
-                move_number=move_number,
-                layer_idx=selected_move.layer_idx,
-                position=selected_move.position,
-                tile_type=selected_move.tile_type,
-                linked_positions=linked_positions_formatted,
-                matched_positions=matched_positions,
-                tiles_cleared=tiles_cleared,
-                goals_after=dict(state.goals_remaining),
-                score_gained=score_gained,
-                decision_reason=reason,
-                dock_after=dock_after,
-                frog_positions_after=frog_positions_after,
-                bomb_states_after=bomb_states_after,
-                curtain_states_after=curtain_states_after,
-                ice_states_after=ice_states_after,
-                chain_states_after=chain_states_after,
-                grass_states_after=grass_states_after,
-                link_states_after=link_states_after,
-                teleport_states_after=teleport_states_after,
-                teleport_click_count_after=teleport_click_count_after,
-                tile_type_overrides=tile_type_overrides,
-            ))
-
-        # Check clear status - must clear all goals AND all tiles
-        goals_cleared = all(count <= 0 for count in state.goals_remaining.values())
-        remaining_tiles = sum(
-            1 for layer in state.tiles.values()
-            for tile in layer.values()
-            if not tile.picked
-        )
-        # Level is cleared only if:
-        # 1. All goals are met (or no goals exist)
-        # 2. All tiles are removed from the board
-        # 3. Dock is empty (all matched)
-        cleared = goals_cleared and remaining_tiles == 0 and len(state.dock_tiles) == 0
+        recorder = VisualMoveRecorder(profile, self._rng)
+        state = self._core._play_game(state, profile, observer=recorder)
 
         return (
             VisualBotResult(
                 profile=bot_type,
                 profile_display=BOT_DISPLAY_NAMES.get(bot_type, bot_type),
-                moves=moves,
-                cleared=cleared,
+                moves=recorder.moves,
+                cleared=state.cleared,
                 total_moves=state.moves_used,
-                final_score=total_score,
+                final_score=recorder.total_score,
                 goals_completed={
-                    k: initial_goals.get(k, 0) - v
+                    k: recorder.initial_goals.get(k, 0) - v
                     for k, v in state.goals_remaining.items()
                 },
             ),
@@ -526,69 +357,6 @@ class VisualSimulator:
             t0_assignments,
         )
 
-    def _is_game_over(self, state: GameState) -> bool:
-        """Check if game is over (uses same logic as core)."""
-        # Check goals cleared and all tiles cleared
-        if all(count <= 0 for count in state.goals_remaining.values()):
-            remaining_unpicked = sum(
-                1 for layer in state.tiles.values()
-                for tile in layer.values()
-                if not tile.picked
-            )
-            if remaining_unpicked == 0 and len(state.dock_tiles) == 0:
-                state.cleared = True
-                return True
-
-        # Check dock full (game fail condition)
-        if self._core._is_dock_full(state):
-            state.failed = True
-            return True
-
-        # Check bomb exploded
-        for pos, remaining in state.bomb_tiles.items():
-            if remaining <= 0:
-                state.failed = True
-                return True
-
-        # Check max moves
-        if state.moves_used >= state.max_moves:
-            state.failed = True
-            return True
-
-        return False
-
-    def _determine_decision_reason(
-        self, selected: Move, all_moves: List[Move], profile: Any
-    ) -> str:
-        """Determine the reason for the bot's decision."""
-        if not all_moves:
-            return DECISION_REASONS["random"]
-
-        # Check if this was a mistake (not the best move)
-        sorted_moves = sorted(all_moves, key=lambda m: m.score, reverse=True)
-        if selected != sorted_moves[0]:
-            if self._rng.random() < profile.mistake_rate:
-                return DECISION_REASONS["mistake"]
-
-        # Check for specific strategic reasons
-        if selected.will_match:
-            return DECISION_REASONS["greedy_match"]
-
-        if selected.attribute and selected.attribute != "none":
-            effect_type = selected.attribute
-            if effect_type in ("chain", "ice", "grass"):
-                return DECISION_REASONS["effect_clear"]
-            elif effect_type == "frog":
-                return DECISION_REASONS["greedy_chain"]
-
-        if selected.layer_idx >= 5:
-            return DECISION_REASONS["greedy_blocking"]
-
-        if selected.match_count == 2:
-            return DECISION_REASONS["dock_safety"]
-
-        return DECISION_REASONS["greedy_goal"]
-
 
 def extract_initial_state(
     level_json: Dict[str, Any],
@@ -615,16 +383,20 @@ def extract_initial_state(
     initial_link_states: Dict[str, List[str]] = {}
     initial_teleport_states: Dict[str, str] = {}
 
-    # Use simulator to get proper t0 assignments for stacked tiles too (fallback only)
-    simulator = VisualSimulator()
+    # Fallback-only simulator for stacked tile types, created on demand
+    simulator: Optional[VisualSimulator] = None
 
     for i in range(num_layers):
         layer_key = f"layer_{i}"
         layer_data = level_json.get(layer_key, {})
 
         if layer_data.get("tiles"):
-            # Deep copy and convert t0 tiles if assignments provided
-            layer_tiles = deepcopy(layer_data.get("tiles", {}))
+            # Copy each tile list (only top-level slots are rewritten below) and
+            # convert t0 tiles if assignments provided
+            layer_tiles = {
+                pos: list(tile_data) if isinstance(tile_data, list) else deepcopy(tile_data)
+                for pos, tile_data in layer_data.get("tiles", {}).items()
+            }
 
             if t0_assignments:
                 for pos, tile_data in layer_tiles.items():
@@ -662,9 +434,13 @@ def extract_initial_state(
                             total_count = len(converted_types)
                         else:
                             # Fallback: Generate random types (should not happen with proper flow)
+                            if simulator is None:
+                                simulator = VisualSimulator()
                             converted_types = []
                             for _ in range(total_count):
-                                converted_type = simulator._rng.choice(RANDOM_TILE_POOL[:simulator.DEFAULT_USE_TILE_COUNT])
+                                converted_type = simulator._rng.choice(
+                                    BotSimulator.RANDOM_TILE_POOL[:BotSimulator.DEFAULT_USE_TILE_COUNT]
+                                )
                                 converted_types.append(converted_type)
 
                         # Ensure tile_data has at least 3 elements
@@ -868,83 +644,147 @@ async def get_benchmark_level(level_id: str):
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.get(
-    "/benchmark/dashboard/summary",
-    summary="Get benchmark system dashboard summary",
-    description="Comprehensive overview of all benchmark levels with statistics",
-)
-async def get_benchmark_dashboard():
-    """Get comprehensive dashboard data for benchmark system."""
-    try:
-        dashboard_data = {
-            "tiers": {},
-            "overall_stats": {
-                "total_levels": 0,
-                "implemented_tiers": [],
-                "pending_tiers": [],
-            }
-        }
+# Benchmark runs use a fixed seed so cached results stay valid until the
+# benchmark fingerprint changes (see core.benchmark_store)
+BENCHMARK_SEED = 42
+DASHBOARD_SAMPLE_ITERATIONS = 10
 
-        simulator = BotSimulator()
+_dashboard_refresh: Optional["asyncio.Future[Dict[str, Any]]"] = None
 
-        for tier in [DifficultyTier.EASY, DifficultyTier.MEDIUM, DifficultyTier.HARD,
-                     DifficultyTier.EXPERT, DifficultyTier.IMPOSSIBLE]:
-            try:
-                benchmark_set = get_benchmark_set(tier)
 
-                # Quick test: Run optimal bot on first level to get performance snapshot
-                first_level = benchmark_set.levels[0]
-                level_data = first_level.to_simulator_format()
-                max_moves = first_level.level_json.get("max_moves", 50)
-
-                profile = get_profile(BotType.OPTIMAL)
-                quick_result = simulator.simulate_with_profile(
-                    level_data,
-                    profile,
-                    iterations=10,  # Quick test
-                    max_moves=max_moves,
-                    seed=42,
-                )
-
-                tier_info = {
-                    "tier": tier.value,
-                    "level_count": len(benchmark_set.levels),
-                    "description": benchmark_set.description,
-                    "status": "implemented",
-                    "levels": [
-                        {
-                            "id": level.id,
-                            "name": level.name,
-                            "description": level.description,
-                            "tags": level.tags,
-                            "expected_clear_rates": level.expected_clear_rates,
-                            "max_moves": level.level_json.get("max_moves", 50),
-                            "tile_count": len(level.level_json.get("tiles", [])),
-                        }
-                        for level in benchmark_set.levels
-                    ],
-                    "sample_performance": {
-                        "level_id": first_level.id,
-                        "optimal_clear_rate": quick_result.clear_rate,
-                        "avg_moves": quick_result.avg_moves,
+async def _get_benchmark_bot_results(
+    level: BenchmarkLevel,
+    bot_types: List[BotType],
+    iterations: int,
+    max_moves: int,
+) -> Dict[str, Dict[str, Any]]:
+    """Per-bot results for a benchmark level, simulating only those not in the store.
+
+    Missing bots run concurrently in the shared process pool.
+    """
+    store = get_benchmark_store()
+    results: Dict[str, Dict[str, Any]] = {}
+    missing: List[BotType] = []
+    for bot_type in bot_types:
+        cached = store.get_bot_result(level.id, bot_type.value, iterations, max_moves, BENCHMARK_SEED)
+        if cached is not None:
+            results[bot_type.value] = cached
+        else:
+            missing.append(bot_type)
+
+    if missing:
+        loop = asyncio.get_running_loop()
+        pool = _get_process_pool()
+        level_data = level.to_simulator_format()
+        simulated = await asyncio.gather(*(
+            loop.run_in_executor(
+                pool, _simulate_bot_process,
+                (level_data, bot_type.value, iterations, max_moves, BENCHMARK_SEED),
+            )
+            for bot_type in missing
+        ))
+        for bot_type, result in zip(missing, simulated):
+            results[bot_type.value] = store.put_bot_result(
+                level.id, bot_type.value, iterations, max_moves, BENCHMARK_SEED,
+                {"clear_rate": result.clear_rate, "avg_moves": result.avg_moves},
+            )
+
+    return results
+
+
+async def _compute_benchmark_dashboard() -> Dict[str, Any]:
+    """Build the dashboard from the benchmark sets and store it."""
+    dashboard_data = {
+        "tiers": {},
+        "overall_stats": {
+            "total_levels": 0,
+            "implemented_tiers": [],
+            "pending_tiers": [],
+        }
+    }
+
+    for tier in [DifficultyTier.EASY, DifficultyTier.MEDIUM, DifficultyTier.HARD,
+                 DifficultyTier.EXPERT, DifficultyTier.IMPOSSIBLE]:
+        try:
+            benchmark_set = get_benchmark_set(tier)
+
+            # Performance snapshot: optimal bot on the first level of the tier
+            first_level = benchmark_set.levels[0]
+            max_moves = first_level.level_json.get("max_moves", 50)
+            sample = (await _get_benchmark_bot_results(
+                first_level, [BotType.OPTIMAL], DASHBOARD_SAMPLE_ITERATIONS, max_moves
+            ))[BotType.OPTIMAL.value]
+
+            tier_info = {
+                "tier": tier.value,
+                "level_count": len(benchmark_set.levels),
+                "description": benchmark_set.description,
+                "status": "implemented",
+                "levels": [
+                    {
+                        "id": level.id,
+                        "name": level.name,
+                        "description": level.description,
+                        "tags": level.tags,
+                        "expected_clear_rates": level.expected_clear_rates,
+                        "max_moves": level.level_json.get("max_moves", 50),
+                        "tile_count": len(level.level_json.get("tiles", [])),
                     }
+                    for level in benchmark_set.levels
+                ],
+                "sample_performance": {
+                    "level_id": first_level.id,
+                    "optimal_clear_rate": sample["clear_rate"],
+                    "avg_moves": sample["avg_moves"],
+                    "computed_at": sample["computed_at"],
                 }
+            }
 
-                dashboard_data["tiers"][tier.value] = tier_info
-                dashboard_data["overall_stats"]["total_levels"] += len(benchmark_set.levels)
-                dashboard_data["overall_stats"]["implemented_tiers"].append(tier.value)
+            dashboard_data["tiers"][tier.value] = tier_info
+            dashboard_data["overall_stats"]["total_levels"] += len(benchmark_set.levels)
+            dashboard_data["overall_stats"]["implemented_tiers"].append(tier.value)
+
+        except ValueError:
+            # Tier not implemented yet
+            dashboard_data["tiers"][tier.value] = {
+                "tier": tier.value,
+                "level_count": 0,
+                "status": "pending",
+                "description": f"{tier.value.upper()} tier not yet implemented"
+            }
+            dashboard_data["overall_stats"]["pending_tiers"].append(tier.value)
+
+    return get_benchmark_store().put_dashboard(dashboard_data)
+
+
+async def refresh_benchmark_dashboard() -> Dict[str, Any]:
+    """Recompute and store the dashboard; concurrent callers share one refresh.
+
+    Also scheduled as a background task at startup so the first dashboard
+    request is served from the store.
+    """
+    global _dashboard_refresh
+    if _dashboard_refresh is None or _dashboard_refresh.done():
+        _dashboard_refresh = asyncio.ensure_future(_compute_benchmark_dashboard())
+    # A disconnecting client must not cancel the refresh other requests wait on
+    return await asyncio.shield(_dashboard_refresh)
 
-            except ValueError:
-                # Tier not implemented yet
-                dashboard_data["tiers"][tier.value] = {
-                    "tier": tier.value,
-                    "level_count": 0,
-                    "status": "pending",
-                    "description": f"{tier.value.upper()} tier not yet implemented"
-                }
-                dashboard_data["overall_stats"]["pending_tiers"].append(tier.value)
 
-        return dashboard_data
+@router.get(
+    "/benchmark/dashboard/summary",
+    summary="Get benchmark system dashboard summary",
+    description="Comprehensive overview of all benchmark levels with statistics. "
+                "Served from the benchmark result store; `computed_at` tells when it was "
+                "computed. It is recomputed only when the benchmark data, bot profiles "
+                "or simulator version change.",
+)
+async def get_benchmark_dashboard():
+    """Get comprehensive dashboard data for benchmark system."""
+    try:
+        dashboard = get_benchmark_store().get_dashboard()
+        if dashboard is None:
+            dashboard = await refresh_benchmark_dashboard()
+        return dashboard
 
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -953,7 +793,9 @@ async def get_benchmark_dashboard():
 @router.post(
     "/benchmark/validate/{level_id}",
     summary="Validate level difficulty",
-    description="Run validation test on a specific level and return detailed results",
+    description="Run validation test on a specific level and return detailed results. "
+                "Per-bot results are reused from the benchmark result store while the "
+                "benchmark fingerprint is unchanged.",
 )
 async def validate_level_difficulty(
     level_id: str,
@@ -973,8 +815,6 @@ async def validate_level_difficulty(
     """
     try:
         level = get_benchmark_level_by_id(level_id)
-        simulator = BotSimulator()
-        level_data = level.to_simulator_format()
         max_moves = level.level_json.get("max_moves", 50)
 
         validation_results = {
@@ -982,6 +822,7 @@ async def validate_level_difficulty(
             "level_name": level.name,
             "iterations": iterations,
             "tolerance": tolerance,
+            "fingerprint": get_benchmark_store().fingerprint,
             "bot_results": [],
             "overall_pass": True,
             "warnings": 0,
@@ -990,21 +831,13 @@ async def validate_level_difficulty(
 
         bot_types = [BotType.NOVICE, BotType.CASUAL, BotType.AVERAGE,
                      BotType.EXPERT, BotType.OPTIMAL]
+        simulated = await _get_benchmark_bot_results(level, bot_types, iterations, max_moves)
 
         for bot_type in bot_types:
-            profile = get_profile(bot_type)
             expected_rate = level.expected_clear_rates.get(bot_type.value, 0.0)
+            result = simulated[bot_type.value]
 
-            # Run simulation
-            result = simulator.simulate_with_profile(
-                level_data,
-                profile,
-                iterations=iterations,
-                max_moves=max_moves,
-                seed=42,
-            )
-
-            actual_rate = result.clear_rate
+            actual_rate = result["clear_rate"]
             deviation = abs(actual_rate - expected_rate) * 100
 
             # Determine status
@@ -1025,6 +858,7 @@ async def validate_level_difficulty(
                 "deviation": deviation,
                 "status": status,
                 "within_tolerance": (deviation <= tolerance),
+                "computed_at": result["computed_at"],
             }
             validation_results["bot_results"].append(bot_result)
 
@@ -1062,104 +896,36 @@ async def simulate_visual(request: VisualSimulationRequest):
     try:
         start_time = time.time()
 
-        level_json = request.level_json
-
-        # Determine which bots to simulate
-        bot_types = request.bot_types or ["novice", "casual", "average", "expert", "optimal"]
-
-        # Validate bot types
-        valid_types = {"novice", "casual", "average", "expert", "optimal"}
-        for bt in bot_types:
-            if bt not in valid_types:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Invalid bot type: {bt}. Valid types: {valid_types}"
-                )
-
-        # Create simulator
-        simulator = VisualSimulator()
-        rand_seed = request.level_json.get("randSeed", 0)
-        effective_seed = request.seed if request.seed is not None else rand_seed
-        # Note: t0_assignments will be extracted from simulation results (first bot)
-        # This ensures frontend displays exact same types as simulation uses
-
-        # Calculate total tiles to determine max_moves
-        # Stack/craft tiles count as multiple tiles based on their totalCount
-        total_tiles = 0
-        level_json = request.level_json
-        num_layers = level_json.get("layer", 0)
-        for layer_idx in range(num_layers):
-            layer_key = f"layer_{layer_idx}"
-            layer_data = level_json.get(layer_key, {})
-            tiles = layer_data.get("tiles", {})
-            for pos, tile_data in tiles.items():
-                if isinstance(tile_data, list) and len(tile_data) > 0:
-                    tile_type = tile_data[0]
-                    # Check for stack/craft tiles (e.g., stack_t1, craft_t2)
-                    if isinstance(tile_type, str) and (tile_type.startswith("stack_") or tile_type.startswith("craft_")):
-                        # Get totalCount from extra_data: [totalCount] or [totalCount, "types"]
-                        extra_data = tile_data[2] if len(tile_data) > 2 else None
-                        if extra_data and isinstance(extra_data, list) and len(extra_data) >= 1:
-                            stack_count = int(extra_data[0]) if extra_data[0] else 1
-                            total_tiles += stack_count
-                        else:
-                            total_tiles += 1
-                    else:
-                        total_tiles += 1
-                else:
-                    total_tiles += 1
-
+        bot_types = _resolve_visual_bot_types(request)
+        total_tiles = _count_visual_tiles(request.level_json)
         # max_moves should be at least equal to total tiles (each move removes 1 tile)
-        # Add some buffer for potential inefficiencies
         effective_max_moves = max(request.max_moves, total_tiles)
+        args_list = _visual_bot_args(request, bot_types, effective_max_moves)
 
-        # Run simulations (reuse simulator created earlier)
-        # All bots use the same initial_state_seed (effective_seed) for consistent tile types
-        # Each bot uses a different behavior seed for varied gameplay
-        bot_results: List[VisualBotResult] = []
-        stack_craft_types: Optional[Dict[str, List[str]]] = None
-        t0_assignments: Optional[Dict[Tuple[int, str], str]] = None
-
-        # effective_seed was already calculated above from randSeed or request.seed
-        initial_state_seed = effective_seed
-
-        for i, bot_type in enumerate(bot_types):
-            # Different behavior seed per bot, but same initial state seed
-            behavior_seed = initial_state_seed + i if initial_state_seed else i
-            result, types_map, tile_assignments = simulator.simulate_bot(
-                request.level_json,
-                bot_type,
-                effective_max_moves,
-                seed=behavior_seed,
-                initial_state_seed=initial_state_seed,
-            )
-            bot_results.append(result)
+        # Bots are independent games, so run them concurrently in the worker pool
+        bot_results: List[Optional[VisualBotResult]] = [None] * len(bot_types)
+        first_types: Optional[Tuple[Dict[str, List[str]], Dict[Tuple[int, str], str]]] = None
+        async for index, (result, types_map, tile_assignments) in _iter_visual_bots(args_list):
+            bot_results[index] = result
             # Use the first bot's types for initial state
-            # (all bots now have the same types due to same initial_state_seed)
-            if i == 0:
-                stack_craft_types = types_map
-                t0_assignments = tile_assignments
+            # (all bots have the same types due to same initial_state_seed)
+            if index == 0:
+                first_types = (types_map, tile_assignments)
 
         # Extract initial state with tile types from simulation (not separately generated)
         # This ensures frontend displays exact same types as simulation uses
+        stack_craft_types, t0_assignments = first_types if first_types else (None, None)
         initial_state = extract_initial_state(request.level_json, t0_assignments, stack_craft_types)
 
         # Calculate max steps
         max_steps = max(len(r.moves) for r in bot_results) if bot_results else 0
 
-        elapsed_ms = int((time.time() - start_time) * 1000)
+        replay = None
+        if request.replay_format == "compact":
+            replay = encode_replay([r.model_dump() for r in bot_results])
+            bot_results = []
 
-        # Validate tile count (must be multiple of 3 for level to be clearable)
-        tile_count_remainder = total_tiles % 3
-        tile_count_valid = tile_count_remainder == 0
-        tile_count_message = ""
-        if not tile_count_valid:
-            if tile_count_remainder == 1:
-                tile_count_message = f"타일 {total_tiles}개 (3의 배수가 아님 - 1개 초과 또는 2개 부족)"
-            else:
-                tile_count_message = f"타일 {total_tiles}개 (3의 배수가 아님 - 2개 초과 또는 1개 부족)"
-        else:
-            tile_count_message = f"타일 {total_tiles}개 ({total_tiles // 3}세트)"
+        elapsed_ms = int((time.time() - start_time) * 1000)
 
         return VisualSimulationResponse(
             initial_state=initial_state,
@@ -1167,21 +933,319 @@ async def simulate_visual(request: VisualSimulationRequest):
             max_steps=max_steps,
             metadata={
                 "elapsed_ms": elapsed_ms,
-                "bot_count": len(bot_results),
-                "total_tiles": total_tiles,
-                "max_moves_setting": effective_max_moves,
-                "dock_slots": 7,  # Add dock info to metadata
-                "game_rules": "sp_template",  # Indicate which rules are used
-                # Tile count validation
-                "tile_count_valid": tile_count_valid,
-                "tile_count_remainder": tile_count_remainder,
-                "tile_count_message": tile_count_message,
+                "bot_count": len(bot_types),
+                "replay_format": request.replay_format,
+                **_visual_metadata(total_tiles, effective_max_moves),
             },
+            replay=replay,
         )
 
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+
+@router.post(
+    "/visual/stream",
+    responses={400: {"model": ErrorResponse}},
+    summary="Streamed visual simulation",
+    description="""
+    Same simulation as `/visual`, but bots run concurrently and each bot's
+    result is streamed as soon as it finishes, so playback can start on the
+    first bot without waiting for the slowest one.
+
+    Events (one JSON object per NDJSON line, or one SSE `data:` frame):
+    - `meta`: tile count validation and effective max_moves (sent immediately)
+    - `initial_state`: board for playback (sent with the first finished bot)
+    - `bot_result`: `{"index", "result"}` where index is the position in `bot_types`
+    - `done`: `{"max_steps", "elapsed_ms"}`
+    - `error`: `{"detail"}` if a bot simulation fails mid-stream
+    """,
+)
+async def simulate_visual_stream(
+    request: VisualSimulationRequest,
+    format: str = Query(default="ndjson", pattern="^(ndjson|sse)$", description="ndjson or sse"),
+):
+    """Stream visual simulation results per bot as NDJSON or server-sent events."""
+    try:
+        bot_types = _resolve_visual_bot_types(request)
+        total_tiles = _count_visual_tiles(request.level_json)
+        effective_max_moves = max(request.max_moves, total_tiles)
+        args_list = _visual_bot_args(request, bot_types, effective_max_moves)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    encode = encode_sse if format == "sse" else encode_ndjson
+
+    async def events() -> AsyncIterator[str]:
+        start_time = time.time()
+        yield encode("meta", {
+            "bot_types": bot_types,
+            **_visual_metadata(total_tiles, effective_max_moves),
+        })
+
+        max_steps = 0
+        initial_state_sent = False
+        try:
+            async for index, (result, types_map, tile_assignments) in _iter_visual_bots(args_list):
+                if not initial_state_sent:
+                    # Every bot shares initial_state_seed, so any bot's types are valid
+                    initial_state = extract_initial_state(request.level_json, tile_assignments, types_map)
+                    yield encode("initial_state", initial_state.model_dump())
+                    initial_state_sent = True
+                max_steps = max(max_steps, len(result.moves))
+                yield encode("bot_result", {"index": index, "result": result.model_dump()})
+        except Exception as e:
+            yield encode("error", {"detail": str(e)})
+            return
+
+        yield encode("done", {
+            "max_steps": max_steps,
+            "elapsed_ms": int((time.time() - start_time) * 1000),
+        })
+
+    media_type = "text/event-stream" if format == "sse" else "application/x-ndjson"
+    return StreamingResponse(events(), media_type=media_type)
+
+
+VALID_VISUAL_BOT_TYPES = {"novice", "casual", "average", "expert", "optimal"}
+
+
+def _resolve_visual_bot_types(request: VisualSimulationRequest) -> List[str]:
+    """Requested bot types (default: all five), validated."""
+    bot_types = request.bot_types or ["novice", "casual", "average", "expert", "optimal"]
+    for bt in bot_types:
+        if bt not in VALID_VISUAL_BOT_TYPES:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid bot type: {bt}. Valid types: {VALID_VISUAL_BOT_TYPES}"
+            )
+    return bot_types
+
+
+def _count_visual_tiles(level_json: Dict[str, Any]) -> int:
+    """Count board tiles, expanding stack/craft tiles to their totalCount."""
+    total_tiles = 0
+    num_layers = level_json.get("layer", 0)
+    for layer_idx in range(num_layers):
+        layer_data = level_json.get(f"layer_{layer_idx}", {})
+        for tile_data in layer_data.get("tiles", {}).values():
+            if isinstance(tile_data, list) and len(tile_data) > 0:
+                tile_type = tile_data[0]
+                # Check for stack/craft tiles (e.g., stack_t1, craft_t2)
+                if isinstance(tile_type, str) and (tile_type.startswith("stack_") or tile_type.startswith("craft_")):
+                    # Get totalCount from extra_data: [totalCount] or [totalCount, "types"]
+                    extra_data = tile_data[2] if len(tile_data) > 2 else None
+                    if extra_data and isinstance(extra_data, list) and len(extra_data) >= 1:
+                        total_tiles += int(extra_data[0]) if extra_data[0] else 1
+                    else:
+                        total_tiles += 1
+                else:
+                    total_tiles += 1
+            else:
+                total_tiles += 1
+    return total_tiles
+
+
+def _visual_metadata(total_tiles: int, effective_max_moves: int) -> Dict[str, Any]:
+    """Metadata shared by the buffered and streamed visual endpoints."""
+    # Validate tile count (must be multiple of 3 for level to be clearable)
+    tile_count_remainder = total_tiles % 3
+    tile_count_valid = tile_count_remainder == 0
+    if not tile_count_valid:
+        if tile_count_remainder == 1:
+            tile_count_message = f"타일 {total_tiles}개 (3의 배수가 아님 - 1개 초과 또는 2개 부족)"
+        else:
+            tile_count_message = f"타일 {total_tiles}개 (3의 배수가 아님 - 2개 초과 또는 1개 부족)"
+    else:
+        tile_count_message = f"타일 {total_tiles}개 ({total_tiles // 3}세트)"
+
+    return {
+        "total_tiles": total_tiles,
+        "max_moves_setting": effective_max_moves,
+        "dock_slots": 7,  # Add dock info to metadata
+        "game_rules": "sp_template",  # Indicate which rules are used
+        # Tile count validation
+        "tile_count_valid": tile_count_valid,
+        "tile_count_remainder": tile_count_remainder,
+        "tile_count_message": tile_count_message,
+    }
+
+
+def _visual_bot_args(
+    request: VisualSimulationRequest, bot_types: List[str], max_moves: int
+) -> List[Tuple[Dict[str, Any], str, int, int, int]]:
+    """Per-bot worker arguments.
+
+    All bots use the same initial_state_seed (request seed or randSeed) for
+    consistent tile types; each bot gets a different behavior seed.
+    """
+    initial_state_seed = request.seed if request.seed is not None else request.level_json.get("randSeed", 0)
+    return [
+        (
+            request.level_json,
+            bot_type,
+            max_moves,
+            initial_state_seed + i if initial_state_seed else i,
+            initial_state_seed,
+        )
+        for i, bot_type in enumerate(bot_types)
+    ]
+
+
+def _run_visual_bot(
+    args: Tuple[Dict[str, Any], str, int, int, int]
+) -> Tuple[VisualBotResult, Dict[str, List[str]], Dict[Tuple[int, str], str]]:
+    """
+    Top-level function for ProcessPoolExecutor (must be picklable).
+    Plays one recorded game for one bot.
+    """
+    level_json, bot_type, max_moves, behavior_seed, initial_state_seed = args
+    return VisualSimulator().simulate_bot(
+        level_json,
+        bot_type,
+        max_moves,
+        seed=behavior_seed,
+        initial_state_seed=initial_state_seed,
+    )
+
+
+async def _iter_visual_bots(
+    args_list: List[Tuple[Dict[str, Any], str, int, int, int]]
+) -> AsyncIterator[Tuple[int, Tuple[VisualBotResult, Dict[str, List[str]], Dict[Tuple[int, str], str]]]]:
+    """Run visual bots in the shared process pool, yielding (index, result) in completion order."""
+    loop = asyncio.get_running_loop()
+    pool = _get_process_pool()
+
+    async def run(index: int, args):
+        return index, await loop.run_in_executor(pool, _run_visual_bot, args)
+
+    tasks = [asyncio.ensure_future(run(i, args)) for i, args in enumerate(args_list)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        # Client went away or a bot failed: drop work that has not started yet
+        for task in tasks:
+            task.cancel()
+
+
+# =============================================================================
+# Streaming level import/export (NDJSON, optionally gzip)
+# =============================================================================
+
+# Longest accepted NDJSON line; one level is a few KB, so this only bounds memory
+MAX_NDJSON_LINE_BYTES = 8 * 1024 * 1024
+# Level ids / errors echoed back by the stream imports (the full lists grow with the set)
+STREAM_SAMPLE_IDS = 20
+
+
+def _write_json(path: Path, data: Any, indent: Optional[int] = None) -> None:
+    with open(path, 'w', encoding='utf-8') as f:
+        if indent is None:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        else:
+            json.dump(data, f, indent=indent, ensure_ascii=False)
+
+
+@dataclass
+class _ThroughputMeter:
+    """Counts bytes and levels of a streaming import/export."""
+    started: float = field(default_factory=time.perf_counter)
+    bytes_received: int = 0
+    bytes_decoded: int = 0
+    levels: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        elapsed = max(time.perf_counter() - self.started, 1e-9)
+        return {
+            "levels": self.levels,
+            "bytes_received": self.bytes_received,
+            "bytes_decoded": self.bytes_decoded,
+            "elapsed_ms": round(elapsed * 1000, 1),
+            "levels_per_second": round(self.levels / elapsed, 1),
+            "mb_per_second": round(self.bytes_decoded / elapsed / 1e6, 2),
+        }
+
+
+class _ErrorSample:
+    """Error count of a streaming import plus the first few errors."""
+
+    def __init__(self, limit: int = STREAM_SAMPLE_IDS):
+        self.limit = limit
+        self.count = 0
+        self.sample: List[Dict[str, Any]] = []
+
+    def append(self, error: Dict[str, Any]) -> None:
+        self.count += 1
+        if len(self.sample) < self.limit:
+            self.sample.append(error)
+
+
+async def _iter_ndjson(request: Request, meter: _ThroughputMeter) -> AsyncIterator[Tuple[int, Any]]:
+    """Parse a request body as NDJSON, one line at a time.
+
+    Gzip bodies are detected by their magic bytes and inflated incrementally.
+    Yields (line number, parsed object); a line that is not a JSON object
+    yields a ValueError in its place so the caller can report it and go on.
+    """
+    decompressor = None
+    buffer = b""
+    line_no = 0
+    first = True
+
+    def parse(raw: bytes):
+        try:
+            record = json.loads(raw)
+        except ValueError as e:
+            return ValueError(f"Invalid JSON: {e}")
+        if not isinstance(record, dict):
+            return ValueError("Line is not a JSON object")
+        return record
+
+    async for chunk in request.stream():
+        if not chunk:
+            continue
+        meter.bytes_received += len(chunk)
+        if first:
+            first = False
+            if chunk[:2] == b"\x1f\x8b":
+                decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+
+        pieces = [chunk] if decompressor is None else _inflate(decompressor, chunk)
+        for piece in pieces:
+            meter.bytes_decoded += len(piece)
+            buffer += piece
+            *complete, buffer = buffer.split(b"\n")
+            if len(buffer) > MAX_NDJSON_LINE_BYTES:
+                raise HTTPException(status_code=413, detail=f"NDJSON line {line_no + len(complete) + 1} too long")
+            for raw in complete:
+                line_no += 1
+                if raw.strip():
+                    yield line_no, parse(raw)
+
+    if decompressor is not None:
+        tail = decompressor.flush()
+        meter.bytes_decoded += len(tail)
+        buffer += tail
+    for raw in buffer.split(b"\n"):
+        line_no += 1
+        if raw.strip():
+            yield line_no, parse(raw)
+
+
+def _inflate(decompressor, data: bytes):
+    """Inflate a gzip chunk in bounded pieces (a small chunk may expand a lot)."""
+    while data:
+        try:
+            piece = decompressor.decompress(data, MAX_NDJSON_LINE_BYTES)
+        except zlib.error as e:
+            raise HTTPException(status_code=400, detail=f"Invalid gzip body: {e}")
+        yield piece
+        data = decompressor.unconsumed_tail
+
+
 # =============================================================================
 # Local Levels Management API
 # =============================================================================
@@ -1536,6 +1600,7 @@ async def import_generated_levels(file_content: Dict[str, Any]):
         errors = []
 
         for level_data in levels:
+            level_id = None
             try:
                 config = level_data.get("config", {})
                 level_id = config.get("level_id")
@@ -1544,29 +1609,7 @@ async def import_generated_levels(file_content: Dict[str, Any]):
                     errors.append({"error": "Missing level_id", "data": config})
                     continue
 
-                # Prepare data for saving
-                save_data = {
-                    "level_id": level_id,
-                    "level_data": level_data.get("level_json", {}),
-                    "metadata": {
-                        "name": config.get("name", level_id),
-                        "description": config.get("description", ""),
-                        "tags": config.get("tags", []) + ["generated"],
-                        "difficulty": config.get("tier", "custom"),
-                        "created_at": datetime.now().isoformat(),
-                        "source": "generated",
-                        "validation_status": level_data.get("validation_status", "unknown"),
-                        "actual_clear_rates": level_data.get("actual_clear_rates", {}),
-                        "suggestions": level_data.get("suggestions", []),
-                        "generation_config": config,
-                    }
-                }
-
-                # Save level
-                file_path = LOCAL_LEVELS_DIR / f"{level_id}.json"
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(save_data, f, indent=2, ensure_ascii=False)
-
+                _save_generated_level(level_id, level_data, indent=2)
                 imported.append(level_id)
 
             except Exception as e:
@@ -1586,6 +1629,73 @@ async def import_generated_levels(file_content: Dict[str, Any]):
         raise HTTPException(status_code=400, detail=str(e))
 
 
+def _save_generated_level(level_id: str, level_data: Dict[str, Any], indent: Optional[int] = None) -> None:
+    """Save one generator output record ({config, level_json, ...}) to local_levels."""
+    config = level_data.get("config", {})
+    save_data = {
+        "level_id": level_id,
+        "level_data": level_data.get("level_json", {}),
+        "metadata": {
+            "name": config.get("name", level_id),
+            "description": config.get("description", ""),
+            "tags": config.get("tags", []) + ["generated"],
+            "difficulty": config.get("tier", "custom"),
+            "created_at": datetime.now().isoformat(),
+            "source": "generated",
+            "validation_status": level_data.get("validation_status", "unknown"),
+            "actual_clear_rates": level_data.get("actual_clear_rates", {}),
+            "suggestions": level_data.get("suggestions", []),
+            "generation_config": config,
+        }
+    }
+    _write_json(LOCAL_LEVELS_DIR / f"{level_id}.json", save_data, indent)
+
+
+@router.post(
+    "/local/import-generated-stream",
+    summary="Stream-import generated levels",
+    description=(
+        "Import generator output as NDJSON, one level record ({config, level_json, ...}) per line, "
+        "optionally gzip-compressed. Levels are saved as they arrive, in constant memory."
+    ),
+)
+async def import_generated_levels_stream(request: Request):
+    """Import generator output one NDJSON line at a time."""
+    meter = _ThroughputMeter()
+    imported_count = 0
+    imported_sample: List[str] = []
+    errors = _ErrorSample()
+
+    async for line_no, record in _iter_ndjson(request, meter):
+        level_id = None
+        try:
+            if isinstance(record, Exception):
+                raise record
+            if record.get("type") in ("metadata", "summary"):
+                continue
+            level_id = record.get("config", {}).get("level_id")
+            if not level_id:
+                errors.append({"line": line_no, "error": "Missing level_id"})
+                continue
+
+            _save_generated_level(level_id, record)
+            imported_count += 1
+            meter.levels += 1
+            if len(imported_sample) < STREAM_SAMPLE_IDS:
+                imported_sample.append(level_id)
+        except Exception as e:
+            errors.append({"line": line_no, "level_id": level_id, "error": str(e)})
+
+    return {
+        "success": True,
+        "imported_count": imported_count,
+        "error_count": errors.count,
+        "imported_levels": imported_sample,
+        "errors": errors.sample or None,
+        "throughput": meter.to_dict(),
+    }
+
+
 @router.post(
     "/local/upload-to-server",
     summary="Upload local level to game server",
@@ -1636,9 +1746,83 @@ async def upload_to_server(level_id: str, server_config: Optional[Dict[str, Any]
 # Level Sets Management API
 # =============================================================================
 
-# Level sets storage path
-LEVEL_SETS_DIR = Path(__file__).parent.parent.parent / "storage" / "level_sets"
-LEVEL_SETS_DIR.mkdir(parents=True, exist_ok=True)
+class _LevelSetWriter:
+    """Writes a level set one level at a time.
+
+    Each level goes to the set directory and, with set metadata, to
+    local_levels for browsing. metadata.json is written last (atomically),
+    so list_level_sets only ever shows complete sets.
+    """
+
+    def __init__(self, name: str, now: Optional[datetime] = None, indent: Optional[int] = None):
+        self.now = now or datetime.now()
+        self.name = name or f"Level Set {self.now.strftime('%Y-%m-%d %H:%M')}"
+        self.indent = indent
+        while True:
+            self.set_id = f"set_{self.now.strftime('%Y%m%d_%H%M%S')}_{random.randint(100, 999)}"
+            self.set_dir = LEVEL_SETS_DIR / self.set_id
+            if not self.set_dir.exists():
+                break
+        self.set_dir.mkdir(parents=True, exist_ok=True)
+        self.count = 0
+        self.difficulties: List[float] = []
+        self.grades: List[str] = []
+
+    def add(self, level: Dict[str, Any], difficulty: Optional[float] = None, grade: Optional[str] = None) -> str:
+        self.count += 1
+        index = self.count
+        difficulty = 0.5 if difficulty is None else difficulty
+        grade = grade or "B"
+        self.difficulties.append(difficulty)
+        self.grades.append(grade)
+
+        _write_json(self.set_dir / f"level_{index:03d}.json", level, self.indent)
+
+        level_id = f"{self.set_id}_level_{index:03d}"
+        level_with_meta = {
+            **level,
+            "id": level_id,
+            "name": f"{self.name} - Level {index}",
+            "difficulty": difficulty,
+            "grade": grade,
+            "set_id": self.set_id,
+            "set_name": self.name,
+            "level_index": index,
+            "created_at": self.now.isoformat(),
+        }
+        _write_json(LOCAL_LEVELS_DIR / f"{level_id}.json", level_with_meta, self.indent)
+        return level_id
+
+    def finish(
+        self,
+        difficulty_profile: Optional[List[Any]] = None,
+        actual_difficulties: Optional[List[float]] = None,
+        grades: Optional[List[str]] = None,
+        generation_config: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        metadata = {
+            "id": self.set_id,
+            "name": self.name,
+            "created_at": self.now.isoformat(),
+            "level_count": self.count,
+            "difficulty_profile": difficulty_profile or [],
+            "actual_difficulties": self.difficulties if actual_difficulties is None else actual_difficulties,
+            "grades": self.grades if grades is None else grades,
+            "generation_config": generation_config or {},
+        }
+        tmp_path = self.set_dir / "metadata.json.tmp"
+        _write_json(tmp_path, metadata, indent=2)
+        os.replace(tmp_path, self.set_dir / "metadata.json")
+        return metadata
+
+    def abort(self) -> None:
+        """Remove everything written so far."""
+        for index in range(1, self.count + 1):
+            (LOCAL_LEVELS_DIR / f"{self.set_id}_level_{index:03d}.json").unlink(missing_ok=True)
+        if self.set_dir.exists():
+            for file in self.set_dir.iterdir():
+                file.unlink()
+            self.set_dir.rmdir()
 
 
 @router.post(
@@ -1665,57 +1849,22 @@ async def save_level_set(data: Dict[str, Any]):
         if not name:
             name = f"Level Set {now.strftime('%Y-%m-%d %H:%M')}"
 
-        # Generate unique ID
-        set_id = f"set_{now.strftime('%Y%m%d_%H%M%S')}_{random.randint(100, 999)}"
-
-        # Create set directory
-        set_dir = LEVEL_SETS_DIR / set_id
-        set_dir.mkdir(parents=True, exist_ok=True)
-
-        # Save metadata
-        metadata = {
-            "id": set_id,
-            "name": name,
-            "created_at": now.isoformat(),
-            "level_count": len(levels),
-            "difficulty_profile": difficulty_profile,
-            "actual_difficulties": actual_difficulties,
-            "grades": grades,
-            "generation_config": generation_config,
-        }
-
-        with open(set_dir / "metadata.json", 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, indent=2, ensure_ascii=False)
-
-        # Save individual levels to level set directory
-        for i, level in enumerate(levels):
-            level_file = set_dir / f"level_{i+1:03d}.json"
-            with open(level_file, 'w', encoding='utf-8') as f:
-                json.dump(level, f, indent=2, ensure_ascii=False)
-
-        # Also save each level to local_levels directory for browsing
-        for i, level in enumerate(levels):
-            # Create unique level ID with set name and index
-            level_id = f"{set_id}_level_{i+1:03d}"
-            difficulty = actual_difficulties[i] if i < len(actual_difficulties) else 0.5
-            grade = grades[i] if i < len(grades) else "B"
-
-            # Add metadata to level
-            level_with_meta = {
-                **level,
-                "id": level_id,
-                "name": f"{name} - Level {i+1}",
-                "difficulty": difficulty,
-                "grade": grade,
-                "set_id": set_id,
-                "set_name": name,
-                "level_index": i + 1,
-                "created_at": now.isoformat(),
-            }
-
-            local_level_file = LOCAL_LEVELS_DIR / f"{level_id}.json"
-            with open(local_level_file, 'w', encoding='utf-8') as f:
-                json.dump(level_with_meta, f, indent=2, ensure_ascii=False)
+        writer = _LevelSetWriter(name, now=now, indent=2)
+        try:
+            for i, level in enumerate(levels):
+                difficulty = actual_difficulties[i] if i < len(actual_difficulties) else 0.5
+                grade = grades[i] if i < len(grades) else "B"
+                writer.add(level, difficulty, grade)
+            writer.finish(
+                difficulty_profile=difficulty_profile,
+                actual_difficulties=actual_difficulties,
+                grades=grades,
+                generation_config=generation_config,
+            )
+        except Exception:
+            writer.abort()
+            raise
+        set_id = writer.set_id
 
         return {
             "success": True,
@@ -1729,6 +1878,131 @@ async def save_level_set(data: Dict[str, Any]):
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.post(
+    "/level-sets/import-stream",
+    summary="Stream-import a level set",
+    description=(
+        "Import a level set as NDJSON, optionally gzip-compressed: an optional "
+        '{"type": "metadata", "name": ...} line, then one level per line, either '
+        '{"type": "level", "level": {...}, "difficulty": ..., "grade": ...} (the export format) '
+        "or a bare level JSON. Levels are written as they arrive, in constant memory."
+    ),
+)
+async def import_level_set_stream(request: Request, name: str = Query("", description="Set name (overrides the metadata line)")):
+    """Import a level set one NDJSON line at a time."""
+    meter = _ThroughputMeter()
+    writer: Optional[_LevelSetWriter] = None
+    header: Dict[str, Any] = {}
+    errors = _ErrorSample()
+
+    try:
+        async for line_no, record in _iter_ndjson(request, meter):
+            if isinstance(record, Exception):
+                errors.append({"line": line_no, "error": str(record)})
+                continue
+            kind = record.get("type")
+            if kind == "metadata":
+                if writer is None:
+                    header = record
+                continue
+            if kind == "summary":
+                continue
+
+            if writer is None:
+                writer = _LevelSetWriter(name or header.get("name", ""))
+            if kind == "level":
+                level = record.get("level")
+                if not isinstance(level, dict):
+                    errors.append({"line": line_no, "error": "level line without a level object"})
+                    continue
+                writer.add(level, record.get("difficulty"), record.get("grade"))
+            else:
+                writer.add(record)
+            meter.levels += 1
+    except Exception as e:
+        if writer is not None:
+            writer.abort()
+        if isinstance(e, HTTPException):
+            raise
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if writer is None:
+        raise HTTPException(status_code=400, detail="No levels provided")
+
+    writer.finish(
+        difficulty_profile=header.get("difficulty_profile"),
+        generation_config=header.get("generation_config"),
+    )
+    return {
+        "success": True,
+        "id": writer.set_id,
+        "level_count": writer.count,
+        "error_count": errors.count,
+        "errors": errors.sample or None,
+        "throughput": meter.to_dict(),
+        "message": f"Level set '{writer.name}' imported with {writer.count} levels",
+    }
+
+
+@router.get(
+    "/level-sets/{set_id}/export",
+    summary="Stream-export a level set",
+    description=(
+        "Export a level set as NDJSON, one level per line (the import-stream format), "
+        "read from disk one level at a time; gzip=true returns a .ndjson.gz download. "
+        "The last line reports throughput."
+    ),
+)
+async def export_level_set_stream(set_id: str, gzip: bool = Query(False)):
+    """Stream a stored level set as NDJSON."""
+    set_dir = LEVEL_SETS_DIR / set_id
+    metadata_file = set_dir / "metadata.json"
+    if not metadata_file.exists():
+        raise HTTPException(status_code=404, detail=f"Level set {set_id} not found")
+
+    with open(metadata_file, 'r', encoding='utf-8') as f:
+        metadata = json.load(f)
+    difficulties = metadata.get("actual_difficulties", [])
+    grades = metadata.get("grades", [])
+
+    def lines():
+        meter = _ThroughputMeter()
+        yield encode_ndjson("metadata", metadata)
+        for i, level_file in enumerate(level_files(set_dir)):
+            with open(level_file, 'r', encoding='utf-8') as f:
+                level = json.load(f)
+            line = encode_ndjson("level", {
+                "index": i + 1,
+                "difficulty": difficulties[i] if i < len(difficulties) else None,
+                "grade": grades[i] if i < len(grades) else None,
+                "level": level,
+            })
+            meter.levels += 1
+            meter.bytes_decoded += len(line)
+            yield line
+        yield encode_ndjson("summary", meter.to_dict())
+
+    def body():
+        if not gzip:
+            for line in lines():
+                yield line.encode("utf-8")
+            return
+        compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+        for line in lines():
+            chunk = compressor.compress(line.encode("utf-8"))
+            if chunk:
+                yield chunk
+        yield compressor.flush()
+
+    if gzip:
+        return StreamingResponse(
+            body(),
+            media_type="application/gzip",
+            headers={"Content-Disposition": f'attachment; filename="{set_id}.ndjson.gz"'},
+        )
+    return StreamingResponse(body(), media_type="application/x-ndjson")
+
+
 @router.get(
     "/level-sets/list",
     summary="List all level sets",
@@ -1805,9 +2079,7 @@ async def get_level_set(set_id: str):
 
         # Load all levels
         levels = []
-        level_files = sorted(set_dir.glob("level_*.json"))
-
-        for level_file in level_files:
+        for level_file in level_files(set_dir):
             with open(level_file, 'r', encoding='utf-8') as f:
                 levels.append(json.load(f))
 
@@ -1822,6 +2094,82 @@ async def get_level_set(set_id: str):
         raise HTTPException(status_code=400, detail=str(e))
 
 
+def _find_level_set_duplicates(
+    set_id: str, threshold: float, include_other_sets: bool
+) -> Dict[str, Any]:
+    """Index the set (and optionally every other stored set) and collect near-duplicate pairs."""
+    index = LevelSimilarityIndex()
+    target_keys = []
+    set_dirs = sorted(LEVEL_SETS_DIR.iterdir()) if include_other_sets else [LEVEL_SETS_DIR / set_id]
+
+    for set_dir in set_dirs:
+        if not set_dir.is_dir():
+            continue
+        for level_file in level_files(set_dir):
+            try:
+                with open(level_file, 'r', encoding='utf-8') as f:
+                    level = json.load(f)
+            except (OSError, ValueError):
+                continue
+            key = f"{set_dir.name}/{level_file.stem}"
+            index.add(key, level)
+            if set_dir.name == set_id:
+                target_keys.append(key)
+
+    if include_other_sets:
+        seen = set()
+        duplicates = []
+        for key in target_keys:
+            for other, similarity in index.query_key(key, threshold):
+                pair = tuple(sorted((key, other)))
+                if pair not in seen:
+                    seen.add(pair)
+                    duplicates.append((pair[0], pair[1], similarity))
+        duplicates.sort(key=lambda d: d[2], reverse=True)
+    else:
+        duplicates = index.find_duplicates(threshold)
+
+    return {
+        "level_count": len(target_keys),
+        "compared_level_count": len(index),
+        "duplicates": [
+            {"level_a": a, "level_b": b, "similarity": round(similarity, 4)}
+            for a, b, similarity in duplicates
+        ],
+    }
+
+
+@router.get(
+    "/level-sets/{set_id}/duplicates",
+    summary="Find near-duplicate levels",
+    description="Find pairs of levels in a stored level set whose layouts are near-duplicates",
+)
+async def find_level_set_duplicates(
+    set_id: str,
+    threshold: float = Query(DEFAULT_SIMILARITY_THRESHOLD, ge=0.0, le=1.0),
+    include_other_sets: bool = Query(False, description="Also compare against every other stored set"),
+):
+    """Find near-duplicate levels using the layout similarity index."""
+    set_dir = LEVEL_SETS_DIR / set_id
+    if not set_dir.is_dir():
+        raise HTTPException(status_code=404, detail=f"Level set {set_id} not found")
+
+    try:
+        start_time = time.time()
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(
+            None, _find_level_set_duplicates, set_id, threshold, include_other_sets
+        )
+        return {
+            "set_id": set_id,
+            "threshold": threshold,
+            **result,
+            "execution_time_ms": int((time.time() - start_time) * 1000),
+        }
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.delete(
     "/level-sets/{set_id}",
     summary="Delete a level set",
@@ -0,0 +1,13 @@
+"""Event encoders for streamed (NDJSON / server-sent events) responses."""
+import json
+from typing import Any, Dict
+
+
+def encode_ndjson(event: str, data: Dict[str, Any]) -> str:
+    """One NDJSON line: the event's data with its type under ``type``."""
+    return json.dumps({"type": event, **data}, ensure_ascii=False) + "\n"
+
+
+def encode_sse(event: str, data: Dict[str, Any]) -> str:
+    """One server-sent event frame."""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
@@ -7,9 +7,12 @@ from .gboost import (
     get_gboost_client,
     parse_gboost_response,
 )
+from .gboost_mirror import GBoostMirror, get_gboost_mirror
 
 __all__ = [
     "GBoostClient",
+    "GBoostMirror",
     "get_gboost_client",
+    "get_gboost_mirror",
     "parse_gboost_response",
 ]
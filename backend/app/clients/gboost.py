@@ -1,11 +1,15 @@
 """GBoost server client for level data management."""
 import json
-import aiohttp
+import re
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 
 from ..config import get_settings
 
+# aiohttp is imported inside each request method: it is the single most
+# expensive import on the API startup path and is only needed once a
+# request actually talks to the GBoost server.
+
 
 def parse_gboost_response(data: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -54,17 +58,48 @@ def parse_gboost_response(data: Dict[str, Any]) -> Dict[str, Any]:
         if not row_id:
             continue
 
-        # Build object from keys and values
-        obj = {}
-        for i, key in enumerate(keys):
-            if key and i < len(row):  # Skip empty keys
-                obj[key] = row[i]
-
-        result[row_id] = obj
+        result[row_id] = gboost_row_to_dict(keys, row)
 
     return result
 
 
+def gboost_row_to_dict(keys: List[str], row: List[Any]) -> Dict[str, Any]:
+    """Build one object from a compressed-format row (empty keys are skipped)."""
+    return {key: row[i] for i, key in enumerate(keys) if key and i < len(row)}
+
+
+def level_number(level_id: str) -> int:
+    """First number in a level ID (level_12 -> 12), used to sort listings."""
+    match = re.search(r'\d+', level_id or "")
+    return int(match.group()) if match else 0
+
+
+def level_list_entry(level_id: str, value: Any) -> Dict[str, Any]:
+    """Listing entry (id, created_at from etime, difficulty) for one board level."""
+    level_info = {
+        "id": level_id,
+        "created_at": "",
+    }
+
+    # Extract metadata if available
+    if isinstance(value, dict):
+        if "etime" in value:
+            # Convert Unix timestamp to ISO format
+            try:
+                etime = int(value["etime"])
+                level_info["created_at"] = datetime.fromtimestamp(etime).isoformat()
+            except (ValueError, TypeError):
+                pass
+
+        if "difficulty" in value:
+            try:
+                level_info["difficulty"] = float(value["difficulty"]) / 100.0
+            except (ValueError, TypeError):
+                pass
+
+    return level_info
+
+
 class GBoostClient:
     """Client for communicating with GBoost server (townpop pattern)."""
 
@@ -134,6 +169,8 @@ class GBoostClient:
             "json": json.dumps(json_data),
         }
 
+        import aiohttp
+
         try:
             async with aiohttp.ClientSession() as session:
                 async with session.post(
@@ -192,6 +229,8 @@ class GBoostClient:
         # Townpop pattern: GET from real_array.php
         endpoint = f"{self.base_url}/real_array.php?act=load&gid={self.project_id}&bid={board_id}&id={array_id}&filter="
 
+        import aiohttp
+
         try:
             async with aiohttp.ClientSession() as session:
                 async with session.get(
@@ -239,96 +278,86 @@ class GBoostClient:
         except (aiohttp.ClientError, json.JSONDecodeError):
             return None
 
-    async def list_levels(
-        self,
-        board_id: str,
-        prefix: str = "level_",
-        limit: int = 100,
-    ) -> List[Dict[str, Any]]:
+    async def fetch_board(self, board_id: str) -> Optional[Dict[str, Any]]:
         """
-        List levels from GBoost server.
+        Download a whole board from GBoost server (real_array.php with empty id).
 
         Args:
             board_id: Board identifier.
-            prefix: Filter prefix for level IDs.
-            limit: Maximum number of results.
 
         Returns:
-            List of level metadata.
+            The raw response (usually in compressed ``__keys``/``__vals``
+            format), {} for an empty board, or None if the request failed.
         """
         if not self.is_configured:
-            return []
+            return None
 
         # Load all data from the board (empty id = all)
         endpoint = f"{self.base_url}/real_array.php?act=load&gid={self.project_id}&bid={board_id}&id=&filter="
 
+        import aiohttp
+
         try:
             async with aiohttp.ClientSession() as session:
                 async with session.get(
                     endpoint,
                     timeout=aiohttp.ClientTimeout(total=60),
                 ) as response:
-                    if response.status == 200:
-                        result_text = await response.text()
-
-                        if not result_text or result_text.strip() == "" or result_text.strip() == "{}":
-                            return []
-
-                        try:
-                            raw_result = json.loads(result_text)
+                    if response.status != 200:
+                        return None
 
-                            # Parse GBoost compressed format
-                            result = parse_gboost_response(raw_result)
+                    result_text = await response.text()
+                    if not result_text or result_text.strip() == "" or result_text.strip() == "{}":
+                        return {}
 
-                            levels = []
-
-                            for key, value in result.items():
-                                if key.startswith(prefix):
-                                    level_info = {
-                                        "id": key,
-                                        "created_at": "",
-                                    }
-
-                                    # Extract metadata if available
-                                    if isinstance(value, dict):
-                                        if "etime" in value:
-                                            # Convert Unix timestamp to ISO format
-                                            try:
-                                                etime = int(value["etime"])
-                                                level_info["created_at"] = datetime.fromtimestamp(etime).isoformat()
-                                            except (ValueError, TypeError):
-                                                pass
-
-                                        if "difficulty" in value:
-                                            try:
-                                                level_info["difficulty"] = float(value["difficulty"]) / 100.0
-                                            except (ValueError, TypeError):
-                                                pass
-
-                                    levels.append(level_info)
-
-                            # Sort by level number
-                            def get_level_num(lvl):
-                                try:
-                                    import re
-                                    match = re.search(r'\d+', lvl.get("id", ""))
-                                    return int(match.group()) if match else 0
-                                except:
-                                    return 0
-
-                            levels.sort(key=get_level_num)
-
-                            return levels[:limit]
-                        except json.JSONDecodeError as e:
-                            print(f"JSON decode error: {e}")
-                            return []
-                    else:
-                        return []
+                    try:
+                        return json.loads(result_text)
+                    except json.JSONDecodeError as e:
+                        print(f"JSON decode error: {e}")
+                        return None
 
         except aiohttp.ClientError as e:
             print(f"Client error: {e}")
+            return None
+
+    async def list_levels(
+        self,
+        board_id: str,
+        prefix: str = "level_",
+        limit: int = 100,
+    ) -> List[Dict[str, Any]]:
+        """
+        List levels from GBoost server.
+
+        Downloads the whole board; the API routes list from the local mirror
+        (gboost_mirror.GBoostMirror) instead.
+
+        Args:
+            board_id: Board identifier.
+            prefix: Filter prefix for level IDs.
+            limit: Maximum number of results.
+
+        Returns:
+            List of level metadata.
+        """
+        raw_result = await self.fetch_board(board_id)
+        if not raw_result:
             return []
 
+        # Parse GBoost compressed format
+        result = parse_gboost_response(raw_result)
+
+        levels = [
+            level_list_entry(key, value)
+            for key, value in result.items()
+            if key.startswith(prefix)
+        ]
+
+        # Sort by level number
+        levels.sort(key=lambda lvl: level_number(lvl.get("id", "")))
+
+        return levels[:limit]
+
     async def delete_level(
         self,
         board_id: str,
@@ -365,6 +394,8 @@ class GBoostClient:
             "json": json.dumps({array_id: None}),
         }
 
+        import aiohttp
+
         try:
             async with aiohttp.ClientSession() as session:
                 async with session.post(
@@ -408,6 +439,8 @@ class GBoostClient:
         # Townpop pattern: POST to real_array.php with thumbpng action
         endpoint = f"{self.base_url}/real_array.php"
 
+        import aiohttp
+
         try:
             # Use aiohttp FormData for multipart upload
             form_data = aiohttp.FormData()
@@ -467,6 +500,8 @@ class GBoostClient:
                 "error": "GBoost URL not configured",
             }
 
+        import aiohttp
+
         try:
             # Try to access a simple endpoint
             async with aiohttp.ClientSession() as session:
@@ -0,0 +1,448 @@
+"""Local on-disk mirror of GBoost boards.
+
+Listing a board on GBoost downloads and parses every level on it, and
+loading a level is one request per open. The mirror keeps a copy of each
+board under ``storage/cache/gboost_mirror/<project>/<board>/``:
+
+- ``objects/<hash>.json``: level data without ``etime``, content-addressed,
+  so a level re-saved unchanged is never rewritten and identical levels
+  share one file
+- ``index.json``: level ID -> content hash, ``etime`` and listing fields,
+  plus when the board was last synced
+
+A sync downloads the board once and only builds, hashes and writes the
+rows whose ``etime`` differs from the index. Listings and loads are served
+from the mirror while it is younger than ``gboost_mirror_max_age``;
+individual levels missing from it are fetched concurrently and added.
+
+Disk writes run in worker threads so a large sync never blocks the event
+loop. Writers update a copy of the index under a lock and swap it in when
+it is saved, so readers on the loop never see an index being changed.
+"""
+import asyncio
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from ..config import get_settings
+from .gboost import (
+    GBoostClient,
+    get_gboost_client,
+    gboost_row_to_dict,
+    level_list_entry,
+    level_number,
+)
+
+DEFAULT_MIRROR_DIR = Path(__file__).parent.parent / "storage" / "cache" / "gboost_mirror"
+
+# Concurrent GBoost requests when fetching levels missing from the mirror
+FETCH_CONCURRENCY = 8
+
+# Above this many levels to fetch, one board sync is cheaper than single loads
+SYNC_FETCH_THRESHOLD = 8
+
+# Index entry fields that are not part of a listing entry
+_INDEX_ONLY_FIELDS = ("hash", "etime", "mirrored_at")
+
+
+def content_hash(level_data: Dict[str, Any]) -> str:
+    """Stable hash of a level's data (key order does not matter, etime is ignored)."""
+    canonical = json.dumps(level_data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:24]
+
+
+def _etime(value: Any) -> Optional[str]:
+    return str(value) if value not in (None, "") else None
+
+
+def _iter_board_rows(data: Dict[str, Any]) -> Iterator[Tuple[str, Optional[str], Any]]:
+    """Yield (level_id, etime, row) for every row of a board response.
+
+    ``row`` is the raw compressed-format row (turn it into a level with
+    ``gboost_row_to_dict``) or the level object itself for responses that
+    are not compressed, so unchanged rows are never converted.
+    """
+    keys = data.get("__keys", [])
+    vals = data.get("__vals", [])
+
+    if not keys or not vals:
+        for level_id, value in data.items():
+            if isinstance(value, dict):
+                yield level_id, _etime(value.get("etime")), value
+        return
+
+    id_index = keys.index("id") if "id" in keys else 0
+    etime_index = keys.index("etime") if "etime" in keys else None
+    for row in vals:
+        if not row or len(row) != len(keys):
+            continue
+        level_id = row[id_index]
+        if not level_id:
+            continue
+        etime = _etime(row[etime_index]) if etime_index is not None else None
+        yield level_id, etime, row
+
+
+class GBoostMirror:
+    """On-disk, content-hashed mirror of the boards of one GBoost client."""
+
+    def __init__(
+        self,
+        client: GBoostClient,
+        root: Path = DEFAULT_MIRROR_DIR,
+        max_age: Optional[float] = None,
+    ):
+        self.client = client
+        self.root = root
+        self.max_age = get_settings().gboost_mirror_max_age if max_age is None else max_age
+        # board_id -> (index file mtime, index)
+        self._indexes: Dict[str, Tuple[Optional[float], Dict[str, Any]]] = {}
+        self._sync_locks: Dict[str, asyncio.Lock] = {}
+        # Held by the worker threads that change an index and its objects
+        self._write_lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    def _board_dir(self, board_id: str) -> Path:
+        return self.root / (self.client.project_id or "_") / board_id
+
+    def _object_path(self, board_id: str, digest: str) -> Path:
+        return self._board_dir(board_id) / "objects" / f"{digest}.json"
+
+    def _empty_index(self) -> Dict[str, Any]:
+        return {"source": self.client.base_url, "synced_at": None, "levels": {}}
+
+    def _index(self, board_id: str) -> Dict[str, Any]:
+        """Board index, reloaded when another worker rewrote it."""
+        path = self._board_dir(board_id) / "index.json"
+        try:
+            mtime = path.stat().st_mtime
+        except OSError:
+            mtime = None
+
+        cached = self._indexes.get(board_id)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        index = self._empty_index()
+        if mtime is not None:
+            try:
+                with open(path, encoding="utf-8") as f:
+                    loaded = json.load(f)
+                # A mirror of another server under the same project ID is not ours
+                if loaded.get("source") == self.client.base_url:
+                    index = loaded
+            except (OSError, ValueError):
+                pass
+        self._indexes[board_id] = (mtime, index)
+        return index
+
+    def _index_copy(self, board_id: str) -> Dict[str, Any]:
+        """Board index to modify and save (caller holds the write lock)."""
+        index = self._index(board_id)
+        return {**index, "levels": dict(index["levels"])}
+
+    def _save_index(self, board_id: str, index: Dict[str, Any]) -> None:
+        path = self._board_dir(board_id) / "index.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(index, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        self._indexes[board_id] = (path.stat().st_mtime, index)
+
+    def _write_object(self, board_id: str, level_data: Dict[str, Any]) -> str:
+        """Store level data (minus etime) under its content hash; returns the hash."""
+        level_data = {key: value for key, value in level_data.items() if key != "etime"}
+        digest = content_hash(level_data)
+        path = self._object_path(board_id, digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(level_data, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        return digest
+
+    def _read_object(self, board_id: str, digest: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._object_path(board_id, digest), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _remove_unreferenced_objects(self, board_id: str, index: Dict[str, Any]) -> None:
+        referenced = {entry["hash"] for entry in index["levels"].values()}
+        objects_dir = self._board_dir(board_id) / "objects"
+        if objects_dir.is_dir():
+            for path in objects_dir.glob("*.json"):
+                if path.stem not in referenced:
+                    path.unlink(missing_ok=True)
+
+    def _store_level(self, board_id: str, index: Dict[str, Any], level_id: str,
+                     level_data: Dict[str, Any], etime: Optional[str]) -> bool:
+        """Put one level into the index; returns whether its content changed."""
+        digest = self._write_object(board_id, level_data)
+        previous = index["levels"].get(level_id)
+        index["levels"][level_id] = {
+            **level_list_entry(level_id, level_data),
+            "hash": digest,
+            "etime": etime,
+        }
+        return previous is None or previous.get("hash") != digest
+
+    def is_fresh(self, board_id: str) -> bool:
+        """Whether the board was synced within ``max_age`` seconds."""
+        synced_at = self._index(board_id).get("synced_at")
+        return synced_at is not None and time.time() - synced_at < self.max_age
+
+    async def invalidate(self, board_id: str, level_id: str) -> None:
+        """Forget a level after it was saved or deleted.
+
+        The board is marked stale as well, so the next listing resyncs and
+        shows the saved level (or no longer shows the deleted one), and the
+        next load fetches it.
+        """
+        await asyncio.to_thread(self._forget_level, board_id, level_id)
+
+    def _forget_level(self, board_id: str, level_id: str) -> None:
+        with self._write_lock:
+            index = self._index_copy(board_id)
+            index["levels"].pop(level_id, None)
+            if index["synced_at"] is not None:
+                # 0 rather than None: an unreachable server still serves the mirror
+                index["synced_at"] = 0.0
+            self._save_index(board_id, index)
+
+    def clear(self, board_id: str) -> None:
+        """Delete the mirror of a board."""
+        shutil.rmtree(self._board_dir(board_id), ignore_errors=True)
+        self._indexes.pop(board_id, None)
+
+    # ------------------------------------------------------------------
+    # Sync
+    # ------------------------------------------------------------------
+
+    async def sync_board(self, board_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Bring the mirror of a board up to date with one board download.
+
+        Rows whose ``etime`` matches the index are skipped without being
+        parsed; changed rows are content-hashed and only written if their
+        data changed. Levels no longer on the board are dropped.
+
+        Args:
+            board_id: Board identifier.
+
+        Returns:
+            Sync statistics, or None if the board could not be downloaded.
+        """
+        lock = self._sync_locks.setdefault(board_id, asyncio.Lock())
+        async with lock:
+            start = time.perf_counter()
+            data = await self.client.fetch_board(board_id)
+            if data is None:
+                return None
+            download_ms = (time.perf_counter() - start) * 1000
+
+            stats = await asyncio.to_thread(self._apply_board, board_id, data)
+            stats["download_ms"] = round(download_ms, 1)
+            stats["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 1)
+            return stats
+
+    def _apply_board(self, board_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Write a downloaded board into the mirror (runs in a worker thread)."""
+        with self._write_lock:
+            index = self._index_copy(board_id)
+            levels = index["levels"]
+            keys = data.get("__keys", [])
+            seen = set()
+            stats = {"levels": 0, "unchanged": 0, "updated": 0, "removed": 0}
+
+            for level_id, etime, row in _iter_board_rows(data):
+                seen.add(level_id)
+                entry = levels.get(level_id)
+                if (etime is not None and entry is not None and entry.get("etime") == etime
+                        and self._object_path(board_id, entry["hash"]).exists()):
+                    stats["unchanged"] += 1
+                    continue
+
+                level_data = gboost_row_to_dict(keys, row) if isinstance(row, list) else row
+                if self._store_level(board_id, index, level_id, level_data, etime):
+                    stats["updated"] += 1
+                else:
+                    stats["unchanged"] += 1
+
+            for level_id in [level_id for level_id in levels if level_id not in seen]:
+                del levels[level_id]
+                stats["removed"] += 1
+
+            index["synced_at"] = time.time()
+            self._save_index(board_id, index)
+            if stats["removed"] or stats["updated"]:
+                self._remove_unreferenced_objects(board_id, index)
+
+            stats["levels"] = len(levels)
+            return stats
+
+    async def ensure_synced(self, board_id: str, refresh: bool = False) -> bool:
+        """Sync the board if it is stale (or ``refresh``); returns whether the mirror has it."""
+        if refresh or not self.is_fresh(board_id):
+            if await self.sync_board(board_id) is None:
+                # GBoost unreachable: serve whatever was mirrored before
+                return self._index(board_id)["synced_at"] is not None
+        return True
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    async def list_levels(
+        self,
+        board_id: str,
+        prefix: str = "level_",
+        limit: int = 100,
+        refresh: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Level listing (same entries as GBoostClient.list_levels) from the mirror."""
+        if not self.client.is_configured or not await self.ensure_synced(board_id, refresh):
+            return []
+
+        levels = [
+            {key: value for key, value in entry.items() if key not in _INDEX_ONLY_FIELDS}
+            for level_id, entry in self._index(board_id)["levels"].items()
+            if level_id.startswith(prefix)
+        ]
+        levels.sort(key=lambda lvl: level_number(lvl.get("id", "")))
+        return levels[:limit]
+
+    def _mirrored(self, board_id: str, level_id: str) -> Optional[Dict[str, Any]]:
+        """Load result (as GBoostClient.load_level) for a level in the mirror."""
+        index = self._index(board_id)
+        entry = index["levels"].get(level_id)
+        if entry is None:
+            return None
+        level_data = self._read_object(board_id, entry["hash"])
+        if level_data is None:
+            return None
+        if entry.get("etime") is not None:
+            level_data["etime"] = entry["etime"]
+        synced_at = entry.get("mirrored_at") or index.get("synced_at")
+        return {
+            "level_json": level_data,
+            "metadata": {
+                "id": level_id,
+                "created_at": level_data.get("etime", ""),
+                "updated_at": datetime.fromtimestamp(synced_at).isoformat() if synced_at else "",
+                "version": "1.0",
+            },
+        }
+
+    def _read_mirrored(self, board_id: str, level_ids: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """level_id -> level JSON (None if not mirrored) read from disk."""
+        levels = {}
+        for level_id in level_ids:
+            result = self._mirrored(board_id, level_id)
+            levels[level_id] = result["level_json"] if result else None
+        return levels
+
+    async def _fetch_level(self, board_id: str, level_id: str) -> Optional[Dict[str, Any]]:
+        """Load one level from GBoost and add it to the mirror."""
+        result = await self.client.load_level(board_id, level_id)
+        if result is None or not isinstance(result.get("level_json"), dict):
+            return None
+
+        await asyncio.to_thread(self._add_fetched_level, board_id, level_id, result["level_json"])
+        return result
+
+    def _add_fetched_level(self, board_id: str, level_id: str, level_data: Dict[str, Any]) -> None:
+        with self._write_lock:
+            index = self._index_copy(board_id)
+            self._store_level(board_id, index, level_id, level_data, _etime(level_data.get("etime")))
+            index["levels"][level_id]["mirrored_at"] = time.time()
+            self._save_index(board_id, index)
+
+    async def load_level(self, board_id: str, level_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a level, from the mirror while the board is fresh.
+
+        Args:
+            board_id: Board identifier.
+            level_id: Level identifier.
+
+        Returns:
+            Level JSON and metadata (as GBoostClient.load_level) or None if not found.
+        """
+        if self.is_fresh(board_id):
+            result = self._mirrored(board_id, level_id)
+            if result is not None:
+                return result
+        return await self._fetch_level(board_id, level_id)
+
+    async def get_levels(
+        self,
+        board_id: str,
+        level_ids: List[str],
+        concurrency: int = FETCH_CONCURRENCY,
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Level data for many levels of a board.
+
+        Mirrored levels are read from disk. If the board is stale and many
+        levels would need fetching, the board is synced once; otherwise the
+        missing levels are fetched concurrently (at most ``concurrency``
+        requests in flight) and added to the mirror.
+
+        Args:
+            board_id: Board identifier.
+            level_ids: Level identifiers.
+            concurrency: Maximum concurrent GBoost requests.
+
+        Returns:
+            level_id -> level JSON, or None for levels not found.
+        """
+        fresh = self.is_fresh(board_id)
+        known = self._index(board_id)["levels"]
+        to_fetch = [level_id for level_id in level_ids if not fresh or level_id not in known]
+
+        if len(to_fetch) > SYNC_FETCH_THRESHOLD and await self.sync_board(board_id) is not None:
+            # The synced board is authoritative: levels not on it do not exist
+            to_fetch = []
+
+        fetching = set(to_fetch)
+        levels = await asyncio.to_thread(
+            self._read_mirrored, board_id, [level_id for level_id in level_ids if level_id not in fetching]
+        )
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(level_id: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+            async with semaphore:
+                result = await self._fetch_level(board_id, level_id)
+            return level_id, result["level_json"] if result else None
+
+        for level_id, level_data in await asyncio.gather(*(fetch(i) for i in fetching)):
+            levels[level_id] = level_data
+
+        return {level_id: levels.get(level_id) for level_id in level_ids}
+
+
+# Singleton instance (rebuilt when the GBoost client is reconfigured)
+_mirror: Optional[GBoostMirror] = None
+
+
+def get_gboost_mirror() -> GBoostMirror:
+    """Get or create the mirror of the current GBoost client."""
+    global _mirror
+    client = get_gboost_client()
+    if _mirror is None or _mirror.client is not client:
+        _mirror = GBoostMirror(client)
+    return _mirror
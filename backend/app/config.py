@@ -25,6 +25,12 @@ class Settings(BaseSettings):
     gboost_url: Optional[str] = None
     gboost_api_key: Optional[str] = None
     gboost_project_id: Optional[str] = "6d126f4db852"
+    # Seconds a local board mirror serves listings/loads before it is re-synced
+    gboost_mirror_max_age: int = 300
+
+    # Benchmark settings
+    # Compute the benchmark dashboard in the background at startup if it is not stored yet
+    benchmark_warmup: bool = True
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -2,22 +2,37 @@
 
 This package contains the core engines for level analysis, generation,
 and simulation.
+
+Engines are imported on first attribute access so that importing a single
+submodule (e.g. ``app.core.bot_simulator`` in a process-pool child) does not
+pull in the generator and analyzer.
 """
-from .analyzer import LevelAnalyzer, get_analyzer
-from .generator import LevelGenerator, get_generator
-from .simulator import LevelSimulator, get_simulator
-from .bot_simulator import BotSimulator, get_bot_simulator
-from .difficulty_assessor import DifficultyAssessor, get_difficulty_assessor
-
-__all__ = [
-    "LevelAnalyzer",
-    "get_analyzer",
-    "LevelGenerator",
-    "get_generator",
-    "LevelSimulator",
-    "get_simulator",
-    "BotSimulator",
-    "get_bot_simulator",
-    "DifficultyAssessor",
-    "get_difficulty_assessor",
-]
+import importlib
+
+_LAZY_EXPORTS = {
+    "LevelAnalyzer": ".analyzer",
+    "get_analyzer": ".analyzer",
+    "LevelGenerator": ".generator",
+    "get_generator": ".generator",
+    "LevelSimulator": ".simulator",
+    "get_simulator": ".simulator",
+    "BotSimulator": ".bot_simulator",
+    "get_bot_simulator": ".bot_simulator",
+    "DifficultyAssessor": ".difficulty_assessor",
+    "get_difficulty_assessor": ".difficulty_assessor",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
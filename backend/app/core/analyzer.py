@@ -1,5 +1,7 @@
 """Level difficulty analyzer engine."""
-from typing import Dict, List, Any, Set, Tuple
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
 from ..models.level import (
     LevelMetrics,
     DifficultyReport,
@@ -8,6 +10,298 @@ from ..models.level import (
 )
 from ..models.gimmick_profile import GIMMICK_DIFFICULTY_WEIGHTS, GIMMICK_BASE_WEIGHT
 
+# Gimmicks counted by the analyzer, in LevelMetrics field order (also the
+# order gimmick_score sums them in)
+GIMMICK_NAMES = (
+    "chain", "frog", "link", "ice", "grass", "bomb", "curtain", "teleport", "unknown",
+)
+
+
+@lru_cache(maxsize=None)
+def attribute_gimmick(attribute: str) -> Tuple[Optional[str], int]:
+    """Gimmick an attribute counts toward and by how much.
+
+    NOTE: ice_2, ice_3, grass_2 require multiple adjacent matches, so they
+    count proportionally to their required hits. Unknown attributes count
+    toward nothing: (None, 0).
+    """
+    if attribute == "chain":
+        return "chain", 1
+    elif attribute == "frog":
+        return "frog", 1
+    elif attribute == "ice" or attribute.startswith("ice_"):
+        # ice_1 = 1 hit, ice_2 = 2 hits, ice_3 = 3 hits
+        if attribute.startswith("ice_"):
+            try:
+                return "ice", int(attribute.split("_")[1])
+            except (IndexError, ValueError):
+                return "ice", 1
+        return "ice", 1
+    elif attribute == "grass" or attribute.startswith("grass_"):
+        # grass_1 = 1 hit, grass_2 = 2 hits
+        if attribute.startswith("grass_"):
+            try:
+                return "grass", int(attribute.split("_")[1])
+            except (IndexError, ValueError):
+                return "grass", 1
+        return "grass", 1
+    elif attribute.startswith("link_"):
+        return "link", 1
+    elif attribute == "bomb" or attribute.startswith("bomb_"):
+        # bomb countdown: lower = harder (less time to defuse)
+        # bomb_3 = 3 points, bomb_4 = 2 points, bomb_5 = 1 point
+        if attribute.startswith("bomb_"):
+            try:
+                countdown = int(attribute.split("_")[1])
+                # Invert: 3 turns = 3 points, 5 turns = 1 point
+                return "bomb", max(1, 6 - countdown)
+            except (IndexError, ValueError):
+                return "bomb", 2  # Default middle value
+        return "bomb", 2  # Default: assume bomb_4
+    elif attribute == "curtain" or attribute.startswith("curtain_"):
+        return "curtain", 1
+    elif attribute == "teleport":
+        return "teleport", 1
+    elif attribute == "unknown":
+        return "unknown", 1
+    return None, 0
+
+
+def gimmick_score(gimmick_data: Dict[str, int], has_key_gimmick: bool, has_time_attack: bool) -> float:
+    """Weighted gimmick difficulty score (unified weights plus synergies) of gimmick counts."""
+    score = 0.0
+
+    # key와 time_attack은 존재 여부로 계산 (1개로 간주)
+    if has_key_gimmick:
+        score += GIMMICK_DIFFICULTY_WEIGHTS.get("key", 1.0) * GIMMICK_BASE_WEIGHT
+    if has_time_attack:
+        score += GIMMICK_DIFFICULTY_WEIGHTS.get("time_attack", 1.0) * GIMMICK_BASE_WEIGHT
+
+    # 각 기믹에 통합 가중치 적용
+    for gimmick_name, count in gimmick_data.items():
+        if count > 0:
+            weight = GIMMICK_DIFFICULTY_WEIGHTS.get(gimmick_name, 1.0)
+            score += count * weight * GIMMICK_BASE_WEIGHT
+
+    # 기믹 시너지 효과 (조합 시 난이도 상승)
+    # [v15.33] 시너지 점수 상한선: 25점, 초과분 30%만 적용
+    synergy_score = 0.0
+
+    # bomb + ice: 시간 압박 + 선택지 제한 = 매우 어려움
+    if gimmick_data["bomb"] > 0 and gimmick_data["ice"] > 0:
+        synergy_score += min(gimmick_data["bomb"], gimmick_data["ice"]) * 0.5 * GIMMICK_BASE_WEIGHT
+
+    # bomb + frog: 시간 압박 + 예측 불가능 = 매우 어려움
+    if gimmick_data["bomb"] > 0 and gimmick_data["frog"] > 0:
+        synergy_score += min(gimmick_data["bomb"], gimmick_data["frog"]) * 0.6 * GIMMICK_BASE_WEIGHT
+
+    # ice + frog: 블로킹 + 예측 불가능
+    if gimmick_data["ice"] > 0 and gimmick_data["frog"] > 0:
+        synergy_score += min(gimmick_data["ice"], gimmick_data["frog"]) * 0.4 * GIMMICK_BASE_WEIGHT
+
+    # link + ice/chain: 연결 해제 + 블로킹 조합
+    if gimmick_data["link"] > 0 and (gimmick_data["ice"] > 0 or gimmick_data["chain"] > 0):
+        blocking_count = gimmick_data["ice"] + gimmick_data["chain"]
+        synergy_score += min(gimmick_data["link"], blocking_count) * 0.4 * GIMMICK_BASE_WEIGHT
+
+    # [v15.33] ice + unknown: 얼음 아래 뭐가 있는지 모름 = 계획 수립 불가
+    # unknown이 너무 많으면 캡 적용 (최대 8개까지만 시너지 계산)
+    effective_unknown = min(gimmick_data["unknown"], 8)
+    if gimmick_data["ice"] > 0 and effective_unknown > 0:
+        synergy_score += gimmick_data["ice"] * effective_unknown * 0.3 * GIMMICK_BASE_WEIGHT
+
+    # [v15.33] chain + unknown: 체인된 unknown 타일은 순서 예측 불가
+    if gimmick_data["chain"] > 0 and effective_unknown > 0:
+        synergy_score += gimmick_data["chain"] * effective_unknown * 0.25 * GIMMICK_BASE_WEIGHT
+
+    # teleport + unknown: 숨겨진 타일이 계속 위치 변경 = 예측 불가 (v2 추가)
+    if gimmick_data["teleport"] > 0 and gimmick_data["unknown"] > 0:
+        synergy_score += min(gimmick_data["teleport"], gimmick_data["unknown"]) * 0.5 * GIMMICK_BASE_WEIGHT
+
+    # teleport + ice: 얼음 녹이기 전에 위치 변경 = 진행 방해 (v2 추가)
+    if gimmick_data["teleport"] > 0 and gimmick_data["ice"] > 0:
+        synergy_score += min(gimmick_data["teleport"], gimmick_data["ice"]) * 0.4 * GIMMICK_BASE_WEIGHT
+
+    # time_attack + 다른 기믹 조합: 시간 압박 하에서 기믹 처리는 훨씬 어려움 (v2 추가)
+    if has_time_attack:
+        total_gimmicks = sum(gimmick_data.values())
+        if total_gimmicks > 0:
+            # 기믹이 많을수록 시간 압박의 영향 증가
+            synergy_score += min(total_gimmicks, 10) * 0.3 * GIMMICK_BASE_WEIGHT
+
+    # [v15.33] excessive unknown penalty: 10개 초과 시 추가 페널티
+    # unknown이 너무 많으면 어떤 전략도 효과가 없음
+    if gimmick_data["unknown"] > 10:
+        excess_unknown = gimmick_data["unknown"] - 10
+        synergy_score += excess_unknown * 0.5 * GIMMICK_BASE_WEIGHT
+
+    # [v15.33] Apply synergy cap with stronger diminishing returns
+    # 상한선 25점으로 상향, 초과분은 30%만 적용 (더 강한 cap)
+    MAX_SYNERGY_SCORE = 25.0
+    if synergy_score > MAX_SYNERGY_SCORE:
+        excess = synergy_score - MAX_SYNERGY_SCORE
+        synergy_score = MAX_SYNERGY_SCORE + excess * 0.3
+
+    score += synergy_score
+    return score
+
+
+GOAL_PREFIXES = ("craft_", "stack_")
+
+# attribute -> (index into GIMMICK_NAMES, amount); index -1 counts toward nothing
+_attribute_slots: Dict[str, Tuple[int, int]] = {}
+
+
+def _attribute_slot(attribute: str) -> Tuple[int, int]:
+    slot = _attribute_slots.get(attribute)
+    if slot is None:
+        gimmick, amount = attribute_gimmick(attribute)
+        slot = (GIMMICK_NAMES.index(gimmick), amount) if gimmick is not None else (-1, 0)
+        _attribute_slots[attribute] = slot
+    return slot
+
+
+@dataclass
+class ExtractedLevel:
+    """Everything the analyzers read from one level, extracted in one pass."""
+    total_tiles: int
+    active_layers: int
+    goal_amount: int
+    layer_blocking: float
+    tile_type_count: Any
+    max_moves: Any
+    move_ratio: float
+    gimmicks: List[int]
+    has_key_gimmick: bool
+    has_time_attack: bool
+    layer_tiles: List[int]
+    tile_types: Dict[str, int]
+    goals: List[Dict[str, Any]]
+
+    def gimmick_counts(self) -> Dict[str, int]:
+        return dict(zip(GIMMICK_NAMES, self.gimmicks))
+
+    def to_metrics(self) -> LevelMetrics:
+        gimmicks = self.gimmick_counts()
+        return LevelMetrics(
+            total_tiles=self.total_tiles,
+            active_layers=self.active_layers,
+            chain_count=gimmicks["chain"],
+            frog_count=gimmicks["frog"],
+            link_count=gimmicks["link"],
+            ice_count=gimmicks["ice"],
+            goal_amount=self.goal_amount,
+            layer_blocking=self.layer_blocking,
+            tile_types=self.tile_types,
+            goals=self.goals,
+            tile_type_count=self.tile_type_count,
+            max_moves=self.max_moves,
+            move_ratio=self.move_ratio,
+            grass_count=gimmicks["grass"],
+            bomb_count=gimmicks["bomb"],
+            curtain_count=gimmicks["curtain"],
+            teleport_count=gimmicks["teleport"],
+            unknown_count=gimmicks["unknown"],
+            has_key_gimmick=self.has_key_gimmick,
+            has_time_attack=self.has_time_attack,
+        )
+
+
+def extract_level(level_json: Dict[str, Any]) -> ExtractedLevel:
+    """Extract one level.
+
+    Counts tile types and attributes in bulk (each distinct attribute is
+    resolved once) and only compares layers that hold tiles for blocking.
+    """
+    num_layers = level_json.get("layer", 8)
+    max_moves = level_json.get("max_moves", 30)
+    has_key_gimmick = level_json.get("unlockTile", 0) > 0
+    has_time_attack = level_json.get("timea", 0) > 0
+
+    total_tiles = 0
+    active_layers = 0
+    goal_amount = 0
+    type_counts: Dict[str, int] = {}
+    attribute_counts: Dict[str, int] = {}
+    layer_tiles = [0] * max(num_layers, 0)
+    layer_positions: Dict[int, Any] = {}
+
+    for i in range(num_layers):
+        tiles = level_json.get(f"layer_{i}", {}).get("tiles", {})
+        if not tiles:
+            continue
+
+        active_layers += 1
+        layer_positions[i] = tiles.keys()
+        count = 0
+        for tile_data in tiles.values():
+            if not isinstance(tile_data, list) or len(tile_data) < 2:
+                continue
+            count += 1
+            tile_type = tile_data[0]
+            type_counts[tile_type] = type_counts.get(tile_type, 0) + 1
+            attribute = tile_data[1]
+            if attribute:
+                attribute_counts[attribute] = attribute_counts.get(attribute, 0) + 1
+        layer_tiles[i] = count
+        total_tiles += count
+
+    gimmicks = [0] * len(GIMMICK_NAMES)
+    for attribute, occurrences in attribute_counts.items():
+        index, amount = _attribute_slot(attribute)
+        if index >= 0:
+            gimmicks[index] += amount * occurrences
+
+    # Goal tiles are rare: walk the tiles again only when the level has one
+    goals: List[Dict[str, Any]] = []
+    if any(t.startswith(GOAL_PREFIXES) for t in type_counts):
+        for i in layer_positions:
+            for tile_data in level_json[f"layer_{i}"]["tiles"].values():
+                if not isinstance(tile_data, list) or len(tile_data) < 2:
+                    continue
+                tile_type = tile_data[0]
+                if tile_type.startswith(GOAL_PREFIXES):
+                    extra = tile_data[2] if len(tile_data) > 2 else None
+                    count = extra[0] if extra and len(extra) > 0 else 1
+                    goals.append({"type": tile_type, "count": count})
+                    goal_amount += count
+
+    # How much upper layers block lower ones, weighted by height (higher
+    # layers blocking = more impact); pairs with an empty layer add nothing,
+    # so only occupied layers are visited
+    layer_blocking = 0.0
+    occupied = sorted(layer_positions, reverse=True)
+    for n, upper_layer in enumerate(occupied):
+        if upper_layer == 0:
+            continue
+        upper_positions = layer_positions[upper_layer]
+        layer_weight = (num_layers - upper_layer) * 0.5
+        for lower_layer in occupied[n + 1:]:
+            layer_blocking += len(upper_positions & layer_positions[lower_layer]) * layer_weight
+
+    # t0 = 랜덤 타일: useTileCount가 실제 타일 종류 수, 아니면 t1~t15 종류 수
+    if "t0" in type_counts:
+        tile_type_count = level_json.get("useTileCount", 5)
+    else:
+        tile_type_count = sum(1 for t in type_counts if t.startswith("t"))
+    move_ratio = total_tiles / max_moves if max_moves > 0 else 0.0
+
+    return ExtractedLevel(
+        total_tiles=total_tiles,
+        active_layers=active_layers,
+        goal_amount=goal_amount,
+        layer_blocking=layer_blocking,
+        tile_type_count=tile_type_count,
+        max_moves=max_moves,
+        move_ratio=move_ratio,
+        gimmicks=gimmicks,
+        has_key_gimmick=has_key_gimmick,
+        has_time_attack=has_time_attack,
+        layer_tiles=layer_tiles,
+        tile_types=type_counts,
+        goals=goals,
+    )
+
 
 class LevelAnalyzer:
     """Analyzes level difficulty based on various metrics."""
@@ -62,180 +356,10 @@ class LevelAnalyzer:
 
     def _extract_metrics(self, level_json: Dict[str, Any]) -> LevelMetrics:
         """Extract all metrics from level JSON."""
-        total_tiles = 0
-        active_layers = 0
-        goal_amount = 0
-        tile_types: Dict[str, int] = {}
-        goals: List[Dict[str, Any]] = []
-        layer_positions: Dict[int, Set[str]] = {}
-
-        # 모든 기믹 카운트 초기화
-        gimmick_counts: Dict[str, int] = {
-            "chain": 0,
-            "grass": 0,
-            "ice": 0,
-            "link": 0,
-            "frog": 0,
-            "bomb": 0,
-            "curtain": 0,
-            "teleport": 0,
-            "unknown": 0,
-        }
-
-        num_layers = level_json.get("layer", 8)
-        max_moves = level_json.get("max_moves", 30)  # 기본값 30
-
-        # key 기믹 체크 (레벨 필드에서)
-        unlock_tile = level_json.get("unlockTile", 0)
-        has_key_gimmick = unlock_tile > 0
-
-        # time_attack 기믹 체크 (레벨 필드에서)
-        time_attack = level_json.get("timea", 0)
-        has_time_attack = time_attack > 0
-
-        for i in range(num_layers):
-            layer_key = f"layer_{i}"
-            layer_data = level_json.get(layer_key, {})
-            tiles = layer_data.get("tiles", {})
-
-            if tiles:
-                active_layers += 1
-                layer_positions[i] = set(tiles.keys())
-
-                for pos, tile_data in tiles.items():
-                    if not isinstance(tile_data, list) or len(tile_data) < 2:
-                        continue
-
-                    tile_type = tile_data[0]
-                    attribute = tile_data[1] if len(tile_data) > 1 else ""
-                    extra = tile_data[2] if len(tile_data) > 2 else None
-
-                    total_tiles += 1
-
-                    # Count tile types
-                    tile_types[tile_type] = tile_types.get(tile_type, 0) + 1
-
-                    # Count all gimmick attributes
-                    # NOTE: ice_2, ice_3, grass_2 require multiple adjacent matches
-                    # Count them proportionally to their required hits
-                    if attribute:
-                        if attribute == "chain":
-                            gimmick_counts["chain"] += 1
-                        elif attribute == "frog":
-                            gimmick_counts["frog"] += 1
-                        elif attribute == "ice" or attribute.startswith("ice_"):
-                            # ice_1 = 1 hit, ice_2 = 2 hits, ice_3 = 3 hits
-                            if attribute.startswith("ice_"):
-                                try:
-                                    level = int(attribute.split("_")[1])
-                                    gimmick_counts["ice"] += level
-                                except (IndexError, ValueError):
-                                    gimmick_counts["ice"] += 1
-                            else:
-                                gimmick_counts["ice"] += 1
-                        elif attribute == "grass" or attribute.startswith("grass_"):
-                            # grass_1 = 1 hit, grass_2 = 2 hits
-                            if attribute.startswith("grass_"):
-                                try:
-                                    level = int(attribute.split("_")[1])
-                                    gimmick_counts["grass"] += level
-                                except (IndexError, ValueError):
-                                    gimmick_counts["grass"] += 1
-                            else:
-                                gimmick_counts["grass"] += 1
-                        elif attribute.startswith("link_"):
-                            gimmick_counts["link"] += 1
-                        elif attribute == "bomb" or attribute.startswith("bomb_"):
-                            # bomb countdown: lower = harder (less time to defuse)
-                            # bomb_3 = 3 points, bomb_4 = 2 points, bomb_5 = 1 point
-                            if attribute.startswith("bomb_"):
-                                try:
-                                    countdown = int(attribute.split("_")[1])
-                                    # Invert: 3 turns = 3 points, 5 turns = 1 point
-                                    difficulty = max(1, 6 - countdown)
-                                    gimmick_counts["bomb"] += difficulty
-                                except (IndexError, ValueError):
-                                    gimmick_counts["bomb"] += 2  # Default middle value
-                            else:
-                                gimmick_counts["bomb"] += 2  # Default: assume bomb_4
-                        elif attribute == "curtain" or attribute.startswith("curtain_"):
-                            gimmick_counts["curtain"] += 1
-                        elif attribute == "teleport":
-                            gimmick_counts["teleport"] += 1
-                        elif attribute == "unknown":
-                            gimmick_counts["unknown"] += 1
-
-                    # Extract goals (support all direction variants: s, n, e, w)
-                    if tile_type.startswith(("craft_", "stack_")):
-                        count = extra[0] if extra and len(extra) > 0 else 1
-                        goals.append({"type": tile_type, "count": count})
-                        goal_amount += count
-
-        # Calculate layer blocking score
-        layer_blocking = self._calculate_layer_blocking(layer_positions, num_layers)
-
-        # Calculate new metrics
-        # t0 사용 시 useTileCount 필드 사용, 아니면 실제 타일 타입 카운트
-        if "t0" in tile_types:
-            # t0 = 랜덤 타일, useTileCount가 실제 타일 종류 수
-            tile_type_count = level_json.get("useTileCount", 5)
-        else:
-            tile_type_count = len([t for t in tile_types.keys() if t.startswith("t")])  # t1~t15만 카운트
-        move_ratio = total_tiles / max_moves if max_moves > 0 else 0.0
-
-        return LevelMetrics(
-            total_tiles=total_tiles,
-            active_layers=active_layers,
-            chain_count=gimmick_counts["chain"],
-            frog_count=gimmick_counts["frog"],
-            link_count=gimmick_counts["link"],
-            ice_count=gimmick_counts["ice"],
-            goal_amount=goal_amount,
-            layer_blocking=layer_blocking,
-            tile_types=tile_types,
-            goals=goals,
-            tile_type_count=tile_type_count,
-            max_moves=max_moves,
-            move_ratio=move_ratio,
-            # 추가 기믹 카운트 (확장 필드로 저장)
-            grass_count=gimmick_counts["grass"],
-            bomb_count=gimmick_counts["bomb"],
-            curtain_count=gimmick_counts["curtain"],
-            teleport_count=gimmick_counts["teleport"],
-            unknown_count=gimmick_counts["unknown"],
-            has_key_gimmick=has_key_gimmick,
-            has_time_attack=has_time_attack,
-        )
-
-    def _calculate_layer_blocking(
-        self, layer_positions: Dict[int, Set[str]], num_layers: int
-    ) -> float:
-        """
-        Calculate how much upper layers block lower layers.
-
-        Higher layers blocking lower layers increases difficulty.
-        """
-        blocking_score = 0.0
-
-        for upper_layer in range(num_layers - 1, 0, -1):
-            upper_positions = layer_positions.get(upper_layer, set())
-
-            for lower_layer in range(upper_layer - 1, -1, -1):
-                lower_positions = layer_positions.get(lower_layer, set())
-
-                # Check for overlapping positions
-                overlap = upper_positions & lower_positions
-
-                # Weight by layer difference (higher layers blocking = more impact)
-                layer_weight = (num_layers - upper_layer) * 0.5
-                blocking_score += len(overlap) * layer_weight
-
-        return blocking_score
+        return extract_level(level_json).to_metrics()
 
     def _calculate_gimmick_score(self, metrics: LevelMetrics) -> float:
         """Calculate weighted gimmick difficulty score using unified weights."""
-        score = 0.0
-
         # 모든 기믹 카운트 (LevelMetrics에 정의된 필드들)
         gimmick_data = {
             "chain": metrics.chain_count,
@@ -248,105 +372,57 @@ class LevelAnalyzer:
             "teleport": metrics.teleport_count,
             "unknown": metrics.unknown_count,
         }
+        return gimmick_score(gimmick_data, metrics.has_key_gimmick, metrics.has_time_attack)
+
+    @classmethod
+    def difficulty_score(
+        cls,
+        total_tiles: int,
+        active_layers: int,
+        goal_amount: int,
+        layer_blocking: float,
+        gimmick_points: float,
+        tile_type_count: int,
+        move_ratio: float,
+    ) -> float:
+        """Difficulty score (0-100) from a level's metric terms.
 
-        # key와 time_attack은 존재 여부로 계산 (1개로 간주)
-        if metrics.has_key_gimmick:
-            score += GIMMICK_DIFFICULTY_WEIGHTS.get("key", 1.0) * GIMMICK_BASE_WEIGHT
-        if metrics.has_time_attack:
-            score += GIMMICK_DIFFICULTY_WEIGHTS.get("time_attack", 1.0) * GIMMICK_BASE_WEIGHT
-
-        # 각 기믹에 통합 가중치 적용
-        for gimmick_name, count in gimmick_data.items():
-            if count > 0:
-                weight = GIMMICK_DIFFICULTY_WEIGHTS.get(gimmick_name, 1.0)
-                score += count * weight * GIMMICK_BASE_WEIGHT
-
-        # 기믹 시너지 효과 (조합 시 난이도 상승)
-        # [v15.33] 시너지 점수 상한선: 25점, 초과분 30%만 적용
-        synergy_score = 0.0
-
-        # bomb + ice: 시간 압박 + 선택지 제한 = 매우 어려움
-        if gimmick_data["bomb"] > 0 and gimmick_data["ice"] > 0:
-            synergy_score += min(gimmick_data["bomb"], gimmick_data["ice"]) * 0.5 * GIMMICK_BASE_WEIGHT
-
-        # bomb + frog: 시간 압박 + 예측 불가능 = 매우 어려움
-        if gimmick_data["bomb"] > 0 and gimmick_data["frog"] > 0:
-            synergy_score += min(gimmick_data["bomb"], gimmick_data["frog"]) * 0.6 * GIMMICK_BASE_WEIGHT
-
-        # ice + frog: 블로킹 + 예측 불가능
-        if gimmick_data["ice"] > 0 and gimmick_data["frog"] > 0:
-            synergy_score += min(gimmick_data["ice"], gimmick_data["frog"]) * 0.4 * GIMMICK_BASE_WEIGHT
-
-        # link + ice/chain: 연결 해제 + 블로킹 조합
-        if gimmick_data["link"] > 0 and (gimmick_data["ice"] > 0 or gimmick_data["chain"] > 0):
-            blocking_count = gimmick_data["ice"] + gimmick_data["chain"]
-            synergy_score += min(gimmick_data["link"], blocking_count) * 0.4 * GIMMICK_BASE_WEIGHT
-
-        # [v15.33] ice + unknown: 얼음 아래 뭐가 있는지 모름 = 계획 수립 불가
-        # unknown이 너무 많으면 캡 적용 (최대 8개까지만 시너지 계산)
-        effective_unknown = min(gimmick_data["unknown"], 8)
-        if gimmick_data["ice"] > 0 and effective_unknown > 0:
-            synergy_score += gimmick_data["ice"] * effective_unknown * 0.3 * GIMMICK_BASE_WEIGHT
-
-        # [v15.33] chain + unknown: 체인된 unknown 타일은 순서 예측 불가
-        if gimmick_data["chain"] > 0 and effective_unknown > 0:
-            synergy_score += gimmick_data["chain"] * effective_unknown * 0.25 * GIMMICK_BASE_WEIGHT
-
-        # teleport + unknown: 숨겨진 타일이 계속 위치 변경 = 예측 불가 (v2 추가)
-        if gimmick_data["teleport"] > 0 and gimmick_data["unknown"] > 0:
-            synergy_score += min(gimmick_data["teleport"], gimmick_data["unknown"]) * 0.5 * GIMMICK_BASE_WEIGHT
-
-        # teleport + ice: 얼음 녹이기 전에 위치 변경 = 진행 방해 (v2 추가)
-        if gimmick_data["teleport"] > 0 and gimmick_data["ice"] > 0:
-            synergy_score += min(gimmick_data["teleport"], gimmick_data["ice"]) * 0.4 * GIMMICK_BASE_WEIGHT
-
-        # time_attack + 다른 기믹 조합: 시간 압박 하에서 기믹 처리는 훨씬 어려움 (v2 추가)
-        if metrics.has_time_attack:
-            total_gimmicks = sum(gimmick_data.values())
-            if total_gimmicks > 0:
-                # 기믹이 많을수록 시간 압박의 영향 증가
-                synergy_score += min(total_gimmicks, 10) * 0.3 * GIMMICK_BASE_WEIGHT
-
-        # [v15.33] excessive unknown penalty: 10개 초과 시 추가 페널티
-        # unknown이 너무 많으면 어떤 전략도 효과가 없음
-        if gimmick_data["unknown"] > 10:
-            excess_unknown = gimmick_data["unknown"] - 10
-            synergy_score += excess_unknown * 0.5 * GIMMICK_BASE_WEIGHT
-
-        # [v15.33] Apply synergy cap with stronger diminishing returns
-        # 상한선 25점으로 상향, 초과분은 30%만 적용 (더 강한 cap)
-        MAX_SYNERGY_SCORE = 25.0
-        if synergy_score > MAX_SYNERGY_SCORE:
-            excess = synergy_score - MAX_SYNERGY_SCORE
-            synergy_score = MAX_SYNERGY_SCORE + excess * 0.3
-
-        score += synergy_score
-        return score
-
-    def _calculate_score(self, metrics: LevelMetrics) -> float:
-        """Calculate difficulty score from metrics."""
+        Shared by ``analyze`` and the batch analyzer, so both score identically.
+        """
         score = 0.0
 
-        score += metrics.total_tiles * self.WEIGHTS["total_tiles"]
-        score += metrics.active_layers * self.WEIGHTS["active_layers"]
-        score += metrics.goal_amount * self.WEIGHTS["goal_amount"]
-        score += metrics.layer_blocking * self.WEIGHTS["layer_blocking"]
+        score += total_tiles * cls.WEIGHTS["total_tiles"]
+        score += active_layers * cls.WEIGHTS["active_layers"]
+        score += goal_amount * cls.WEIGHTS["goal_amount"]
+        score += layer_blocking * cls.WEIGHTS["layer_blocking"]
 
         # 통합 기믹 가중치 시스템 사용
-        score += self._calculate_gimmick_score(metrics)
+        score += gimmick_points
 
         # 타일 종류 다양성: 8종류 기준, 초과 시 어려워짐 (v2: 10종류 기준선 반영)
-        tile_type_penalty = max(0, metrics.tile_type_count - 8)
-        score += tile_type_penalty * self.WEIGHTS["tile_type_count"]
+        tile_type_penalty = max(0, tile_type_count - 8)
+        score += tile_type_penalty * cls.WEIGHTS["tile_type_count"]
 
         # 무브 여유도: 비율 2.0 기준, 초과 시 어려움 증가
-        move_ratio_penalty = max(0, metrics.move_ratio - 2.0)
-        score += move_ratio_penalty * self.WEIGHTS["move_ratio"]
+        move_ratio_penalty = max(0, move_ratio - 2.0)
+        score += move_ratio_penalty * cls.WEIGHTS["move_ratio"]
 
         # Normalize to 0-100 range
         normalized_score = score / 3.0
         return min(100.0, max(0.0, normalized_score))
 
+    def _calculate_score(self, metrics: LevelMetrics) -> float:
+        """Calculate difficulty score from metrics."""
+        return self.difficulty_score(
+            total_tiles=metrics.total_tiles,
+            active_layers=metrics.active_layers,
+            goal_amount=metrics.goal_amount,
+            layer_blocking=metrics.layer_blocking,
+            gimmick_points=self._calculate_gimmick_score(metrics),
+            tile_type_count=metrics.tile_type_count,
+            move_ratio=metrics.move_ratio,
+        )
+
     def _generate_recommendations(self, metrics: LevelMetrics) -> List[str]:
         """Generate recommendations based on metrics."""
         recommendations = []
@@ -0,0 +1,152 @@
+"""
+Batch Static Analysis
+=====================
+Static difficulty analysis of a whole level set at once.
+
+``analyze_batch`` extracts each level into one ``ExtractedLevel`` record
+(tile counts, per-layer occupancy, gimmick counts, layer blocking, ...)
+and scores and grades the levels one at a time. Extraction and scoring
+are the analyzer's own (``extract_level`` and
+``LevelAnalyzer.difficulty_score``), so scores, grades and metrics are
+identical to ``LevelAnalyzer.analyze``.
+
+Recommendations are only built when a full report of a level is
+requested. The result renders as a compact table (column names plus one
+row per level) for set-wide views such as the level distribution charts.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+from ..models.level import DifficultyGrade, DifficultyReport, LevelMetrics
+from .analyzer import GIMMICK_NAMES, ExtractedLevel, LevelAnalyzer, extract_level, gimmick_score
+
+# Table columns after level_id, in order
+TABLE_COLUMNS = (
+    "score", "grade", "total_tiles", "active_layers", "goal_amount", "layer_blocking",
+    "tile_type_count", "max_moves", "move_ratio",
+    *(f"{name}_count" for name in GIMMICK_NAMES),
+    "has_key_gimmick", "has_time_attack", "layer_tiles",
+)
+
+
+def _level_score(level: ExtractedLevel) -> float:
+    """Score of one level, through the analyzer's own scoring routine."""
+    return LevelAnalyzer.difficulty_score(
+        total_tiles=level.total_tiles,
+        active_layers=level.active_layers,
+        goal_amount=level.goal_amount,
+        layer_blocking=level.layer_blocking,
+        gimmick_points=gimmick_score(level.gimmick_counts(), level.has_key_gimmick, level.has_time_attack),
+        tile_type_count=level.tile_type_count,
+        move_ratio=level.move_ratio,
+    )
+
+
+@dataclass
+class BatchAnalysis:
+    """Static analysis of a level set, one entry per level in input order."""
+    level_ids: List[str]
+    scores: List[Optional[float]]
+    grades: List[str]
+    levels: List[Optional[ExtractedLevel]]
+    errors: Dict[int, str] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.level_ids)
+
+    def mark_failed(self, index: int, error: str) -> None:
+        """Report one level as failed (e.g. it could not be loaded)."""
+        self.scores[index] = None
+        self.grades[index] = "?"
+        self.levels[index] = None
+        self.errors[index] = error
+
+    def metrics(self, index: int) -> LevelMetrics:
+        """LevelMetrics of one level (raises ValueError if it failed to analyze)."""
+        level = self.levels[index]
+        if level is None:
+            raise ValueError(self.errors[index])
+        return level.to_metrics()
+
+    def report(self, index: int, analyzer: Optional[LevelAnalyzer] = None) -> DifficultyReport:
+        """Full report of one level, as LevelAnalyzer.analyze returns it."""
+        metrics = self.metrics(index)
+        analyzer = analyzer or LevelAnalyzer()
+        return DifficultyReport(
+            score=self.scores[index],
+            grade=DifficultyGrade(self.grades[index]),
+            metrics=metrics,
+            recommendations=analyzer._generate_recommendations(metrics),
+        )
+
+    def grade_counts(self) -> Dict[str, int]:
+        """Number of levels per grade ("?" for levels that failed)."""
+        counts = {grade.value: 0 for grade in DifficultyGrade}
+        for grade in self.grades:
+            counts[grade] = counts.get(grade, 0) + 1
+        return counts
+
+    def to_table(self) -> Dict[str, Any]:
+        """Compact table: ``columns`` names and one row per level."""
+        rows = []
+        for index, level_id in enumerate(self.level_ids):
+            level = self.levels[index]
+            if level is None:
+                rows.append([level_id, None, "?"] + [None] * (len(TABLE_COLUMNS) - 2))
+                continue
+            rows.append([
+                level_id, round(self.scores[index], 2), self.grades[index],
+                level.total_tiles, level.active_layers, level.goal_amount, level.layer_blocking,
+                level.tile_type_count, level.max_moves, round(level.move_ratio, 2),
+                *level.gimmicks,
+                level.has_key_gimmick, level.has_time_attack, level.layer_tiles,
+            ])
+        return {
+            "columns": ["level_id", *TABLE_COLUMNS],
+            "rows": rows,
+            "errors": {self.level_ids[index]: error for index, error in self.errors.items()},
+        }
+
+
+def analyze_batch(
+    levels: Sequence[Dict[str, Any]],
+    level_ids: Optional[Sequence[str]] = None,
+) -> BatchAnalysis:
+    """
+    Analyze a whole level set.
+
+    Args:
+        levels: Level JSONs.
+        level_ids: Identifiers in the same order (default: level_<index>).
+
+    Returns:
+        BatchAnalysis with scores, grades and metrics identical to
+        LevelAnalyzer.analyze; levels that fail to analyze get grade "?"
+        and an entry in ``errors``.
+    """
+    ids = list(level_ids) if level_ids is not None else [f"level_{i}" for i in range(len(levels))]
+    extracted: List[Optional[ExtractedLevel]] = []
+    errors: Dict[int, str] = {}
+    for index, level_json in enumerate(levels):
+        try:
+            extracted.append(extract_level(level_json))
+        except Exception as e:
+            extracted.append(None)
+            errors[index] = str(e)
+
+    ok = [index for index, level in enumerate(extracted) if level is not None]
+    scores: List[Optional[float]] = [None] * len(extracted)
+    for index in ok:
+        try:
+            scores[index] = _level_score(extracted[index])
+        except Exception as e:
+            # A malformed field, e.g. a non-numeric useTileCount
+            extracted[index] = None
+            errors[index] = str(e)
+
+    grades = [
+        DifficultyGrade.from_score(score).value if score is not None else "?"
+        for score in scores
+    ]
+    return BatchAnalysis(level_ids=ids, scores=scores, grades=grades, levels=extracted, errors=errors)
@@ -0,0 +1,162 @@
+"""
+Benchmark Result Store
+======================
+Caches bot simulation results for the benchmark levels so the benchmark
+dashboard and level validation do not re-simulate on every request.
+
+Entries are tied to a fingerprint of everything that determines a result:
+the benchmark level definitions, the bot profiles and ``SIMULATOR_VERSION``.
+When the fingerprint changes the store empties itself and results are
+recomputed on next use. Each entry records when it was computed.
+
+The store is persisted as one JSON file so that restarts and the other
+uvicorn workers reuse the same results.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from .bot_simulator import SIMULATOR_VERSION
+
+_MODELS_DIR = Path(__file__).parent.parent / "models"
+
+# Files whose content decides benchmark results
+FINGERPRINT_SOURCES = (
+    _MODELS_DIR / "benchmark_level.py",
+    _MODELS_DIR / "data" / "benchmark_levels.json",
+    _MODELS_DIR / "bot_profile.py",
+)
+
+DEFAULT_STORE_PATH = Path(__file__).parent.parent / "storage" / "cache" / "benchmark_results.json"
+
+
+# (source mtimes) -> fingerprint, so unchanged files are not re-hashed per lookup
+_fingerprint_memo: Dict[Tuple[int, ...], str] = {}
+
+
+def benchmark_fingerprint() -> str:
+    """Hash of the benchmark data, bot profiles and simulator version."""
+    stamps = tuple(path.stat().st_mtime_ns for path in FINGERPRINT_SOURCES)
+    fingerprint = _fingerprint_memo.get(stamps)
+    if fingerprint is None:
+        digest = hashlib.sha256(SIMULATOR_VERSION.encode())
+        for path in FINGERPRINT_SOURCES:
+            digest.update(path.name.encode())
+            digest.update(path.read_bytes())
+        fingerprint = digest.hexdigest()[:16]
+        _fingerprint_memo.clear()
+        _fingerprint_memo[stamps] = fingerprint
+    return fingerprint
+
+
+def bot_result_key(level_id: str, bot_type: str, iterations: int, max_moves: int, seed: int) -> str:
+    return f"{level_id}:{bot_type}:{iterations}:{max_moves}:{seed}"
+
+
+class BenchmarkResultStore:
+    """Fingerprinted cache of per-bot benchmark results and the dashboard."""
+
+    def __init__(self, path: Optional[Path] = DEFAULT_STORE_PATH):
+        self._path = path
+        self._lock = threading.Lock()
+        self._mtime: Optional[float] = None
+        self._data: Dict[str, Any] = self._load()
+
+    def _empty(self, fingerprint: str) -> Dict[str, Any]:
+        return {"fingerprint": fingerprint, "dashboard": None, "bot_results": {}}
+
+    def _file_mtime(self) -> Optional[float]:
+        try:
+            return self._path.stat().st_mtime if self._path is not None else None
+        except OSError:
+            return None
+
+    def _load(self) -> Dict[str, Any]:
+        self._mtime = self._file_mtime()
+        if self._mtime is not None:
+            try:
+                with open(self._path, encoding="utf-8") as f:
+                    return json.load(f)
+            except (OSError, ValueError):
+                pass
+        return self._empty("")
+
+    def _save(self) -> None:
+        if self._path is None:
+            return
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._data, f, ensure_ascii=False)
+        os.replace(tmp_path, self._path)
+        self._mtime = self._file_mtime()
+
+    def _current(self) -> Dict[str, Any]:
+        """Store contents, emptied first if the fingerprint no longer matches."""
+        if self._file_mtime() != self._mtime:
+            # Another worker wrote the file
+            self._data = self._load()
+        fingerprint = benchmark_fingerprint()
+        if self._data.get("fingerprint") != fingerprint:
+            self._data = self._empty(fingerprint)
+        return self._data
+
+    @property
+    def fingerprint(self) -> str:
+        with self._lock:
+            return self._current()["fingerprint"]
+
+    def get_bot_result(
+        self, level_id: str, bot_type: str, iterations: int, max_moves: int, seed: int
+    ) -> Optional[Dict[str, Any]]:
+        """Cached result dict (clear_rate, avg_moves, computed_at, ...) or None."""
+        key = bot_result_key(level_id, bot_type, iterations, max_moves, seed)
+        with self._lock:
+            return self._current()["bot_results"].get(key)
+
+    def put_bot_result(
+        self, level_id: str, bot_type: str, iterations: int, max_moves: int, seed: int,
+        result: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Store a result dict, stamped with ``computed_at``; returns the stored entry."""
+        key = bot_result_key(level_id, bot_type, iterations, max_moves, seed)
+        entry = {**result, "computed_at": datetime.now().isoformat()}
+        with self._lock:
+            self._current()["bot_results"][key] = entry
+            self._save()
+        return entry
+
+    def get_dashboard(self) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._current()["dashboard"]
+
+    def put_dashboard(self, dashboard: Dict[str, Any]) -> Dict[str, Any]:
+        """Store the dashboard, stamped with ``computed_at`` and the fingerprint."""
+        with self._lock:
+            current = self._current()
+            entry = {**dashboard, "computed_at": datetime.now().isoformat(),
+                     "fingerprint": current["fingerprint"]}
+            current["dashboard"] = entry
+            self._save()
+        return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data = self._empty(benchmark_fingerprint())
+            self._save()
+
+
+_store: Optional[BenchmarkResultStore] = None
+
+
+def get_benchmark_store() -> BenchmarkResultStore:
+    """Get or create the benchmark result store singleton."""
+    global _store
+    if _store is None:
+        _store = BenchmarkResultStore()
+    return _store
@@ -8,14 +8,29 @@ Based on sp_template TileGroup/Dock/TileEffect mechanics:
 """
 import random
 import math
-from typing import Dict, List, Any, Optional, Tuple, Set
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Sequence, Tuple, Set
 from dataclasses import dataclass, field
-from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, ProcessPoolExecutor, as_completed, wait
 import statistics
+import time
 from enum import Enum
 import os
 
 from ..models.bot_profile import BotProfile, BotType, BotTeam, get_profile
+from .common_random_numbers import CRN_STREAMS, new_crn_seed, paired_difference, stream_seed
+from .endgame_solver import ENDGAME_MAX_TILES, solve_endgame
+from .coverage_graph import (
+    BLOCKING_OFFSETS_SAME_PARITY,
+    BLOCKING_OFFSETS_UPPER_BIGGER,
+    BLOCKING_OFFSETS_UPPER_SMALLER,
+    CoverageGraph,
+    blocking_offsets,
+)
+
+# Version of the game rules and bot behavior. Bump it whenever a change makes
+# simulations of the same level and seed give different results, so stored
+# results (see benchmark_store) are recomputed.
+SIMULATOR_VERSION = "15.32"
 
 
 # ============================================================
@@ -41,7 +56,6 @@ class zWellRandom:
         """Initialize state array with seed (matches C# implementation)."""
         if seed == 0:
             # In C#, it uses DateTime. For Python, we use a default.
-            import time
             seed = int(time.time()) & 0xFFFFFFFF
 
         # Ensure seed is unsigned 32-bit
@@ -103,6 +117,38 @@ class zWellRandom:
 
         return s + (self._rand() % range_size)
 
+    @classmethod
+    def rand_sequence(cls, seed: int, count: int, s: int, e: int) -> List[int]:
+        """Draw ``count`` values of rand(s, e) from a fresh generator for ``seed``.
+
+        Equivalent to ``[zWellRandom(seed).rand(s, e) for _ in range(count)]``
+        on one generator, with the state update inlined, which is several
+        times faster than going through _rand() for a whole sequence.
+        """
+        range_size = e - s + 1
+        if range_size <= 0:
+            return [0] * count
+
+        mask = 0xFFFFFFFF
+        state = cls(seed)._state
+        index = 0
+        values = []
+        append = values.append
+        for _ in range(count):
+            a = state[index]
+            c = state[(index + 13) & 15]
+            b = (a ^ c ^ (a << 16) ^ (c << 15)) & mask
+            c = state[(index + 9) & 15]
+            c ^= c >> 11
+            a = b ^ c
+            state[index] = a
+            index = (index + 15) & 15
+            z0 = state[index]
+            result = (z0 ^ (z0 << 2) ^ b ^ (b << 18) ^ (c << 28) ^ a ^ ((a << 5) & 0xDA442D24)) & mask
+            state[index] = result
+            append(s + result % range_size)
+        return values
+
 
 # ============================================================
 # TileDistributor - t0 Tile Distribution Logic Port from Unity C#
@@ -308,6 +354,33 @@ class TileDistributor:
         # Initialize zWellRandom with seed
         rng = zWellRandom(rand_seed if rand_seed > 0 else 0)
 
+        assignments = TileDistributor.unshuffled_t0_tiles(
+            t0_count, use_tile_count, type_imbalance, unlock_tile, tile_type_offset, existing_tile_counts
+        )
+
+        # Shuffle tile positions
+        shuffle_count = t0_count + shuffle_tile
+        assignments = TileDistributor.shuffle_tile_assignments(assignments, rng, shuffle_count)
+
+        return assignments
+
+    @staticmethod
+    def unshuffled_t0_tiles(
+        t0_count: int,
+        use_tile_count: int,
+        type_imbalance: int = 0,
+        unlock_tile: int = 0,
+        tile_type_offset: int = 0,
+        existing_tile_counts: Optional[Dict[str, int]] = None
+    ) -> List[str]:
+        """t0 tile types in distribution order, before the seeded shuffle.
+
+        Depends only on the level settings, not on randSeed, so callers that
+        shuffle for many seeds compute it once.
+        """
+        if t0_count <= 0 or use_tile_count <= 0:
+            return []
+
         # Calculate set count (3 tiles per set)
         set_count = t0_count // 3
 
@@ -360,29 +433,59 @@ class TileDistributor:
 
             assignments.append(tile_type)
 
-        # Shuffle tile positions
-        shuffle_count = t0_count + shuffle_tile
-        assignments = TileDistributor.shuffle_tile_assignments(assignments, rng, shuffle_count)
-
         return assignments
 
+    @staticmethod
+    def shuffle_for_seed(assignments: List[str], seed: int, shuffle_count: int) -> List[str]:
+        """shuffle_tile_assignments() with a fresh zWellRandom(seed), on a copy.
+
+        The swap indices come from one zWellRandom.rand_sequence call.
+        """
+        result = assignments.copy()
+        if not assignments or shuffle_count <= 0:
+            return result
+
+        swaps = zWellRandom.rand_sequence(seed, 2 * shuffle_count, 0, len(assignments) - 1)
+        for k in range(0, len(swaps), 2):
+            idx1 = swaps[k]
+            idx2 = swaps[k + 1]
+            result[idx1], result[idx2] = result[idx2], result[idx1]
+        return result
+
+
+def _decrement_count(counts: Dict[str, int], key: str) -> None:
+    """Decrement a counter dict entry, dropping it at zero."""
+    remaining = counts.get(key, 0) - 1
+    if remaining > 0:
+        counts[key] = remaining
+    else:
+        counts.pop(key, None)
+
 
 # ============================================================
 # Module-level ProcessPoolExecutor for CPU-bound bot simulations
 # Enables true CPU parallelism (bypasses GIL)
 # ============================================================
 _process_pool: ProcessPoolExecutor | None = None
+PROCESS_POOL_WORKERS = min(5, os.cpu_count() or 4)
+
+# simulate_many: target wall time of one (level, bot, iteration chunk) task.
+# Long enough that pickling the level is noise, short enough that the chunks
+# of the last levels spread over every worker instead of trailing on one.
+SIMULATE_MANY_CHUNK_MS = 250.0
+# Tasks kept queued per worker; the input iterator is only read this far ahead
+SIMULATE_MANY_TASKS_PER_WORKER = 4
 
 def _get_process_pool() -> ProcessPoolExecutor:
     """Get or create the module-level ProcessPoolExecutor for bot simulations."""
     global _process_pool
     if _process_pool is None:
-        workers = min(5, os.cpu_count() or 4)
+        workers = PROCESS_POOL_WORKERS
         _process_pool = ProcessPoolExecutor(max_workers=workers)
     return _process_pool
 
 
-def _simulate_bot_process(args: Tuple[dict, str, int, int, Optional[int], bool, bool]) -> 'BotSimulationResult':
+def _simulate_bot_process(args: Tuple[dict, str, int, int, Optional[int], bool, bool, Optional[int]]) -> 'BotSimulationResult':
     """
     Top-level function for ProcessPoolExecutor (must be picklable).
     Runs a single bot simulation in a separate process for true CPU parallelism.
@@ -395,24 +498,94 @@ def _simulate_bot_process(args: Tuple[dict, str, int, int, Optional[int], bool,
         seed: Random seed
         fast_mode: Use fast verification profiles
         early_termination: Enable early termination optimization
+        crn_seed: Common random numbers seed (optional 8th item)
     """
-    # Support both old 5-tuple and new 7-tuple format for backwards compatibility
+    # Support old 5-tuple and 7-tuple formats for backwards compatibility
+    crn_seed = None
     if len(args) == 5:
         level_json, bot_type_value, iterations, max_moves, seed = args
         fast_mode = False
         early_termination = False
-    else:
+    elif len(args) == 7:
         level_json, bot_type_value, iterations, max_moves, seed, fast_mode, early_termination = args
+    else:
+        level_json, bot_type_value, iterations, max_moves, seed, fast_mode, early_termination, crn_seed = args
 
     simulator = BotSimulator()
     profile = get_profile(BotType(bot_type_value), fast_mode=fast_mode)
     result = simulator.simulate_with_profile(
         level_json, profile, iterations=iterations, max_moves=max_moves, seed=seed,
-        early_termination=early_termination
+        early_termination=early_termination, crn_seed=crn_seed,
     )
     return result
 
 
+def _simulate_single_bot(args: Tuple) -> Tuple[str, float, float, List[bool]]:
+    """
+    Top-level function for ProcessPoolExecutor (must be picklable).
+    Returns (bot_type_value, clear_rate, elapsed_ms, cleared_runs) for one bot on one level.
+
+    Args tuple: (bot_type_value, level_json, iterations, max_moves[, crn_seed]);
+    with a crn_seed, cleared_runs can be paired with other runs of the same seed.
+
+    Lives here rather than in the generate route so spawned pool children
+    only import this module, not the FastAPI route graph.
+    """
+    bot_type_value, level_json, iterations, max_moves = args[:4]
+    crn_seed = args[4] if len(args) > 4 else None
+    simulator = BotSimulator()
+    profile = get_profile(BotType(bot_type_value))
+    result = simulator.simulate_with_profile(
+        level_json, profile, iterations=iterations, max_moves=max_moves, crn_seed=crn_seed,
+    )
+    return bot_type_value, result.clear_rate, result.elapsed_ms, result.cleared_runs
+
+
+def _simulate_chunk_process(args: Tuple[dict, BotProfile, int, Optional[int], Optional[int], Optional[int], int]) -> 'BotSimulationResult':
+    """
+    Top-level function for ProcessPoolExecutor (must be picklable).
+    Runs one iteration chunk of one bot on one level for simulate_many.
+
+    Args tuple: (level_json, profile, iterations, max_moves, seed, crn_seed, first_iteration)
+    """
+    level_json, profile, iterations, max_moves, seed, crn_seed, first_iteration = args
+    return BotSimulator().simulate_with_profile(
+        level_json, profile, iterations=iterations, max_moves=max_moves, seed=seed,
+        crn_seed=crn_seed, first_iteration=first_iteration,
+    )
+
+
+def _merge_chunk_results(chunks: List['BotSimulationResult']) -> 'BotSimulationResult':
+    """Combine the iteration chunks of one bot on one level, in iteration order."""
+    if len(chunks) == 1:
+        return chunks[0]
+    n = sum(c.iterations for c in chunks)
+
+    def pooled(attr: str) -> float:
+        return sum(getattr(c, attr) * c.iterations for c in chunks) / n if n else 0.0
+
+    avg_moves = pooled("avg_moves")
+    # Pooled sample variance: within-chunk spread plus spread of the chunk means
+    squares = sum(
+        (c.iterations - 1) * c.std_moves ** 2 + c.iterations * (c.avg_moves - avg_moves) ** 2
+        for c in chunks if c.iterations
+    )
+    return BotSimulationResult(
+        bot_type=chunks[0].bot_type,
+        bot_name=chunks[0].bot_name,
+        iterations=n,
+        clear_rate=pooled("clear_rate"),
+        avg_moves=avg_moves,
+        min_moves=min(c.min_moves for c in chunks),
+        max_moves=max(c.max_moves for c in chunks),
+        std_moves=math.sqrt(squares / (n - 1)) if n > 1 else 0,
+        avg_combo=pooled("avg_combo"),
+        avg_tiles_cleared=pooled("avg_tiles_cleared"),
+        elapsed_ms=sum(c.elapsed_ms for c in chunks),
+        cleared_runs=[cleared for c in chunks for cleared in c.cleared_runs],
+    )
+
+
 class TileEffectType(str, Enum):
     """Tile effect types matching sp_template TileEffectType enum."""
     NONE = "none"
@@ -436,17 +609,25 @@ class TileEffectType(str, Enum):
     STACK_WEST = "stack_w"
 
 
-@dataclass
+@dataclass(slots=True)
 class TileState:
-    """Represents a tile's current state."""
+    """Represents a tile's current state.
+
+    Slotted, with one typed attribute per effect value, since every simulated
+    game holds a copy of each tile of the level.
+    """
     tile_type: str  # t0, t1, t2, ... t15, t16(key)
     layer_idx: int
     x_idx: int
     y_idx: int
     effect_type: TileEffectType = TileEffectType.NONE
-    effect_data: Dict[str, Any] = field(default_factory=dict)
-    # Ice: remaining layers (1-3), Chain: unlocked (bool), Grass: remaining (1-2)
-    # Link: linked_tile_pos, Bomb: remaining_count, Curtain: is_open
+    # Effect values; each is only meaningful for its effect type
+    remaining: int = 0  # Ice: remaining layers (1-3), Grass: remaining (1-2), Bomb: countdown
+    unlocked: bool = False  # Chain
+    link_can_pick: bool = False  # Link: whether the linked pair is currently pickable
+    linked_pos: str = ""  # Link: position of the linked tile in the same layer
+    on_frog: bool = False  # Any tile: a frog sits on it
+    is_open: bool = True  # Curtain
     picked: bool = False
 
     # Stack/Craft tile fields (matching sp_template Tile.cs)
@@ -466,6 +647,17 @@ class TileState:
     def position_key(self) -> str:
         return f"{self.x_idx}_{self.y_idx}"
 
+    def copy(self) -> "TileState":
+        """Independent copy of this tile (all fields are immutable values)."""
+        return TileState(
+            self.tile_type, self.layer_idx, self.x_idx, self.y_idx, self.effect_type,
+            self.remaining, self.unlocked, self.link_can_pick, self.linked_pos, self.on_frog,
+            self.is_open, self.picked, self.is_stack_tile, self.is_craft_tile, self.is_crafted,
+            self.stack_index, self.stack_max_index, self.upper_stacked_tile_key,
+            self.under_stacked_tile_key, self.root_stacked_tile_key, self.craft_direction,
+            self.origin_goal_type, self.original_full_key,
+        )
+
     @property
     def full_key(self) -> str:
         """Full key including layer and stack index for unique identification."""
@@ -485,25 +677,25 @@ class TileState:
 
         # sp_template checks onFrog BEFORE effect type switch
         # A frog can move to ANY tile, making it unpickable
-        if self.effect_data.get("on_frog", False):
+        if self.on_frog:
             return False
 
         if self.effect_type == TileEffectType.ICE:
-            return self.effect_data.get("remaining", 0) <= 0
+            return self.remaining <= 0
         elif self.effect_type == TileEffectType.CHAIN:
-            return self.effect_data.get("unlocked", False)
+            return self.unlocked
         elif self.effect_type == TileEffectType.GRASS:
-            return self.effect_data.get("remaining", 0) <= 0
+            return self.remaining <= 0
         elif self.effect_type in (TileEffectType.LINK_EAST, TileEffectType.LINK_WEST,
                                    TileEffectType.LINK_SOUTH, TileEffectType.LINK_NORTH):
-            return self.effect_data.get("can_pick", False)
+            return self.link_can_pick
         elif self.effect_type == TileEffectType.CURTAIN:
-            return self.effect_data.get("is_open", True)
+            return self.is_open
         else:
             return True
 
 
-@dataclass
+@dataclass(slots=True)
 class DockSlot:
     """Represents a slot in the 7-slot dock queue."""
     index: int
@@ -511,7 +703,7 @@ class DockSlot:
     is_locked: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class GameState:
     """Represents the current state of a simulated game."""
     # Layer structure: layer_idx -> {pos_key: TileState}
@@ -556,7 +748,7 @@ class GameState:
     # Performance optimization: cached max layer index
     _max_layer_idx: int = -1
     # Performance optimization: blocking status cache (full_key -> is_blocked)
-    # Invalidated when tiles are picked
+    # Invalidated when tiles are picked; entries under a newly placed tile are dropped
     _blocking_cache: Dict[str, bool] = field(default_factory=dict)
     # Performance optimization: accessible tiles cache
     _accessible_cache: Optional[List['TileState']] = None
@@ -570,6 +762,40 @@ class GameState:
     _blocking_map: Optional[Dict[str, Set[str]]] = None
     # reverse_blocking_map: tile_key -> set of lower tile keys it blocks
     _reverse_blocking_map: Optional[Dict[str, Set[str]]] = None
+    # Incrementally maintained board counters (see BotSimulator._init_tile_counters)
+    # remaining: unpicked tiles in `tiles`; exposed: remaining and not covered by an upper layer
+    remaining_tile_count: int = 0
+    remaining_type_counts: Dict[str, int] = field(default_factory=dict)  # tile_type -> count
+    exposed_type_counts: Dict[str, int] = field(default_factory=dict)  # tile_type -> count
+    # (layer_idx, pos) -> number of unpicked upper-layer tiles covering that slot
+    _cover_counts: Dict[Tuple[int, str], int] = field(default_factory=dict)
+    # (layer_idx, pos) -> tile type currently counted in exposed_type_counts
+    _exposed_slots: Dict[Tuple[int, str], str] = field(default_factory=dict)
+    _counters_ready: bool = False
+    # Exposed-gimmick frontier (see BotSimulator._init_gimmick_frontier)
+    # Bomb/curtain/ice/grass/chain tiles get integer ids at setup; the id tables are shared by copies
+    _gimmick_ids: Dict[Tuple[int, str], int] = field(default_factory=dict)  # (layer_idx, pos) -> id
+    _gimmick_slots: List[Tuple[int, str]] = field(default_factory=list)  # id -> (layer_idx, pos)
+    _gimmick_kinds: List[str] = field(default_factory=list)  # id -> "bomb", "curtain", ...
+    # kind -> ids of gimmick tiles still in effect, split by whether an upper tile covers them
+    gimmick_exposed: Dict[str, Set[int]] = field(default_factory=dict)
+    gimmick_covered: Dict[str, Set[int]] = field(default_factory=dict)
+    # "grass"/"chain" -> ids that can no longer be cleared (any entry means the level is lost)
+    gimmick_stuck: Dict[str, Set[int]] = field(default_factory=dict)
+    unpicked_ice_count: int = 0  # unpicked ICE tiles, melted or not
+    # (layer_idx, pos) -> position in board scan order (keeps frog target order stable)
+    _slot_order: Dict[Tuple[int, str], int] = field(default_factory=dict)
+    _next_slot_order: int = 0
+    _frog_slots: Set[Tuple[int, str]] = field(default_factory=set)  # slots of tiles carrying a frog
+    # LINK partners precomputed at setup (same layer only); shared by copies
+    _link_slots: List[Tuple[int, str]] = field(default_factory=list)  # LINK tile slots in board order
+    _link_sources: Dict[Tuple[int, str], List[str]] = field(default_factory=dict)  # target slot -> source positions
+    # Pickable-move frontier (see BotSimulator._get_pickable_tiles)
+    _pickable_slots: Set[Tuple[int, str]] = field(default_factory=set)  # slots passing _can_pick_tile
+    _pickable_dirty: Set[Tuple[int, str]] = field(default_factory=set)  # slots to re-check before next use
+    # Endgame solver (see BotSimulator._endgame_move): remaining winning line, or proven loss
+    _endgame_line: List[Tuple[int, str]] = field(default_factory=list)
+    _endgame_lost: bool = False
 
 
 @dataclass
@@ -586,6 +812,51 @@ class Move:
     linked_tiles: List[Tuple[int, str]] = field(default_factory=list)  # [(layer_idx, position), ...] for link pairs
 
 
+@dataclass
+class ScoringContext:
+    """Board facts shared by every move scored in one turn.
+
+    Built once per turn by BotSimulator._build_scoring_context and read by
+    _score_move_with_profile. The gimmick section is only needed by
+    blocking-aware profiles, so it is filled on first use.
+    """
+    dock_count: int = 0
+    dock_type_counts: Dict[str, int] = field(default_factory=dict)  # tile_type -> tiles in dock
+    accessible_type_counts: Dict[str, int] = field(default_factory=dict)  # pickable tiles by type
+    remaining_accessible: int = 0  # sum of accessible_type_counts
+    goals_total: int = 0
+    has_locked_slots: bool = False
+    unlocked_slots: int = 0
+    # Gimmick section (see BotSimulator._fill_gimmick_scoring_context)
+    gimmicks_ready: bool = False
+    # (layer_idx, x, y) of a pick -> blocked chains/grass it would leave unclearable
+    isolating_chains: Dict[Tuple[int, int, int], int] = field(default_factory=dict)
+    isolating_grass: Dict[Tuple[int, int, int], int] = field(default_factory=dict)
+    exposed_bomb_slots: Set[Tuple[int, str]] = field(default_factory=set)
+    min_bomb_remaining: float = float('inf')
+    exposed_ice_count: int = 0
+    blocked_ice_count: int = 0
+    last_tile_layer_idx: int = 0  # layer of the last tile in board scan order
+    accessible_count: int = 0  # unpicked tiles
+    effect_blocked_count: int = 0  # unpicked ICE/CHAIN/GRASS/LINK tiles that cannot be picked
+
+
+@dataclass
+class SeedTemplate:
+    """Layout-dependent initial state of a level, retyped per randSeed.
+
+    Built once by BotSimulator._create_seed_template. Only the t0 tiles
+    change between seeds; parsing, gimmicks, stack/craft structure and the
+    blocking map are shared through BotSimulator._fast_copy_state.
+    """
+    base_state: GameState
+    # (layer_idx, pos, stacked_key) per t0 assignment index; the tile lives in
+    # state.stacked_tiles[stacked_key] if stacked_key is set, else state.tiles[layer_idx][pos]
+    t0_slots: List[Tuple[int, str, Optional[str]]] = field(default_factory=list)
+    unshuffled: List[str] = field(default_factory=list)  # t0 types before the seeded shuffle
+    shuffle_count: int = 0
+
+
 @dataclass
 class BotSimulationResult:
     """Result from a single bot's simulation runs."""
@@ -599,6 +870,8 @@ class BotSimulationResult:
     std_moves: float
     avg_combo: float
     avg_tiles_cleared: float
+    elapsed_ms: float = 0.0  # Wall time of the whole run (cost model calibration)
+    cleared_runs: List[bool] = field(default_factory=list)  # Outcome per iteration (paired comparisons)
 
     def to_dict(self) -> Dict:
         return {
@@ -625,6 +898,9 @@ class MultiBotAssessmentResult:
     difficulty_variance: float
     recommended_moves: int
     analysis_summary: Dict[str, Any]
+    # Paired clear-rate differences between neighbouring bots ("casual_vs_novice"),
+    # only filled in common random numbers mode
+    paired_differences: Dict[str, Dict[str, Any]] = field(default_factory=dict)
 
     def to_dict(self) -> Dict:
         return {
@@ -635,9 +911,78 @@ class MultiBotAssessmentResult:
             "difficulty_variance": round(self.difficulty_variance, 4),
             "recommended_moves": self.recommended_moves,
             "analysis_summary": self.analysis_summary,
+            "paired_differences": self.paired_differences,
+        }
+
+
+@dataclass
+class LevelSimulationResult:
+    """Result of simulate_many for one level of the input."""
+    index: int  # Position of the level in the input iterator
+    level_json: Dict[str, Any]
+    bot_results: List[BotSimulationResult]  # In the order of the requested profiles
+    elapsed_ms: float = 0.0  # From the level's first task submitted to its last one done
+    error: Optional[str] = None  # Set when a task failed; bot_results is then empty
+
+    def to_dict(self) -> Dict:
+        return {
+            "index": self.index,
+            "bot_results": [r.to_dict() for r in self.bot_results],
+            "elapsed_ms": round(self.elapsed_ms, 1),
+            "error": self.error,
         }
 
 
+class MoveObserver:
+    """Hooks called by BotSimulator._play_game while a game is played.
+
+    Subclass and override what is needed; observers must not modify the
+    state. Visual playback (VisualSimulator) and MoveRecorder are built on
+    these hooks, so recording moves never needs a second copy of the rules.
+    """
+
+    def on_game_start(self, state: GameState) -> None:
+        """Called once before the first move."""
+
+    def before_move(self, state: GameState, move: Move, moves: List[Move], solved: bool) -> None:
+        """Called with the selected move and all candidates, before it is applied.
+
+        solved is True when the move follows a solved endgame line; the
+        candidates are then not scored.
+        """
+
+    def after_move(self, state: GameState, move: Move, tiles_cleared: int) -> None:
+        """Called once the move and its effects (frog, bomb, curtain, ...) are resolved."""
+
+    def on_game_end(self, state: GameState) -> None:
+        """Called with the final state (cleared/failed set)."""
+
+
+@dataclass
+class RecordedGame:
+    """Moves of one game recorded by MoveRecorder."""
+    moves: List[Tuple[int, str, str]] = field(default_factory=list)  # (layer_idx, position, tile_type)
+    cleared: bool = False
+    moves_used: int = 0
+
+
+class MoveRecorder(MoveObserver):
+    """Record the picks of every game of a run, e.g. simulate_with_profile(observer=...)."""
+
+    def __init__(self):
+        self.games: List[RecordedGame] = []
+
+    def on_game_start(self, state: GameState) -> None:
+        self.games.append(RecordedGame())
+
+    def before_move(self, state: GameState, move: Move, moves: List[Move], solved: bool) -> None:
+        self.games[-1].moves.append((move.layer_idx, move.position, move.tile_type))
+
+    def on_game_end(self, state: GameState) -> None:
+        self.games[-1].cleared = state.cleared
+        self.games[-1].moves_used = state.moves_used
+
+
 class BotSimulatorConfig:
     """Feature flags for bot simulation accuracy improvements.
 
@@ -735,13 +1080,25 @@ class BotSimulator:
         "stack_s", "stack_n", "stack_e", "stack_w",
     }
 
-    # Precomputed blocking offsets for _is_blocked_by_upper (tuples for performance)
-    # Same parity: only check same position
-    BLOCKING_OFFSETS_SAME_PARITY = ((0, 0),)
-    # Different parity, upper layer bigger: check 4 positions
-    BLOCKING_OFFSETS_UPPER_BIGGER = ((0, 0), (1, 0), (0, 1), (1, 1))
-    # Different parity, upper layer smaller or equal: check 4 positions
-    BLOCKING_OFFSETS_UPPER_SMALLER = ((-1, -1), (0, -1), (-1, 0), (0, 0))
+    # Blocking offsets shared with the generator (see coverage_graph)
+    BLOCKING_OFFSETS_SAME_PARITY = BLOCKING_OFFSETS_SAME_PARITY
+    BLOCKING_OFFSETS_UPPER_BIGGER = BLOCKING_OFFSETS_UPPER_BIGGER
+    BLOCKING_OFFSETS_UPPER_SMALLER = BLOCKING_OFFSETS_UPPER_SMALLER
+
+    # Gimmick effects tracked by the exposed-gimmick frontier (effect -> frontier kind)
+    GIMMICK_FRONTIER_KINDS = {
+        TileEffectType.BOMB: "bomb",
+        TileEffectType.CURTAIN: "curtain",
+        TileEffectType.ICE: "ice",
+        TileEffectType.GRASS: "grass",
+        TileEffectType.CHAIN: "chain",
+    }
+    # Frontier kinds that can become impossible to clear when their neighbors run out
+    NEIGHBOR_GIMMICK_KINDS = ("grass", "chain")
+    LINK_EFFECT_TYPES = (
+        TileEffectType.LINK_EAST, TileEffectType.LINK_WEST,
+        TileEffectType.LINK_SOUTH, TileEffectType.LINK_NORTH,
+    )
 
     # Effect type mapping from level JSON
     EFFECT_MAPPING = {
@@ -770,6 +1127,9 @@ class BotSimulator:
 
     def __init__(self):
         self._rng = random.Random()
+        # Per-purpose streams for bot decisions; they all share _rng except
+        # during a common-random-numbers run (see common_random_numbers)
+        self._join_crn_streams()
 
     # Early termination constants
     EARLY_TERM_MIN_ITERATIONS = 5  # Minimum iterations before checking early termination (reduced from 10)
@@ -784,6 +1144,9 @@ class BotSimulator:
         seed: Optional[int] = None,
         honor_zero_seed: bool = False,
         early_termination: bool = False,
+        crn_seed: Optional[int] = None,
+        first_iteration: int = 0,
+        observer: Optional[MoveObserver] = None,
     ) -> BotSimulationResult:
         """Run simulation with a specific bot profile.
 
@@ -793,53 +1156,123 @@ class BotSimulator:
         3. Early termination when results are statistically conclusive
 
         randSeed behavior (matches actual game):
-        - randSeed = 0 + honor_zero_seed=True: Each iteration uses different random seed (slow, accurate)
+        - randSeed = 0 + honor_zero_seed=True: Each iteration uses different random seed (accurate;
+          only the t0 assignment is redone per iteration, see _create_seed_template)
         - randSeed = 0 + honor_zero_seed=False: Use seed 0 as fixed (fast, for generation/validation)
         - randSeed > 0: All iterations use the same fixed seed (fast)
 
         Args:
-            honor_zero_seed: If True and randSeed=0, simulate random seed per play (slower but accurate).
+            honor_zero_seed: If True and randSeed=0, simulate random seed per play (accurate).
                            If False, treat randSeed=0 as a fixed seed for fast validation.
                            Default False for performance during level generation.
             early_termination: If True, stop early when results are statistically conclusive.
                              (100% or 0% clear rate after minimum iterations)
+            crn_seed: Common random numbers mode. Iteration i draws from streams
+                     seeded by (crn_seed, i) only, so runs of other bots or other
+                     levels with the same crn_seed can be compared pairwise with
+                     paired_difference(). Overrides seed.
+            first_iteration: Index of the first iteration for per-iteration seeding,
+                     so a run split into chunks (simulate_many) plays exactly the
+                     iterations of one run of the whole count.
+            observer: Notified of every move of every iteration, e.g. a
+                     MoveRecorder to keep the games of this run (in-process only).
         """
-        if seed is not None:
+        start_time = time.perf_counter()
+        if crn_seed is not None:
+            self._split_crn_streams()
+            self._rng.seed(stream_seed(crn_seed, -1, "layout"))
+        elif seed is not None:
             self._rng.seed(seed)
 
         # Use level's max_moves if not specified
         if max_moves is None:
             max_moves = level_json.get("max_moves", 30)
 
+        try:
+            results = self._run_iterations(
+                level_json, profile, iterations, max_moves, seed, honor_zero_seed,
+                early_termination, crn_seed, first_iteration, observer,
+            )
+        finally:
+            if crn_seed is not None:
+                self._join_crn_streams()
+
+        actual_iterations = len(results)
+        cleared_runs = [r.cleared for r in results]
+        cleared_count = sum(cleared_runs)
+        moves_list = [r.moves_used for r in results]
+        combo_list = [r.combo_count for r in results]
+        tiles_list = [r.total_tiles_cleared for r in results]
+
+        return BotSimulationResult(
+            bot_type=profile.bot_type,
+            bot_name=profile.name,
+            iterations=actual_iterations,  # Report actual iterations run
+            clear_rate=cleared_count / actual_iterations if actual_iterations > 0 else 0,
+            avg_moves=statistics.mean(moves_list) if moves_list else 0,
+            min_moves=min(moves_list) if moves_list else 0,
+            max_moves=max(moves_list) if moves_list else max_moves,
+            std_moves=statistics.stdev(moves_list) if len(moves_list) > 1 else 0,
+            avg_combo=statistics.mean(combo_list) if combo_list else 0,
+            avg_tiles_cleared=statistics.mean(tiles_list) if tiles_list else 0,
+            elapsed_ms=(time.perf_counter() - start_time) * 1000,
+            cleared_runs=cleared_runs,
+        )
+
+    def _split_crn_streams(self) -> None:
+        """Give every decision purpose its own stream for a CRN run."""
+        for name in CRN_STREAMS[1:]:
+            setattr(self, f"_rng_{name}", random.Random())
+
+    def _join_crn_streams(self) -> None:
+        """Route every decision purpose back through the shared _rng."""
+        for name in CRN_STREAMS[1:]:
+            setattr(self, f"_rng_{name}", self._rng)
+
+    def _seed_crn_streams(self, crn_seed: int, iteration: int) -> None:
+        """Reseed all streams for one iteration of a CRN run."""
+        self._rng.seed(stream_seed(crn_seed, iteration, "layout"))
+        for name in CRN_STREAMS[1:]:
+            getattr(self, f"_rng_{name}").seed(stream_seed(crn_seed, iteration, name))
+
+    def _run_iterations(
+        self,
+        level_json: Dict[str, Any],
+        profile: BotProfile,
+        iterations: int,
+        max_moves: int,
+        seed: Optional[int],
+        honor_zero_seed: bool,
+        early_termination: bool,
+        crn_seed: Optional[int],
+        first_iteration: int = 0,
+        observer: Optional[MoveObserver] = None,
+    ) -> List[GameState]:
+        """Play the iterations of simulate_with_profile and return the final states."""
         # Check randSeed mode: 0 = random each play (only if honor_zero_seed=True), >0 = fixed seed
         level_rand_seed = level_json.get("randSeed", 0)
         use_random_seed_per_iteration = (level_rand_seed == 0 and honor_zero_seed)
 
         results: List[GameState] = []
-        actual_iterations = 0
 
         if use_random_seed_per_iteration:
             # randSeed = 0 with honor_zero_seed=True: Each iteration gets a different random seed
             # This simulates the actual game behavior where each play has different t0 distribution
-            # NOTE: This is slower but more accurate for final difficulty assessment
-            for i in range(iterations):
-                if seed is not None:
+            # Layout, gimmicks and blocking map are built once; only t0 types are redone per seed
+            template = self._create_seed_template(level_json, max_moves)
+
+            for i in range(first_iteration, first_iteration + iterations):
+                if crn_seed is not None:
+                    self._seed_crn_streams(crn_seed, i)
+                elif seed is not None:
                     self._rng.seed(seed + i)
 
                 # Generate a random seed for this iteration
                 iteration_seed = self._rng.randint(1, 999999)
+                state = self._create_seeded_state(template, iteration_seed)
 
-                # Create modified level_json with the random seed
-                level_with_seed = level_json.copy()
-                level_with_seed["randSeed"] = iteration_seed
-
-                # Create fresh initial state with this seed's t0 distribution
-                state = self._create_initial_state(level_with_seed, max_moves)
-                self._precompute_blocking_map(state)
-
-                final_state = self._play_game(state, profile)
+                final_state = self._play_game(state, profile, observer)
                 results.append(final_state)
-                actual_iterations += 1
 
                 # Early termination check
                 if early_termination and self._should_terminate_early(results, iterations):
@@ -852,38 +1285,99 @@ class BotSimulator:
             # OPTIMIZATION 2: Precompute all blocking relationships
             self._precompute_blocking_map(base_state)
 
-            for i in range(iterations):
-                if seed is not None:
+            for i in range(first_iteration, first_iteration + iterations):
+                if crn_seed is not None:
+                    self._seed_crn_streams(crn_seed, i)
+                elif seed is not None:
                     self._rng.seed(seed + i)
 
                 # OPTIMIZATION 3: Fast copy instead of full re-parse
                 state = self._fast_copy_state(base_state)
-                final_state = self._play_game(state, profile)
+                final_state = self._play_game(state, profile, observer)
                 results.append(final_state)
-                actual_iterations += 1
 
                 # Early termination check
                 if early_termination and self._should_terminate_early(results, iterations):
                     break
 
-        cleared_count = sum(1 for r in results if r.cleared)
-        moves_list = [r.moves_used for r in results]
-        combo_list = [r.combo_count for r in results]
-        tiles_list = [r.total_tiles_cleared for r in results]
+        return results
 
-        return BotSimulationResult(
-            bot_type=profile.bot_type,
-            bot_name=profile.name,
-            iterations=actual_iterations,  # Report actual iterations run
-            clear_rate=cleared_count / actual_iterations if actual_iterations > 0 else 0,
-            avg_moves=statistics.mean(moves_list) if moves_list else 0,
-            min_moves=min(moves_list) if moves_list else 0,
-            max_moves=max(moves_list) if moves_list else max_moves,
-            std_moves=statistics.stdev(moves_list) if len(moves_list) > 1 else 0,
-            avg_combo=statistics.mean(combo_list) if combo_list else 0,
-            avg_tiles_cleared=statistics.mean(tiles_list) if tiles_list else 0,
+    def _create_seed_template(self, level_json: Dict[str, Any], max_moves: int) -> SeedTemplate:
+        """Build the seed-independent part of a level's initial state once.
+
+        The base state is created with the level's own randSeed; its t0 tiles
+        are overwritten by _create_seeded_state for every simulated seed.
+        """
+        base_state = self._create_initial_state(level_json, max_moves)
+        self._precompute_blocking_map(base_state)
+
+        t0_tiles, distribution = self._collect_t0_tiles(level_json)
+        template = SeedTemplate(
+            base_state=base_state,
+            unshuffled=TileDistributor.unshuffled_t0_tiles(
+                distribution["t0_count"],
+                distribution["use_tile_count"],
+                distribution["type_imbalance"],
+                distribution["unlock_tile"],
+                distribution["tile_type_offset"],
+                distribution["existing_tile_counts"],
+            ),
+            shuffle_count=distribution["t0_count"] + distribution["shuffle_tile"],
         )
 
+        # Stack/craft internals are found by their original key; the top of a
+        # stack and an emitted craft tile sit in state.tiles instead of stacked_tiles
+        board_stack_slots: Dict[str, Tuple[int, str]] = {}
+        for layer_idx, layer_tiles in base_state.tiles.items():
+            for pos, tile in layer_tiles.items():
+                if tile.is_stack_tile:
+                    board_stack_slots[tile.original_full_key] = (layer_idx, pos)
+
+        for layer_idx, key, _ in t0_tiles:
+            if "_stack_" not in key:
+                template.t0_slots.append((layer_idx, key, None))
+                continue
+            pos, stack_idx = key.split("_stack_")
+            parts = pos.split("_")
+            full_key = f"{layer_idx}_{int(parts[0])}_{int(parts[1])}_{stack_idx}"
+            if full_key in base_state.stacked_tiles:
+                template.t0_slots.append((layer_idx, pos, full_key))
+            else:
+                board_layer, board_pos = board_stack_slots[full_key]
+                template.t0_slots.append((board_layer, board_pos, None))
+
+        return template
+
+    def _create_seeded_state(self, template: SeedTemplate, rand_seed: int) -> GameState:
+        """Initial state for one randSeed, equal to _create_initial_state with that seed."""
+        state = self._fast_copy_state(template.base_state)
+        assignments = TileDistributor.shuffle_for_seed(template.unshuffled, rand_seed, template.shuffle_count)
+
+        for (layer_idx, pos, stacked_key), tile_type in zip(template.t0_slots, assignments):
+            if stacked_key is not None:
+                state.stacked_tiles[stacked_key].tile_type = tile_type
+            else:
+                state.tiles[layer_idx][pos].tile_type = tile_type
+
+        # Type counters were copied from the base seed; recount them in board order
+        self._calculate_all_tile_counts(state)
+        remaining: Dict[str, int] = {}
+        for layer_tiles in state.tiles.values():
+            for tile in layer_tiles.values():
+                if not tile.picked:
+                    remaining[tile.tile_type] = remaining.get(tile.tile_type, 0) + 1
+        state.remaining_type_counts = remaining
+
+        exposed: Dict[str, int] = {}
+        exposed_slots = state._exposed_slots
+        for slot in exposed_slots:
+            tile_type = state.tiles[slot[0]][slot[1]].tile_type
+            exposed_slots[slot] = tile_type
+            exposed[tile_type] = exposed.get(tile_type, 0) + 1
+        state.exposed_type_counts = exposed
+
+        return state
+
     def _should_terminate_early(self, results: List[GameState], target_iterations: int) -> bool:
         """Check if we should terminate early based on current results.
 
@@ -932,6 +1426,7 @@ class BotSimulator:
         seed: Optional[int] = None,
         fast_mode: bool = False,
         early_termination: bool = False,
+        common_random_numbers: bool = False,
     ) -> MultiBotAssessmentResult:
         """Run multi-bot assessment to determine level difficulty.
 
@@ -943,10 +1438,17 @@ class BotSimulator:
             seed: Random seed
             fast_mode: Use fast verification profiles (reduced lookahead)
             early_termination: Stop iterations early when results are conclusive
+            common_random_numbers: Play iteration i of every bot with the same
+                random draws (seeded from seed if given) and report paired
+                clear-rate differences between neighbouring bots
         """
         if team is None:
             team = BotTeam.default_team(iterations_per_bot=100)
 
+        crn_seed = None
+        if common_random_numbers:
+            crn_seed = seed if seed else new_crn_seed()
+
         bot_results: List[BotSimulationResult] = []
 
         if parallel and len(team.profiles) > 1:
@@ -954,7 +1456,7 @@ class BotSimulator:
             pool = _get_process_pool()
             args_list = [
                 (level_json, profile.bot_type.value, team.iterations_per_bot, max_moves,
-                 seed + i if seed else None, fast_mode, early_termination)
+                 seed + i if seed else None, fast_mode, early_termination, crn_seed)
                 for i, profile in enumerate(team.profiles)
             ]
             futures = [pool.submit(_simulate_bot_process, args) for args in args_list]
@@ -973,11 +1475,160 @@ class BotSimulator:
                     max_moves,
                     seed + i if seed else None,
                     early_termination=early_termination,
+                    crn_seed=crn_seed,
                 )
                 bot_results.append(result)
 
         bot_results.sort(key=lambda r: BotType.all_types().index(r.bot_type))
-        return self._aggregate_results(bot_results, team, max_moves)
+        assessment = self._aggregate_results(bot_results, team, max_moves)
+        if crn_seed is not None:
+            for weaker, stronger in zip(bot_results, bot_results[1:]):
+                key = f"{stronger.bot_type.value}_vs_{weaker.bot_type.value}"
+                assessment.paired_differences[key] = paired_difference(
+                    stronger.cleared_runs, weaker.cleared_runs
+                ).to_dict()
+        return assessment
+
+    def simulate_many(
+        self,
+        levels: Iterable[Dict[str, Any]],
+        profiles: Sequence[BotProfile],
+        iterations: int = 100,
+        max_moves: Optional[int] = None,
+        seed: Optional[int] = None,
+        crn_seed: Optional[int] = None,
+        chunk_iterations: Optional[int] = None,
+        parallel: bool = True,
+        workers: Optional[int] = None,
+    ) -> Iterator[LevelSimulationResult]:
+        """Simulate every profile on every level of a level set, streaming results.
+
+        Each (level, bot) run is split into iteration chunks sized by the
+        simulation cost model to take about SIMULATE_MANY_CHUNK_MS, and the
+        chunks go to one process pool whose workers pull the next task as
+        soon as they are free, so no worker idles behind a slow level while
+        tasks are left. Levels are read lazily from ``levels`` (a generator
+        works) and only as far as keeps every worker busy; a level's result
+        is yielded as soon as its last chunk is done, so results arrive out
+        of input order (use ``index``).
+
+        Chunks seed their iterations by absolute index (first_iteration), so
+        with a seed or crn_seed a level's result has the same cleared_runs
+        as one simulate_with_profile call with all iterations.
+
+        Args:
+            levels: Level data, e.g. a generator over a level set directory
+            profiles: Bot profiles to run on every level
+            iterations: Iterations per bot per level
+            max_moves: Maximum moves (default: each level's own max_moves)
+            seed: Random seed, the same for every bot (as simulate_with_profile)
+            crn_seed: Common random numbers seed (see simulate_with_profile)
+            chunk_iterations: Iterations per task instead of the cost-model size
+            parallel: Use the process pool; otherwise run in this process, in order
+            workers: Dedicated pool size for this call (e.g. os.cpu_count() in
+                batch scripts); default shares the module pool
+        """
+        if not parallel:
+            for index, level_json in enumerate(levels):
+                start = time.perf_counter()
+                try:
+                    bot_results = [
+                        self.simulate_with_profile(
+                            level_json, profile, iterations, max_moves, seed, crn_seed=crn_seed,
+                        )
+                        for profile in profiles
+                    ]
+                    error = None
+                except Exception as e:
+                    bot_results, error = [], str(e)
+                yield LevelSimulationResult(
+                    index=index, level_json=level_json, bot_results=bot_results,
+                    elapsed_ms=(time.perf_counter() - start) * 1000, error=error,
+                )
+            return
+
+        # Imported here: the cost model pulls in the analyzer, which pool workers never need
+        from .simulation_cost import FALLBACK_COST_MS, get_simulation_cost_model
+        try:
+            cost_model = get_simulation_cost_model()
+        except FileNotFoundError:
+            cost_model = None
+
+        def level_tasks(level_json: Dict[str, Any]) -> List[Tuple[int, tuple, float]]:
+            bots = [profile.bot_type.value for profile in profiles]
+            if cost_model is not None:
+                costs = cost_model.predict(level_json, bots, max_moves=max_moves)
+            else:
+                costs = {bot: FALLBACK_COST_MS for bot in bots}
+            tasks = []
+            for p, profile in enumerate(profiles):
+                cost = costs[profile.bot_type.value]
+                size = chunk_iterations or int(SIMULATE_MANY_CHUNK_MS / cost)
+                size = max(1, min(iterations, size))
+                for first in range(0, iterations, size):
+                    count = min(size, iterations - first)
+                    args = (level_json, profile, count, max_moves, seed, crn_seed, first)
+                    tasks.append((p, args, cost * count))
+            # Longest chunks first, so the short ones fill the gaps at the end
+            tasks.sort(key=lambda task: -task[2])
+            return tasks
+
+        own_pool = workers is not None
+        pool = ProcessPoolExecutor(max_workers=workers) if own_pool else _get_process_pool()
+        max_pending = (workers or PROCESS_POOL_WORKERS) * SIMULATE_MANY_TASKS_PER_WORKER
+
+        # Per open level: [level_json, chunk results per profile, tasks left, start time, error]
+        open_levels: Dict[int, list] = {}
+        pending: Dict[Any, Tuple[int, int, int]] = {}  # future -> (level index, profile index, first iteration)
+        level_iter = enumerate(levels)
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(pending) < max_pending:
+                    item = next(level_iter, None)
+                    if item is None:
+                        exhausted = True
+                        break
+                    index, level_json = item
+                    try:
+                        tasks = level_tasks(level_json)
+                    except Exception as e:
+                        yield LevelSimulationResult(index=index, level_json=level_json, bot_results=[], error=str(e))
+                        continue
+                    open_levels[index] = [level_json, [[] for _ in profiles], len(tasks), time.perf_counter(), None]
+                    for p, args, _ in tasks:
+                        pending[pool.submit(_simulate_chunk_process, args)] = (index, p, args[-1])
+                if not pending:
+                    break
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, p, first = pending.pop(future)
+                    entry = open_levels[index]
+                    try:
+                        entry[1][p].append((first, future.result()))
+                    except Exception as e:
+                        entry[4] = entry[4] or str(e)
+                    entry[2] -= 1
+                    if entry[2]:
+                        continue
+
+                    level_json, chunks, _, start, error = open_levels.pop(index)
+                    bot_results = []
+                    if error is None:
+                        for profile_chunks in chunks:
+                            profile_chunks.sort(key=lambda chunk: chunk[0])
+                            bot_results.append(_merge_chunk_results([c for _, c in profile_chunks]))
+                    yield LevelSimulationResult(
+                        index=index, level_json=level_json, bot_results=bot_results,
+                        elapsed_ms=(time.perf_counter() - start) * 1000, error=error,
+                    )
+        finally:
+            # Consumer stopped early (or failed): drop the queued tasks
+            for future in pending:
+                future.cancel()
+            if own_pool:
+                pool.shutdown(wait=True, cancel_futures=True)
 
     def _create_initial_state(
         self, level_json: Dict[str, Any], max_moves: int
@@ -1012,96 +1663,12 @@ class BotSimulator:
 
         # Get level settings for t0 distribution (sp_template compatible)
         rand_seed = level_json.get("randSeed", 0)
-        use_tile_count = level_json.get("useTileCount", self.DEFAULT_USE_TILE_COUNT)
-        if use_tile_count <= 0:
-            use_tile_count = self.DEFAULT_USE_TILE_COUNT
-        # CRITICAL: Cap use_tile_count to MAX_USE_TILE_COUNT for playable levels
-        # Even if level JSON specifies more types, limit to prevent impossible levels
-        use_tile_count = min(use_tile_count, self.MAX_USE_TILE_COUNT)
-
-        # Additional level settings for exact in-game t0 distribution matching
-        shuffle_tile = level_json.get("xShuffleTile", 0)
-        type_imbalance = level_json.get("xTypeImbalance", 0)
-        # NOTE: unlock_tile is already read above for dock initialization
-
-        # First pass: collect ALL t0 tiles AND count existing t1~t15 tiles AND explicit key tiles
-        # This includes:
-        # 1. Regular t0 tiles on the board
-        # 2. t0 tiles INSIDE stack/craft containers
-        # 3. Existing t1~t15 tiles (need to track for proper t0 distribution)
-        # 4. Explicit "key" tiles (need to subtract from unlock_tile for t0 distribution)
-        t0_tiles: List[Tuple[int, str, Any]] = []  # (layer_idx, pos_key, tile_data)
-        existing_tile_counts: Dict[str, int] = {}  # t1~t15 counts
-        explicit_key_count = 0  # Count of explicit "key" tiles in level JSON
-
-        for layer_idx in range(num_layers):
-            layer_key = f"layer_{layer_idx}"
-            layer_data = level_json.get(layer_key, {})
-            layer_tiles = layer_data.get("tiles", {})
-
-            if layer_tiles:
-                for pos, tile_data in layer_tiles.items():
-                    if not isinstance(tile_data, list) or not tile_data:
-                        continue
-                    tile_type = tile_data[0]
-
-                    # Check if this is a stack/craft tile with hidden t0 tiles inside
-                    is_stack = isinstance(tile_type, str) and tile_type.startswith("stack_")
-                    is_craft = isinstance(tile_type, str) and tile_type.startswith("craft_")
-
-                    if is_stack or is_craft:
-                        # Stack/craft tiles contain internal t0 tiles
-                        # [count] = number of internal tiles to output
-                        stack_info = tile_data[2] if len(tile_data) > 2 else None
-                        if stack_info and isinstance(stack_info, list) and len(stack_info) > 0:
-                            internal_count = int(stack_info[0]) if stack_info[0] else 1
-                            # Add internal t0 tiles for distribution
-                            # Order: bottom to top (stack_idx 0, 1, 2, ...)
-                            for stack_idx in range(internal_count):
-                                t0_tiles.append((layer_idx, f"{pos}_stack_{stack_idx}", tile_data))
-                    elif tile_type == "t0":
-                        # Regular t0 tile
-                        t0_tiles.append((layer_idx, pos, tile_data))
-                    elif tile_type == "key":
-                        # Explicit key tile - count it (don't generate more from t0)
-                        explicit_key_count += 1
-                    elif isinstance(tile_type, str) and tile_type.startswith("t") and tile_type[1:].isdigit():
-                        # Existing t1~t15 tile - count it
-                        tile_num = int(tile_type[1:])
-                        if 1 <= tile_num <= 15:
-                            existing_tile_counts[tile_type] = existing_tile_counts.get(tile_type, 0) + 1
-
-        # Detect tile type offset from existing tiles
-        # If level uses t11~t15 instead of t1~t5, we need to offset t0 assignments
-        tile_type_offset = 0
-        if existing_tile_counts:
-            # Get the minimum tile number from existing tiles (e.g., 11 for t11~t15)
-            min_tile_num = min(int(t[1:]) for t in existing_tile_counts.keys())
-            # If tiles start at t11 or higher, calculate offset
-            # Offset = min_tile_num - 1 (so t1 becomes t11, t2 becomes t12, etc.)
-            if min_tile_num > use_tile_count:
-                tile_type_offset = min_tile_num - 1
-
-        # Calculate effective unlock_tile for t0 distribution
-        # If level already has explicit "key" tiles, reduce the number of keys to generate
-        # Each unlock_tile generates 3 key tiles, so we need: unlock_tile * 3 total keys
-        # effective_unlock_tile = max(0, unlock_tile - (explicit_key_count // 3))
-        # This prevents double key generation when level JSON has explicit keys
-        explicit_key_sets = explicit_key_count // 3
-        effective_unlock_tile = max(0, unlock_tile - explicit_key_sets)
+        t0_tiles, distribution = self._collect_t0_tiles(level_json)
+        use_tile_count = distribution["use_tile_count"]
 
         # Generate tile type assignments for ALL t0 tiles
         # Use TileDistributor for exact in-game matching (zWellRandom + original algorithm)
-        t0_assignments = TileDistributor.assign_t0_tiles(
-            t0_count=len(t0_tiles),
-            use_tile_count=use_tile_count,
-            rand_seed=rand_seed,
-            shuffle_tile=shuffle_tile,
-            type_imbalance=type_imbalance,
-            unlock_tile=effective_unlock_tile,  # Use adjusted value to prevent double key generation
-            tile_type_offset=tile_type_offset,
-            existing_tile_counts=existing_tile_counts  # For GetToAddIndexList logic
-        )
+        t0_assignments = TileDistributor.assign_t0_tiles(rand_seed=rand_seed, **distribution)
 
         # Create a mapping for quick lookup
         t0_assignment_map: Dict[Tuple[int, str], str] = {}
@@ -1119,7 +1686,7 @@ class BotSimulator:
             layer_tiles = layer_data.get("tiles", {})
 
             # Store layer col for blocking calculation (sp_template uses col comparison)
-            layer_col = layer_data.get("col", 7)
+            layer_col = int(layer_data.get("col", 7))
             state.layer_cols[layer_idx] = layer_col
 
             if layer_tiles:
@@ -1147,7 +1714,7 @@ class BotSimulator:
 
                     # Parse effect
                     effect_type = TileEffectType.NONE
-                    effect_data = {}
+                    effect_fields: Dict[str, Any] = {}  # TileState effect attributes
 
                     if len(tile_data) > 1 and tile_data[1]:
                         effect_str = str(tile_data[1]).lower()
@@ -1188,23 +1755,23 @@ class BotSimulator:
 
                             if effect_type == TileEffectType.ICE:
                                 # ICE tiles always start with remaining=3
-                                effect_data["remaining"] = 3
+                                effect_fields["remaining"] = 3
                                 # Track ice tiles for fast lookup
                                 ice_key = f"{layer_idx}_{pos}"
                                 state.ice_tiles[ice_key] = 3
                             elif effect_type == TileEffectType.CHAIN:
-                                effect_data["unlocked"] = False
+                                effect_fields["unlocked"] = False
                             elif effect_type == TileEffectType.GRASS:
                                 # Priority: extra_data > parsed from attribute > default
                                 if "grass_layer" in extra_data:
-                                    effect_data["remaining"] = int(extra_data["grass_layer"])
+                                    effect_fields["remaining"] = int(extra_data["grass_layer"])
                                 elif parsed_level is not None:
-                                    effect_data["remaining"] = parsed_level
+                                    effect_fields["remaining"] = parsed_level
                                 else:
-                                    effect_data["remaining"] = 1
+                                    effect_fields["remaining"] = 1
                             elif effect_type in (TileEffectType.LINK_EAST, TileEffectType.LINK_WEST,
                                                   TileEffectType.LINK_SOUTH, TileEffectType.LINK_NORTH):
-                                effect_data["can_pick"] = False
+                                effect_fields["link_can_pick"] = False
                                 # Find linked tile position
                                 linked_x, linked_y = x_idx, y_idx
                                 if effect_type == TileEffectType.LINK_EAST:
@@ -1215,10 +1782,10 @@ class BotSimulator:
                                     linked_y += 1
                                 elif effect_type == TileEffectType.LINK_NORTH:
                                     linked_y -= 1
-                                effect_data["linked_pos"] = f"{linked_x}_{linked_y}"
+                                effect_fields["linked_pos"] = f"{linked_x}_{linked_y}"
                                 state.link_pairs[pos] = f"{linked_x}_{linked_y}"
                             elif effect_type == TileEffectType.FROG:
-                                effect_data["on_frog"] = True
+                                effect_fields["on_frog"] = True
                                 state.frog_positions.add(pos)
                             elif effect_type == TileEffectType.BOMB:
                                 # BOMB count is always fixed between 3-5
@@ -1233,28 +1800,27 @@ class BotSimulator:
                                 # Clamp bomb count to 3-5 range
                                 bomb_count = max(3, min(5, bomb_count))
 
-                                effect_data["remaining"] = bomb_count
+                                effect_fields["remaining"] = bomb_count
                                 # Use layerIdx_x_y format for bomb tracking
                                 bomb_key = f"{layer_idx}_{pos}"
                                 state.bomb_tiles[bomb_key] = bomb_count
                             elif effect_type == TileEffectType.CURTAIN:
                                 # First check extra_data for is_open (highest priority)
                                 if isinstance(extra_data, dict) and "is_open" in extra_data:
-                                    effect_data["is_open"] = bool(extra_data["is_open"])
+                                    effect_fields["is_open"] = bool(extra_data["is_open"])
                                 else:
                                     # Fall back to parsing from attribute string
-                                    effect_data["is_open"] = "open" in effect_str
+                                    effect_fields["is_open"] = "open" in effect_str
                                 # Track curtain tiles for faster lookup
                                 curtain_key = f"{layer_idx}_{pos}"
-                                state.curtain_tiles[curtain_key] = effect_data["is_open"]
+                                state.curtain_tiles[curtain_key] = effect_fields["is_open"]
 
                     # Handle t0 random tile - use pre-computed assignment
                     actual_tile_type = tile_type
                     if tile_type == "t0":
-                        actual_tile_type = t0_assignment_map.get(
-                            (layer_idx, pos),
-                            self._rng.choice(self.RANDOM_TILE_POOL[:use_tile_count])
-                        )
+                        actual_tile_type = t0_assignment_map.get((layer_idx, pos))
+                        if actual_tile_type is None:
+                            actual_tile_type = self._rng.choice(self.RANDOM_TILE_POOL[:use_tile_count])
 
                     # Create tile state
                     tile_state = TileState(
@@ -1263,7 +1829,7 @@ class BotSimulator:
                         x_idx=x_idx,
                         y_idx=y_idx,
                         effect_type=effect_type,
-                        effect_data=effect_data,
+                        **effect_fields,
                     )
 
                     state.tiles[layer_idx][pos] = tile_state
@@ -1282,9 +1848,6 @@ class BotSimulator:
         # Process stack/craft tiles
         self._process_stack_craft_tiles(state, stack_craft_tiles, t0_assignment_map, use_tile_count)
 
-        # Initialize link pairs can_pick status
-        self._update_link_tiles_status(state)
-
         # Load goalCount from level JSON
         # This overrides any goals set from tile types
         goal_count = level_json.get("goalCount", {})
@@ -1298,8 +1861,114 @@ class BotSimulator:
         # Cache max layer for performance optimization
         state._max_layer_idx = max(state.tiles.keys()) if state.tiles else -1
 
+        # Board counters, gimmick/pickable frontiers and link partners
+        self._init_tile_counters(state)
+
+        # Initialize link pairs can_pick status
+        self._update_link_tiles_status(state)
+
         return state
 
+    def _collect_t0_tiles(
+        self, level_json: Dict[str, Any]
+    ) -> Tuple[List[Tuple[int, str, Any]], Dict[str, Any]]:
+        """Collect the t0 slots of a level and its t0 distribution settings.
+
+        Returns (t0_tiles, distribution): t0_tiles lists (layer_idx, pos_key, tile_data)
+        in assignment order, with stack/craft internals keyed "{pos}_stack_{i}";
+        distribution holds the TileDistributor.assign_t0_tiles arguments except
+        rand_seed. Neither depends on randSeed.
+        """
+        num_layers = level_json.get("layer", 8)
+        use_tile_count = level_json.get("useTileCount", self.DEFAULT_USE_TILE_COUNT)
+        if use_tile_count <= 0:
+            use_tile_count = self.DEFAULT_USE_TILE_COUNT
+        # CRITICAL: Cap use_tile_count to MAX_USE_TILE_COUNT for playable levels
+        # Even if level JSON specifies more types, limit to prevent impossible levels
+        use_tile_count = min(use_tile_count, self.MAX_USE_TILE_COUNT)
+
+        # Additional level settings for exact in-game t0 distribution matching
+        shuffle_tile = level_json.get("xShuffleTile", 0)
+        type_imbalance = level_json.get("xTypeImbalance", 0)
+        unlock_tile = level_json.get("xUnlockTile", level_json.get("unlockTile", 0))
+
+        # First pass: collect ALL t0 tiles AND count existing t1~t15 tiles AND explicit key tiles
+        # This includes:
+        # 1. Regular t0 tiles on the board
+        # 2. t0 tiles INSIDE stack/craft containers
+        # 3. Existing t1~t15 tiles (need to track for proper t0 distribution)
+        # 4. Explicit "key" tiles (need to subtract from unlock_tile for t0 distribution)
+        t0_tiles: List[Tuple[int, str, Any]] = []  # (layer_idx, pos_key, tile_data)
+        existing_tile_counts: Dict[str, int] = {}  # t1~t15 counts
+        explicit_key_count = 0  # Count of explicit "key" tiles in level JSON
+
+        for layer_idx in range(num_layers):
+            layer_key = f"layer_{layer_idx}"
+            layer_data = level_json.get(layer_key, {})
+            layer_tiles = layer_data.get("tiles", {})
+
+            if layer_tiles:
+                for pos, tile_data in layer_tiles.items():
+                    if not isinstance(tile_data, list) or not tile_data:
+                        continue
+                    tile_type = tile_data[0]
+
+                    # Check if this is a stack/craft tile with hidden t0 tiles inside
+                    is_stack = isinstance(tile_type, str) and tile_type.startswith("stack_")
+                    is_craft = isinstance(tile_type, str) and tile_type.startswith("craft_")
+
+                    if is_stack or is_craft:
+                        # Stack/craft tiles contain internal t0 tiles
+                        # [count] = number of internal tiles to output
+                        stack_info = tile_data[2] if len(tile_data) > 2 else None
+                        if stack_info and isinstance(stack_info, list) and len(stack_info) > 0:
+                            internal_count = int(stack_info[0]) if stack_info[0] else 1
+                            # Add internal t0 tiles for distribution
+                            # Order: bottom to top (stack_idx 0, 1, 2, ...)
+                            for stack_idx in range(internal_count):
+                                t0_tiles.append((layer_idx, f"{pos}_stack_{stack_idx}", tile_data))
+                    elif tile_type == "t0":
+                        # Regular t0 tile
+                        t0_tiles.append((layer_idx, pos, tile_data))
+                    elif tile_type == "key":
+                        # Explicit key tile - count it (don't generate more from t0)
+                        explicit_key_count += 1
+                    elif isinstance(tile_type, str) and tile_type.startswith("t") and tile_type[1:].isdigit():
+                        # Existing t1~t15 tile - count it
+                        tile_num = int(tile_type[1:])
+                        if 1 <= tile_num <= 15:
+                            existing_tile_counts[tile_type] = existing_tile_counts.get(tile_type, 0) + 1
+
+        # Detect tile type offset from existing tiles
+        # If level uses t11~t15 instead of t1~t5, we need to offset t0 assignments
+        tile_type_offset = 0
+        if existing_tile_counts:
+            # Get the minimum tile number from existing tiles (e.g., 11 for t11~t15)
+            min_tile_num = min(int(t[1:]) for t in existing_tile_counts.keys())
+            # If tiles start at t11 or higher, calculate offset
+            # Offset = min_tile_num - 1 (so t1 becomes t11, t2 becomes t12, etc.)
+            if min_tile_num > use_tile_count:
+                tile_type_offset = min_tile_num - 1
+
+        # Calculate effective unlock_tile for t0 distribution
+        # If level already has explicit "key" tiles, reduce the number of keys to generate
+        # Each unlock_tile generates 3 key tiles, so we need: unlock_tile * 3 total keys
+        # effective_unlock_tile = max(0, unlock_tile - (explicit_key_count // 3))
+        # This prevents double key generation when level JSON has explicit keys
+        explicit_key_sets = explicit_key_count // 3
+        effective_unlock_tile = max(0, unlock_tile - explicit_key_sets)
+
+        distribution = {
+            "t0_count": len(t0_tiles),
+            "use_tile_count": use_tile_count,
+            "shuffle_tile": shuffle_tile,
+            "type_imbalance": type_imbalance,
+            "unlock_tile": effective_unlock_tile,  # Adjusted value prevents double key generation
+            "tile_type_offset": tile_type_offset,
+            "existing_tile_counts": existing_tile_counts,  # For GetToAddIndexList logic
+        }
+        return t0_tiles, distribution
+
     def _calculate_all_tile_counts(self, state: GameState) -> None:
         """Calculate complete counts of all tile types including hidden tiles.
 
@@ -1327,6 +1996,315 @@ class BotSimulator:
 
         state.all_tile_type_counts = counts
 
+    def _covered_slots(self, state: GameState, layer_idx: int, x: int, y: int) -> List[Tuple[int, str]]:
+        """Get lower-layer slots covered by a tile at (layer_idx, x, y).
+
+        Inverse of the offsets used by _is_blocked_by_upper: a tile at a
+        returned slot is blocked while this tile is unpicked.
+        """
+        slots = []
+        upper_col = state.layer_cols.get(layer_idx, 7)
+        for lower_idx in range(layer_idx):
+            offsets = blocking_offsets(lower_idx, layer_idx, state.layer_cols.get(lower_idx, 7), upper_col)
+            for dx, dy in offsets:
+                slots.append((lower_idx, f"{x - dx}_{y - dy}"))
+        return slots
+
+    def _init_tile_counters(self, state: GameState) -> None:
+        """Build remaining/exposed tile counters from a full board scan.
+
+        After this, _on_tile_picked, _on_tile_placed and _on_tile_retyped keep
+        the counters current so per-turn checks read them in O(1).
+        """
+        state.remaining_tile_count = 0
+        state.remaining_type_counts = {}
+        state.exposed_type_counts = {}
+        state.unpicked_ice_count = 0
+        state._cover_counts = {}
+        state._exposed_slots = {}
+        state._slot_order = {}
+        state._frog_slots = set()
+        state._pickable_slots = set()
+        state._pickable_dirty = set()
+        self._init_gimmick_frontier(state)
+        self._init_link_partners(state)
+
+        for layer_idx, layer_tiles in state.tiles.items():
+            for pos, tile in layer_tiles.items():
+                state._slot_order[(layer_idx, pos)] = len(state._slot_order)
+                if tile.on_frog:
+                    state._frog_slots.add((layer_idx, pos))
+                if tile.picked:
+                    continue
+                state.remaining_tile_count += 1
+                counts = state.remaining_type_counts
+                counts[tile.tile_type] = counts.get(tile.tile_type, 0) + 1
+                if tile.effect_type == TileEffectType.ICE:
+                    state.unpicked_ice_count += 1
+                for slot in self._covered_slots(state, layer_idx, tile.x_idx, tile.y_idx):
+                    state._cover_counts[slot] = state._cover_counts.get(slot, 0) + 1
+
+        state._next_slot_order = len(state._slot_order)
+        state._counters_ready = True
+        for layer_idx, layer_tiles in state.tiles.items():
+            for pos in layer_tiles:
+                self._refresh_exposure(state, (layer_idx, pos))
+
+    def _ensure_tile_counters(self, state: GameState) -> None:
+        """Initialize counters for states that were not built by _create_initial_state."""
+        if not state._counters_ready:
+            self._init_tile_counters(state)
+
+    def _refresh_exposure(self, state: GameState, slot: Tuple[int, str]) -> None:
+        """Recount whether the tile currently in a slot is exposed."""
+        state._pickable_dirty.add(slot)
+        exposed = state.exposed_type_counts
+        old_type = state._exposed_slots.pop(slot, None)
+        if old_type is not None:
+            _decrement_count(exposed, old_type)
+
+        tile = state.tiles.get(slot[0], {}).get(slot[1])
+        if tile is not None and not tile.picked and not state._cover_counts.get(slot):
+            state._exposed_slots[slot] = tile.tile_type
+            exposed[tile.tile_type] = exposed.get(tile.tile_type, 0) + 1
+
+        if slot in state._gimmick_ids:
+            self._update_gimmick_frontier(state, slot)
+
+    def _on_tile_picked(self, state: GameState, tile: TileState) -> None:
+        """Update counters after a board tile was marked picked."""
+        if not state._counters_ready:
+            return
+        state.remaining_tile_count -= 1
+        _decrement_count(state.remaining_type_counts, tile.tile_type)
+        if tile.effect_type == TileEffectType.ICE:
+            state.unpicked_ice_count -= 1
+        self._refresh_exposure(state, (tile.layer_idx, tile.position_key))
+
+        cover = state._cover_counts
+        for slot in self._covered_slots(state, tile.layer_idx, tile.x_idx, tile.y_idx):
+            cover[slot] -= 1
+            if cover[slot] == 0:
+                self._refresh_exposure(state, slot)
+        self._refresh_neighbor_gimmicks(state, tile)
+
+    def _on_tile_placed(self, state: GameState, tile: TileState, appended: bool = False) -> None:
+        """Update counters after an unpicked tile was put into a board slot.
+
+        Args:
+            appended: The slot's key was (re)inserted at the end of its layer dict
+                rather than overwriting an existing entry in place
+        """
+        if not state._counters_ready:
+            return
+        state.remaining_tile_count += 1
+        counts = state.remaining_type_counts
+        counts[tile.tile_type] = counts.get(tile.tile_type, 0) + 1
+        if tile.effect_type == TileEffectType.ICE:
+            state.unpicked_ice_count += 1
+
+        slot = (tile.layer_idx, tile.position_key)
+        if appended or slot not in state._slot_order:
+            state._slot_order[slot] = state._next_slot_order
+            state._next_slot_order += 1
+
+        cover = state._cover_counts
+        for lower_slot in self._covered_slots(state, tile.layer_idx, tile.x_idx, tile.y_idx):
+            cover[lower_slot] = cover.get(lower_slot, 0) + 1
+            if cover[lower_slot] == 1:
+                # Tiles below are blocked now; drop their cached "not blocked" answers
+                lower = state.tiles.get(lower_slot[0], {}).get(lower_slot[1])
+                if lower is not None:
+                    state._blocking_cache.pop(lower.full_key, None)
+                self._refresh_exposure(state, lower_slot)
+        state._accessible_cache = None
+        state._accessible_type_counts = None
+        self._refresh_exposure(state, slot)
+        self._refresh_neighbor_gimmicks(state, tile)
+
+    def _on_tile_retyped(self, state: GameState, tile: TileState, new_type: str) -> None:
+        """Change an unpicked board tile's type, keeping counters current."""
+        if state._counters_ready:
+            counts = state.remaining_type_counts
+            _decrement_count(counts, tile.tile_type)
+            counts[new_type] = counts.get(new_type, 0) + 1
+        tile.tile_type = new_type
+        if state._counters_ready:
+            self._refresh_exposure(state, (tile.layer_idx, tile.position_key))
+
+    def _init_gimmick_frontier(self, state: GameState) -> None:
+        """Assign integer ids to gimmick tiles and reset the frontier sets.
+
+        Set membership is filled in by _refresh_exposure. From then on a gimmick
+        only moves between sets when its slot is covered or uncovered, when it
+        is picked, or when its effect is cleared (ice/grass melted, chain
+        unlocked), so per-turn code never rescans the board for gimmicks.
+        """
+        state._gimmick_ids = {}
+        state._gimmick_slots = []
+        state._gimmick_kinds = []
+        kinds = self.GIMMICK_FRONTIER_KINDS.values()
+        state.gimmick_exposed = {kind: set() for kind in kinds}
+        state.gimmick_covered = {kind: set() for kind in kinds}
+        state.gimmick_stuck = {kind: set() for kind in self.NEIGHBOR_GIMMICK_KINDS}
+
+        for layer_idx, layer_tiles in state.tiles.items():
+            for pos, tile in layer_tiles.items():
+                kind = self.GIMMICK_FRONTIER_KINDS.get(tile.effect_type)
+                if kind is None:
+                    continue
+                state._gimmick_ids[(layer_idx, pos)] = len(state._gimmick_slots)
+                state._gimmick_slots.append((layer_idx, pos))
+                state._gimmick_kinds.append(kind)
+
+    def _is_gimmick_active(self, tile: Optional[TileState], kind: str) -> bool:
+        """Whether a tile still carries an uncleared gimmick of the given kind."""
+        if tile is None or tile.picked or self.GIMMICK_FRONTIER_KINDS.get(tile.effect_type) != kind:
+            return False
+        if kind == "chain":
+            return not tile.unlocked
+        if kind in ("ice", "grass"):
+            return tile.remaining > 0
+        return True
+
+    def _is_gimmick_stuck(self, state: GameState, tile: TileState, kind: str) -> bool:
+        """Whether an active grass/chain tile has too few unpicked neighbors left to clear it.
+
+        Grass needs one adjacent (4-directional) pick per remaining layer; a chain
+        needs at least one horizontal neighbor to be picked.
+        """
+        layer_tiles = state.tiles.get(tile.layer_idx, {})
+        x, y = tile.x_idx, tile.y_idx
+        if kind == "chain":
+            neighbors = ((x - 1, y), (x + 1, y))
+        else:
+            neighbors = ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1))
+
+        unpicked = 0
+        for nx, ny in neighbors:
+            neighbor = layer_tiles.get(f"{nx}_{ny}")
+            if neighbor is not None and not neighbor.picked:
+                unpicked += 1
+
+        if kind == "chain":
+            return unpicked == 0
+        return tile.remaining > unpicked
+
+    def _update_gimmick_frontier(self, state: GameState, slot: Tuple[int, str]) -> None:
+        """Re-file the gimmick tile in a slot after its exposure or effect changed."""
+        gimmick_id = state._gimmick_ids.get(slot)
+        if gimmick_id is None:
+            return
+        state._pickable_dirty.add(slot)
+        kind = state._gimmick_kinds[gimmick_id]
+        exposed = state.gimmick_exposed[kind]
+        covered = state.gimmick_covered[kind]
+        stuck = state.gimmick_stuck.get(kind)
+        exposed.discard(gimmick_id)
+        covered.discard(gimmick_id)
+
+        tile = state.tiles.get(slot[0], {}).get(slot[1])
+        if not self._is_gimmick_active(tile, kind):
+            if stuck is not None:
+                stuck.discard(gimmick_id)
+            return
+
+        if slot in state._exposed_slots:
+            exposed.add(gimmick_id)
+        else:
+            covered.add(gimmick_id)
+        if stuck is not None:
+            if self._is_gimmick_stuck(state, tile, kind):
+                stuck.add(gimmick_id)
+            else:
+                stuck.discard(gimmick_id)
+
+    def _refresh_neighbor_gimmicks(self, state: GameState, tile: TileState) -> None:
+        """Re-check grass/chain tiles next to a slot whose occupancy just changed."""
+        if not state._gimmick_ids:
+            return
+        x, y = tile.x_idx, tile.y_idx
+        for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            slot = (tile.layer_idx, f"{nx}_{ny}")
+            gimmick_id = state._gimmick_ids.get(slot)
+            if gimmick_id is not None and state._gimmick_kinds[gimmick_id] in state.gimmick_stuck:
+                self._update_gimmick_frontier(state, slot)
+
+    def _init_link_partners(self, state: GameState) -> None:
+        """Precompute LINK source slots and the reverse target -> sources index.
+
+        LINK tiles never move or appear after setup, so move generation and
+        _apply_move can find a tile's partner without scanning its layer.
+        """
+        state._link_slots = []
+        state._link_sources = {}
+        for layer_idx, layer_tiles in state.tiles.items():
+            for pos, tile in layer_tiles.items():
+                if tile.effect_type not in self.LINK_EFFECT_TYPES:
+                    continue
+                state._link_slots.append((layer_idx, pos))
+                target_slot = (layer_idx, tile.linked_pos)
+                state._link_sources.setdefault(target_slot, []).append(pos)
+
+    def _find_link_source(self, state: GameState, tile: TileState) -> Optional[TileState]:
+        """Find the unpicked LINK tile in the same layer that points to this tile."""
+        my_pos = tile.position_key
+        layer_tiles = state.tiles.get(tile.layer_idx, {})
+        for pos in state._link_sources.get((tile.layer_idx, my_pos), ()):
+            source = layer_tiles.get(pos)
+            if source is None or source.picked:
+                continue
+            if source.effect_type in self.LINK_EFFECT_TYPES and source.linked_pos == my_pos:
+                return source
+        return None
+
+    def _get_pickable_tiles(self, state: GameState) -> List[TileState]:
+        """Get tiles that pass _can_pick_tile, in _get_accessible_tiles order.
+
+        Slots are marked dirty when their exposure, occupant or effect state
+        changes (picks, placements, retypes, melting, unlocking, curtains,
+        frogs, link status); only those are re-checked here, so the cost per
+        turn follows what the last move changed rather than the board size.
+        """
+        self._ensure_tile_counters(state)
+        pickable = state._pickable_slots
+        if state._pickable_dirty:
+            for slot in state._pickable_dirty:
+                tile = state.tiles.get(slot[0], {}).get(slot[1])
+                if tile is not None and self._can_pick_tile(state, tile):
+                    pickable.add(slot)
+                else:
+                    pickable.discard(slot)
+            state._pickable_dirty.clear()
+
+        slot_order = state._slot_order
+        ordered = sorted(pickable, key=lambda slot: (-slot[0], slot_order[slot]))
+        return [state.tiles[layer_idx][pos] for layer_idx, pos in ordered]
+
+    def _capture_exposed_gimmicks(self, state: GameState) -> Tuple[Set[str], Set[Tuple[int, str]]]:
+        """Snapshot the bombs and curtains that are exposed before a move.
+
+        Only gimmicks that were already exposed react to the move, so this has
+        to run before _apply_move.
+
+        Returns:
+            (bomb keys "layerIdx_x_y", curtain (layer_idx, pos) tuples), the
+            arguments expected by _process_move_effects
+        """
+        self._ensure_tile_counters(state)
+        slots = state._gimmick_slots
+        exposed_bombs = set()
+        for gimmick_id in state.gimmick_exposed["bomb"]:
+            layer_idx, pos = slots[gimmick_id]
+            exposed_bombs.add(f"{layer_idx}_{pos}")
+        exposed_curtains = {slots[gimmick_id] for gimmick_id in state.gimmick_exposed["curtain"]}
+        return exposed_bombs, exposed_curtains
+
+    def _remaining_tile_count(self, state: GameState) -> int:
+        """Number of unpicked tiles on the board."""
+        self._ensure_tile_counters(state)
+        return state.remaining_tile_count
+
     def _process_stack_craft_tiles(
         self,
         state: GameState,
@@ -1443,7 +2421,6 @@ class BotSimulator:
                     x_idx=x_idx,
                     y_idx=y_idx,
                     effect_type=effect_type,
-                    effect_data={},
                     is_stack_tile=True,
                     is_craft_tile=is_craft,
                     stack_index=stack_idx,
@@ -1655,6 +2632,7 @@ class BotSimulator:
                 if spawn_pos in state.tiles[layer_idx] and state.tiles[layer_idx][spawn_pos].picked:
                     del state.tiles[layer_idx][spawn_pos]
                 state.tiles[layer_idx][spawn_pos] = topmost_unpicked
+                self._on_tile_placed(state, topmost_unpicked, appended=True)
 
     def _process_craft_after_pick(self, state: GameState, picked_tile: TileState) -> None:
         """Process craft box after a tile is picked.
@@ -1705,12 +2683,21 @@ class BotSimulator:
                     if spawn_pos in layer_tiles and layer_tiles[spawn_pos].picked:
                         del layer_tiles[spawn_pos]
                     layer_tiles[pos_key] = next_tile
+                    self._on_tile_placed(state, next_tile, appended=True)
                 else:
                     # Spawn position still blocked - tile remains in craft box
                     next_tile.is_crafted = False
 
-    def _play_game(self, state: GameState, profile: BotProfile) -> GameState:
-        """Play through a game with the given bot profile."""
+    def _play_game(
+        self, state: GameState, profile: BotProfile, observer: Optional[MoveObserver] = None
+    ) -> GameState:
+        """Play through a game with the given bot profile.
+
+        observer, if given, is notified of every move (see MoveObserver).
+        """
+        if observer is not None:
+            observer.on_game_start(state)
+
         while not self._is_game_over(state):
             # Phase 5: Update curtain memory at start of each turn
             self._update_curtain_memory(state, profile)
@@ -1721,61 +2708,46 @@ class BotSimulator:
                 state.failed = True
                 break
 
-            # Score moves based on profile
-            for move in moves:
-                move.score = self._score_move_with_profile(move, state, profile)
+            # A solved endgame (optimal bot) is played out without scoring
+            selected_move = self._endgame_move(state, moves) if state._endgame_line else None
+            solved = selected_move is not None
+            if selected_move is None:
+                # Score moves based on profile
+                context = self._build_scoring_context(state)
+                for move in moves:
+                    move.score = self._score_move_with_profile(move, state, profile, context)
 
-            # Select move based on profile behavior
-            selected_move = self._select_move_with_profile(moves, state, profile)
+                # Select move based on profile behavior
+                selected_move = self._select_move_with_profile(moves, state, profile)
 
             if selected_move:
-                # Capture exposed bomb positions BEFORE applying the move
+                if observer is not None:
+                    observer.before_move(state, selected_move, moves, solved)
+
+                # Capture exposed bombs/curtains BEFORE applying the move
                 # This is important: bomb countdown should only decrease for bombs that were
-                # already exposed before this move, not bombs that become exposed by this move
-                exposed_bombs_before_move = set()
-                for bomb_key in state.bomb_tiles.keys():
-                    # Parse layerIdx_x_y format (e.g., "0_1_2" -> layer_idx=0, pos="1_2")
-                    parts = bomb_key.split('_')
-                    if len(parts) >= 3:
-                        layer_idx = int(parts[0])
-                        pos = f"{parts[1]}_{parts[2]}"
-                        layer = state.tiles.get(layer_idx, {})
-                        if pos in layer and not layer[pos].picked:
-                            bomb_tile = layer[pos]
-                            if not self._is_blocked_by_upper(state, bomb_tile):
-                                exposed_bombs_before_move.add(bomb_key)
-
-                # Capture exposed curtain positions BEFORE applying the move
-                # Curtains that become exposed by this move should NOT toggle yet
-                # OPTIMIZED: Use curtain_tiles dict instead of iterating all tiles
-                exposed_curtains_before_move = set()
-                for curtain_key in state.curtain_tiles.keys():
-                    parts = curtain_key.split('_')
-                    if len(parts) >= 3:
-                        layer_idx = int(parts[0])
-                        pos = f"{parts[1]}_{parts[2]}"
-                        layer = state.tiles.get(layer_idx, {})
-                        if pos in layer and not layer[pos].picked:
-                            if not self._is_blocked_by_upper(state, layer[pos]):
-                                exposed_curtains_before_move.add((layer_idx, pos))
-
-                self._apply_move(state, selected_move)
+                # already exposed before this move, not bombs that become exposed by this move,
+                # and curtains that become exposed by this move should NOT toggle yet
+                exposed_bombs_before_move, exposed_curtains_before_move = self._capture_exposed_gimmicks(state)
+
+                tiles_cleared = self._apply_move(state, selected_move)
                 state.moves_used += 1
 
                 # Process move effects (frog moves, bomb decreases, curtain toggle, etc.)
                 self._process_move_effects(state, exposed_bombs_before_move, exposed_curtains_before_move)
 
+                if observer is not None:
+                    observer.after_move(state, selected_move, tiles_cleared)
+
         # Determine final state
         if not state.failed:
             goals_cleared = all(count <= 0 for count in state.goals_remaining.values())
-            remaining_tiles = sum(
-                1 for layer in state.tiles.values()
-                for tile in layer.values()
-                if not tile.picked
-            )
+            remaining_tiles = self._remaining_tile_count(state)
             # Level is cleared when all goals met AND all tiles picked AND dock empty
             state.cleared = goals_cleared and remaining_tiles == 0 and len(state.dock_tiles) == 0
 
+        if observer is not None:
+            observer.on_game_end(state)
         return state
 
     def _is_game_over(self, state: GameState) -> bool:
@@ -1783,11 +2755,7 @@ class BotSimulator:
         # Check goals cleared
         if all(count <= 0 for count in state.goals_remaining.values()):
             # Also check if all tiles are cleared (only count unpicked tiles)
-            remaining_tiles = sum(
-                1 for layer in state.tiles.values()
-                for tile in layer.values()
-                if not tile.picked
-            )
+            remaining_tiles = self._remaining_tile_count(state)
             if remaining_tiles == 0 and len(state.dock_tiles) == 0:
                 state.cleared = True
                 return True
@@ -1849,41 +2817,14 @@ class BotSimulator:
         Similar to chain blocking rule: if adjacent tiles needed to clear grass
         are all removed, it becomes impossible to clear the grass.
 
+        The condition is maintained incrementally in state.gimmick_stuck (see
+        _update_gimmick_frontier), re-evaluated only when a neighbor is picked
+        or placed or the grass loses a layer.
+
         Returns True if game is in impossible state.
         """
-        for layer_idx, layer_tiles in state.tiles.items():
-            for pos_key, tile in layer_tiles.items():
-                if tile.picked:
-                    continue
-
-                # Only check grass tiles
-                if tile.effect_type != TileEffectType.GRASS:
-                    continue
-
-                grass_remaining = tile.effect_data.get("remaining", 0)
-                if grass_remaining <= 0:
-                    # Grass already cleared, no issue
-                    continue
-
-                # Count adjacent unpicked tiles that can reduce grass
-                # Check both blocked and unblocked grass tiles
-                x, y = tile.x_idx, tile.y_idx
-                adjacent_positions = [
-                    (x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)
-                ]
-
-                adjacent_unpicked_count = 0
-                for adj_x, adj_y in adjacent_positions:
-                    adj_pos_key = f"{adj_x}_{adj_y}"
-                    adj_tile = layer_tiles.get(adj_pos_key)
-                    if adj_tile and not adj_tile.picked:
-                        adjacent_unpicked_count += 1
-
-                # If grass layers > unpicked adjacent tiles, impossible to clear grass
-                if grass_remaining > adjacent_unpicked_count:
-                    return True
-
-        return False
+        self._ensure_tile_counters(state)
+        return bool(state.gimmick_stuck["grass"])
 
     def _check_ice_impossible(self, state: GameState) -> bool:
         """Check if any blocked ice tile cannot be cleared due to insufficient remaining tiles.
@@ -1895,37 +2836,31 @@ class BotSimulator:
         Ice melts 1 level per tile pick (for unblocked ice tiles).
         For blocked ice: first need to unblock it, then melt it.
 
+        Only the covered ice frontier is examined; the pick budget comes from
+        the maintained tile counters.
+
         Returns True if game is in impossible state.
         """
-        # Count total remaining non-ice tiles (these provide "pick opportunities")
-        total_remaining_non_ice = 0
-        blocked_ice_tiles = []
-
-        for layer_idx, layer_tiles in state.tiles.items():
-            for pos_key, tile in layer_tiles.items():
-                if tile.picked:
-                    continue
-
-                if tile.effect_type == TileEffectType.ICE:
-                    ice_remaining = tile.effect_data.get("remaining", 0)
-                    if ice_remaining > 0 and self._is_blocked_by_upper(state, tile):
-                        blocked_ice_tiles.append((layer_idx, pos_key, tile, ice_remaining))
-                else:
-                    total_remaining_non_ice += 1
-
-        if not blocked_ice_tiles:
+        self._ensure_tile_counters(state)
+        blocked_ice_ids = state.gimmick_covered["ice"]
+        if not blocked_ice_ids:
             return False
 
+        # Count total remaining non-ice tiles (these provide "pick opportunities")
+        total_remaining_non_ice = state.remaining_tile_count - state.unpicked_ice_count
+        max_layer_idx = max(state.tiles.keys())
+
         # For each blocked ice tile, check if it can be cleared
-        for layer_idx, pos_key, ice_tile, ice_remaining in blocked_ice_tiles:
+        for gimmick_id in blocked_ice_ids:
+            layer_idx, pos_key = state._gimmick_slots[gimmick_id]
+            ice_remaining = state.tiles[layer_idx][pos_key].remaining
+
             # Count tiles blocking this ice tile (upper layer tiles at same position)
             blocking_count = 0
-            for upper_layer_idx in range(layer_idx + 1, max(state.tiles.keys()) + 1):
-                upper_layer = state.tiles.get(upper_layer_idx, {})
-                if pos_key in upper_layer:
-                    upper_tile = upper_layer[pos_key]
-                    if not upper_tile.picked:
-                        blocking_count += 1
+            for upper_layer_idx in range(layer_idx + 1, max_layer_idx + 1):
+                upper_tile = state.tiles.get(upper_layer_idx, {}).get(pos_key)
+                if upper_tile is not None and not upper_tile.picked:
+                    blocking_count += 1
 
             # Total picks needed for this ice:
             # 1. Pick all blocking tiles to unblock (blocking_count picks)
@@ -1949,38 +2884,12 @@ class BotSimulator:
         - There are no remaining unpicked horizontal adjacent tiles (left or right)
         - Chain unlocks ONLY when a horizontal adjacent tile is picked
 
+        Maintained incrementally in state.gimmick_stuck like the grass check.
+
         Returns True if game is in impossible state.
         """
-        for layer_idx, layer_tiles in state.tiles.items():
-            for pos_key, tile in layer_tiles.items():
-                if tile.picked:
-                    continue
-
-                # Only check chain tiles
-                if tile.effect_type != TileEffectType.CHAIN:
-                    continue
-
-                # Skip if already unlocked
-                if tile.effect_data.get("unlocked", False):
-                    continue
-
-                # Chain is locked - check if any horizontal neighbor exists
-                x, y = tile.x_idx, tile.y_idx
-                horizontal_neighbors = [(x - 1, y), (x + 1, y)]
-
-                has_horizontal_neighbor = False
-                for nx, ny in horizontal_neighbors:
-                    neighbor_pos = f"{nx}_{ny}"
-                    neighbor = layer_tiles.get(neighbor_pos)
-                    if neighbor and not neighbor.picked:
-                        has_horizontal_neighbor = True
-                        break
-
-                # If no horizontal neighbors remain, chain can never be unlocked
-                if not has_horizontal_neighbor:
-                    return True
-
-        return False
+        self._ensure_tile_counters(state)
+        return bool(state.gimmick_stuck["chain"])
 
     def _find_linked_tiles(self, state: GameState, tile_state: TileState) -> List[Tuple[int, str]]:
         """Find linked tiles for a given tile (LINK gimmick).
@@ -1993,7 +2902,7 @@ class BotSimulator:
         # Forward direction: this tile has LINK attribute pointing to another tile
         if tile_state.effect_type in (TileEffectType.LINK_EAST, TileEffectType.LINK_WEST,
                                        TileEffectType.LINK_SOUTH, TileEffectType.LINK_NORTH):
-            linked_pos = tile_state.effect_data.get("linked_pos", "")
+            linked_pos = tile_state.linked_pos
             if linked_pos:
                 # Find linked tile in the SAME LAYER only
                 my_layer_idx = tile_state.layer_idx
@@ -2003,57 +2912,29 @@ class BotSimulator:
                     linked_tiles.append((my_layer_idx, linked_pos))
         else:
             # Reverse direction: check if any LINK tile in the SAME LAYER points to this tile
-            my_pos = tile_state.position_key
-            my_layer_idx = tile_state.layer_idx
-            layer_tiles = state.tiles.get(my_layer_idx, {})
-            for pos, tile in layer_tiles.items():
-                if tile.picked:
-                    continue
-                if tile.effect_type in (TileEffectType.LINK_EAST, TileEffectType.LINK_WEST,
-                                         TileEffectType.LINK_SOUTH, TileEffectType.LINK_NORTH):
-                    if tile.effect_data.get("linked_pos", "") == my_pos:
-                        linked_tiles.append((my_layer_idx, pos))
-                        break
+            source = self._find_link_source(state, tile_state)
+            if source is not None:
+                linked_tiles.append((source.layer_idx, source.position_key))
 
         return linked_tiles
 
     def _get_available_moves(self, state: GameState) -> List[Move]:
         """Get all available moves (pickable tiles) in current state."""
         moves = []
-        accessible = self._get_accessible_tiles(state)
 
         # Count tiles by type in dock for match prediction
         dock_type_counts: Dict[str, int] = {}
         for tile in state.dock_tiles:
             dock_type_counts[tile.tile_type] = dock_type_counts.get(tile.tile_type, 0) + 1
 
-        for tile_state in accessible:
-            if tile_state.tile_type not in self.MATCHABLE_TYPES:
-                continue
-
-            # Check if tile can be picked (effect conditions)
-            if not tile_state.can_pick():
-                continue
-
-            # Check if blocked by upper tiles (layer blocking)
-            if self._is_blocked_by_upper(state, tile_state):
-                continue
-
-            # Check stack blocking (upper stacked tiles in same stack)
-            if tile_state.is_stack_tile and self._is_stack_blocked(state, tile_state):
-                continue
-
-            # Check craft tile pickability
-            if tile_state.is_craft_tile and not self._is_craft_tile_pickable(state, tile_state):
-                continue
-
+        # Pickable frontier: matchable, effect-pickable, not layer/stack blocked, craft-ready
+        for tile_state in self._get_pickable_tiles(state):
             # Find linked tiles (for LINK gimmick)
             linked_tiles = self._find_linked_tiles(state, tile_state)
 
             # If this tile is a link target (no link attribute but has a link source pointing to it),
             # check if the source tile is blocked - if so, this tile cannot be picked
-            if linked_tiles and tile_state.effect_type not in (TileEffectType.LINK_EAST, TileEffectType.LINK_WEST,
-                                                                 TileEffectType.LINK_SOUTH, TileEffectType.LINK_NORTH):
+            if linked_tiles and tile_state.effect_type not in self.LINK_EFFECT_TYPES:
                 # This is a link target tile - check if the source is blocked
                 source_layer_idx, source_pos = linked_tiles[0]
                 source_tile = state.tiles.get(source_layer_idx, {}).get(source_pos)
@@ -2105,11 +2986,9 @@ class BotSimulator:
         if hasattr(state, '_accessible_type_counts') and state._accessible_type_counts is not None:
             return state._accessible_type_counts
 
-        accessible = self._get_accessible_tiles(state)
         type_counts: Dict[str, int] = {}
-        for tile in accessible:
-            if self._can_pick_tile(state, tile):
-                type_counts[tile.tile_type] = type_counts.get(tile.tile_type, 0) + 1
+        for tile in self._get_pickable_tiles(state):
+            type_counts[tile.tile_type] = type_counts.get(tile.tile_type, 0) + 1
 
         state._accessible_type_counts = type_counts
         return type_counts
@@ -2133,58 +3012,29 @@ class BotSimulator:
     def _precompute_blocking_map(self, state: GameState) -> None:
         """Precompute all blocking relationships for faster lookup.
 
-        Creates:
+        Creates (from the level's CoverageGraph):
         - blocking_map: tile_key -> set of upper tile keys that block it
         - reverse_blocking_map: tile_key -> set of lower tile keys it blocks
 
         This allows O(1) blocking checks and efficient incremental updates.
         """
-        blocking_map: Dict[str, Set[str]] = {}
-        reverse_blocking_map: Dict[str, Set[str]] = {}
-
-        max_layer = max(state.tiles.keys()) if state.tiles else 0
-        state._max_layer_idx = max_layer
-
-        # Initialize empty sets for all tiles
-        for layer_idx in state.tiles:
-            for pos, tile in state.tiles[layer_idx].items():
-                blocking_map[tile.full_key] = set()
-                reverse_blocking_map[tile.full_key] = set()
-
-        # Compute blocking relationships
-        for layer_idx in state.tiles:
-            for pos, tile in state.tiles[layer_idx].items():
-                if tile.layer_idx >= max_layer:
-                    continue
-
-                tile_parity = tile.layer_idx % 2
-                cur_layer_col = state.layer_cols.get(tile.layer_idx, 7)
-
-                for upper_layer_idx in range(tile.layer_idx + 1, max_layer + 1):
-                    upper_layer = state.tiles.get(upper_layer_idx, {})
-                    if not upper_layer:
-                        continue
-
-                    upper_parity = upper_layer_idx % 2
-                    upper_layer_col = state.layer_cols.get(upper_layer_idx, 7)
-
-                    # Determine blocking offsets
-                    if tile_parity == upper_parity:
-                        blocking_offsets = BotSimulator.BLOCKING_OFFSETS_SAME_PARITY
-                    elif upper_layer_col > cur_layer_col:
-                        blocking_offsets = BotSimulator.BLOCKING_OFFSETS_UPPER_BIGGER
-                    else:
-                        blocking_offsets = BotSimulator.BLOCKING_OFFSETS_UPPER_SMALLER
+        state._max_layer_idx = max(state.tiles.keys()) if state.tiles else 0
 
-                    for dx, dy in blocking_offsets:
-                        bx = tile.x_idx + dx
-                        by = tile.y_idx + dy
-                        pos_key = f"{bx}_{by}"
+        coverage = CoverageGraph(state.layer_cols)
+        slot_tiles: Dict[Tuple[int, int, int], TileState] = {}
+        for layer_idx, layer in state.tiles.items():
+            for tile in layer.values():
+                slot = (layer_idx, tile.x_idx, tile.y_idx)
+                slot_tiles[slot] = tile
+                coverage.add(*slot)
 
-                        if pos_key in upper_layer:
-                            upper_tile = upper_layer[pos_key]
-                            blocking_map[tile.full_key].add(upper_tile.full_key)
-                            reverse_blocking_map[upper_tile.full_key].add(tile.full_key)
+        blocking_map: Dict[str, Set[str]] = {}
+        reverse_blocking_map: Dict[str, Set[str]] = {}
+        for slot, tile in slot_tiles.items():
+            blocking_map[tile.full_key] = {slot_tiles[b].full_key for b in coverage.blockers(*slot)}
+            reverse_blocking_map[tile.full_key] = {
+                slot_tiles[c].full_key for c in coverage.covered_tiles(*slot)
+            }
 
         state._blocking_map = blocking_map
         state._reverse_blocking_map = reverse_blocking_map
@@ -2208,42 +3058,20 @@ class BotSimulator:
     def _fast_copy_state(self, base_state: GameState) -> GameState:
         """Create a fast copy of game state for simulation iteration.
 
-        Uses shallow copy for immutable/shared data and deep copy only for mutable parts.
+        Tiles and per-game tracking are copied; layout data that play never
+        mutates (layer cols, link pairs, craft boxes, blocking maps, gimmick
+        and link tables) is shared with the base state.
         """
-        import copy
-
-        # Deep copy tiles (they will be modified during play)
-        new_tiles: Dict[int, Dict[str, TileState]] = {}
-        for layer_idx, layer in base_state.tiles.items():
-            new_tiles[layer_idx] = {}
-            for pos, tile in layer.items():
-                # Copy tile state with all attributes
-                new_tile = TileState(
-                    tile_type=tile.tile_type,
-                    layer_idx=tile.layer_idx,
-                    x_idx=tile.x_idx,
-                    y_idx=tile.y_idx,
-                    effect_type=tile.effect_type,
-                    effect_data=copy.copy(tile.effect_data) if tile.effect_data else {},
-                    picked=tile.picked,
-                    is_stack_tile=tile.is_stack_tile,
-                    is_craft_tile=tile.is_craft_tile,
-                    is_crafted=tile.is_crafted,
-                    stack_index=tile.stack_index,
-                    stack_max_index=tile.stack_max_index,
-                    upper_stacked_tile_key=tile.upper_stacked_tile_key,
-                    under_stacked_tile_key=tile.under_stacked_tile_key,
-                    root_stacked_tile_key=tile.root_stacked_tile_key,
-                    craft_direction=tile.craft_direction,
-                    origin_goal_type=tile.origin_goal_type,
-                    original_full_key=tile.original_full_key,
-                )
-                new_tiles[layer_idx][pos] = new_tile
+        # Copy tiles (they will be modified during play)
+        new_tiles: Dict[int, Dict[str, TileState]] = {
+            layer_idx: {pos: tile.copy() for pos, tile in layer.items()}
+            for layer_idx, layer in base_state.tiles.items()
+        }
 
         # Create new state with copied mutable data
         new_state = GameState()
         new_state.tiles = new_tiles
-        new_state.layer_cols = base_state.layer_cols.copy()  # Shallow - doesn't change
+        new_state.layer_cols = base_state.layer_cols  # Shared - doesn't change
         # CRITICAL: Copy dock slot lock status from base_state
         new_state.dock = [DockSlot(index=s.index, is_locked=s.is_locked) for s in base_state.dock]
         new_state.dock_tiles = []
@@ -2255,75 +3083,54 @@ class BotSimulator:
         new_state.combo_count = 0
         new_state.total_tiles_cleared = 0
         new_state.max_dock_slots = base_state.max_dock_slots
-        new_state.link_pairs = base_state.link_pairs.copy()
+        new_state.link_pairs = base_state.link_pairs  # Shared - links never move
         new_state.frog_positions = base_state.frog_positions.copy()
         new_state.bomb_tiles = base_state.bomb_tiles.copy()
         new_state.curtain_tiles = base_state.curtain_tiles.copy()
         new_state.ice_tiles = base_state.ice_tiles.copy()
-        new_state.stacked_tiles = {}  # Will be rebuilt if needed
-        new_state.craft_boxes = copy.deepcopy(base_state.craft_boxes) if base_state.craft_boxes else {}
+        new_state.stacked_tiles = {key: tile.copy() for key, tile in base_state.stacked_tiles.items()}
+        new_state.craft_boxes = base_state.craft_boxes  # Shared - box key lists never change
         new_state.teleport_click_count = 0
         new_state.teleport_tiles = base_state.teleport_tiles.copy() if base_state.teleport_tiles else []
         new_state.tile_type_overrides = base_state.tile_type_overrides.copy()
         new_state.all_tile_type_counts = base_state.all_tile_type_counts.copy()
         new_state._max_layer_idx = base_state._max_layer_idx
         new_state.curtain_memory = {}
-
-        # Copy stacked tiles with proper references
-        for key, stacked_tile in base_state.stacked_tiles.items():
-            new_stacked = TileState(
-                tile_type=stacked_tile.tile_type,
-                layer_idx=stacked_tile.layer_idx,
-                x_idx=stacked_tile.x_idx,
-                y_idx=stacked_tile.y_idx,
-                effect_type=stacked_tile.effect_type,
-                effect_data=copy.copy(stacked_tile.effect_data) if stacked_tile.effect_data else {},
-                picked=stacked_tile.picked,
-                is_stack_tile=stacked_tile.is_stack_tile,
-                is_craft_tile=stacked_tile.is_craft_tile,
-                is_crafted=stacked_tile.is_crafted,
-                stack_index=stacked_tile.stack_index,
-                stack_max_index=stacked_tile.stack_max_index,
-                upper_stacked_tile_key=stacked_tile.upper_stacked_tile_key,
-                under_stacked_tile_key=stacked_tile.under_stacked_tile_key,
-                root_stacked_tile_key=stacked_tile.root_stacked_tile_key,
-                craft_direction=stacked_tile.craft_direction,
-                origin_goal_type=stacked_tile.origin_goal_type,
-                original_full_key=stacked_tile.original_full_key,
-            )
-            new_state.stacked_tiles[key] = new_stacked
-
-        # Copy precomputed blocking maps (shallow - structure doesn't change)
+        new_state.remaining_tile_count = base_state.remaining_tile_count
+        new_state.remaining_type_counts = base_state.remaining_type_counts.copy()
+        new_state.exposed_type_counts = base_state.exposed_type_counts.copy()
+        new_state._cover_counts = base_state._cover_counts.copy()
+        new_state._exposed_slots = base_state._exposed_slots.copy()
+        new_state._counters_ready = base_state._counters_ready
+        new_state._gimmick_ids = base_state._gimmick_ids  # Shared - ids never change
+        new_state._gimmick_slots = base_state._gimmick_slots
+        new_state._gimmick_kinds = base_state._gimmick_kinds
+        new_state.gimmick_exposed = {kind: ids.copy() for kind, ids in base_state.gimmick_exposed.items()}
+        new_state.gimmick_covered = {kind: ids.copy() for kind, ids in base_state.gimmick_covered.items()}
+        new_state.gimmick_stuck = {kind: ids.copy() for kind, ids in base_state.gimmick_stuck.items()}
+        new_state.unpicked_ice_count = base_state.unpicked_ice_count
+        new_state._slot_order = base_state._slot_order.copy()
+        new_state._next_slot_order = base_state._next_slot_order
+        new_state._frog_slots = base_state._frog_slots.copy()
+        new_state._link_slots = base_state._link_slots  # Shared - links never move
+        new_state._link_sources = base_state._link_sources
+        new_state._pickable_slots = base_state._pickable_slots.copy()
+        new_state._pickable_dirty = base_state._pickable_dirty.copy()
+
+        # Share precomputed blocking maps (structure doesn't change); the cache
+        # reflects picked states, which equal the base state's
         if base_state._blocking_map is not None:
-            new_state._blocking_map = {k: v.copy() for k, v in base_state._blocking_map.items()}
-            new_state._reverse_blocking_map = {k: v.copy() for k, v in base_state._reverse_blocking_map.items()}
-            # Recompute blocking cache from current picked states
-            new_state._blocking_cache = {}
-            for tile_key, blockers in new_state._blocking_map.items():
-                is_blocked = False
-                for blocker_key in blockers:
-                    parts = blocker_key.split('_')
-                    if len(parts) >= 3:
-                        b_layer = int(parts[0])
-                        b_pos = f"{parts[1]}_{parts[2]}"
-                        blocker_tile = new_state.tiles.get(b_layer, {}).get(b_pos)
-                        if blocker_tile and not blocker_tile.picked:
-                            is_blocked = True
-                            break
-                new_state._blocking_cache[tile_key] = is_blocked
+            new_state._blocking_map = base_state._blocking_map
+            new_state._reverse_blocking_map = base_state._reverse_blocking_map
+            new_state._blocking_cache = base_state._blocking_cache.copy()
 
         return new_state
 
     def _is_blocked_by_upper(self, state: GameState, tile: TileState) -> bool:
         """Check if a tile is blocked by tiles in upper layers.
 
-        Based on sp_template TileGroup.FindAllUpperTiles logic:
-        - Same parity (layer 0→2, 1→3): Check same position only
-        - Different parity: Compare layer col sizes to determine offset direction
-          - Upper layer col > current layer col: Check (0,0), (+1,0), (0,+1), (+1,+1)
-          - Upper layer col <= current layer col: Check (-1,-1), (0,-1), (-1,0), (0,0)
-
-        Parity is determined by layer_idx % 2.
+        Based on sp_template TileGroup.FindAllUpperTiles logic (see
+        coverage_graph.blocking_offsets).
 
         Performance: Uses precomputed blocking map when available for O(1) lookup.
         """
@@ -2367,7 +3174,6 @@ class BotSimulator:
             state._blocking_cache[cache_key] = False
             return False
 
-        tile_parity = tile.layer_idx % 2
         cur_layer_col = state.layer_cols.get(tile.layer_idx, 7)
 
         result = False
@@ -2376,18 +3182,10 @@ class BotSimulator:
             if not layer:
                 continue
 
-            upper_parity = upper_layer_idx % 2
-            upper_layer_col = state.layer_cols.get(upper_layer_idx, 7)
-
-            if tile_parity == upper_parity:
-                blocking_offsets = BotSimulator.BLOCKING_OFFSETS_SAME_PARITY
-            else:
-                if upper_layer_col > cur_layer_col:
-                    blocking_offsets = BotSimulator.BLOCKING_OFFSETS_UPPER_BIGGER
-                else:
-                    blocking_offsets = BotSimulator.BLOCKING_OFFSETS_UPPER_SMALLER
-
-            for dx, dy in blocking_offsets:
+            offsets = blocking_offsets(
+                tile.layer_idx, upper_layer_idx, cur_layer_col, state.layer_cols.get(upper_layer_idx, 7)
+            )
+            for dx, dy in offsets:
                 bx = tile.x_idx + dx
                 by = tile.y_idx + dy
                 pos_key = f"{bx}_{by}"
@@ -2409,46 +3207,26 @@ class BotSimulator:
         # IMPORTANT: Collect unblocked ice tiles BEFORE marking tile as picked
         # Only these ice tiles should have their count decreased
         # Ice tiles that become unblocked AFTER this pick should NOT be melted this turn
-        # Performance optimization: use ice_tiles tracking dict instead of iterating all tiles
-        unblocked_ice_before_pick: set = set()
-        for ice_key, remaining in state.ice_tiles.items():
-            if remaining <= 0:
-                continue
-            # Parse layerIdx_x_y format
-            parts = ice_key.split('_')
-            if len(parts) >= 3:
-                l_idx = int(parts[0])
-                pos_key = f"{parts[1]}_{parts[2]}"
-                layer_tiles = state.tiles.get(l_idx, {})
-                tile = layer_tiles.get(pos_key)
-                if tile and not tile.picked:
-                    if not self._is_blocked_by_upper(state, tile):
-                        unblocked_ice_before_pick.add((l_idx, pos_key))
+        # Performance optimization: read the exposed ice frontier instead of checking every ice tile
+        self._ensure_tile_counters(state)
+        ice_slots = state._gimmick_slots
+        unblocked_ice_before_pick = {ice_slots[gimmick_id] for gimmick_id in state.gimmick_exposed["ice"]}
 
         # Check if this is a LINK tile and find its linked tile (forward direction)
         linked_tile = None
         if tile_state.effect_type in (TileEffectType.LINK_EAST, TileEffectType.LINK_WEST,
                                        TileEffectType.LINK_SOUTH, TileEffectType.LINK_NORTH):
-            linked_pos = tile_state.effect_data.get("linked_pos", "")
+            linked_pos = tile_state.linked_pos
             # Find linked tile in the SAME LAYER only
             my_layer_tiles = state.tiles.get(tile_state.layer_idx, {})
             linked_tile = my_layer_tiles.get(linked_pos)
         else:
             # Check reverse direction: is there a LINK tile in the SAME LAYER pointing to this tile?
-            my_pos = tile_state.position_key
-            my_layer_idx = tile_state.layer_idx
-            layer_tiles = state.tiles.get(my_layer_idx, {})
-            for tile in layer_tiles.values():
-                if tile.picked:
-                    continue
-                if tile.effect_type in (TileEffectType.LINK_EAST, TileEffectType.LINK_WEST,
-                                         TileEffectType.LINK_SOUTH, TileEffectType.LINK_NORTH):
-                    if tile.effect_data.get("linked_pos", "") == my_pos:
-                        linked_tile = tile
-                        break
+            linked_tile = self._find_link_source(state, tile_state)
 
         # Mark tile as picked
         tile_state.picked = True
+        self._on_tile_picked(state, tile_state)
 
         # Invalidate blocking cache when tile is picked (performance optimization)
         state._blocking_cache.clear()
@@ -2479,6 +3257,7 @@ class BotSimulator:
         # If this is a LINK tile, also pick the linked tile
         if linked_tile is not None and not linked_tile.picked:
             linked_tile.picked = True
+            self._on_tile_picked(state, linked_tile)
 
             # Update all_tile_type_counts for linked tile
             linked_type = linked_tile.tile_type
@@ -2541,6 +3320,7 @@ class BotSimulator:
                 pos_key = picked_tile.position_key
                 if pos_key in layer_tiles:
                     layer_tiles[pos_key] = under_tile
+                    self._on_tile_placed(state, under_tile)
 
     def _process_dock_matches(self, state: GameState) -> Dict[str, int]:
         """Process 3-matches in dock. Returns dict of cleared tiles by type.
@@ -2604,20 +3384,18 @@ class BotSimulator:
         # === Ice 처리: 타일 선택 전에 이미 가려지지 않았던 Ice 타일만 녹음 ===
         # 방금 가려짐이 해제된 ice 타일은 이번 턴에 녹지 않음
         if unblocked_ice_before_pick:
-            for l_idx, layer_tiles in state.tiles.items():
-                for pos_key, tile in layer_tiles.items():
-                    if tile.picked:
-                        continue
+            for l_idx, pos_key in unblocked_ice_before_pick:
+                tile = state.tiles.get(l_idx, {}).get(pos_key)
+                if tile is None or tile.picked or tile.effect_type != TileEffectType.ICE:
+                    continue
 
-                    if tile.effect_type == TileEffectType.ICE:
-                        # Only melt if it was already unblocked before the pick
-                        if (l_idx, pos_key) in unblocked_ice_before_pick:
-                            remaining = tile.effect_data.get("remaining", 0)
-                            if remaining > 0:
-                                tile.effect_data["remaining"] = remaining - 1
-                                # Update ice_tiles tracking
-                                ice_key = f"{l_idx}_{pos_key}"
-                                state.ice_tiles[ice_key] = remaining - 1
+                remaining = tile.remaining
+                if remaining > 0:
+                    tile.remaining = remaining - 1
+                    # Update ice_tiles tracking
+                    ice_key = f"{l_idx}_{pos_key}"
+                    state.ice_tiles[ice_key] = remaining - 1
+                    self._update_gimmick_frontier(state, (l_idx, pos_key))
 
         # === Grass 처리: 인접 타일(4방향)에만 영향 ===
         # Adjacent positions (4-directional)
@@ -2640,9 +3418,10 @@ class BotSimulator:
             # ONLY if the grass tile is NOT blocked by upper layer tiles
             if adj_tile.effect_type == TileEffectType.GRASS:
                 if not self._is_blocked_by_upper(state, adj_tile):
-                    remaining = adj_tile.effect_data.get("remaining", 0)
+                    remaining = adj_tile.remaining
                     if remaining > 0:
-                        adj_tile.effect_data["remaining"] = remaining - 1
+                        adj_tile.remaining = remaining - 1
+                        self._update_gimmick_frontier(state, (layer_idx, pos_key))
 
         # === Chain 처리: 수평 인접 타일에만 영향, 덮여있지 않은 경우에만 해제 ===
         horizontal_positions = [(x + 1, y), (x - 1, y)]
@@ -2659,32 +3438,36 @@ class BotSimulator:
             if adj_tile.effect_type == TileEffectType.CHAIN:
                 # 체인 타일이 덮여있으면 해제하지 않음 (잔디와 동일한 규칙)
                 if not self._is_blocked_by_upper(state, adj_tile):
-                    adj_tile.effect_data["unlocked"] = True
+                    adj_tile.unlocked = True
+                    self._update_gimmick_frontier(state, (layer_idx, pos_key))
 
         # Update link tiles status
         self._update_link_tiles_status(state)
 
     def _update_link_tiles_status(self, state: GameState) -> None:
         """Update can_pick status for all link tiles."""
-        for layer_idx, layer_tiles in state.tiles.items():
-            for tile in layer_tiles.values():
-                if tile.picked:
-                    continue
+        self._ensure_tile_counters(state)
+        for layer_idx, pos in state._link_slots:
+            layer_tiles = state.tiles.get(layer_idx, {})
+            tile = layer_tiles.get(pos)
+            if tile is None or tile.picked or tile.effect_type not in self.LINK_EFFECT_TYPES:
+                continue
 
-                if tile.effect_type in (TileEffectType.LINK_EAST, TileEffectType.LINK_WEST,
-                                         TileEffectType.LINK_SOUTH, TileEffectType.LINK_NORTH):
-                    linked_pos = tile.effect_data.get("linked_pos", "")
+            linked_pos = tile.linked_pos
 
-                    # Find linked tile in the SAME LAYER only
-                    linked_tile = layer_tiles.get(linked_pos)
+            # Find linked tile in the SAME LAYER only
+            linked_tile = layer_tiles.get(linked_pos)
 
-                    if linked_tile is None or linked_tile.picked:
-                        tile.effect_data["can_pick"] = True
-                    else:
-                        # Both tiles must be unblocked for link to be pickable
-                        tile_blocked = self._is_blocked_by_upper(state, tile)
-                        linked_blocked = self._is_blocked_by_upper(state, linked_tile)
-                        tile.effect_data["can_pick"] = not tile_blocked and not linked_blocked
+            if linked_tile is None or linked_tile.picked:
+                can_pick = True
+            else:
+                # Both tiles must be unblocked for link to be pickable
+                tile_blocked = self._is_blocked_by_upper(state, tile)
+                linked_blocked = self._is_blocked_by_upper(state, linked_tile)
+                can_pick = not tile_blocked and not linked_blocked
+            if tile.link_can_pick != can_pick:
+                tile.link_can_pick = can_pick
+                state._pickable_dirty.add((layer_idx, pos))
 
     def _get_frog_movable_tiles(self, state: GameState) -> List[Tuple[int, str, TileState]]:
         """Get list of tiles that frogs can move to.
@@ -2694,32 +3477,35 @@ class BotSimulator:
         - Is not blocked by upper layer
         - Does not already have a frog on it
         - Is a matchable tile type (not goal tiles or special tiles)
-        """
-        available_tiles: List[Tuple[int, str, TileState]] = []
 
-        for layer_idx, layer in state.tiles.items():
-            for pos, tile in layer.items():
-                # Skip picked tiles
-                if tile.picked:
-                    continue
+        Candidates come from the exposed-slot counters and are returned in
+        board scan order, so the frog shuffle does not depend on set order.
+        """
+        self._ensure_tile_counters(state)
+        layer_rank = {layer_idx: rank for rank, layer_idx in enumerate(state.tiles)}
+        slot_order = state._slot_order
+        exposed_slots = sorted(
+            state._exposed_slots,
+            key=lambda slot: (layer_rank[slot[0]], slot_order[slot]),
+        )
 
-                # Skip non-matchable tiles (goal tiles, etc.)
-                if tile.tile_type not in self.MATCHABLE_TYPES:
-                    continue
+        available_tiles: List[Tuple[int, str, TileState]] = []
+        for layer_idx, pos in exposed_slots:
+            tile = state.tiles[layer_idx][pos]
 
-                # Skip tiles that already have a frog
-                if tile.effect_data.get("on_frog", False):
-                    continue
+            # Skip non-matchable tiles (goal tiles, etc.)
+            if tile.tile_type not in self.MATCHABLE_TYPES:
+                continue
 
-                # Skip tiles blocked by upper layer
-                if self._is_blocked_by_upper(state, tile):
-                    continue
+            # Skip tiles that already have a frog
+            if tile.on_frog:
+                continue
 
-                # Skip tiles that can't be picked due to effects (chain, ice, etc.)
-                if not tile.can_pick():
-                    continue
+            # Skip tiles that can't be picked due to effects (chain, ice, etc.)
+            if not tile.can_pick():
+                continue
 
-                available_tiles.append((layer_idx, pos, tile))
+            available_tiles.append((layer_idx, pos, tile))
 
         return available_tiles
 
@@ -2737,19 +3523,21 @@ class BotSimulator:
         available_tiles = self._get_frog_movable_tiles(state)
 
         # Shuffle for random assignment
-        self._rng.shuffle(available_tiles)
+        self._rng_frog.shuffle(available_tiles)
 
-        # Collect current frog tiles (any tile with on_frog=True)
-        frog_tiles: List[Tuple[int, str, TileState]] = []
-        for layer_idx, layer in state.tiles.items():
-            for pos, tile in layer.items():
-                if tile.effect_data.get("on_frog", False):
-                    frog_tiles.append((layer_idx, pos, tile))
+        # Collect current frog tiles (tiles in the tracked frog slots still carrying a frog)
+        frog_tiles: List[TileState] = []
+        for layer_idx, pos in state._frog_slots:
+            tile = state.tiles.get(layer_idx, {}).get(pos)
+            if tile is not None and tile.on_frog:
+                frog_tiles.append(tile)
 
         # Clear all current frog positions
-        for layer_idx, pos, tile in frog_tiles:
-            tile.effect_data["on_frog"] = False
+        for tile in frog_tiles:
+            tile.on_frog = False
+        state._pickable_dirty.update(state._frog_slots)
         state.frog_positions.clear()
+        state._frog_slots.clear()
 
         # Move frogs to new positions
         # If fewer available tiles than frogs, some frogs won't have a place to go (removed)
@@ -2757,8 +3545,10 @@ class BotSimulator:
 
         for i in range(num_frogs_to_move):
             target_layer_idx, target_pos, target_tile = available_tiles[i]
-            target_tile.effect_data["on_frog"] = True
+            target_tile.on_frog = True
             state.frog_positions.add(target_pos)
+            state._frog_slots.add((target_layer_idx, target_pos))
+        state._pickable_dirty.update(state._frog_slots)
 
     def _process_move_effects(self, state: GameState, exposed_bombs_before_move: set = None,
                                exposed_curtains_before_move: set = None) -> None:
@@ -2793,7 +3583,7 @@ class BotSimulator:
             layer = state.tiles.get(layer_idx, {})
             if pos in layer and not layer[pos].picked:
                 state.bomb_tiles[bomb_key] -= 1
-                layer[pos].effect_data["remaining"] = state.bomb_tiles[bomb_key]
+                layer[pos].remaining = state.bomb_tiles[bomb_key]
 
         # Move frogs to random available tiles (sp_template FrogManager behavior)
         # All frogs move simultaneously when user picks a tile
@@ -2808,8 +3598,9 @@ class BotSimulator:
                 layer = state.tiles.get(layer_idx, {})
                 tile = layer.get(pos)
                 if tile and tile.effect_type == TileEffectType.CURTAIN and not tile.picked:
-                    new_state = not tile.effect_data.get("is_open", True)
-                    tile.effect_data["is_open"] = new_state
+                    new_state = not tile.is_open
+                    tile.is_open = new_state
+                    state._pickable_dirty.add((layer_idx, pos))
                     # Update curtain_tiles tracking
                     curtain_key = f"{layer_idx}_{pos}"
                     if curtain_key in state.curtain_tiles:
@@ -2854,7 +3645,6 @@ class BotSimulator:
                 state.tile_type_overrides[tile_key] = tile.tile_type
                 # Remove teleport effect
                 tile.effect_type = TileEffectType.NONE
-                tile.attribute = None
             # Clear teleport tracking
             state.teleport_tiles = []
             state.teleport_click_count = 0
@@ -2874,7 +3664,7 @@ class BotSimulator:
 
         # Sattolo shuffle: i > 0, j = random(0, i-1)
         for i in range(n - 1, 0, -1):
-            j = self._rng.randint(0, i - 1)  # Note: exclusive upper bound like Sattolo
+            j = self._rng_teleport.randint(0, i - 1)  # Note: exclusive upper bound like Sattolo
             tiles_copy[i], tiles_copy[j] = tiles_copy[j], tiles_copy[i]
 
         # Now perform circular tile type swap based on shuffled order
@@ -2882,30 +3672,135 @@ class BotSimulator:
         if n > 0:
             first_type = active_teleport_tiles[0].tile_type
             for i in range(n - 1):
-                active_teleport_tiles[i].tile_type = active_teleport_tiles[i + 1].tile_type
-            active_teleport_tiles[n - 1].tile_type = first_type
+                self._on_tile_retyped(state, active_teleport_tiles[i], active_teleport_tiles[i + 1].tile_type)
+            self._on_tile_retyped(state, active_teleport_tiles[n - 1], first_type)
+
+    def _build_scoring_context(self, state: GameState) -> ScoringContext:
+        """Collect the per-turn inputs of _score_move_with_profile.
+
+        The result is valid until the state changes, i.e. for every move
+        scored against this state.
+        """
+        dock_type_counts: Dict[str, int] = {}
+        for t in state.dock_tiles:
+            dock_type_counts[t.tile_type] = dock_type_counts.get(t.tile_type, 0) + 1
+
+        type_counts = self._get_accessible_type_counts(state)
+        return ScoringContext(
+            dock_count=len(state.dock_tiles),
+            dock_type_counts=dock_type_counts,
+            accessible_type_counts=type_counts,
+            remaining_accessible=sum(type_counts.values()),
+            goals_total=sum(state.goals_remaining.values()) if state.goals_remaining else 0,
+            has_locked_slots=any(slot.is_locked for slot in state.dock),
+            unlocked_slots=sum(1 for s in state.dock if not s.is_locked),
+        )
+
+    def _fill_gimmick_scoring_context(self, state: GameState, context: ScoringContext) -> None:
+        """Fill the gimmick section of a scoring context (no-op once filled).
+
+        Covers the board scans of the game-over prevention block: chain/grass
+        isolation, exposed bombs and ice, and the effect deadlock ratio.
+        """
+        if context.gimmicks_ready:
+            return
+        context.gimmicks_ready = True
+        self._ensure_tile_counters(state)
+        slots = state._gimmick_slots
+
+        # A blocked chain/grass loses a neighbor when the pick at that neighbor
+        # happens; record, per neighbor slot, how many would become unclearable
+        for kind, isolating in (("chain", context.isolating_chains), ("grass", context.isolating_grass)):
+            for gimmick_id in state.gimmick_exposed[kind] | state.gimmick_covered[kind]:
+                layer_idx, pos = slots[gimmick_id]
+                layer_tiles = state.tiles.get(layer_idx, {})
+                gimmick_tile = layer_tiles[pos]
+                if not self._is_blocked_by_upper(state, gimmick_tile):
+                    continue
+                x, y = gimmick_tile.x_idx, gimmick_tile.y_idx
+                if kind == "chain":
+                    neighbors = [(x - 1, y), (x + 1, y)]
+                    needed = 1
+                else:
+                    neighbors = [(x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)]
+                    needed = gimmick_tile.remaining
+                unpicked = []
+                for nx, ny in neighbors:
+                    neighbor = layer_tiles.get(f"{nx}_{ny}")
+                    unpicked.append(neighbor is not None and not neighbor.picked)
+                total = sum(unpicked)
+                for (nx, ny), is_unpicked in zip(neighbors, unpicked):
+                    if total - is_unpicked < needed:
+                        key = (layer_idx, nx, ny)
+                        isolating[key] = isolating.get(key, 0) + 1
+
+        for bomb_key, remaining in state.bomb_tiles.items():
+            parts = bomb_key.split('_')
+            if len(parts) >= 3:
+                layer_idx = int(parts[0])
+                pos = f"{parts[1]}_{parts[2]}"
+                layer = state.tiles.get(layer_idx, {})
+                if pos in layer and not layer[pos].picked:
+                    if not self._is_blocked_by_upper(state, layer[pos]):
+                        context.min_bomb_remaining = min(context.min_bomb_remaining, remaining)
+                        context.exposed_bomb_slots.add((layer_idx, pos))
+
+        for ice_key, remaining in state.ice_tiles.items():
+            if remaining <= 0:
+                continue
+            parts = ice_key.split('_')
+            if len(parts) >= 3:
+                ice_tile = state.tiles.get(int(parts[0]), {}).get(f"{parts[1]}_{parts[2]}")
+                if ice_tile and not ice_tile.picked:
+                    if not self._is_blocked_by_upper(state, ice_tile):
+                        context.exposed_ice_count += 1
+                    else:
+                        context.blocked_ice_count += 1
+
+        for layer in reversed(list(state.tiles.values())):
+            if layer:
+                context.last_tile_layer_idx = next(reversed(layer.values())).layer_idx
+                break
+
+        accessible = self._get_accessible_tiles(state)
+        context.accessible_count = len(accessible)
+        context.effect_blocked_count = sum(
+            1 for t in accessible
+            if t.effect_type in (TileEffectType.ICE, TileEffectType.CHAIN,
+                                 TileEffectType.GRASS, TileEffectType.LINK_EAST,
+                                 TileEffectType.LINK_WEST, TileEffectType.LINK_SOUTH,
+                                 TileEffectType.LINK_NORTH)
+            and not self._can_pick_tile(state, t)
+        )
 
     def _score_move_with_profile(
-        self, move: Move, state: GameState, profile: BotProfile
+        self,
+        move: Move,
+        state: GameState,
+        profile: BotProfile,
+        context: Optional[ScoringContext] = None,
     ) -> float:
         """Score a move based on bot profile characteristics.
 
-        Optimized: Pre-compute expensive values only when needed.
+        Args:
+            move: Move to score
+            state: Current game state
+            profile: Bot profile
+            context: Per-turn inputs from _build_scoring_context; built here
+                when omitted. Callers scoring several moves on one state
+                should build it once and pass it to every call.
         """
+        if context is None:
+            context = self._build_scoring_context(state)
         base_score = 1.0
-        dock_count = len(state.dock_tiles)
+        dock_count = context.dock_count
 
         # CRITICAL: Moves that complete a 3-match get MASSIVE bonus
         # This is the most important factor - always prefer matching
         if move.will_match:
             base_score += 100.0  # Very high - matching is always best
 
-        # Pre-compute dock tile type counts once (only if needed)
-        dock_type_counts = None
-        if move.match_count == 2 or (profile.pattern_recognition >= 1.0 and dock_count >= 4 and not move.will_match):
-            dock_type_counts = {}
-            for t in state.dock_tiles:
-                dock_type_counts[t.tile_type] = dock_type_counts.get(t.tile_type, 0) + 1
+        dock_type_counts = context.dock_type_counts
 
         # IMPORTANT: Tiles that bring us to 2-in-dock are valuable
         # because they set up the next match
@@ -2913,9 +3808,8 @@ class BotSimulator:
         same_type_accessible = None
 
         if move.match_count == 2:
-            # Use cached type counts - subtract 1 for current tile
-            type_counts = self._get_accessible_type_counts(state)
-            count = type_counts.get(move.tile_type, 0)
+            # Subtract 1 for current tile
+            count = context.accessible_type_counts.get(move.tile_type, 0)
             same_type_accessible = max(0, count - 1)
             if same_type_accessible >= 1:
                 # Good setup - we can complete match next move
@@ -2975,13 +3869,8 @@ class BotSimulator:
                         if linked_count == 0:
                             linked_new_type = True
 
-            # Calculate remaining tiles for endgame detection (use cached type counts)
-            type_counts = self._get_accessible_type_counts(state)
-            remaining_tiles = sum(type_counts.values())
-
             # Endgame: few tiles remaining and goals mostly complete
-            goals_total = sum(state.goals_remaining.values()) if state.goals_remaining else 0
-            is_endgame = remaining_tiles <= 20 or goals_total == 0
+            is_endgame = context.remaining_accessible <= 20 or context.goals_total == 0
 
             # For link tiles: both types must have tiles in dock to be safe
             is_link_move = bool(move.linked_tiles)
@@ -3021,11 +3910,6 @@ class BotSimulator:
         # Phase 3: Only allow if ENABLE_HIDDEN_INFO_BLOCK is disabled (legacy behavior)
         if profile.pattern_recognition >= 1.0 and not BotSimulatorConfig.ENABLE_HIDDEN_INFO_BLOCK:
             total_of_type = state.all_tile_type_counts.get(move.tile_type, 0)
-            # Ensure dock_type_counts is computed for optimal bot
-            if dock_type_counts is None:
-                dock_type_counts = {}
-                for t in state.dock_tiles:
-                    dock_type_counts[t.tile_type] = dock_type_counts.get(t.tile_type, 0) + 1
             in_dock = dock_type_counts.get(move.tile_type, 0)
             # Check if this type can form complete sets of 3
             remaining_after_pick = total_of_type - 1  # After picking this tile
@@ -3044,9 +3928,7 @@ class BotSimulator:
                 # Already computed above - reuse it
                 same_type_on_board = same_type_accessible
             else:
-                # Use cached type counts - subtract 1 for current tile
-                type_counts = self._get_accessible_type_counts(state)
-                count = type_counts.get(move.tile_type, 0)
+                count = context.accessible_type_counts.get(move.tile_type, 0)
                 # Subtract 1 because we want "other" tiles of same type (not including current tile)
                 same_type_on_board = max(0, count - 1)
 
@@ -3057,8 +3939,7 @@ class BotSimulator:
             type_concentration_bonus = profile.pattern_recognition * 5.0
 
             # Check dock state for enhanced bonus
-            dock_has_same_type = any(t.tile_type == move.tile_type for t in state.dock_tiles)
-            if dock_has_same_type:
+            if move.tile_type in dock_type_counts:
                 # Already have this type in dock - great for matching!
                 type_concentration_bonus += 50.0 * profile.blocking_awareness
             elif dock_count == 0:
@@ -3079,10 +3960,6 @@ class BotSimulator:
             # Phase 3: Only allow if ENABLE_HIDDEN_INFO_BLOCK is disabled (legacy behavior)
             if profile.pattern_recognition >= 1.0 and not BotSimulatorConfig.ENABLE_HIDDEN_INFO_BLOCK:
                 total_of_type = state.all_tile_type_counts.get(move.tile_type, 0)
-                if dock_type_counts is None:
-                    dock_type_counts = {}
-                    for t in state.dock_tiles:
-                        dock_type_counts[t.tile_type] = dock_type_counts.get(t.tile_type, 0) + 1
                 in_dock = dock_type_counts.get(move.tile_type, 0)
                 hidden_remaining = total_of_type - in_dock - 1  # -1 for this tile
                 if hidden_remaining >= 2:
@@ -3175,10 +4052,8 @@ class BotSimulator:
         # KEY TILE PRIORITY - unlock dock slots when locked
         # Key tiles unlock one dock slot when 3 are matched
         # Without unlocking, player has fewer dock slots = higher game over risk
-        has_locked_slots = any(slot.is_locked for slot in state.dock)
-        if has_locked_slots and move.tile_type == "key":
-            # Count key tiles already in dock
-            key_in_dock = sum(1 for t in state.dock_tiles if t.tile_type == "key")
+        if context.has_locked_slots and move.tile_type == "key":
+            key_in_dock = dock_type_counts.get("key", 0)
 
             # Base bonus scaled by bot's awareness level
             # Higher awareness = more strategic about unlocking
@@ -3196,7 +4071,7 @@ class BotSimulator:
 
             # Extra urgency when dock is pressured
             # With locked slots, effective dock space is smaller
-            unlocked_slots = sum(1 for s in state.dock if not s.is_locked)
+            unlocked_slots = context.unlocked_slots
             if dock_count >= unlocked_slots - 1:
                 # Critical: dock almost full relative to available slots
                 base_score += 20.0 * awareness_factor
@@ -3244,7 +4119,7 @@ class BotSimulator:
                             craft_tile = state.stacked_tiles.get(tile_key)
                             if craft_tile:
                                 # Count tiles matching current dock tiles
-                                if any(d.tile_type == craft_tile.tile_type for d in state.dock_tiles):
+                                if craft_tile.tile_type in dock_type_counts:
                                     matching_in_craft += 1
                                 # Count goal tiles in craft box
                                 if craft_tile.tile_type in state.goals_remaining:
@@ -3279,7 +4154,7 @@ class BotSimulator:
                         while current_tile:
                             stack_depth += 1
                             # Check if this tile matches dock tiles
-                            if any(d.tile_type == current_tile.tile_type for d in state.dock_tiles):
+                            if current_tile.tile_type in dock_type_counts:
                                 matching_in_stack += 1
                             # Check if this is a goal tile
                             if current_tile.tile_type in state.goals_remaining:
@@ -3315,10 +4190,11 @@ class BotSimulator:
         # Learn to avoid moves that lead to effect-based game over scenarios
         if profile.blocking_awareness >= 0.7:  # Average, Expert, Optimal bots
             tile_state = move.tile_state
+            self._fill_gimmick_scoring_context(state, context)
 
             # 1. ICE tiles: Penalty if dock is filling and ice tiles are blocking critical tiles
             if tile_state and tile_state.effect_type == TileEffectType.ICE:
-                remaining_ice = tile_state.effect_data.get("remaining", 0)
+                remaining_ice = tile_state.remaining
                 if remaining_ice > 0 and dock_count >= 4:
                     # Can't pick ice tiles directly - this shouldn't happen, but safety check
                     base_score -= profile.blocking_awareness * 10.0
@@ -3354,7 +4230,7 @@ class BotSimulator:
                         neighbor_tile = layer_tiles[neighbor_pos]
                         if (not neighbor_tile.picked and
                             neighbor_tile.effect_type == TileEffectType.CHAIN and
-                            not neighbor_tile.effect_data.get("unlocked", False)):
+                            not neighbor_tile.unlocked):
                             # Count how many horizontal neighbors the chain has
                             chain_x, chain_y = neighbor_tile.x_idx, neighbor_tile.y_idx
                             chain_h_neighbors = [(chain_x - 1, chain_y), (chain_x + 1, chain_y)]
@@ -3379,9 +4255,7 @@ class BotSimulator:
                 if chain_unlock_bonus > 0:
                     # [v15.31] Balance chain unlock bonus with type matching priority
                     # CRITICAL: Type concentration is MORE important than chain unlock at game start
-                    dock_has_same_type = any(t.tile_type == move.tile_type for t in state.dock_tiles)
-
-                    if dock_has_same_type:
+                    if move.tile_type in dock_type_counts:
                         # BONUS: Can help match AND unlock chain - excellent move
                         chain_unlock_bonus *= 1.5
                     else:
@@ -3415,7 +4289,7 @@ class BotSimulator:
                         neighbor_tile = layer_tiles[neighbor_pos]
                         if (not neighbor_tile.picked and
                             neighbor_tile.effect_type == TileEffectType.GRASS):
-                            remaining_grass = neighbor_tile.effect_data.get("remaining", 0)
+                            remaining_grass = neighbor_tile.remaining
                             if remaining_grass > 0:
                                 # Count how many adjacent tiles the grass has (accessibility)
                                 grass_x, grass_y = neighbor_tile.x_idx, neighbor_tile.y_idx
@@ -3455,9 +4329,7 @@ class BotSimulator:
                 if grass_reduce_bonus > 0:
                     # [v15.31] Balance grass reduce bonus with type matching priority
                     # Same logic as chain: type concentration is more important early game
-                    dock_has_same_type = any(t.tile_type == move.tile_type for t in state.dock_tiles)
-
-                    if dock_has_same_type:
+                    if move.tile_type in dock_type_counts:
                         grass_reduce_bonus *= 1.5  # BONUS: match + grass reduce
                     else:
                         # REDUCE: Adding new type - grass unlock is much less valuable
@@ -3471,131 +4343,25 @@ class BotSimulator:
 
                     base_score += grass_reduce_bonus
 
-            # 3. CHAIN tiles: Collect locked chain positions for isolation check
-            locked_chain_positions = []
-            for layer_idx, layer in state.tiles.items():
-                for pos, tile in layer.items():
-                    if not tile.picked and tile.effect_type == TileEffectType.CHAIN:
-                        if not tile.effect_data.get("unlocked", False):
-                            locked_chain_positions.append((layer_idx, pos, tile))
-
             # ============================================================
-            # [v15.31] CHAIN ISOLATION DANGER - Only penalize when:
+            # [v15.31] 3. CHAIN ISOLATION DANGER - Only penalize when:
             # 1. Chain is BLOCKED by upper layer (can't be unlocked yet)
             # 2. This move is adjacent to the chain (left/right)
             # 3. This move would leave chain with NO horizontal neighbors (game over)
-            # ============================================================
-            if tile_state and locked_chain_positions:
-                move_pos = tile_state.position_key
-                move_layer = tile_state.layer_idx
-                move_x, move_y = tile_state.x_idx, tile_state.y_idx
-
-                for chain_layer_idx, chain_pos, chain_tile in locked_chain_positions:
-                    # Only check chains in the same layer
-                    if chain_layer_idx != move_layer:
-                        continue
-
-                    chain_x, chain_y = chain_tile.x_idx, chain_tile.y_idx
-                    horizontal_neighbors = [
-                        (chain_x - 1, chain_y),
-                        (chain_x + 1, chain_y)
-                    ]
-
-                    # Check if THIS move is adjacent to the chain
-                    is_move_adjacent_to_chain = (move_x, move_y) in horizontal_neighbors
-
-                    # Skip if this move is NOT adjacent to the chain
-                    if not is_move_adjacent_to_chain:
-                        continue
-
-                    # Check if chain is blocked by upper layer
-                    chain_is_blocked = self._is_blocked_by_upper(state, chain_tile)
-
-                    # If chain is NOT blocked and move is adjacent, it will UNLOCK the chain
-                    # No penalty - this is a GOOD move
-                    if not chain_is_blocked:
-                        continue
-
-                    # Chain IS blocked - check if this move would cause isolation
-                    # Count remaining horizontal neighbors after this move
-                    remaining_neighbors = 0
-                    for nx, ny in horizontal_neighbors:
-                        neighbor_pos = f"{nx}_{ny}"
-                        if neighbor_pos == move_pos:
-                            # This tile would be removed by this move
-                            continue
-                        layer_tiles = state.tiles.get(chain_layer_idx, {})
-                        neighbor = layer_tiles.get(neighbor_pos)
-                        if neighbor and not neighbor.picked:
-                            remaining_neighbors += 1
-
-                    # If this move would leave chain with NO horizontal neighbors
-                    # while chain is still blocked = guaranteed game over
-                    if remaining_neighbors == 0:
-                        # CRITICAL: This move would cause guaranteed game over
-                        base_score -= 1000.0 * profile.blocking_awareness
-
-            # ============================================================
+            #
             # 4. GRASS ISOLATION DANGER - Only penalize when:
             # 1. Grass is BLOCKED by upper layer (can't be reduced yet)
             # 2. This move is adjacent to the grass (up/down/left/right)
             # 3. This move would leave grass with insufficient neighbors to clear
             # ============================================================
-            grass_positions = []
-            for layer_idx, layer in state.tiles.items():
-                for pos, tile in layer.items():
-                    if not tile.picked and tile.effect_type == TileEffectType.GRASS:
-                        remaining_grass = tile.effect_data.get("remaining", 0)
-                        if remaining_grass > 0:
-                            grass_positions.append((layer_idx, pos, tile, remaining_grass))
-
-            if tile_state and grass_positions:
-                move_pos = tile_state.position_key
-                move_layer = tile_state.layer_idx
-                move_x, move_y = tile_state.x_idx, tile_state.y_idx
-
-                for grass_layer_idx, grass_pos, grass_tile, remaining_grass in grass_positions:
-                    # Only check grass in the same layer
-                    if grass_layer_idx != move_layer:
-                        continue
-
-                    grass_x, grass_y = grass_tile.x_idx, grass_tile.y_idx
-                    adjacent_neighbors = [
-                        (grass_x - 1, grass_y), (grass_x + 1, grass_y),
-                        (grass_x, grass_y - 1), (grass_x, grass_y + 1)
-                    ]
-
-                    # Check if THIS move is adjacent to the grass
-                    is_move_adjacent_to_grass = (move_x, move_y) in adjacent_neighbors
-
-                    # Skip if this move is NOT adjacent to the grass
-                    if not is_move_adjacent_to_grass:
-                        continue
-
-                    # Check if grass is blocked by upper layer
-                    grass_is_blocked = self._is_blocked_by_upper(state, grass_tile)
-
-                    # If grass is NOT blocked and move is adjacent, it will REDUCE the grass
-                    # No penalty - this is a GOOD move
-                    if not grass_is_blocked:
-                        continue
-
-                    # Grass IS blocked - check if this move would cause isolation
-                    # Count remaining adjacent neighbors after this move
-                    remaining_neighbors = 0
-                    for nx, ny in adjacent_neighbors:
-                        neighbor_pos = f"{nx}_{ny}"
-                        if neighbor_pos == move_pos:
-                            continue
-                        layer_tiles = state.tiles.get(grass_layer_idx, {})
-                        neighbor = layer_tiles.get(neighbor_pos)
-                        if neighbor and not neighbor.picked:
-                            remaining_neighbors += 1
-
-                    # If remaining neighbors < remaining grass layers = impossible to clear
-                    if remaining_neighbors < remaining_grass:
-                        # CRITICAL: This move would make grass impossible to clear
-                        base_score -= 800.0 * profile.blocking_awareness
+            if tile_state:
+                move_slot = (tile_state.layer_idx, tile_state.x_idx, tile_state.y_idx)
+                for _ in range(context.isolating_chains.get(move_slot, 0)):
+                    # CRITICAL: This move would cause guaranteed game over
+                    base_score -= 1000.0 * profile.blocking_awareness
+                for _ in range(context.isolating_grass.get(move_slot, 0)):
+                    # CRITICAL: This move would make grass impossible to clear
+                    base_score -= 800.0 * profile.blocking_awareness
 
             # 4. LINK tiles: Bonus for completing link pairs (clears 2 tiles at once)
             # [v15.17] Enhanced bonus - links are very efficient (2 tiles per move)
@@ -3619,28 +4385,12 @@ class BotSimulator:
                 bomb_noticed = self._is_gimmick_noticed(TileEffectType.BOMB, profile)
 
                 if bomb_noticed:
-                    # Find exposed bombs and their urgency
-                    critical_bomb_move = False
-                    min_bomb_remaining = float('inf')
-
-                    for bomb_key, remaining in state.bomb_tiles.items():
-                        # Parse bomb key: layerIdx_x_y
-                        parts = bomb_key.split('_')
-                        if len(parts) >= 3:
-                            layer_idx = int(parts[0])
-                            pos = f"{parts[1]}_{parts[2]}"
-                            layer = state.tiles.get(layer_idx, {})
-                            if pos in layer and not layer[pos].picked:
-                                bomb_tile = layer[pos]
-                                # Check if bomb is exposed (not blocked by upper layer)
-                                if not self._is_blocked_by_upper(state, bomb_tile):
-                                    min_bomb_remaining = min(min_bomb_remaining, remaining)
-
-                                    # Check if THIS move is picking this bomb tile
-                                    if (tile_state and
-                                        tile_state.layer_idx == layer_idx and
-                                        tile_state.position_key == pos):
-                                        critical_bomb_move = True
+                    # Exposed bombs and their urgency
+                    min_bomb_remaining = context.min_bomb_remaining
+                    critical_bomb_move = bool(
+                        tile_state and
+                        (tile_state.layer_idx, tile_state.position_key) in context.exposed_bomb_slots
+                    )
 
                     # Score adjustment based on bomb urgency
                     if min_bomb_remaining != float('inf'):
@@ -3689,26 +4439,8 @@ class BotSimulator:
             #   - Prioritize unblocking ICE (bonus for removing blocking tiles)
             # ============================================================
             if tile_state:
-                # Use ice_tiles tracking dict for efficiency
-                exposed_ice_count = 0
-                blocked_ice_count = 0
-
-                for ice_key, remaining in state.ice_tiles.items():
-                    if remaining <= 0:
-                        continue
-                    # Parse layerIdx_x_y format
-                    parts = ice_key.split('_')
-                    if len(parts) >= 3:
-                        l_idx = int(parts[0])
-                        pos_key = f"{parts[1]}_{parts[2]}"
-                        ice_tile = state.tiles.get(l_idx, {}).get(pos_key)
-                        if ice_tile and not ice_tile.picked:
-                            if not self._is_blocked_by_upper(state, ice_tile):
-                                # ICE is exposed - any pick will reduce its count
-                                exposed_ice_count += 1
-                            else:
-                                # ICE is blocked - need to clear blocking tiles first
-                                blocked_ice_count += 1
+                exposed_ice_count = context.exposed_ice_count
+                blocked_ice_count = context.blocked_ice_count
 
                 # Bonus 1: If exposed ICE exists, this pick helps clear it
                 if exposed_ice_count > 0:
@@ -3718,7 +4450,8 @@ class BotSimulator:
 
                 # Bonus 2: Extra priority for moves that might unblock ICE
                 # (This is heuristic - checking actual blocking is expensive)
-                if blocked_ice_count > 0 and tile.layer_idx > 0:
+                # (layer of the last tile on the board, not of this move - kept as tuned)
+                if blocked_ice_count > 0 and context.last_tile_layer_idx > 0:
                     # Tiles on higher layers more likely to be blocking something
                     unblock_bonus = 8.0 * profile.blocking_awareness
                     base_score += unblock_bonus
@@ -3728,7 +4461,7 @@ class BotSimulator:
             # Prefer picking open curtains (known type) over closed (unknown)
             # ============================================================
             if tile_state and tile_state.effect_type == TileEffectType.CURTAIN:
-                curtain_is_open = tile_state.effect_data.get("is_open", True)
+                curtain_is_open = tile_state.is_open
                 if curtain_is_open:
                     # Open curtain - we know the type, safe to pick
                     base_score += 10.0 * profile.blocking_awareness
@@ -3741,16 +4474,8 @@ class BotSimulator:
 
             # 9. General effect tile deadlock detection
             # If many effect tiles remain and accessible tiles are limited
-            accessible = self._get_accessible_tiles(state)
-            effect_tiles = sum(
-                1 for t in accessible
-                if t.effect_type in (TileEffectType.ICE, TileEffectType.CHAIN,
-                                     TileEffectType.GRASS, TileEffectType.LINK_EAST,
-                                     TileEffectType.LINK_WEST, TileEffectType.LINK_SOUTH,
-                                     TileEffectType.LINK_NORTH)
-                and not self._can_pick_tile(state, t)
-            )
-            total_accessible = len(accessible)
+            effect_tiles = context.effect_blocked_count
+            total_accessible = context.accessible_count
             if total_accessible > 0:
                 effect_ratio = effect_tiles / total_accessible
                 if effect_ratio > 0.5 and dock_count >= 5 and not move.will_match:
@@ -3760,7 +4485,7 @@ class BotSimulator:
 
         # Add randomness based on profile (NONE for optimal bot)
         if profile.pattern_recognition < 1.0:
-            randomness = (1 - profile.pattern_recognition) * self._rng.random() * 2
+            randomness = (1 - profile.pattern_recognition) * self._rng_noise.random() * 2
             base_score += randomness
         # Optimal bot (pattern_recognition=1.0) is perfectly deterministic
 
@@ -3836,7 +4561,7 @@ class BotSimulator:
             if move.match_count == 2:
                 base_prob += 0.15
 
-            if self._rng.random() < base_prob:
+            if self._rng_attention.random() < base_prob:
                 visible_moves.append(move)
 
         # Ensure at least one move is available
@@ -3844,9 +4569,9 @@ class BotSimulator:
             # Pick random from top layer
             top_layer_moves = [m for m in moves if m.layer_idx == max_layer]
             if top_layer_moves:
-                visible_moves = [self._rng.choice(top_layer_moves)]
+                visible_moves = [self._rng_choice.choice(top_layer_moves)]
             else:
-                visible_moves = [self._rng.choice(moves)]
+                visible_moves = [self._rng_choice.choice(moves)]
 
         return visible_moves
 
@@ -3904,7 +4629,7 @@ class BotSimulator:
             return True  # Always notice if feature disabled
 
         notice_rate = self._get_gimmick_notice_rate(effect_type, profile)
-        return self._rng.random() < notice_rate
+        return self._rng_notice.random() < notice_rate
 
     def _apply_dock_panic(
         self,
@@ -4044,7 +4769,7 @@ class BotSimulator:
             # Memory accuracy depends on pattern_recognition and age
             accuracy = profile.pattern_recognition * (1.0 - age * 0.1)
 
-            if self._rng.random() < accuracy:
+            if self._rng_notice.random() < accuracy:
                 return remembered  # Correct memory
             else:
                 return not remembered  # Incorrect memory
@@ -4070,8 +4795,15 @@ class BotSimulator:
         adjusted_mistake_rate, adjusted_lookahead = self._apply_dock_panic(profile, dock_count)
 
         # Check for mistake (random wrong choice) - using adjusted rate
-        if self._rng.random() < adjusted_mistake_rate:
-            return self._rng.choice(moves)
+        if self._rng_mistake.random() < adjusted_mistake_rate:
+            return self._rng_choice.choice(moves)
+
+        # Optimal bot: play small gimmick-free endgames exactly instead of by heuristics
+        # (never with mistakes, since a solved line is then followed without scoring)
+        if profile.bot_type == BotType.OPTIMAL and profile.mistake_rate == 0 and not state._endgame_lost:
+            solved_move = self._endgame_move(state, moves)
+            if solved_move is not None:
+                return solved_move
 
         # CRITICAL: Filter out dangerous moves that would cause game over
         # Score threshold: -100 indicates critical danger (e.g., chain isolation)
@@ -4100,7 +4832,7 @@ class BotSimulator:
             # 성급한 플레이어: 상위 후보 중 랜덤 선택
             # patience가 낮을수록 더 적은 후보에서 선택
             cutoff = max(1, int(len(sorted_moves) * (0.3 + profile.patience * 0.4)))
-            return self._rng.choice(sorted_moves[:cutoff])
+            return self._rng_choice.choice(sorted_moves[:cutoff])
         elif profile.patience >= 0.8 and len(sorted_moves) > 1:
             # 신중한 플레이어: 점수 차이가 작으면 2-in-dock 셋업 우선
             top_score = sorted_moves[0].score
@@ -4128,10 +4860,22 @@ class BotSimulator:
             if not candidates:
                 return sorted_moves[0]
 
-            best_move = candidates[0]
+            # The estimate depends on a move only through its score and tile type,
+            # so only the best-scored candidate of each type can win; with a
+            # single type left the move is forced and lookahead is skipped
+            contenders = []
+            seen_types = set()
+            for move in candidates:
+                if move.tile_type not in seen_types:
+                    seen_types.add(move.tile_type)
+                    contenders.append(move)
+            if len(contenders) == 1:
+                return contenders[0]
+
+            best_move = contenders[0]
             best_future_score = self._estimate_future_score(state, best_move, adaptive_depth)
 
-            for move in candidates[1:]:
+            for move in contenders[1:]:
                 future_score = self._estimate_future_score(state, move, adaptive_depth)
                 if future_score > best_future_score:
                     best_move = move
@@ -4141,17 +4885,113 @@ class BotSimulator:
 
         return sorted_moves[0]
 
+    def _endgame_move(self, state: GameState, moves: List[Move]) -> Optional[Move]:
+        """Next move of a solved winning endgame line, or None to use the heuristics.
+
+        Solves once per game when the board turns into a small plain endgame
+        (see endgame_solver) and then follows the stored line, so later turns
+        cost a dict lookup. A proven loss is remembered on the state and the
+        solver is not asked again for that game.
+        """
+        if state._endgame_line:
+            slot = state._endgame_line[0]
+            for move in moves:
+                if (move.layer_idx, move.position) == slot:
+                    state._endgame_line.pop(0)
+                    return move
+            state._endgame_line = []  # Left the line (a mistake); solve again
+
+        endgame = self._plain_endgame(state)
+        if endgame is None:
+            return None
+        tiles, tile_types, blockers, dock_counts = endgame
+
+        index_of = {(tile.layer_idx, tile.position_key): i for i, tile in enumerate(tiles)}
+        root_moves = [index_of[(m.layer_idx, m.position)] for m in moves if (m.layer_idx, m.position) in index_of]
+        solution = solve_endgame(tile_types, blockers, dock_counts, state.max_dock_slots, root_moves)
+        if solution.winnable is None:
+            return None  # Too large to decide yet; retry next turn with one tile less
+        if not solution.winnable:
+            state._endgame_lost = True
+            return None
+
+        state._endgame_line = [(tiles[i].layer_idx, tiles[i].position_key) for i in solution.line[1:]]
+        first = tiles[solution.line[0]]
+        for move in moves:
+            if move.layer_idx == first.layer_idx and move.position == first.position_key:
+                return move
+        return None
+
+    def _plain_endgame(
+        self, state: GameState
+    ) -> Optional[Tuple[List[TileState], List[int], List[int], List[int]]]:
+        """Compact solver input if only a few plain tiles remain, else None.
+
+        Plain means nothing but the pick order matters from here on: no tile
+        carries an effect or a frog, no stack/craft tiles or key tiles remain,
+        every goal left is a tile type, and enough moves remain to pick every
+        tile. Returns (tiles, type ids, blocker bitmasks, dock counts by type id).
+        """
+        self._ensure_tile_counters(state)
+        if state.remaining_tile_count > ENDGAME_MAX_TILES or state._blocking_map is None:
+            return None
+        if state.bomb_tiles or state.frog_positions or state._frog_slots:
+            return None
+        if any(not tile.picked for tile in state.stacked_tiles.values()):
+            return None
+        if state.max_moves - state.moves_used < state.remaining_tile_count:
+            return None
+
+        tiles: List[TileState] = []
+        for layer_tiles in state.tiles.values():
+            for tile in layer_tiles.values():
+                if tile.picked:
+                    continue
+                effect = tile.effect_type
+                if effect != TileEffectType.NONE and not (
+                    # Cleared gimmicks play like plain tiles
+                    (effect in (TileEffectType.ICE, TileEffectType.GRASS) and tile.remaining <= 0)
+                    or (effect == TileEffectType.CHAIN and tile.unlocked)
+                ):
+                    return None
+                if (tile.on_frog or tile.is_stack_tile or tile.is_craft_tile or tile.tile_type == "key"
+                        or tile.tile_type not in self.MATCHABLE_TYPES):
+                    return None
+                tiles.append(tile)
+
+        type_ids: Dict[str, int] = {}
+        tile_types = [type_ids.setdefault(tile.tile_type, len(type_ids)) for tile in tiles]
+        dock_counts = [0] * len(type_ids)
+        for tile in state.dock_tiles:
+            if tile.tile_type not in type_ids:
+                type_ids[tile.tile_type] = len(type_ids)
+                dock_counts.append(0)
+            dock_counts[type_ids[tile.tile_type]] += 1
+        if "key" in type_ids:
+            return None
+
+        # Goals left must be tile types that clearing the board still fulfils
+        for goal_type, goal_count in state.goals_remaining.items():
+            if goal_count > 0 and goal_type not in type_ids:
+                return None
+
+        bit_of = {tile.full_key: 1 << i for i, tile in enumerate(tiles)}
+        blockers = []
+        for tile in tiles:
+            mask = 0
+            for upper_key in state._blocking_map.get(tile.full_key, ()):
+                mask |= bit_of.get(upper_key, 0)
+            blockers.append(mask)
+
+        return tiles, tile_types, blockers, [count % 3 for count in dock_counts]
+
     def _get_adaptive_depth(self, state: GameState) -> int:
         """Calculate adaptive lookahead depth based on game state.
 
         More aggressive depth reduction for better performance.
         Considers both tile count and dock danger level.
         """
-        remaining_tiles = sum(
-            1 for layer in state.tiles.values()
-            for tile in layer.values()
-            if not tile.picked
-        )
+        remaining_tiles = self._remaining_tile_count(state)
         dock_size = len(state.dock_tiles)
 
         # Base depth from remaining tiles (more aggressive reduction)
@@ -4276,6 +5116,7 @@ class BotSimulator:
         profile: BotProfile,
         depth: int,
         max_width: int,
+        context: Optional[ScoringContext] = None,
     ) -> float:
         """Recursively evaluate a move sequence to find best continuation.
 
@@ -4285,6 +5126,7 @@ class BotSimulator:
             profile: Bot profile for scoring
             depth: How many moves ahead to look
             max_width: Maximum number of moves to consider at each level
+            context: Scoring context of ``state``, if the caller has one
 
         Returns:
             Score representing the best achievable outcome from this move
@@ -4292,7 +5134,7 @@ class BotSimulator:
         # Base case: no more depth
         if depth <= 0:
             return self._score_move_with_profile(
-                first_move, state, profile
+                first_move, state, profile, context
             )
 
         # Check if this move leads to immediate problems
@@ -4329,8 +5171,9 @@ class BotSimulator:
                 return -10000.0
 
             # Score all next moves
+            next_context = self._build_scoring_context(next_state)
             for m in next_moves:
-                m.score = self._score_move_with_profile(m, next_state, profile)
+                m.score = self._score_move_with_profile(m, next_state, profile, next_context)
 
             # Sort and take top candidates
             next_moves.sort(key=lambda m: m.score, reverse=True)
@@ -4340,13 +5183,13 @@ class BotSimulator:
             best_continuation_score = float('-inf')
             for next_move in candidates:
                 continuation_score = self._evaluate_move_sequence(
-                    next_state, next_move, profile, depth - 1, max_width
+                    next_state, next_move, profile, depth - 1, max_width, next_context
                 )
                 best_continuation_score = max(best_continuation_score, continuation_score)
 
             # Score = immediate move score + discounted future score
             immediate_score = self._score_move_with_profile(
-                first_move, state, profile
+                first_move, state, profile, context
             )
             discount = 0.95  # Slightly prefer immediate rewards
             return immediate_score + (discount * best_continuation_score)
@@ -4876,22 +5719,18 @@ class BotSimulator:
         dock_full = dock_size >= 7
 
         # Count remaining tiles (excluding the one we're picking)
-        remaining_tiles = 0
-        pickable_tiles: Dict[str, int] = {}
-
-        for layer_tiles in state.tiles.values():
-            for pos, tile in layer_tiles.items():
-                if tile.picked:
-                    continue
-                if pos == move.position and tile.layer_idx == move.layer_idx:
-                    continue  # Skip the tile we're picking
-                remaining_tiles += 1
-
-                # Check if this tile would be pickable after the move
-                # Simplified check - we'll count all unpicked tiles
-                tile_type = tile.tile_type
-                if tile_type in self.MATCHABLE_TYPES:
-                    pickable_tiles[tile_type] = pickable_tiles.get(tile_type, 0) + 1
+        # Simplified pickability check - all unpicked matchable tiles count
+        remaining_tiles = self._remaining_tile_count(state)
+        pickable_tiles: Dict[str, int] = {
+            tile_type: count
+            for tile_type, count in state.remaining_type_counts.items()
+            if tile_type in self.MATCHABLE_TYPES
+        }
+        picked_tile = state.tiles.get(move.layer_idx, {}).get(move.position)
+        if picked_tile is not None and not picked_tile.picked:
+            remaining_tiles -= 1
+            if picked_tile.tile_type in pickable_tiles:
+                _decrement_count(pickable_tiles, picked_tile.tile_type)
 
         # Copy all_tile_type_counts and decrement the picked tile
         # Phase 3: When ENABLE_HIDDEN_INFO_BLOCK is enabled, use accessible tiles only
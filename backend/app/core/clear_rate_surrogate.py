@@ -0,0 +1,263 @@
+"""
+Clear Rate Surrogate
+====================
+Lightweight regression model that predicts per-bot clear rates from a
+level's static features, so ``generate_validated_level`` can rank
+candidates and reject obviously off-target ones before paying for bot
+simulation.
+
+Every simulated candidate is appended to a sample log (features plus the
+simulated clear rates); ``scripts/train_clear_rate_surrogate.py`` fits one
+ridge regression per bot on that log and stores the model as JSON. The
+model is plain Python (a dot product per bot), so a prediction costs
+microseconds once the features are extracted.
+"""
+
+import math
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from .analyzer import LevelAnalyzer
+from .learned_model import (
+    CACHE_DIR,
+    MAX_LOG_SAMPLES,
+    ModelFileCache,
+    RidgeModel,
+    SampleLog,
+    ridge_gram,
+    ridge_weights,
+    standardize,
+)
+from ..models.bot_profile import BotType
+
+DEFAULT_MODEL_PATH = CACHE_DIR / "clear_rate_surrogate.json"
+DEFAULT_SAMPLES_PATH = CACHE_DIR / "surrogate_samples.jsonl"
+
+SURROGATE_BOTS = [bot_type.value for bot_type in BotType]
+
+# Order matters: it is the column order of the stored weights
+FEATURE_NAMES = (
+    "total_tiles",
+    "active_layers",
+    "layer_blocking",
+    "tile_type_count",
+    "use_tile_count",
+    "max_moves",
+    "move_ratio",
+    "tiles_per_type",
+    "goal_amount",
+    "chain_count",
+    "frog_count",
+    "link_count",
+    "ice_count",
+    "grass_count",
+    "bomb_count",
+    "curtain_count",
+    "teleport_count",
+    "unknown_count",
+    "has_key_gimmick",
+    "has_time_attack",
+)
+
+MIN_TRAINING_SAMPLES = 20
+
+_analyzer = LevelAnalyzer()
+
+
+def extract_features(level_json: Dict[str, Any]) -> Dict[str, float]:
+    """Static features of a level (analyzer metrics plus move/tile budget)."""
+    metrics = _analyzer._extract_metrics(level_json)
+    tile_type_count = metrics.tile_type_count or 1
+    return {
+        "total_tiles": float(metrics.total_tiles),
+        "active_layers": float(metrics.active_layers),
+        "layer_blocking": float(metrics.layer_blocking),
+        "tile_type_count": float(metrics.tile_type_count),
+        "use_tile_count": float(level_json.get("useTileCount", 0)),
+        "max_moves": float(metrics.max_moves),
+        "move_ratio": float(metrics.move_ratio),
+        "tiles_per_type": metrics.total_tiles / tile_type_count,
+        "goal_amount": float(metrics.goal_amount),
+        "chain_count": float(metrics.chain_count),
+        "frog_count": float(metrics.frog_count),
+        "link_count": float(metrics.link_count),
+        "ice_count": float(metrics.ice_count),
+        "grass_count": float(metrics.grass_count),
+        "bomb_count": float(metrics.bomb_count),
+        "curtain_count": float(metrics.curtain_count),
+        "teleport_count": float(metrics.teleport_count),
+        "unknown_count": float(metrics.unknown_count),
+        "has_key_gimmick": float(metrics.has_key_gimmick),
+        "has_time_attack": float(metrics.has_time_attack),
+    }
+
+
+def _error_metrics(pairs: Iterable[tuple]) -> Dict[str, float]:
+    """MAE/RMSE (clear rate units) over (predicted, actual) pairs."""
+    errors = [predicted - actual for predicted, actual in pairs]
+    if not errors:
+        return {"mae": 0.0, "rmse": 0.0, "count": 0}
+    return {
+        "mae": round(sum(abs(e) for e in errors) / len(errors), 4),
+        "rmse": round(math.sqrt(sum(e * e for e in errors) / len(errors)), 4),
+        "count": len(errors),
+    }
+
+
+class ClearRateSurrogate(RidgeModel):
+    """Per-bot ridge regression over standardized static features."""
+
+    def __init__(
+        self,
+        weights: Dict[str, List[float]],
+        means: Sequence[float],
+        scales: Sequence[float],
+        feature_names: Sequence[str] = FEATURE_NAMES,
+        metrics: Optional[Dict[str, Any]] = None,
+        trained_at: Optional[str] = None,
+        sample_count: int = 0,
+    ):
+        super().__init__(weights, means, scales, feature_names, metrics, trained_at, sample_count)
+        # Running error of predictions against simulated outcomes since load
+        self._online_lock = threading.Lock()
+        self._online_abs_error = {bot: 0.0 for bot in weights}
+        self._online_count = {bot: 0 for bot in weights}
+
+    @classmethod
+    def fit(
+        cls,
+        samples: List[Dict[str, Any]],
+        ridge: float = 1.0,
+        holdout_every: int = 5,
+    ) -> "ClearRateSurrogate":
+        """Fit from logged samples ({"features": {...}, "clear_rates": {...}}).
+
+        Every ``holdout_every``-th sample is held out to measure prediction
+        error; the final weights are then refit on all samples.
+        """
+        if len(samples) < MIN_TRAINING_SAMPLES:
+            raise ValueError(
+                f"Need at least {MIN_TRAINING_SAMPLES} samples to train, got {len(samples)}"
+            )
+
+        if holdout_every > 1:
+            train = [s for i, s in enumerate(samples) if i % holdout_every]
+            holdout = [s for i, s in enumerate(samples) if not i % holdout_every]
+            metrics = cls._fit_weights(train, ridge).evaluate(holdout)
+        else:
+            metrics = {}
+
+        model = cls._fit_weights(samples, ridge)
+        model.metrics = metrics
+        model.trained_at = datetime.now().isoformat()
+        return model
+
+    @classmethod
+    def _fit_weights(cls, samples: List[Dict[str, Any]], ridge: float) -> "ClearRateSurrogate":
+        rows = [[float(s["features"].get(name, 0.0)) for name in FEATURE_NAMES] for s in samples]
+        means, scales, design = standardize(rows)
+        size = len(FEATURE_NAMES) + 1
+        gram = ridge_gram(design, size, ridge)
+
+        weights = {}
+        for bot in SURROGATE_BOTS:
+            bot_samples = [(x, s["clear_rates"][bot]) for x, s in zip(design, samples) if bot in s["clear_rates"]]
+            if len(bot_samples) < MIN_TRAINING_SAMPLES:
+                continue
+            if len(bot_samples) == len(design):
+                bot_gram = gram
+            else:
+                bot_gram = ridge_gram((x for x, _ in bot_samples), size, ridge)
+            weights[bot] = ridge_weights(bot_gram, bot_samples)
+
+        return cls(weights, means, scales, sample_count=len(samples))
+
+    def predict_features(self, features: Dict[str, float]) -> Dict[str, float]:
+        """Predicted clear rate (0-1) per bot from extracted features."""
+        return {
+            bot: min(1.0, max(0.0, value))
+            for bot, value in self.linear_predictions(features, self.weights).items()
+        }
+
+    def predict(self, level_json: Dict[str, Any]) -> Dict[str, float]:
+        """Predicted clear rate (0-1) per bot for a level."""
+        return self.predict_features(extract_features(level_json))
+
+    def evaluate(self, samples: List[Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
+        """Prediction error per bot against the samples' simulated clear rates."""
+        pairs: Dict[str, List[tuple]] = {bot: [] for bot in self.weights}
+        for sample in samples:
+            predicted = self.predict_features(sample["features"])
+            for bot, actual in sample["clear_rates"].items():
+                if bot in predicted:
+                    pairs[bot].append((predicted[bot], actual))
+        return {bot: _error_metrics(bot_pairs) for bot, bot_pairs in pairs.items()}
+
+    def record_outcome(self, predicted: Dict[str, float], actual: Dict[str, float]) -> float:
+        """Track prediction error against a simulated outcome.
+
+        Returns:
+            Mean absolute error over the simulated bots
+        """
+        errors = [abs(predicted[bot] - rate) for bot, rate in actual.items() if bot in predicted]
+        with self._online_lock:
+            for bot, rate in actual.items():
+                if bot in predicted:
+                    self._online_abs_error[bot] += abs(predicted[bot] - rate)
+                    self._online_count[bot] += 1
+        return sum(errors) / len(errors) if errors else 0.0
+
+    def online_error(self) -> Dict[str, Dict[str, float]]:
+        """MAE per bot of predictions checked against simulation since load."""
+        with self._online_lock:
+            return {
+                bot: {
+                    "mae": round(self._online_abs_error[bot] / count, 4) if count else 0.0,
+                    "count": count,
+                }
+                for bot, count in self._online_count.items()
+            }
+
+
+class SurrogateSampleLog(SampleLog):
+    """JSONL log of (features, simulated clear rates) samples."""
+
+    required_keys = ("features", "clear_rates")
+
+    def __init__(self, path: Path = DEFAULT_SAMPLES_PATH, max_samples: int = MAX_LOG_SAMPLES):
+        super().__init__(path, max_samples)
+
+    def append(
+        self,
+        level_json: Dict[str, Any],
+        clear_rates: Dict[str, float],
+        iterations: int,
+        predicted: Optional[Dict[str, float]] = None,
+    ) -> None:
+        sample = {
+            "features": extract_features(level_json),
+            "clear_rates": clear_rates,
+            "iterations": iterations,
+        }
+        if predicted is not None:
+            sample["predicted"] = {bot: round(rate, 4) for bot, rate in predicted.items()}
+        self.append_samples([sample])
+
+
+_surrogate_file: ModelFileCache[ClearRateSurrogate] = ModelFileCache(ClearRateSurrogate.load)
+_sample_log: Optional[SurrogateSampleLog] = None
+
+
+def get_clear_rate_surrogate() -> Optional[ClearRateSurrogate]:
+    """Trained surrogate, reloaded when the model file changes; None if untrained."""
+    return _surrogate_file.get(DEFAULT_MODEL_PATH)
+
+
+def get_surrogate_sample_log() -> SurrogateSampleLog:
+    """Get or create the sample log singleton."""
+    global _sample_log
+    if _sample_log is None:
+        _sample_log = SurrogateSampleLog()
+    return _sample_log
@@ -0,0 +1,123 @@
+"""Common random numbers (CRN) for comparing bots and candidate levels.
+
+Clear rates of two nearby levels, or of two bots on one level, differ by
+a few percent while the Monte Carlo noise of each estimate is larger than
+that at the iteration counts we can afford. With common random numbers
+every simulation of iteration ``i`` draws its mistakes, attention checks,
+frog hops and teleport shuffles from the same streams, seeded only by
+(crn_seed, i, purpose), so both sides of a comparison face the same luck
+and the noise largely cancels in the per-iteration difference.
+
+Each purpose gets its own stream so that a bot which makes one extra
+draw of one kind (e.g. an attention check on a deeper board) does not
+shift every later draw of the other kinds.
+"""
+import math
+import random
+from dataclasses import dataclass
+from typing import Any, Dict, Sequence
+
+# Per-purpose random streams of BotSimulator, reseeded every iteration in CRN mode
+CRN_STREAMS = ("layout", "mistake", "choice", "attention", "notice", "noise", "frog", "teleport")
+
+# Two-sided 95% normal quantile for the paired-difference interval
+Z_95 = 1.959964
+
+
+def new_crn_seed() -> int:
+    """Fresh seed for a CRN comparison (kept fixed across everything compared)."""
+    return random.SystemRandom().randrange(1, 2**31)
+
+
+def stream_seed(crn_seed: int, iteration: int, stream: str) -> str:
+    """Seed for one stream of one iteration.
+
+    A string seed is hashed by random.seed independently of PYTHONHASHSEED,
+    so pool workers derive the same streams as the parent process.
+    """
+    return f"crn:{crn_seed}:{iteration}:{stream}"
+
+
+@dataclass
+class PairedDifference:
+    """Paired comparison of per-iteration clear outcomes, a minus b."""
+    n: int
+    rate_a: float
+    rate_b: float
+    mean_difference: float
+    std_error: float
+    ci_low: float
+    ci_high: float
+    only_a: int  # iterations cleared by a but not b
+    only_b: int  # iterations cleared by b but not a
+    unpaired_std_error: float  # what the standard error would be without CRN
+
+    @property
+    def significant(self) -> bool:
+        """Whether the 95% interval excludes zero."""
+        return self.ci_low > 0 or self.ci_high < 0
+
+    @property
+    def variance_reduction(self) -> float:
+        """Variance of the unpaired estimate over the paired one (1 = no gain)."""
+        if self.std_error <= 0:
+            # No discordant iterations: the paired variance is zero, cap the ratio at n
+            return float(self.n) if self.unpaired_std_error > 0 else 1.0
+        return (self.unpaired_std_error / self.std_error) ** 2
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "n": self.n,
+            "rate_a": round(self.rate_a, 4),
+            "rate_b": round(self.rate_b, 4),
+            "mean_difference": round(self.mean_difference, 4),
+            "std_error": round(self.std_error, 4),
+            "ci_low": round(self.ci_low, 4),
+            "ci_high": round(self.ci_high, 4),
+            "only_a": self.only_a,
+            "only_b": self.only_b,
+            "significant": self.significant,
+            "variance_reduction": round(self.variance_reduction, 2),
+        }
+
+
+def paired_difference(a: Sequence[bool], b: Sequence[bool]) -> PairedDifference:
+    """Paired difference in clear rate between two CRN runs.
+
+    Outcomes are paired by iteration index; when the runs have different
+    lengths (early termination, budgeted iteration counts) the common prefix
+    is used, which stays paired because streams are keyed by index.
+    """
+    n = min(len(a), len(b))
+    if n == 0:
+        return PairedDifference(0, 0.0, 0.0, 0.0, 1.0, -1.0, 1.0, 0, 0, 1.0)
+
+    cleared_a = sum(1 for x in a[:n] if x)
+    cleared_b = sum(1 for x in b[:n] if x)
+    only_a = sum(1 for x, y in zip(a[:n], b[:n]) if x and not y)
+    only_b = sum(1 for x, y in zip(a[:n], b[:n]) if y and not x)
+    rate_a = cleared_a / n
+    rate_b = cleared_b / n
+    mean = (only_a - only_b) / n
+
+    if n > 1:
+        # Differences are -1/0/+1, so sum of squares is the discordant count
+        variance = ((only_a + only_b) - n * mean * mean) / (n - 1)
+        std_error = math.sqrt(max(variance, 0.0) / n)
+        unpaired = math.sqrt((rate_a * (1 - rate_a) + rate_b * (1 - rate_b)) / (n - 1))
+    else:
+        # One pair says nothing about spread; report the widest possible interval
+        std_error = unpaired = 1.0
+
+    return PairedDifference(
+        n=n,
+        rate_a=rate_a,
+        rate_b=rate_b,
+        mean_difference=mean,
+        std_error=std_error,
+        ci_low=max(-1.0, mean - Z_95 * std_error),
+        ci_high=min(1.0, mean + Z_95 * std_error),
+        only_a=only_a,
+        only_b=only_b,
+        unpaired_std_error=unpaired,
+    )
@@ -0,0 +1,175 @@
+"""
+Coverage Graph
+==============
+Which upper-layer tiles cover each slot of a level layout.
+
+Blocking geometry follows sp_template TileGroup.FindAllUpperTiles: a tile
+at (x, y) on layer L is blocked by a tile on upper layer U at (x + dx, y + dy)
+for each (dx, dy) of ``blocking_offsets(L, U, col_L, col_U)``:
+
+- Same parity (layer 0→2, 1→3): the same position only
+- Different parity, upper layer has more columns: (0,0), (+1,0), (0,+1), (+1,+1)
+- Different parity otherwise: (-1,-1), (0,-1), (-1,0), (0,0)
+
+The graph is built once per layout and updated incrementally with ``add``
+and ``remove``. Covered/uncovered checks and blocker lists are dictionary
+lookups, for occupied and empty slots alike, so passes that ask about every
+tile no longer rescan the upper layers per query.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+BLOCKING_OFFSETS_SAME_PARITY = ((0, 0),)
+BLOCKING_OFFSETS_UPPER_BIGGER = ((0, 0), (1, 0), (0, 1), (1, 1))
+BLOCKING_OFFSETS_UPPER_SMALLER = ((-1, -1), (0, -1), (-1, 0), (0, 0))
+
+DEFAULT_LAYER_COL = 7
+
+Slot = Tuple[int, int, int]  # (layer_idx, x, y)
+
+
+def blocking_offsets(
+    lower_idx: int, upper_idx: int, lower_col: int, upper_col: int
+) -> Tuple[Tuple[int, int], ...]:
+    """Offsets from a lower tile to the upper-layer positions that block it."""
+    if lower_idx % 2 == upper_idx % 2:
+        return BLOCKING_OFFSETS_SAME_PARITY
+    if upper_col > lower_col:
+        return BLOCKING_OFFSETS_UPPER_BIGGER
+    return BLOCKING_OFFSETS_UPPER_SMALLER
+
+
+class CoverageGraph:
+    """Coverage DAG of one level layout.
+
+    Edges run from each occupied tile to the slots it covers on lower
+    layers. Slots are (layer_idx, x, y); queries accept any slot, occupied
+    or not, so a caller can also ask whether a tile placed there would be
+    covered.
+    """
+
+    def __init__(self, layer_cols: Optional[Dict[int, Any]] = None):
+        self.layer_cols: Dict[int, int] = {
+            layer_idx: int(col) for layer_idx, col in (layer_cols or {}).items()
+        }
+        self._tiles: Set[Slot] = set()
+        self._blockers: Dict[Slot, Set[Slot]] = {}  # any slot -> occupied upper slots covering it
+        self._depth: Dict[Slot, int] = {}  # memo, cleared on every change
+        self._offsets: Dict[Tuple[int, int], Tuple[Tuple[int, int], ...]] = {}
+
+    @classmethod
+    def from_level(cls, level: Dict[str, Any]) -> "CoverageGraph":
+        """Graph of a generator-format level (``layer_N`` with ``col`` and ``tiles``)."""
+        num_layers = level.get("layer", 8)
+        layers = [level.get(f"layer_{i}", {}) for i in range(num_layers)]
+        graph = cls({i: layer.get("col", DEFAULT_LAYER_COL) for i, layer in enumerate(layers)})
+        for layer_idx, layer in enumerate(layers):
+            for pos in layer.get("tiles", {}) or {}:
+                try:
+                    x, y = map(int, pos.split("_"))
+                except ValueError:
+                    continue
+                graph.add(layer_idx, x, y)
+        return graph
+
+    @classmethod
+    def from_slots(cls, layer_cols: Dict[int, Any], slots: Iterable[Slot]) -> "CoverageGraph":
+        """Graph of the given occupied slots."""
+        graph = cls(layer_cols)
+        for layer_idx, x, y in slots:
+            graph.add(layer_idx, x, y)
+        return graph
+
+    def __len__(self) -> int:
+        return len(self._tiles)
+
+    def __contains__(self, slot: Slot) -> bool:
+        return slot in self._tiles
+
+    def _layer_offsets(self, lower_idx: int, upper_idx: int) -> Tuple[Tuple[int, int], ...]:
+        key = (lower_idx, upper_idx)
+        offsets = self._offsets.get(key)
+        if offsets is None:
+            offsets = blocking_offsets(
+                lower_idx, upper_idx,
+                self.layer_cols.get(lower_idx, DEFAULT_LAYER_COL),
+                self.layer_cols.get(upper_idx, DEFAULT_LAYER_COL),
+            )
+            self._offsets[key] = offsets
+        return offsets
+
+    def footprint(self, layer_idx: int, x: int, y: int) -> List[Slot]:
+        """Lower-layer slots a tile at this slot covers, occupied or not."""
+        slots = []
+        for lower_idx in range(layer_idx):
+            for dx, dy in self._layer_offsets(lower_idx, layer_idx):
+                slots.append((lower_idx, x - dx, y - dy))
+        return slots
+
+    def add(self, layer_idx: int, x: int, y: int) -> None:
+        """Record a tile at this slot."""
+        slot = (layer_idx, x, y)
+        if slot in self._tiles:
+            return
+        self._tiles.add(slot)
+        blockers = self._blockers
+        for covered in self.footprint(layer_idx, x, y):
+            entry = blockers.get(covered)
+            if entry is None:
+                blockers[covered] = {slot}
+            else:
+                entry.add(slot)
+        self._depth.clear()
+
+    def remove(self, layer_idx: int, x: int, y: int) -> None:
+        """Forget the tile at this slot."""
+        slot = (layer_idx, x, y)
+        if slot not in self._tiles:
+            return
+        self._tiles.discard(slot)
+        for covered in self.footprint(layer_idx, x, y):
+            entry = self._blockers.get(covered)
+            if entry is not None:
+                entry.discard(slot)
+                if not entry:
+                    del self._blockers[covered]
+        self._depth.clear()
+
+    def is_covered(self, layer_idx: int, x: int, y: int) -> bool:
+        """Whether any upper-layer tile covers this slot."""
+        return (layer_idx, x, y) in self._blockers
+
+    def blockers(self, layer_idx: int, x: int, y: int) -> Set[Slot]:
+        """Occupied upper-layer slots covering this slot (read-only view)."""
+        return self._blockers.get((layer_idx, x, y), _EMPTY)
+
+    def covered_tiles(self, layer_idx: int, x: int, y: int) -> List[Slot]:
+        """Occupied lower-layer slots that a tile at this slot covers."""
+        return [slot for slot in self.footprint(layer_idx, x, y) if slot in self._tiles]
+
+    def blocking_layers(self, layer_idx: int, x: int, y: int) -> int:
+        """Number of distinct upper layers with a tile covering this slot."""
+        return len({upper[0] for upper in self.blockers(layer_idx, x, y)})
+
+    def depth(self, layer_idx: int, x: int, y: int) -> int:
+        """Length of the longest chain of covering tiles above this slot (0 = uncovered)."""
+        slot = (layer_idx, x, y)
+        depth = self._depth.get(slot)
+        if depth is not None:
+            return depth
+
+        # Iterative post-order over the blockers so deep stacks do not recurse
+        stack = [slot]
+        memo = self._depth
+        while stack:
+            current = stack[-1]
+            pending = [b for b in self._blockers.get(current, ()) if b not in memo]
+            if pending:
+                stack.extend(pending)
+                continue
+            stack.pop()
+            memo[current] = 1 + max((memo[b] for b in self._blockers.get(current, ())), default=-1)
+        return memo[slot]
+
+
+_EMPTY: Set[Slot] = frozenset()
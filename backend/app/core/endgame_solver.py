@@ -0,0 +1,139 @@
+"""Exact solver for small gimmick-free endgames.
+
+Once only plain tiles are left (no ice, chain, grass, link, frog, bomb,
+curtain, teleport, stack/craft or key tiles), a game is deterministic: the
+only state is which tiles remain, and the dock contents follow from that
+because every picked tile either waits in the dock or has been matched.
+A depth-first search memoized on the bitmask of remaining tiles therefore
+decides exactly whether the game can still be cleared, and with which
+sequence of picks.
+
+BotSimulator builds the compact input with _plain_endgame and lets the
+optimal bot follow the solved line instead of its lookahead heuristics.
+"""
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence
+
+# Largest endgame handed to the solver; the search is exponential in the worst case
+ENDGAME_MAX_TILES = 36
+# Search nodes per solve before giving up (the bot falls back to its heuristics)
+ENDGAME_MAX_NODES = 20000
+
+
+class _BudgetExceeded(Exception):
+    """Raised inside the search when ENDGAME_MAX_NODES is reached."""
+
+
+@dataclass
+class EndgameSolution:
+    """Outcome of solve_endgame.
+
+    winnable is None when the node budget ran out before the game was decided.
+    line holds a winning sequence of tile indices (empty unless winnable).
+    """
+    winnable: Optional[bool]
+    line: List[int] = field(default_factory=list)
+    nodes: int = 0
+
+
+def solve_endgame(
+    tile_types: Sequence[int],
+    blockers: Sequence[int],
+    dock_counts: Sequence[int],
+    dock_slots: int,
+    root_moves: Optional[Sequence[int]] = None,
+    max_nodes: int = ENDGAME_MAX_NODES,
+) -> EndgameSolution:
+    """Decide whether a plain endgame can be cleared.
+
+    Args:
+        tile_types: Type id of each remaining tile
+        blockers: Per tile, bitmask of the remaining tiles covering it
+        dock_counts: Tiles of each type id waiting in the dock (0-2)
+        dock_slots: Unlocked dock slots; the game is lost once this many
+            unmatched tiles sit in the dock
+        root_moves: Tile indices allowed as the first pick (default: any pickable)
+        max_nodes: Search budget
+    """
+    n = len(tile_types)
+    counts = list(dock_counts)
+    if n == 0:
+        return EndgameSolution(winnable=sum(counts) == 0)
+
+    # Every type must come out in whole triples, whatever the order
+    totals = counts[:]
+    for t in tile_types:
+        totals[t] += 1
+    if any(total % 3 for total in totals):
+        return EndgameSolution(winnable=False)
+
+    memo: Dict[int, bool] = {}
+    nodes = 0
+
+    def ordered_picks(remaining: int, allowed: Optional[Sequence[int]] = None) -> List[int]:
+        picks = [
+            i for i in (allowed if allowed is not None else range(n))
+            if remaining >> i & 1 and not blockers[i] & remaining
+        ]
+        # Completing a match first, then pairing up, then opening a new type
+        picks.sort(key=lambda i: -counts[tile_types[i]])
+        return picks
+
+    def winnable(remaining: int, load: int, allowed: Optional[Sequence[int]] = None) -> bool:
+        nonlocal nodes
+        if remaining == 0:
+            return load == 0
+        known = memo.get(remaining)
+        if known is not None and allowed is None:
+            return known
+        nodes += 1
+        if nodes > max_nodes:
+            raise _BudgetExceeded
+
+        result = False
+        for i in ordered_picks(remaining, allowed):
+            t = tile_types[i]
+            held = counts[t]
+            if held == 2:
+                counts[t] = 0
+                next_load = load - 2
+            else:
+                counts[t] = held + 1
+                next_load = load + 1
+            ok = next_load < dock_slots and winnable(remaining & ~(1 << i), next_load)
+            counts[t] = held
+            if ok:
+                result = True
+                break
+
+        if allowed is None:
+            memo[remaining] = result
+        return result
+
+    full = (1 << n) - 1
+    try:
+        if not winnable(full, sum(counts), root_moves):
+            return EndgameSolution(winnable=False, nodes=nodes)
+    except _BudgetExceeded:
+        return EndgameSolution(winnable=None, nodes=nodes)
+
+    # Replay the search along solved positions to recover the winning line
+    line: List[int] = []
+    remaining, load = full, sum(counts)
+    allowed = root_moves
+    while remaining:
+        for i in ordered_picks(remaining, allowed):
+            t = tile_types[i]
+            held = counts[t]
+            next_load = load - 2 if held == 2 else load + 1
+            rest = remaining & ~(1 << i)
+            if next_load < dock_slots and (memo.get(rest) if rest else next_load == 0):
+                counts[t] = 0 if held == 2 else held + 1
+                line.append(i)
+                remaining, load = rest, next_load
+                break
+        else:  # pragma: no cover - the search proved a win along this path
+            break
+        allowed = None
+
+    return EndgameSolution(winnable=True, line=line, nodes=nodes)
@@ -2,11 +2,14 @@
 import logging
 import random
 import time
-from typing import Dict, List, Any, Optional, Tuple, Set
+from typing import Dict, List, Any, Optional, Tuple, Set, Union
 from dataclasses import dataclass
 
 from .bot_simulator import BotSimulator, TileDistributor
-from .pattern_templates import get_pattern_positions, get_pattern_name, PATTERN_TEMPLATES, is_layered_pattern, get_layered_pattern_positions
+from .pattern_templates import get_pattern_name, PATTERN_TEMPLATES, is_layered_pattern
+from .pattern_library import get_pattern_positions, get_layered_pattern_positions
+from .similarity_index import LevelSimilarityIndex, extract_layer_positions, layout_similarity
+from .coverage_graph import CoverageGraph, blocking_offsets
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +45,77 @@ def get_tile_uniformity(target_difficulty: float) -> float:
     return 0.5  # 기본값
 
 
+# === PATTERN DENSITY WEIGHTS (v15.7) ===
+# Patterns with higher tile density get lower fill ratio to compensate
+# 1.0 = baseline, >1.0 = dense (reduce fill), <1.0 = sparse (increase fill)
+PATTERN_DENSITY_WEIGHTS = {
+    # Basic shapes - generally baseline
+    0: 1.0,   # rectangle - baseline
+    1: 0.9,   # diamond - slightly less
+    2: 0.95,  # oval
+    3: 1.15,  # cross - more tiles (full width + height)
+    4: 0.8,   # donut - hollow center
+    5: 0.8,   # concentric diamond - ring shape
+    6: 0.85,  # corner anchored
+    7: 0.9,   # hexagonal
+    8: 1.1,   # heart - dense pixel art
+    9: 1.0,   # T-shape
+    # Arrows
+    10: 1.0, 11: 1.0, 12: 1.0, 13: 1.0, 14: 0.9,  # arrows, chevron
+    # Celestial - often dense
+    15: 1.2,  # star 5-pointed - many tiles
+    16: 1.25, # star 6-pointed - more tiles
+    17: 0.85, # crescent - sparse
+    18: 1.3,  # sun burst - VERY dense
+    19: 0.9,  # spiral
+    # Letters - variable
+    20: 1.1, 21: 0.8, 22: 0.85, 23: 0.9, 24: 1.0,  # H, I, L, U, X
+    25: 0.9, 26: 1.0, 27: 1.0, 28: 0.85, 29: 0.8,  # Y, Z, S, O, C
+    # Geometric
+    30: 0.9, 31: 0.9,  # triangles
+    32: 1.0, 33: 1.0,  # hourglass, bowtie
+    34: 0.85, 35: 0.85, # stairs
+    36: 0.9, 37: 0.9,  # pyramid
+    38: 0.95, 39: 1.0, # zigzag, wave
+    # Frames - typically sparse (border only)
+    40: 0.75, 41: 0.8, 42: 0.75, 43: 0.7, 44: 1.0,
+    # Artistic
+    45: 1.15, # butterfly - dense
+    46: 1.2,  # flower - dense
+    47: 0.7,  # scattered islands - sparse
+    48: 0.9, 49: 1.0,  # diagonal stripes, honeycomb
+    # Islands/Bridges
+    50: 0.8, 51: 0.8, 52: 0.7, 53: 0.75, 54: 0.8, 55: 0.85,
+    # GBoost
+    56: 0.75, 57: 0.8, 58: 0.85, 59: 0.9, 60: 0.7, 61: 0.9, 62: 0.85, 63: 0.9,
+    # Layered
+    64: 0.85,
+}
+
+# Procedural aesthetic patterns that draw from `random` and must not be cached
+_RANDOMIZED_AESTHETIC_PATTERNS = frozenset({"scattered_islands", "gboost_scattered_clusters"})
+
+# (pattern_name, cols, rows, target_count) -> positions for deterministic procedural patterns
+_PROCEDURAL_POSITION_CACHE: Dict[Tuple[str, int, int, int], Tuple[str, ...]] = {}
+_PROCEDURAL_POSITION_CACHE_MAX = 8192
+
+
+def _cached_procedural_positions(
+    pattern_name: str, pattern_fn, cols: int, rows: int, target_count: int
+) -> List[str]:
+    """Run a procedural aesthetic pattern, memoizing deterministic shapes per grid/target."""
+    if pattern_name in _RANDOMIZED_AESTHETIC_PATTERNS:
+        return pattern_fn()
+    key = (pattern_name, cols, rows, target_count)
+    cached = _PROCEDURAL_POSITION_CACHE.get(key)
+    if cached is None:
+        cached = tuple(pattern_fn())
+        if len(_PROCEDURAL_POSITION_CACHE) >= _PROCEDURAL_POSITION_CACHE_MAX:
+            _PROCEDURAL_POSITION_CACHE.clear()
+        _PROCEDURAL_POSITION_CACHE[key] = cached
+    return list(cached)
+
+
 # ============ GBoost-Style Level Range Gimmick Configuration ============
 # 인게임 확정 기믹 언락 스케줄 (2026.02 최종 확정 - 13개 기믹)
 # Gimmicks are progressively introduced to match the natural learning curve
@@ -536,79 +610,24 @@ class LevelGenerator:
         - Layer structure
         """
         try:
-            map1 = level1.get("map", level1)
-            map2 = level2.get("map", level2)
-
-            # Extract layer data
-            layers1 = {}
-            layers2 = {}
-
-            for key, value in map1.items():
-                if key.startswith("layer") and isinstance(value, dict):
-                    layer_idx = int(key.replace("layer", ""))
-                    positions = set(value.get("position", {}).keys())
-                    layers1[layer_idx] = positions
-
-            for key, value in map2.items():
-                if key.startswith("layer") and isinstance(value, dict):
-                    layer_idx = int(key.replace("layer", ""))
-                    positions = set(value.get("position", {}).keys())
-                    layers2[layer_idx] = positions
-
-            if not layers1 or not layers2:
-                return 0.0
-
-            # Compare layer structure
-            all_layers = set(layers1.keys()) | set(layers2.keys())
-            layer_count_sim = 1.0 - abs(len(layers1) - len(layers2)) / max(len(all_layers), 1)
-
-            # Compare positions per layer with weighted importance
-            position_similarities = []
-            for layer_idx in all_layers:
-                pos1 = layers1.get(layer_idx, set())
-                pos2 = layers2.get(layer_idx, set())
-
-                if not pos1 and not pos2:
-                    continue
-
-                intersection = len(pos1 & pos2)
-                union = len(pos1 | pos2)
-                jaccard = intersection / union if union > 0 else 0.0
-
-                # Higher layers (more visible) weighted more
-                weight = 1.0 + layer_idx * 0.2
-                position_similarities.append((jaccard, weight))
-
-            if not position_similarities:
-                return layer_count_sim * 0.5
-
-            weighted_pos_sim = sum(s * w for s, w in position_similarities) / sum(w for _, w in position_similarities)
-
-            # Compare total tile counts
-            total1 = sum(len(p) for p in layers1.values())
-            total2 = sum(len(p) for p in layers2.values())
-            count_sim = 1.0 - abs(total1 - total2) / max(total1, total2, 1)
-
-            # Final weighted similarity
-            similarity = (
-                weighted_pos_sim * 0.6 +  # Position similarity most important
-                layer_count_sim * 0.2 +   # Layer structure
-                count_sim * 0.2           # Total count
-            )
-
-            return min(1.0, max(0.0, similarity))
+            return layout_similarity(extract_layer_positions(level1), extract_layer_positions(level2))
 
         except Exception as e:
             logger.warning(f"Error calculating level similarity: {e}")
             return 0.0
 
     @staticmethod
-    def is_too_similar(new_level: Dict[str, Any], recent_levels: List[Dict[str, Any]], threshold: float = None) -> bool:
+    def is_too_similar(
+        new_level: Dict[str, Any],
+        recent_levels: Union[List[Dict[str, Any]], LevelSimilarityIndex],
+        threshold: float = None,
+    ) -> bool:
         """Check if new level is too similar to any recent levels.
 
         Args:
             new_level: The newly generated level
-            recent_levels: List of recently generated levels to compare against
+            recent_levels: Levels to compare against, either a list (compared
+                pairwise) or a LevelSimilarityIndex (LSH lookup, for large sets)
             threshold: Similarity threshold (default: SIMILARITY_THRESHOLD)
 
         Returns:
@@ -617,6 +636,9 @@ class LevelGenerator:
         if threshold is None:
             threshold = LevelGenerator.SIMILARITY_THRESHOLD
 
+        if isinstance(recent_levels, LevelSimilarityIndex):
+            return recent_levels.is_duplicate(new_level, threshold)
+
         for recent_level in recent_levels:
             similarity = LevelGenerator.calculate_level_similarity(new_level, recent_level)
             if similarity > threshold:
@@ -3364,52 +3386,6 @@ class LevelGenerator:
         import math
         center_x, center_y = cols / 2.0, rows / 2.0
 
-        # === PATTERN DENSITY WEIGHTS (v15.7) ===
-        # Patterns with higher tile density get lower fill ratio to compensate
-        # 1.0 = baseline, >1.0 = dense (reduce fill), <1.0 = sparse (increase fill)
-        PATTERN_DENSITY_WEIGHTS = {
-            # Basic shapes - generally baseline
-            0: 1.0,   # rectangle - baseline
-            1: 0.9,   # diamond - slightly less
-            2: 0.95,  # oval
-            3: 1.15,  # cross - more tiles (full width + height)
-            4: 0.8,   # donut - hollow center
-            5: 0.8,   # concentric diamond - ring shape
-            6: 0.85,  # corner anchored
-            7: 0.9,   # hexagonal
-            8: 1.1,   # heart - dense pixel art
-            9: 1.0,   # T-shape
-            # Arrows
-            10: 1.0, 11: 1.0, 12: 1.0, 13: 1.0, 14: 0.9,  # arrows, chevron
-            # Celestial - often dense
-            15: 1.2,  # star 5-pointed - many tiles
-            16: 1.25, # star 6-pointed - more tiles
-            17: 0.85, # crescent - sparse
-            18: 1.3,  # sun burst - VERY dense
-            19: 0.9,  # spiral
-            # Letters - variable
-            20: 1.1, 21: 0.8, 22: 0.85, 23: 0.9, 24: 1.0,  # H, I, L, U, X
-            25: 0.9, 26: 1.0, 27: 1.0, 28: 0.85, 29: 0.8,  # Y, Z, S, O, C
-            # Geometric
-            30: 0.9, 31: 0.9,  # triangles
-            32: 1.0, 33: 1.0,  # hourglass, bowtie
-            34: 0.85, 35: 0.85, # stairs
-            36: 0.9, 37: 0.9,  # pyramid
-            38: 0.95, 39: 1.0, # zigzag, wave
-            # Frames - typically sparse (border only)
-            40: 0.75, 41: 0.8, 42: 0.75, 43: 0.7, 44: 1.0,
-            # Artistic
-            45: 1.15, # butterfly - dense
-            46: 1.2,  # flower - dense
-            47: 0.7,  # scattered islands - sparse
-            48: 0.9, 49: 1.0,  # diagonal stripes, honeycomb
-            # Islands/Bridges
-            50: 0.8, 51: 0.8, 52: 0.7, 53: 0.75, 54: 0.8, 55: 0.85,
-            # GBoost
-            56: 0.75, 57: 0.8, 58: 0.85, 59: 0.9, 60: 0.7, 61: 0.9, 62: 0.85, 63: 0.9,
-            # Layered
-            64: 0.85,
-        }
 
         # PATTERN MODE FIX: When pattern_index is specified, use dynamic fill ratio
         # based on target_difficulty and pattern density weight
@@ -5137,12 +5113,12 @@ class LevelGenerator:
                 else:
                     # Template returned empty, fall back to procedural
                     pattern_name, pattern_fn = all_patterns[pattern_index]
-                    best_positions = pattern_fn()
+                    best_positions = _cached_procedural_positions(pattern_name, pattern_fn, cols, rows, target_count)
                     print(f"[AESTHETIC_PATTERN] Template empty, using PROCEDURAL pattern_index={pattern_index}, name={pattern_name}, positions={len(best_positions)}")
             else:
                 # PRIORITY 2: Fall back to procedural function
                 pattern_name, pattern_fn = all_patterns[pattern_index]
-                best_positions = pattern_fn()
+                best_positions = _cached_procedural_positions(pattern_name, pattern_fn, cols, rows, target_count)
                 print(f"[AESTHETIC_PATTERN] Using PROCEDURAL pattern_index={pattern_index}, name={pattern_name}, positions={len(best_positions)}")
 
             if not best_positions:
@@ -5153,7 +5129,7 @@ class LevelGenerator:
             pattern_results = []
             for pattern_name, pattern_fn in all_patterns:
                 try:
-                    positions = pattern_fn()
+                    positions = _cached_procedural_positions(pattern_name, pattern_fn, cols, rows, target_count)
                     if positions:
                         # Score based on how close to target count
                         score = -abs(len(positions) - target_count)
@@ -5911,62 +5887,39 @@ class LevelGenerator:
         return random.sample(all_positions, min(target_count, len(all_positions)))
 
     def _is_position_covered_by_upper(
-        self, level: Dict[str, Any], layer_idx: int, col: int, row: int
+        self, level: Dict[str, Any], layer_idx: int, col: int, row: int,
+        coverage: Optional[CoverageGraph] = None,
     ) -> bool:
         """Check if a position is covered by tiles in upper layers.
 
-        Based on sp_template TileGroup.FindAllUpperTiles logic:
-        - Same parity (layer 0→2, 1→3): Check same position only
-        - Different parity: Compare layer col sizes to determine offset direction
-          - Upper layer col > current layer col: Check (0,0), (+1,0), (0,+1), (+1,+1)
-          - Upper layer col <= current layer col: Check (-1,-1), (0,-1), (-1,0), (0,0)
-
-        Parity is determined by layer_idx % 2.
+        Based on sp_template TileGroup.FindAllUpperTiles logic (see
+        coverage_graph.blocking_offsets). Passes that query many positions
+        build a CoverageGraph of the level once and pass it as ``coverage``;
+        the lookup is then O(1) instead of a scan of every upper layer.
         """
+        if coverage is not None:
+            return coverage.is_covered(layer_idx, col, row)
+
         num_layers = level.get("layer", 8)
 
         # Early exit if on top layer
         if layer_idx >= num_layers - 1:
             return False
 
-        tile_parity = layer_idx % 2
-        cur_layer_data = level.get(f"layer_{layer_idx}", {})
-        cur_layer_col = int(cur_layer_data.get("col", 7))
-
-        # Blocking offsets based on parity
-        BLOCKING_OFFSETS_SAME_PARITY = ((0, 0),)
-        BLOCKING_OFFSETS_UPPER_BIGGER = ((0, 0), (1, 0), (0, 1), (1, 1))
-        BLOCKING_OFFSETS_UPPER_SMALLER = ((-1, -1), (0, -1), (-1, 0), (0, 0))
+        cur_layer_col = int(level.get(f"layer_{layer_idx}", {}).get("col", 7))
 
         for upper_layer_idx in range(layer_idx + 1, num_layers):
-            upper_layer_key = f"layer_{upper_layer_idx}"
-            upper_layer_data = level.get(upper_layer_key, {})
+            upper_layer_data = level.get(f"layer_{upper_layer_idx}", {})
             upper_tiles = upper_layer_data.get("tiles", {})
 
             if not upper_tiles:
                 continue
 
-            upper_parity = upper_layer_idx % 2
-            upper_layer_col = int(upper_layer_data.get("col", 7))
-
-            # Determine blocking positions based on parity and layer size
-            if tile_parity == upper_parity:
-                # Same parity (odd-odd or even-even): only check same position
-                blocking_offsets = BLOCKING_OFFSETS_SAME_PARITY
-            else:
-                # Different parity: compare layer col sizes
-                if upper_layer_col > cur_layer_col:
-                    # Upper layer is bigger (has more columns)
-                    blocking_offsets = BLOCKING_OFFSETS_UPPER_BIGGER
-                else:
-                    # Upper layer is smaller or same size
-                    blocking_offsets = BLOCKING_OFFSETS_UPPER_SMALLER
-
-            for dx, dy in blocking_offsets:
-                bx = col + dx
-                by = row + dy
-                pos_key = f"{bx}_{by}"
-                if pos_key in upper_tiles:
+            offsets = blocking_offsets(
+                layer_idx, upper_layer_idx, cur_layer_col, int(upper_layer_data.get("col", 7))
+            )
+            for dx, dy in offsets:
+                if f"{col + dx}_{row + dy}" in upper_tiles:
                     return True
 
         return False
@@ -6525,6 +6478,7 @@ class LevelGenerator:
             Modified level with unknown tutorial gimmicks ensured
         """
         num_layers = level.get("layer", 8)
+        coverage = CoverageGraph.from_level(level)
 
         # Count current unknown gimmicks that are properly covered
         current_count = 0
@@ -6536,7 +6490,7 @@ class LevelGenerator:
                     # Verify it's covered
                     try:
                         col, row = map(int, pos.split('_'))
-                        if self._is_position_covered_by_upper(level, i, col, row):
+                        if self._is_position_covered_by_upper(level, i, col, row, coverage):
                             current_count += 1
                     except:
                         pass
@@ -6564,7 +6518,7 @@ class LevelGenerator:
                 # Check if covered
                 try:
                     col, row = map(int, pos.split('_'))
-                    if self._is_position_covered_by_upper(level, i, col, row):
+                    if self._is_position_covered_by_upper(level, i, col, row, coverage):
                         covered_candidates.append((i, pos, tile_data))
                 except:
                     continue
@@ -6611,7 +6565,7 @@ class LevelGenerator:
                         continue
 
                     # Check if already covered
-                    if self._is_position_covered_by_upper(level, target_layer, col, row):
+                    if self._is_position_covered_by_upper(level, target_layer, col, row, coverage):
                         # Already covered - just add unknown
                         if len(tile_data) == 1:
                             tile_data.append("unknown")
@@ -6672,6 +6626,7 @@ class LevelGenerator:
                                 new_tile_type = random.choice(tile_types)
                                 self._place_tile(upper_tiles, cover_pos, new_tile_type, "")
                                 level[upper_layer_key]["tiles"] = upper_tiles
+                                coverage.add(upper_layer, c, r)
                                 # Update num count
                                 level[upper_layer_key]["num"] = str(len(upper_tiles))
 
@@ -6894,6 +6849,9 @@ class LevelGenerator:
 
         obstacles_added = {obs: 0 for obs in ALL_OBSTACLE_TYPES}
 
+        # Layout is fixed while obstacles are assigned, so one coverage graph serves every layer
+        coverage = CoverageGraph.from_level(level)
+
         # Add obstacles per layer
         for layer_idx in range(num_layers):
             targets = layer_targets.get(layer_idx, {})
@@ -6903,7 +6861,7 @@ class LevelGenerator:
                 frog_target = targets.get("frog", 0)
                 if frog_target > 0:
                     level = self._add_frog_obstacles_to_layer(
-                        level, layer_idx, frog_target, obstacles_added
+                        level, layer_idx, frog_target, obstacles_added, coverage
                     )
 
             # Add chain obstacles (must have clearable LEFT or RIGHT neighbor)
@@ -6911,7 +6869,7 @@ class LevelGenerator:
                 chain_target = targets.get("chain", 0)
                 if chain_target > 0:
                     level = self._add_chain_obstacles_to_layer(
-                        level, layer_idx, chain_target, obstacles_added
+                        level, layer_idx, chain_target, obstacles_added, coverage
                     )
 
             # Add link obstacles (must create valid pairs with clearable neighbor)
@@ -6967,7 +6925,7 @@ class LevelGenerator:
                 unknown_target = targets.get("unknown", 0)
                 if unknown_target > 0:
                     level = self._add_unknown_obstacles_to_layer(
-                        level, layer_idx, unknown_target, obstacles_added
+                        level, layer_idx, unknown_target, obstacles_added, coverage
                     )
 
         # DIFFICULTY ENHANCEMENT: Place blocking tiles above chain/grass gimmicks
@@ -7092,7 +7050,8 @@ class LevelGenerator:
         return level
 
     def _add_frog_obstacles_to_layer(
-        self, level: Dict[str, Any], layer_idx: int, target: int, counter: Dict[str, int]
+        self, level: Dict[str, Any], layer_idx: int, target: int, counter: Dict[str, int],
+        coverage: Optional[CoverageGraph] = None,
     ) -> Dict[str, Any]:
         """Add frog obstacles to a specific layer.
 
@@ -7131,7 +7090,7 @@ class LevelGenerator:
             # RULE: Skip positions covered by upper layers (frogs must be selectable at spawn)
             try:
                 col, row = map(int, pos.split('_'))
-                if self._is_position_covered_by_upper(level, layer_idx, col, row):
+                if self._is_position_covered_by_upper(level, layer_idx, col, row, coverage):
                     skipped_covered += 1
                     continue
             except Exception as e:
@@ -7149,7 +7108,8 @@ class LevelGenerator:
         return level
 
     def _add_chain_obstacles_to_layer(
-        self, level: Dict[str, Any], layer_idx: int, target: int, counter: Dict[str, int]
+        self, level: Dict[str, Any], layer_idx: int, target: int, counter: Dict[str, int],
+        coverage: Optional[CoverageGraph] = None,
     ) -> Dict[str, Any]:
         """Add chain obstacles to a specific layer.
 
@@ -7208,7 +7168,7 @@ class LevelGenerator:
                     continue
                 # CRITICAL: Neighbor must NOT be covered by upper layers
                 # If covered, the chain cannot be unlocked because neighbor can't be selected first
-                if self._is_position_covered_by_upper(level, layer_idx, ncol, nrow):
+                if self._is_position_covered_by_upper(level, layer_idx, ncol, nrow, coverage):
                     continue
                 valid_chain = True
                 break
@@ -7604,7 +7564,8 @@ class LevelGenerator:
         return level
 
     def _add_unknown_obstacles_to_layer(
-        self, level: Dict[str, Any], layer_idx: int, target: int, counter: Dict[str, int]
+        self, level: Dict[str, Any], layer_idx: int, target: int, counter: Dict[str, int],
+        coverage: Optional[CoverageGraph] = None,
     ) -> Dict[str, Any]:
         """Add unknown obstacles to a specific layer.
 
@@ -7642,7 +7603,7 @@ class LevelGenerator:
                 continue
 
             # RULE: Unknown tiles must be covered by upper layers to have any effect
-            if not self._is_position_covered_by_upper(level, layer_idx, col, row):
+            if not self._is_position_covered_by_upper(level, layer_idx, col, row, coverage):
                 continue
 
             tile_data[1] = "unknown"
@@ -7663,6 +7624,7 @@ class LevelGenerator:
         """
         MAX_FROGS_PER_LEVEL = 3
         num_layers = level.get("layer", 8)
+        coverage = CoverageGraph.from_level(level)
 
         for i in range(num_layers - 1, -1, -1):
             # Check both target and global max
@@ -7686,7 +7648,7 @@ class LevelGenerator:
                 # RULE: Skip positions covered by upper layers (frogs must be selectable at spawn)
                 try:
                     col, row = map(int, pos.split('_'))
-                    if self._is_position_covered_by_upper(level, i, col, row):
+                    if self._is_position_covered_by_upper(level, i, col, row, coverage):
                         continue
                 except:
                     continue
@@ -7706,6 +7668,7 @@ class LevelGenerator:
         Chain is released by clearing adjacent tiles on the left or right side only.
         """
         num_layers = level.get("layer", 8)
+        coverage = CoverageGraph.from_level(level)
 
         # Collect all tiles by layer with their positions
         layer_tiles = {}
@@ -7781,7 +7744,7 @@ class LevelGenerator:
 
                 # CRITICAL: Neighbor must NOT be covered by upper layers
                 # If covered, the chain cannot be unlocked because neighbor can't be selected first
-                if self._is_position_covered_by_upper(level, layer_idx, ncol, nrow):
+                if self._is_position_covered_by_upper(level, layer_idx, ncol, nrow, coverage):
                     continue
 
                 # Valid chain position found!
@@ -9114,6 +9077,7 @@ class LevelGenerator:
         Chain is released by clearing adjacent tiles on the left or right side.
         """
         num_layers = level.get("layer", 8)
+        coverage = CoverageGraph.from_level(level)
 
         # Collect candidates: tiles without attributes that have a clearable LEFT or RIGHT neighbor
         candidates = []
@@ -9151,7 +9115,7 @@ class LevelGenerator:
                             (not ndata[1] or ndata[1] == "frog") and
                             ndata[0] not in self.GOAL_TYPES):
                             # CRITICAL: Neighbor must NOT be covered by upper layers
-                            if not self._is_position_covered_by_upper(level, i, ncol, nrow):
+                            if not self._is_position_covered_by_upper(level, i, ncol, nrow, coverage):
                                 has_clearable_neighbor = True
                                 break
 
@@ -9176,6 +9140,7 @@ class LevelGenerator:
 
         # Count existing frogs
         num_layers = level.get("layer", 8)
+        coverage = CoverageGraph.from_level(level)
         current_frog_count = 0
         for i in range(num_layers):
             layer_key = f"layer_{i}"
@@ -9204,7 +9169,7 @@ class LevelGenerator:
                     # Check if position is covered by upper layers
                     try:
                         col, row = map(int, pos.split('_'))
-                        if not self._is_position_covered_by_upper(level, i, col, row):
+                        if not self._is_position_covered_by_upper(level, i, col, row, coverage):
                             candidates.append((layer_key, pos))
                     except:
                         continue
@@ -9232,6 +9197,7 @@ class LevelGenerator:
         When upper tiles are removed, the tile type becomes visible.
         """
         num_layers = level.get("layer", 8)
+        coverage = CoverageGraph.from_level(level)
 
         # Collect all tiles without attributes that ARE covered by upper layers
         candidates = []
@@ -9248,7 +9214,7 @@ class LevelGenerator:
                     try:
                         col, row = map(int, pos.split('_'))
                         # Only add to tiles covered by upper layers
-                        if self._is_position_covered_by_upper(level, i, col, row):
+                        if self._is_position_covered_by_upper(level, i, col, row, coverage):
                             candidates.append((layer_key, pos))
                     except:
                         continue
@@ -9304,6 +9270,7 @@ class LevelGenerator:
         that wouldn't violate placement rules or break tile count divisibility.
         """
         num_layers = level.get("layer", 8)
+        coverage = CoverageGraph.from_level(level)
         removed_count = 0
 
         for layer_idx in range(num_layers):
@@ -9321,7 +9288,7 @@ class LevelGenerator:
                 # Check if covered by upper layers
                 try:
                     col, row = map(int, pos.split('_'))
-                    if self._is_position_covered_by_upper(level, layer_idx, col, row):
+                    if self._is_position_covered_by_upper(level, layer_idx, col, row, coverage):
                         # Remove frog attribute from covered tile
                         tile_data[1] = ""
                         removed_count += 1
@@ -11736,17 +11703,6 @@ class LevelGenerator:
 
         num_layers = level.get("layer", 8)
 
-        # 블로킹 오프셋 정의 (TownPop 방식)
-        BLOCKING_OFFSETS_SAME_PARITY = [
-            (0, 0), (1, 0), (0, 1), (1, 1)
-        ]
-        BLOCKING_OFFSETS_UPPER_SMALLER = [
-            (-1, -1), (0, -1), (-1, 0), (0, 0)
-        ]
-        BLOCKING_OFFSETS_UPPER_BIGGER = [
-            (0, 0), (1, 0), (0, 1), (1, 1)
-        ]
-
         issues = []
         blocking_stats = {
             "same_type_blocking": 0,
@@ -11810,37 +11766,18 @@ class LevelGenerator:
                     all_tiles[tile_type].append((layer_idx, pos, gimmick))
                     tile_positions[f"{layer_idx}_{pos}"] = (layer_idx, pos, tile_type)
 
-        # Step 2: 블로킹 관계 분석
-        def get_blocking_offsets(lower_layer: int, upper_layer: int) -> List[Tuple[int, int]]:
-            """레이어 크기에 따른 블로킹 오프셋 반환"""
-            lower_col = int(level.get(f"layer_{lower_layer}", {}).get("col", 7))
-            upper_col = int(level.get(f"layer_{upper_layer}", {}).get("col", 7))
-
-            if lower_col == upper_col:
-                return BLOCKING_OFFSETS_SAME_PARITY
-            elif upper_col > lower_col:
-                return BLOCKING_OFFSETS_UPPER_BIGGER
-            else:
-                return BLOCKING_OFFSETS_UPPER_SMALLER
-
-        def is_blocked_by(lower_layer: int, lower_pos: str, upper_layer: int) -> Optional[str]:
-            """하위 타일이 상위 레이어의 어떤 타일에 막히는지 확인"""
-            if upper_layer >= num_layers:
-                return None
-
+        # Step 2: 블로킹 관계 분석 (게임과 같은 패리티 기반 오프셋)
+        coverage = CoverageGraph(
+            {i: level.get(f"layer_{i}", {}).get("col", 7) for i in range(num_layers)}
+        )
+        slot_types: Dict[Tuple[int, int, int], str] = {}
+        for layer_idx, pos, tile_type in tile_positions.values():
             try:
-                col, row = map(int, lower_pos.split("_"))
-            except:
-                return None
-
-            upper_tiles = level.get(f"layer_{upper_layer}", {}).get("tiles", {})
-            offsets = get_blocking_offsets(lower_layer, upper_layer)
-
-            for dx, dy in offsets:
-                check_pos = f"{col + dx}_{row + dy}"
-                if check_pos in upper_tiles:
-                    return check_pos
-            return None
+                col, row = map(int, pos.split("_"))
+            except ValueError:
+                continue
+            coverage.add(layer_idx, col, row)
+            slot_types[(layer_idx, col, row)] = tile_type
 
         # Step 3: 같은 타입 상호 블로킹 검사
         same_type_blocking_pairs = []
@@ -11851,19 +11788,21 @@ class LevelGenerator:
 
             # 각 타일에 대해 상위 레이어에서 같은 타입이 막고 있는지 확인
             for lower_layer, lower_pos, _ in tiles:
-                for check_layer in range(lower_layer + 1, num_layers):
-                    blocking_pos = is_blocked_by(lower_layer, lower_pos, check_layer)
-                    if blocking_pos:
-                        check_key = f"{check_layer}_{blocking_pos}"
-                        if check_key in tile_positions:
-                            _, _, blocking_type = tile_positions[check_key]
-                            blocking_stats["total_blocking_pairs"] += 1
-
-                            if blocking_type == tile_type:
-                                blocking_stats["same_type_blocking"] += 1
-                                same_type_blocking_pairs.append(
-                                    (tile_type, f"L{lower_layer}:{lower_pos}", f"L{check_layer}:{blocking_pos}")
-                                )
+                try:
+                    col, row = map(int, lower_pos.split("_"))
+                except ValueError:
+                    continue
+                for blocker in sorted(coverage.blockers(lower_layer, col, row)):
+                    check_layer, bx, by = blocker
+                    blocking_pos = f"{bx}_{by}"
+                    blocking_type = slot_types[blocker]
+                    blocking_stats["total_blocking_pairs"] += 1
+
+                    if blocking_type == tile_type:
+                        blocking_stats["same_type_blocking"] += 1
+                        same_type_blocking_pairs.append(
+                            (tile_type, f"L{lower_layer}:{lower_pos}", f"L{check_layer}:{blocking_pos}")
+                        )
 
         # Step 4: 같은 타입 블로킹 비율 평가
         if blocking_stats["total_blocking_pairs"] > 0:
@@ -12477,6 +12416,7 @@ class LevelGenerator:
         2. Link tiles: Partner tile MUST exist AND at least one of the pair must have clearable neighbor
         """
         num_layers = level.get("layer", 8)
+        coverage = CoverageGraph.from_level(level)
 
         for i in range(num_layers):
             layer_key = f"layer_{i}"
@@ -12520,12 +12460,12 @@ class LevelGenerator:
                                     continue
                                 # CRITICAL: Neighbor must NOT be covered by upper layers
                                 # If covered, the chain cannot be unlocked
-                                if not self._is_position_covered_by_upper(level, i, ncol, nrow):
+                                if not self._is_position_covered_by_upper(level, i, ncol, nrow, coverage):
                                     has_clearable_neighbor = True
                                     clearable_neighbor_count += 1
 
                     # ENHANCED VALIDATION: Check chain tile's own blocking status
-                    chain_is_blocked = self._is_position_covered_by_upper(level, i, col, row)
+                    chain_is_blocked = self._is_position_covered_by_upper(level, i, col, row, coverage)
 
                     if not has_clearable_neighbor:
                         invalid_obstacles.append(pos)
@@ -12536,10 +12476,7 @@ class LevelGenerator:
                         # Only invalidate if in layer 0 with no accessible neighbors
                         if i == 0:
                             # Count how many layers are above this position
-                            blocking_layers = 0
-                            for upper_layer in range(i + 1, num_layers):
-                                if self._is_position_covered_by_upper(level, i, col, row):
-                                    blocking_layers += 1
+                            blocking_layers = coverage.blocking_layers(i, col, row)
                             # If chain is in layer 0 and blocked by 3+ layers, consider risky
                             if blocking_layers >= 3 and clearable_neighbor_count < 2:
                                 logger.warning(f"[VALIDATE] Risky chain at layer {i}/{pos}: blocked by {blocking_layers} layers, only {clearable_neighbor_count} clearable neighbors")
@@ -12629,7 +12566,7 @@ class LevelGenerator:
                 elif attr == "unknown":
                     col, row = map(int, pos.split('_'))
                     # Unknown tiles MUST be covered by upper layers to show curtain effect
-                    if not self._is_position_covered_by_upper(level, i, col, row):
+                    if not self._is_position_covered_by_upper(level, i, col, row, coverage):
                         invalid_obstacles.append(pos)
 
             # Remove invalid obstacles
@@ -0,0 +1,242 @@
+"""
+Learned Model Plumbing
+======================
+Infrastructure shared by the small regression models fitted on logged
+simulation data (``clear_rate_surrogate`` and ``simulation_cost``):
+
+- ``RidgeModel``: weights per key over standardized features, fitted with
+  ridge regression in plain Python, stored as JSON (tmp + ``os.replace``)
+- ``SampleLog``: thread-safe, size-capped JSONL log of training samples
+- ``ModelFileCache``: a model loaded from disk and reloaded when its file
+  changes, so a retrained model is picked up without a restart
+"""
+
+import json
+import math
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Generic, Iterable, List, Optional, Sequence, Tuple, TypeVar
+
+CACHE_DIR = Path(__file__).parent.parent / "storage" / "cache"
+
+# Samples kept per log; older ones are dropped once the log grows past this
+MAX_LOG_SAMPLES = 20000
+# Compact only after this much growth, so appends stay O(1) amortized
+_LOG_SLACK = 1.25
+
+ModelT = TypeVar("ModelT", bound="RidgeModel")
+
+
+def solve_linear(matrix: List[List[float]], rhs: List[float]) -> List[float]:
+    """Solve a small dense linear system (Gaussian elimination, partial pivoting)."""
+    n = len(rhs)
+    a = [row[:] + [rhs[i]] for i, row in enumerate(matrix)]
+    for col in range(n):
+        pivot = max(range(col, n), key=lambda r: abs(a[r][col]))
+        if abs(a[pivot][col]) < 1e-12:
+            raise ValueError("Singular system while fitting model")
+        a[col], a[pivot] = a[pivot], a[col]
+        for r in range(col + 1, n):
+            factor = a[r][col] / a[col][col]
+            if factor:
+                for c in range(col, n + 1):
+                    a[r][c] -= factor * a[col][c]
+    x = [0.0] * n
+    for r in range(n - 1, -1, -1):
+        x[r] = (a[r][n] - sum(a[r][c] * x[c] for c in range(r + 1, n))) / a[r][r]
+    return x
+
+
+def standardize(rows: List[List[float]]) -> Tuple[List[float], List[float], List[List[float]]]:
+    """Column means, scales and the standardized design matrix (leading bias column)."""
+    n_features = len(rows[0]) if rows else 0
+    means = [sum(row[j] for row in rows) / len(rows) for j in range(n_features)]
+    scales = []
+    for j in range(n_features):
+        variance = sum((row[j] - means[j]) ** 2 for row in rows) / len(rows)
+        scales.append(math.sqrt(variance) or 1.0)
+    design = [[1.0] + [(row[j] - means[j]) / scales[j] for j in range(n_features)] for row in rows]
+    return means, scales, design
+
+
+def ridge_gram(design: Iterable[List[float]], size: int, ridge: float) -> List[List[float]]:
+    """X^T X + ridge * I over design rows (the bias is not regularized)."""
+    gram = [[0.0] * size for _ in range(size)]
+    for x in design:
+        for i in range(size):
+            xi = x[i]
+            gram_row = gram[i]
+            for j in range(i, size):
+                gram_row[j] += xi * x[j]
+    for i in range(size):
+        for j in range(i):
+            gram[i][j] = gram[j][i]
+        if i:
+            gram[i][i] += ridge
+    return gram
+
+
+def ridge_weights(gram: List[List[float]], samples: Sequence[Tuple[List[float], float]]) -> List[float]:
+    """Ridge solution for (design row, target) samples given their gram matrix."""
+    rhs = [sum(x[i] * y for x, y in samples) for i in range(len(gram))]
+    return solve_linear(gram, rhs)
+
+
+class RidgeModel:
+    """Linear weights per key (bot profile) over standardized features."""
+
+    def __init__(
+        self,
+        weights: Dict[str, List[float]],
+        means: Sequence[float],
+        scales: Sequence[float],
+        feature_names: Sequence[str],
+        metrics: Optional[Dict[str, Any]] = None,
+        trained_at: Optional[str] = None,
+        sample_count: int = 0,
+    ):
+        self.weights = weights
+        self.means = list(means)
+        self.scales = list(scales)
+        self.feature_names = tuple(feature_names)
+        self.metrics = metrics or {}
+        self.trained_at = trained_at
+        self.sample_count = sample_count
+
+    def linear_predictions(self, features: Dict[str, float], keys: Iterable[str]) -> Dict[str, float]:
+        """Raw linear output per key that has weights (clamping is up to the model)."""
+        z = [
+            (features.get(name, 0.0) - mean) / scale
+            for name, mean, scale in zip(self.feature_names, self.means, self.scales)
+        ]
+        predictions = {}
+        for key in keys:
+            w = self.weights.get(key)
+            if w is not None:
+                predictions[key] = w[0] + sum(wi * zi for wi, zi in zip(w[1:], z))
+        return predictions
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "feature_names": list(self.feature_names),
+            "means": self.means,
+            "scales": self.scales,
+            "weights": self.weights,
+            "metrics": self.metrics,
+            "trained_at": self.trained_at,
+            "sample_count": self.sample_count,
+        }
+
+    @classmethod
+    def from_dict(cls: type, data: Dict[str, Any]) -> ModelT:
+        return cls(
+            weights=data["weights"],
+            means=data["means"],
+            scales=data["scales"],
+            feature_names=data["feature_names"],
+            metrics=data.get("metrics"),
+            trained_at=data.get("trained_at"),
+            sample_count=data.get("sample_count", 0),
+        )
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls: type, path: Path) -> ModelT:
+        with open(path, encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+
+class SampleLog:
+    """Append-only JSONL log of training samples, capped at ``max_samples``.
+
+    Once the log holds ``max_samples * 1.25`` lines it is rewritten with the
+    newest ``max_samples``, so models keep training on recent data and the
+    file does not grow without bound.
+    """
+
+    # Keys every loaded sample must have (malformed lines are skipped)
+    required_keys: Tuple[str, ...] = ()
+
+    def __init__(self, path: Path, max_samples: int = MAX_LOG_SAMPLES):
+        self.path = path
+        self.max_samples = max_samples
+        self._lock = threading.Lock()
+        self._line_count: Optional[int] = None  # Counted on first append
+
+    def append_samples(self, samples: Iterable[Dict[str, Any]]) -> None:
+        lines = [json.dumps(sample, ensure_ascii=False) + "\n" for sample in samples]
+        if not lines:
+            return
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            if self._line_count is None:
+                self._line_count = self._count_lines()
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write("".join(lines))
+            self._line_count += len(lines)
+            if self._line_count > self.max_samples * _LOG_SLACK:
+                self._compact()
+
+    def _count_lines(self) -> int:
+        try:
+            with open(self.path, "rb") as f:
+                return sum(1 for _ in f)
+        except OSError:
+            return 0
+
+    def _compact(self) -> None:
+        """Keep the newest max_samples lines (caller holds the lock)."""
+        with open(self.path, encoding="utf-8") as f:
+            lines = f.readlines()[-self.max_samples:]
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.writelines(lines)
+        os.replace(tmp_path, self.path)
+        self._line_count = len(lines)
+
+    def load(self) -> List[Dict[str, Any]]:
+        """All readable samples (malformed lines are skipped)."""
+        samples = []
+        if not self.path.exists():
+            return samples
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    sample = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(sample, dict) and all(key in sample for key in self.required_keys):
+                    samples.append(sample)
+        return samples
+
+
+class ModelFileCache(Generic[ModelT]):
+    """Model from the first loadable of some files, reloaded when that file changes."""
+
+    def __init__(self, load: Callable[[Path], ModelT]):
+        self._load = load
+        self._model: Optional[ModelT] = None
+        self._source: Optional[Tuple[Path, float]] = None
+
+    def get(self, *paths: Path) -> Optional[ModelT]:
+        for path in paths:
+            try:
+                source = (path, path.stat().st_mtime)
+            except OSError:
+                continue
+            if source != self._source:
+                try:
+                    model = self._load(path)
+                except (OSError, ValueError, KeyError):
+                    continue
+                self._model, self._source = model, source
+            return self._model
+        self._model, self._source = None, None
+        return None
@@ -0,0 +1,124 @@
+"""
+Precompiled Pattern Library
+
+Compiles the pixel-art templates in ``pattern_templates`` once per
+(pattern, cols, rows) into compact position records so that layout
+generation becomes a table lookup instead of re-selecting and re-scanning
+template strings on every call.
+
+Each compiled pattern carries:
+- positions: "x_y" strings in template scan order (what the generator emits)
+- coords: (x, y) integer pairs in the same order
+- count / density / centroid: precomputed shape statistics
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+from .pattern_templates import (
+    PATTERN_TEMPLATES,
+    get_template,
+    get_layered_template,
+    template_to_positions,
+)
+
+
+@dataclass(frozen=True)
+class CompiledPattern:
+    """Immutable, precomputed position set for one pattern on one grid size."""
+    pattern_index: int
+    cols: int
+    rows: int
+    positions: Tuple[str, ...]
+    coords: Tuple[Tuple[int, int], ...]
+    count: int
+    density: float
+    centroid: Tuple[float, float]
+    layer_index: Optional[int] = None
+
+    def to_positions(self) -> List[str]:
+        """Return a fresh, mutable list of position strings."""
+        return list(self.positions)
+
+
+_EMPTY_CENTROID = (0.0, 0.0)
+
+
+def _compile_coords(
+    pattern_index: int,
+    cols: int,
+    rows: int,
+    coords: List[Tuple[int, int]],
+    layer_index: Optional[int] = None,
+) -> CompiledPattern:
+    sum_x = sum(x for x, _ in coords)
+    sum_y = sum(y for _, y in coords)
+
+    count = len(coords)
+    cells = cols * rows
+    return CompiledPattern(
+        pattern_index=pattern_index,
+        cols=cols,
+        rows=rows,
+        positions=tuple(f"{x}_{y}" for x, y in coords),
+        coords=tuple(coords),
+        count=count,
+        density=count / cells if cells else 0.0,
+        centroid=(sum_x / count, sum_y / count) if count else _EMPTY_CENTROID,
+        layer_index=layer_index,
+    )
+
+
+def _template_coords(template: Optional[List[str]], cols: int, rows: int) -> List[Tuple[int, int]]:
+    if not template:
+        return []
+    coords = []
+    for pos in template_to_positions(template, cols, rows):
+        x, y = pos.split("_")
+        coords.append((int(x), int(y)))
+    return coords
+
+
+@lru_cache(maxsize=None)
+def compile_pattern(pattern_index: int, cols: int, rows: int) -> Optional[CompiledPattern]:
+    """
+    Compile a pattern template for a grid size.
+
+    Returns:
+        CompiledPattern, or None if the pattern index is unknown
+    """
+    if pattern_index not in PATTERN_TEMPLATES:
+        return None
+    coords = _template_coords(get_template(pattern_index, cols, rows), cols, rows)
+    return _compile_coords(pattern_index, cols, rows, coords)
+
+
+@lru_cache(maxsize=None)
+def compile_layered_pattern(
+    pattern_index: int, layer_index: int, cols: int, rows: int
+) -> Optional[CompiledPattern]:
+    """Compile the layer-specific template of a layered pattern for a grid size."""
+    if pattern_index not in PATTERN_TEMPLATES:
+        return None
+    template = get_layered_template(pattern_index, layer_index, cols, rows)
+    coords = _template_coords(template, cols, rows)
+    return _compile_coords(pattern_index, cols, rows, coords, layer_index=layer_index)
+
+
+def get_pattern_positions(pattern_index: int, cols: int, rows: int) -> List[str]:
+    """Cached equivalent of ``pattern_templates.get_pattern_positions``."""
+    compiled = compile_pattern(pattern_index, cols, rows)
+    return compiled.to_positions() if compiled else []
+
+
+def get_layered_pattern_positions(pattern_index: int, layer_index: int, cols: int, rows: int) -> List[str]:
+    """Cached equivalent of ``pattern_templates.get_layered_pattern_positions``."""
+    compiled = compile_layered_pattern(pattern_index, layer_index, cols, rows)
+    return compiled.to_positions() if compiled else []
+
+
+def clear_pattern_library() -> None:
+    """Drop all compiled patterns (e.g. after editing templates at runtime)."""
+    compile_pattern.cache_clear()
+    compile_layered_pattern.cache_clear()
@@ -8,8 +8,14 @@ Template format:
 - '#' = tile position
 - ' ' or '.' = empty
 - Templates are centered in the grid automatically
+
+Template data lives in ``data/pattern_templates.json`` and is parsed on
+first access to ``PATTERN_TEMPLATES``.
 """
 
+import json
+from collections.abc import Mapping
+from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 
 
@@ -17,2135 +23,39 @@ from typing import List, Dict, Tuple, Optional
 # PATTERN TEMPLATE DEFINITIONS
 # =============================================================================
 # Structure: { pattern_index: { 'name': str, 'small': [...], 'medium': [...], 'large': [...] } }
+# Optional keys: 'medium6', 'medium7', 'xlarge', 'is_layered' + 'layer_0'..'layer_3'
+
+PATTERN_TEMPLATES_PATH = Path(__file__).parent / "data" / "pattern_templates.json"
 
-PATTERN_TEMPLATES: Dict[int, Dict] = {
-    # =========================================================================
-    # Category 1: Basic Shapes (0-9)
-    # =========================================================================
-    0: {
-        'name': 'filled_rectangle',
-        'small': [
-            "#####",
-            "#####",
-            "#####",
-            "#####",
-        ],
-        'medium': [
-            "######",
-            "######",
-            "######",
-            "######",
-            "######",
-        ],
-        'large': [
-            "#######",
-            "#######",
-            "#######",
-            "#######",
-            "#######",
-            "#######",
-        ],
-    },
-    1: {
-        'name': 'diamond',
-        'small': [
-            "  #  ",
-            " ### ",
-            "#####",
-            " ### ",
-            "  #  ",
-        ],
-        'medium': [
-            "   #   ",
-            "  ###  ",
-            " ##### ",
-            "#######",
-            " ##### ",
-            "  ###  ",
-            "   #   ",
-        ],
-        'large': [
-            "   ##   ",
-            "  ####  ",
-            " ###### ",
-            "########",
-            "########",
-            " ###### ",
-            "  ####  ",
-            "   ##   ",
-        ],
-    },
-    2: {
-        'name': 'oval',
-        'small': [
-            " ### ",
-            "#####",
-            "#####",
-            "#####",
-            " ### ",
-        ],
-        'medium': [
-            "  ###  ",
-            " ##### ",
-            "#######",
-            "#######",
-            "#######",
-            " ##### ",
-            "  ###  ",
-        ],
-        'large': [
-            "  ####  ",
-            " ###### ",
-            "########",
-            "########",
-            "########",
-            "########",
-            " ###### ",
-            "  ####  ",
-        ],
-    },
-    3: {
-        'name': 'cross',
-        'small': [
-            " # ",
-            "###",
-            " # ",
-        ],
-        'medium': [
-            "  ##  ",
-            "  ##  ",
-            "######",
-            "######",
-            "  ##  ",
-            "  ##  ",
-        ],
-        'large': [
-            "   ##   ",
-            "   ##   ",
-            "   ##   ",
-            "########",
-            "########",
-            "   ##   ",
-            "   ##   ",
-            "   ##   ",
-        ],
-    },
-    4: {
-        'name': 'donut',
-        'small': [
-            " ### ",
-            "## ##",
-            "#   #",
-            "## ##",
-            " ### ",
-        ],
-        'medium': [
-            " ##### ",
-            "##   ##",
-            "#     #",
-            "#     #",
-            "#     #",
-            "##   ##",
-            " ##### ",
-        ],
-        'large': [
-            " ###### ",
-            "##    ##",
-            "#      #",
-            "#      #",
-            "#      #",
-            "#      #",
-            "##    ##",
-            " ###### ",
-        ],
-    },
-    5: {
-        'name': 'concentric_diamond',
-        'small': [
-            "  #  ",
-            " # # ",
-            "# # #",
-            " # # ",
-            "  #  ",
-        ],
-        'medium': [
-            "   #   ",
-            "  # #  ",
-            " #   # ",
-            "#  #  #",
-            " #   # ",
-            "  # #  ",
-            "   #   ",
-        ],
-        'large': [
-            "   ##   ",
-            "  #  #  ",
-            " #    # ",
-            "#  ##  #",
-            "#  ##  #",
-            " #    # ",
-            "  #  #  ",
-            "   ##   ",
-        ],
-    },
-    6: {
-        'name': 'corner_anchored',
-        'small': [
-            "#####",
-            "#   #",
-            "#   #",
-            "#   #",
-            "#####",
-        ],
-        'medium6': [
-            "######",
-            "##  ##",
-            "#    #",
-            "#    #",
-            "##  ##",
-            "######",
-        ],
-        'medium': [
-            "#######",
-            "##   ##",
-            "#     #",
-            "#     #",
-            "#     #",
-            "##   ##",
-            "#######",
-        ],
-        'large': [
-            "########",
-            "###  ###",
-            "##    ##",
-            "#      #",
-            "#      #",
-            "##    ##",
-            "###  ###",
-            "########",
-        ],
-    },
-    7: {
-        'name': 'hexagon',
-        'small': [
-            " ### ",
-            "#####",
-            "#####",
-            "#####",
-            " ### ",
-        ],
-        'medium': [
-            "  ###  ",
-            " ##### ",
-            "#######",
-            "#######",
-            "#######",
-            " ##### ",
-            "  ###  ",
-        ],
-        'large': [
-            "  ####  ",
-            " ###### ",
-            "########",
-            "########",
-            "########",
-            "########",
-            " ###### ",
-            "  ####  ",
-        ],
-    },
-    8: {
-        'name': 'heart',
-        'small': [
-            " # # ",
-            "#####",
-            "#####",
-            " ### ",
-            "  #  ",
-        ],
-        'medium6': [
-            ".#..#.",
-            "######",
-            "######",
-            ".####.",
-            "..##..",
-            "..##..",
-        ],
-        'medium7': [
-            ".##.##.",
-            "#######",
-            "#######",
-            ".#####.",
-            "..###..",
-            "...#...",
-        ],
-        'medium': [
-            " ##  ## ",
-            "########",
-            "########",
-            " ###### ",
-            "  ####  ",
-            "   ##   ",
-        ],
-        'large': [
-            " ##  ## ",
-            "########",
-            "########",
-            "########",
-            " ###### ",
-            "  ####  ",
-            "   ##   ",
-            "   ##   ",
-        ],
-    },
-    9: {
-        'name': 't_shape',
-        'small': [
-            "#####",
-            "  #  ",
-            "  #  ",
-            "  #  ",
-        ],
-        'medium': [
-            "#######",
-            "#######",
-            "  ###  ",
-            "  ###  ",
-            "  ###  ",
-            "  ###  ",
-        ],
-        'large': [
-            "########",
-            "########",
-            "  ####  ",
-            "  ####  ",
-            "  ####  ",
-            "  ####  ",
-            "  ####  ",
-            "  ####  ",
-        ],
-    },
 
-    # =========================================================================
-    # Category 2: Arrow/Direction Patterns (10-14)
-    # =========================================================================
-    10: {
-        'name': 'arrow_up',
-        'small': [
-            "  #  ",
-            " ### ",
-            "#####",
-            " ### ",
-            " ### ",
-        ],
-        'medium': [
-            "   #   ",
-            "  ###  ",
-            " ##### ",
-            "#######",
-            "  ###  ",
-            "  ###  ",
-            "  ###  ",
-        ],
-        'large': [
-            "   ##   ",
-            "  ####  ",
-            " ###### ",
-            "########",
-            "  ####  ",
-            "  ####  ",
-            "  ####  ",
-            "  ####  ",
-        ],
-    },
-    11: {
-        'name': 'arrow_down',
-        'small': [
-            " ### ",
-            " ### ",
-            "#####",
-            " ### ",
-            "  #  ",
-        ],
-        'medium': [
-            "  ###  ",
-            "  ###  ",
-            "  ###  ",
-            "#######",
-            " ##### ",
-            "  ###  ",
-            "   #   ",
-        ],
-        'large': [
-            "  ####  ",
-            "  ####  ",
-            "  ####  ",
-            "  ####  ",
-            "########",
-            " ###### ",
-            "  ####  ",
-            "   ##   ",
-        ],
-    },
-    12: {
-        'name': 'arrow_left',
-        'small': [
-            "  #  ",
-            " ##  ",
-            "#####",
-            " ##  ",
-            "  #  ",
-        ],
-        'medium': [
-            "   #   ",
-            "  ##   ",
-            " ###   ",
-            "#######",
-            " ###   ",
-            "  ##   ",
-            "   #   ",
-        ],
-        'large': [
-            "   #    ",
-            "  ##    ",
-            " ###    ",
-            "########",
-            "########",
-            " ###    ",
-            "  ##    ",
-            "   #    ",
-        ],
-    },
-    13: {
-        'name': 'arrow_right',
-        'small': [
-            "  #  ",
-            "  ## ",
-            "#####",
-            "  ## ",
-            "  #  ",
-        ],
-        'medium': [
-            "   #   ",
-            "   ##  ",
-            "   ### ",
-            "#######",
-            "   ### ",
-            "   ##  ",
-            "   #   ",
-        ],
-        'large': [
-            "    #   ",
-            "    ##  ",
-            "    ### ",
-            "########",
-            "########",
-            "    ### ",
-            "    ##  ",
-            "    #   ",
-        ],
-    },
-    14: {
-        'name': 'chevron',
-        'small': [
-            " ### ",
-            "## ##",
-            "#   #",
-            "#   #",
-            "#   #",
-        ],
-        'medium6': [
-            ".####.",
-            "###.##",
-            "##..##",
-            "#....#",
-            "#....#",
-            "#....#",
-        ],
-        'medium7': [
-            ".#####.",
-            "###.###",
-            "##...##",
-            "#.....#",
-            "#.....#",
-            "#.....#",
-            "#.....#",
-        ],
-        'medium': [
-            " ###### ",
-            "#### ###",
-            "###   ##",
-            "##     #",
-            "##     #",
-            "#       ",
-            "#       ",
-            "#       ",
-        ],
-        'large': [
-            " ###### ",
-            "###  ###",
-            "##    ##",
-            "##    ##",
-            "#      #",
-            "#      #",
-            "#      #",
-            "#      #",
-        ],
-    },
+class _LazyPatternTemplates(Mapping):
+    """Read-only pattern_index -> template mapping loaded on first access."""
 
-    # =========================================================================
-    # Category 3: Star/Celestial Patterns (15-19)
-    # =========================================================================
-    15: {
-        'name': 'star_five',
-        'small': [
-            "..#..",
-            ".###.",
-            "#####",
-            "..#..",
-            ".#.#.",
-        ],
-        'medium6': [
-            "..##..",
-            ".####.",
-            "######",
-            "..##..",
-            ".####.",
-            ".#..#.",
-        ],
-        'medium7': [
-            "...#...",
-            "..###..",
-            ".#####.",
-            "#######",
-            "...#...",
-            "..###..",
-            ".##.##.",
-        ],
-        'medium': [
-            "   ##   ",
-            "  ####  ",
-            " ###### ",
-            "########",
-            "   ##   ",
-            "  ####  ",
-            " ##  ## ",
-            "##    ##",
-        ],
-        'large': [
-            "   ##   ",
-            "  ####  ",
-            " ###### ",
-            "########",
-            "   ##   ",
-            "  ####  ",
-            " ##  ## ",
-            "##    ##",
-        ],
-    },
-    16: {
-        'name': 'star_six',
-        'small': [
-            "  #  ",
-            "#####",
-            " ### ",
-            "#####",
-            "  #  ",
-        ],
-        'medium': [
-            "   #   ",
-            "  ###  ",
-            "#######",
-            " ##### ",
-            "#######",
-            "  ###  ",
-            "   #   ",
-        ],
-        'large': [
-            "   ##   ",
-            "  ####  ",
-            "########",
-            " ###### ",
-            " ###### ",
-            "########",
-            "  ####  ",
-            "   ##   ",
-        ],
-    },
-    17: {
-        'name': 'crescent_moon',
-        'small': [
-            " ####",
-            "#### ",
-            "###  ",
-            "#### ",
-            " ####",
-        ],
-        'medium': [
-            "  #####",
-            " ##### ",
-            "#####  ",
-            "####   ",
-            "#####  ",
-            " ##### ",
-            "  #####",
-        ],
-        'large': [
-            "  ######",
-            " ###### ",
-            "######  ",
-            "#####   ",
-            "#####   ",
-            "######  ",
-            " ###### ",
-            "  ######",
-        ],
-    },
-    18: {
-        'name': 'sun_burst',
-        'small': [
-            "# # #",
-            " ### ",
-            "#####",
-            " ### ",
-            "# # #",
-        ],
-        'medium': [
-            "#  #  #",
-            " # # # ",
-            "  ###  ",
-            "### ###",
-            "  ###  ",
-            " # # # ",
-            "#  #  #",
-        ],
-        'large': [
-            "#  ##  #",
-            " # ## # ",
-            "  ####  ",
-            "########",
-            "########",
-            "  ####  ",
-            " # ## # ",
-            "#  ##  #",
-        ],
-    },
-    19: {
-        'name': 'spiral',
-        'small': [
-            " ####",
-            "#    ",
-            "# ## ",
-            "#  # ",
-            " ### ",
-        ],
-        'medium': [
-            " ##### ",
-            "#     #",
-            "# ### #",
-            "# # # #",
-            "# ### #",
-            "#      ",
-            " ######",
-        ],
-        'large': [
-            " ###### ",
-            "#      #",
-            "# #### #",
-            "# #  # #",
-            "# # ## #",
-            "# #### #",
-            "#       ",
-            " #######",
-        ],
-    },
+    def __init__(self, path: Path):
+        self._path = path
+        self._data: Optional[Dict[int, Dict]] = None
 
-    # =========================================================================
-    # Category 4: Letter Shapes (20-29)
-    # =========================================================================
-    20: {
-        'name': 'letter_H',
-        'small': [
-            "# #",
-            "# #",
-            "###",
-            "# #",
-            "# #",
-        ],
-        'medium': [
-            "##   ##",
-            "##   ##",
-            "##   ##",
-            "#######",
-            "##   ##",
-            "##   ##",
-            "##   ##",
-        ],
-        'large': [
-            "##    ##",
-            "##    ##",
-            "##    ##",
-            "########",
-            "########",
-            "##    ##",
-            "##    ##",
-            "##    ##",
-        ],
-    },
-    21: {
-        'name': 'letter_I',
-        'small': [
-            "###",
-            " # ",
-            " # ",
-            " # ",
-            "###",
-        ],
-        'medium6': [
-            "######",
-            ".##..",
-            ".##..",
-            ".##..",
-            ".##..",
-            "######",
-        ],
-        'medium7': [
-            "#######",
-            "..##...",
-            "..##...",
-            "..##...",
-            "..##...",
-            "..##...",
-            "#######",
-        ],
-        'medium': [
-            "########",
-            "   ##   ",
-            "   ##   ",
-            "   ##   ",
-            "   ##   ",
-            "   ##   ",
-            "   ##   ",
-            "########",
-        ],
-        'large': [
-            "########",
-            "   ##   ",
-            "   ##   ",
-            "   ##   ",
-            "   ##   ",
-            "   ##   ",
-            "   ##   ",
-            "########",
-        ],
-    },
-    22: {
-        'name': 'letter_L',
-        'small': [
-            "#  ",
-            "#  ",
-            "#  ",
-            "#  ",
-            "###",
-        ],
-        'medium': [
-            "##     ",
-            "##     ",
-            "##     ",
-            "##     ",
-            "##     ",
-            "##     ",
-            "#######",
-        ],
-        'large': [
-            "##      ",
-            "##      ",
-            "##      ",
-            "##      ",
-            "##      ",
-            "##      ",
-            "##      ",
-            "########",
-        ],
-    },
-    23: {
-        'name': 'letter_U',
-        'small': [
-            "# #",
-            "# #",
-            "# #",
-            "# #",
-            "###",
-        ],
-        'medium': [
-            "##   ##",
-            "##   ##",
-            "##   ##",
-            "##   ##",
-            "##   ##",
-            " ## ## ",
-            "  ###  ",
-        ],
-        'large': [
-            "##    ##",
-            "##    ##",
-            "##    ##",
-            "##    ##",
-            "##    ##",
-            "##    ##",
-            " ##  ## ",
-            "  ####  ",
-        ],
-    },
-    24: {
-        'name': 'letter_X',
-        'small': [
-            "# #",
-            " # ",
-            "# #",
-        ],
-        'medium': [
-            "##   ##",
-            " ## ## ",
-            "  ###  ",
-            "   #   ",
-            "  ###  ",
-            " ## ## ",
-            "##   ##",
-        ],
-        'large': [
-            "##    ##",
-            " ##  ## ",
-            "  ####  ",
-            "   ##   ",
-            "   ##   ",
-            "  ####  ",
-            " ##  ## ",
-            "##    ##",
-        ],
-    },
-    25: {
-        'name': 'letter_Y',
-        'small': [
-            "# #",
-            "# #",
-            " # ",
-            " # ",
-            " # ",
-        ],
-        'medium6': [
-            "##..##",
-            ".####.",
-            "..##..",
-            "..##..",
-            "..##..",
-            "..##..",
-        ],
-        'medium7': [
-            "##...##",
-            ".##.##.",
-            "..###..",
-            "...#...",
-            "..###..",
-            "..###..",
-            "..###..",
-        ],
-        'medium': [
-            "##    ##",
-            " ##  ## ",
-            "  ####  ",
-            "   ##   ",
-            "   ##   ",
-            "   ##   ",
-            "   ##   ",
-            "   ##   ",
-        ],
-        'large': [
-            "##    ##",
-            " ##  ## ",
-            "  ####  ",
-            "   ##   ",
-            "   ##   ",
-            "   ##   ",
-            "   ##   ",
-            "   ##   ",
-        ],
-    },
-    26: {
-        'name': 'letter_Z',
-        'small': [
-            "###",
-            " # ",
-            "# ",
-            "###",
-        ],
-        'medium': [
-            "#######",
-            "    ## ",
-            "   ##  ",
-            "  ##   ",
-            " ##    ",
-            "##     ",
-            "#######",
-        ],
-        'large': [
-            "########",
-            "     ## ",
-            "    ##  ",
-            "   ##   ",
-            "  ##    ",
-            " ##     ",
-            "##      ",
-            "########",
-        ],
-    },
-    27: {
-        'name': 'letter_S',
-        'small': [
-            "#####",
-            "#    ",
-            "#####",
-            "    #",
-            "#####",
-        ],
-        'medium6': [
-            ".####.",
-            "##....",
-            ".###..",
-            "..###.",
-            "....##",
-            ".####.",
-        ],
-        'medium7': [
-            ".#####.",
-            "##.....",
-            ".####..",
-            "...###.",
-            ".....##",
-            ".#####.",
-        ],
-        'medium': [
-            " ##### ",
-            "##   # ",
-            " ###   ",
-            "   ### ",
-            " #   ##",
-            " ##### ",
-        ],
-        'large': [
-            "  #####  ",
-            " ##   ## ",
-            " ##      ",
-            "  #####  ",
-            "      ## ",
-            " ##   ## ",
-            "  #####  ",
-        ],
-    },
-    28: {
-        'name': 'letter_O',
-        'small': [
-            " ### ",
-            "#   #",
-            "#   #",
-            "#   #",
-            " ### ",
-        ],
-        'medium6': [
-            ".####.",
-            "##..##",
-            "##..##",
-            "##..##",
-            "##..##",
-            ".####.",
-        ],
-        'medium7': [
-            ".#####.",
-            "##...##",
-            "##...##",
-            "##...##",
-            "##...##",
-            "##...##",
-            ".#####.",
-        ],
-        'medium': [
-            " ###### ",
-            "##    ##",
-            "##    ##",
-            "##    ##",
-            "##    ##",
-            "##    ##",
-            "##    ##",
-            " ###### ",
-        ],
-        'large': [
-            " ###### ",
-            "##    ##",
-            "##    ##",
-            "##    ##",
-            "##    ##",
-            "##    ##",
-            "##    ##",
-            " ###### ",
-        ],
-    },
-    29: {
-        'name': 'letter_C',
-        'small': [
-            " ###",
-            "#   ",
-            "#   ",
-            "#   ",
-            " ###",
-        ],
-        'medium': [
-            "  #### ",
-            " #     ",
-            "#      ",
-            "#      ",
-            "#      ",
-            " #     ",
-            "  #### ",
-        ],
-        'large': [
-            "  ##### ",
-            " #      ",
-            "#       ",
-            "#       ",
-            "#       ",
-            "#       ",
-            " #      ",
-            "  ##### ",
-        ],
-    },
+    def _load(self) -> Dict[int, Dict]:
+        if self._data is None:
+            with open(self._path, encoding="utf-8") as f:
+                raw = json.load(f)
+            self._data = {int(idx): pattern for idx, pattern in raw["patterns"].items()}
+        return self._data
 
-    # =========================================================================
-    # Category 5: Advanced Geometric (30-39)
-    # =========================================================================
-    30: {
-        'name': 'triangle_up',
-        'small': [
-            "  #  ",
-            "  #  ",
-            " ### ",
-            " ### ",
-            "#####",
-        ],
-        'medium6': [
-            "..##..",
-            "..##..",
-            ".####.",
-            ".####.",
-            "######",
-            "######",
-        ],
-        'medium7': [
-            "...#...",
-            "..###..",
-            "..###..",
-            ".#####.",
-            ".#####.",
-            "#######",
-            "#######",
-        ],
-        'medium': [
-            "   ##   ",
-            "   ##   ",
-            "  ####  ",
-            "  ####  ",
-            " ###### ",
-            " ###### ",
-            "########",
-            "########",
-        ],
-        'large': [
-            "   ##   ",
-            "   ##   ",
-            "  ####  ",
-            "  ####  ",
-            " ###### ",
-            " ###### ",
-            "########",
-            "########",
-        ],
-    },
-    31: {
-        'name': 'triangle_down',
-        'small': [
-            "#####",
-            "#####",
-            " ### ",
-            " ### ",
-            "  #  ",
-        ],
-        'medium6': [
-            "######",
-            "######",
-            ".####.",
-            ".####.",
-            "..##..",
-            "..##..",
-        ],
-        'medium7': [
-            "#######",
-            "#######",
-            ".#####.",
-            ".#####.",
-            "..###..",
-            "..###..",
-            "...#...",
-        ],
-        'medium': [
-            "########",
-            "########",
-            " ###### ",
-            " ###### ",
-            "  ####  ",
-            "  ####  ",
-            "   ##   ",
-            "   ##   ",
-        ],
-        'large': [
-            "########",
-            "########",
-            " ###### ",
-            " ###### ",
-            "  ####  ",
-            "  ####  ",
-            "   ##   ",
-            "   ##   ",
-        ],
-    },
-    32: {
-        'name': 'hourglass',
-        'small': [
-            "#####",
-            " ### ",
-            "  #  ",
-            " ### ",
-            "#####",
-        ],
-        'medium': [
-            "#######",
-            " ##### ",
-            "  ###  ",
-            "   #   ",
-            "  ###  ",
-            " ##### ",
-            "#######",
-        ],
-        'large': [
-            "########",
-            " ###### ",
-            "  ####  ",
-            "   ##   ",
-            "   ##   ",
-            "  ####  ",
-            " ###### ",
-            "########",
-        ],
-    },
-    33: {
-        'name': 'bowtie',
-        'small': [
-            "# #",
-            "###",
-            "# #",
-        ],
-        'medium': [
-            "##   ##",
-            " ## ## ",
-            "  ###  ",
-            " ## ## ",
-            "##   ##",
-        ],
-        'large': [
-            "###  ###",
-            " ##  ## ",
-            "  ####  ",
-            "   ##   ",
-            "  ####  ",
-            " ##  ## ",
-            "###  ###",
-        ],
-    },
-    34: {
-        'name': 'stairs_up',
-        'small': [
-            "    #",
-            "  ###",
-            "#####",
-        ],
-        'medium': [
-            "      #",
-            "    ###",
-            "  #####",
-            "#######",
-        ],
-        'large': [
-            "      ##",
-            "    ####",
-            "  ######",
-            "########",
-        ],
-    },
-    35: {
-        'name': 'stairs_down',
-        'small': [
-            "#####",
-            "  ###",
-            "    #",
-        ],
-        'medium': [
-            "#######",
-            "  #####",
-            "    ###",
-            "      #",
-        ],
-        'large': [
-            "########",
-            "  ######",
-            "    ####",
-            "      ##",
-        ],
-    },
-    36: {
-        'name': 'pyramid',
-        'small': [
-            "  #  ",
-            "  #  ",
-            " ### ",
-            " ### ",
-            "#####",
-        ],
-        'medium6': [
-            "..##..",
-            "..##..",
-            ".####.",
-            ".####.",
-            "######",
-            "######",
-        ],
-        'medium7': [
-            "...#...",
-            "..###..",
-            "..###..",
-            ".#####.",
-            ".#####.",
-            "#######",
-            "#######",
-        ],
-        'medium': [
-            "   ##   ",
-            "   ##   ",
-            "  ####  ",
-            "  ####  ",
-            " ###### ",
-            " ###### ",
-            "########",
-            "########",
-        ],
-        'large': [
-            "   ##   ",
-            "   ##   ",
-            "  ####  ",
-            "  ####  ",
-            " ###### ",
-            " ###### ",
-            "########",
-            "########",
-        ],
-    },
-    37: {
-        'name': 'inverted_pyramid',
-        'small': [
-            "#####",
-            "#####",
-            " ### ",
-            " ### ",
-            "  #  ",
-        ],
-        'medium6': [
-            "######",
-            "######",
-            ".####.",
-            ".####.",
-            "..##..",
-            "..##..",
-        ],
-        'medium7': [
-            "#######",
-            "#######",
-            ".#####.",
-            ".#####.",
-            "..###..",
-            "..###..",
-            "...#...",
-        ],
-        'medium': [
-            "########",
-            "########",
-            " ###### ",
-            " ###### ",
-            "  ####  ",
-            "  ####  ",
-            "   ##   ",
-            "   ##   ",
-        ],
-        'large': [
-            "########",
-            "########",
-            " ###### ",
-            " ###### ",
-            "  ####  ",
-            "  ####  ",
-            "   ##   ",
-            "   ##   ",
-        ],
-    },
-    38: {
-        'name': 'zigzag_horizontal',
-        'small': [
-            "###  ",
-            "#### ",
-            " ####",
-            "  ###",
-            "  ###",
-        ],
-        'medium6': [
-            "###...",
-            "####..",
-            ".####.",
-            "..####",
-            "...###",
-            "...###",
-        ],
-        'medium7': [
-            "###....",
-            "####...",
-            ".####..",
-            "..####.",
-            "...####",
-            "....###",
-            "....###",
-        ],
-        'medium': [
-            "####    ",
-            "#####   ",
-            " #####  ",
-            "  ##### ",
-            "   #####",
-            "    ####",
-            "    ####",
-            "    ####",
-        ],
-        'large': [
-            "####    ",
-            "#####   ",
-            " #####  ",
-            "  ##### ",
-            "   #####",
-            "    ####",
-            "    ####",
-            "    ####",
-        ],
-    },
-    39: {
-        'name': 'wave',
-        'small': [
-            " ## ",
-            "#  #",
-            " ## ",
-        ],
-        'medium': [
-            "  ###  ",
-            " #   # ",
-            "#     #",
-            " #   # ",
-            "  ###  ",
-        ],
-        'large': [
-            "  ####  ",
-            " #    # ",
-            "#      #",
-            "#      #",
-            " #    # ",
-            "  ####  ",
-        ],
-    },
+    def __getitem__(self, pattern_index: int) -> Dict:
+        return self._load()[pattern_index]
 
-    # =========================================================================
-    # Category 6: Frame/Border Patterns (40-44)
-    # =========================================================================
-    40: {
-        'name': 'frame_border',
-        'small': [
-            "#####",
-            "#   #",
-            "#   #",
-            "#   #",
-            "#####",
-        ],
-        'medium': [
-            "#######",
-            "#     #",
-            "#     #",
-            "#     #",
-            "#     #",
-            "#     #",
-            "#######",
-        ],
-        'large': [
-            "########",
-            "#      #",
-            "#      #",
-            "#      #",
-            "#      #",
-            "#      #",
-            "#      #",
-            "########",
-        ],
-    },
-    41: {
-        'name': 'double_frame',
-        'small': [
-            "#####",
-            "# # #",
-            "## ##",
-            "# # #",
-            "#####",
-        ],
-        'medium': [
-            "#######",
-            "#     #",
-            "# ### #",
-            "# # # #",
-            "# ### #",
-            "#     #",
-            "#######",
-        ],
-        'large': [
-            "########",
-            "#      #",
-            "# #### #",
-            "# #  # #",
-            "# #  # #",
-            "# #### #",
-            "#      #",
-            "########",
-        ],
-    },
-    42: {
-        'name': 'corner_triangles',
-        'small': [
-            "##  ##",
-            "#    #",
-            "      ",
-            "#    #",
-            "##  ##",
-        ],
-        'medium': [
-            "###  ###",
-            "##    ##",
-            "#      #",
-            "        ",
-            "#      #",
-            "##    ##",
-            "###  ###",
-        ],
-        'large': [
-            "###  ###",
-            "##    ##",
-            "#      #",
-            "        ",
-            "        ",
-            "#      #",
-            "##    ##",
-            "###  ###",
-        ],
-    },
-    43: {
-        'name': 'center_hollow',
-        'small': [
-            "#####",
-            "#####",
-            "## ##",
-            "#####",
-            "#####",
-        ],
-        'medium': [
-            "#######",
-            "#######",
-            "##   ##",
-            "##   ##",
-            "##   ##",
-            "#######",
-            "#######",
-        ],
-        'large': [
-            "########",
-            "########",
-            "##    ##",
-            "##    ##",
-            "##    ##",
-            "##    ##",
-            "########",
-            "########",
-        ],
-    },
-    44: {
-        'name': 'window_panes',
-        'small': [
-            "## ##",
-            "## ##",
-            "     ",
-            "## ##",
-            "## ##",
-        ],
-        'medium': [
-            "### ###",
-            "### ###",
-            "### ###",
-            "       ",
-            "### ###",
-            "### ###",
-            "### ###",
-        ],
-        'large': [
-            "### ####",
-            "### ####",
-            "### ####",
-            "        ",
-            "### ####",
-            "### ####",
-            "### ####",
-            "### ####",
-        ],
-    },
+    def __contains__(self, pattern_index) -> bool:
+        return pattern_index in self._load()
 
-    # =========================================================================
-    # Category 7: Artistic Patterns (45-49)
-    # =========================================================================
-    45: {
-        'name': 'butterfly',
-        'small': [
-            "# #",
-            "###",
-            "# #",
-        ],
-        'medium6': [
-            "#..#.#",
-            "##.###",
-            ".####.",
-            ".####.",
-            "##.###",
-            "#..#.#",
-        ],
-        'medium7': [
-            "#..#..#",
-            "##.#.##",
-            "###.###",
-            "..###..",
-            "###.###",
-            "##.#.##",
-            "#..#..#",
-        ],
-        'medium': [
-            "#  #  #",
-            "## # ##",
-            "### ###",
-            "  ###  ",
-            "### ###",
-            "## # ##",
-            "#  #  #",
-        ],
-        'large': [
-            "##  ##  ##",
-            " ## ## ## ",
-            " ######## ",
-            "   ####   ",
-            " ######## ",
-            " ## ## ## ",
-            "##  ##  ##",
-        ],
-    },
-    46: {
-        'name': 'flower',
-        'small': [
-            " # ",
-            "###",
-            " # ",
-        ],
-        'medium': [
-            "  ###  ",
-            " ##### ",
-            "### ###",
-            "## # ##",
-            "### ###",
-            " ##### ",
-            "  ###  ",
-        ],
-        'large': [
-            "  ####  ",
-            " ###### ",
-            "###  ###",
-            "##    ##",
-            "###  ###",
-            " ###### ",
-            "  ####  ",
-        ],
-    },
-    47: {
-        'name': 'scattered_islands',
-        'small': [
-            "# # #",
-            "     ",
-            "# # #",
-            "     ",
-            "# # #",
-        ],
-        'medium': [
-            "## # ##",
-            "       ",
-            "# ### #",
-            "       ",
-            "# ### #",
-            "       ",
-            "## # ##",
-        ],
-        'large': [
-            "##   ##",
-            "       ",
-            "  ###  ",
-            "       ",
-            "  ###  ",
-            "       ",
-            "##   ##",
-        ],
-    },
-    48: {
-        'name': 'diagonal_stripes',
-        'small': [
-            "#  # ",
-            " #  #",
-            "#  # ",
-            " #  #",
-            "#  # ",
-        ],
-        'medium': [
-            "##  ##  ",
-            " ##  ## ",
-            "  ##  ##",
-            "##  ##  ",
-            " ##  ## ",
-            "  ##  ##",
-            "##  ##  ",
-        ],
-        'large': [
-            "##  ##  ",
-            " ##  ## ",
-            "  ##  ##",
-            "   ##  #",
-            "##  ##  ",
-            " ##  ## ",
-            "  ##  ##",
-            "   ##  #",
-        ],
-    },
-    49: {
-        'name': 'honeycomb',
-        'small': [
-            " # # ",
-            "# # #",
-            " # # ",
-            "# # #",
-            " # # ",
-        ],
-        'medium': [
-            " ## ## ",
-            "# ## # ",
-            " ## ## ",
-            "# ## # ",
-            " ## ## ",
-            "# ## # ",
-            " ## ## ",
-        ],
-        'large': [
-            " ## ##  ",
-            "# ## ## ",
-            " ## ## #",
-            "# ## ## ",
-            " ## ## #",
-            "# ## ## ",
-            " ## ##  ",
-            "# ## ## ",
-        ],
-    },
+    def __iter__(self):
+        return iter(self._load())
 
-    # =========================================================================
-    # Category 8: Bridge/Island Patterns (50-55)
-    # =========================================================================
-    50: {
-        'name': 'bridge_horizontal',
-        'small': [
-            "## ##",
-            "## ##",
-            "#####",
-            "## ##",
-            "## ##",
-        ],
-        'medium': [
-            "###   ###",
-            "###   ###",
-            "###   ###",
-            "#########",
-            "###   ###",
-            "###   ###",
-            "###   ###",
-        ],
-        'large': [
-            "###    ###",
-            "###    ###",
-            "###    ###",
-            "##########",
-            "##########",
-            "###    ###",
-            "###    ###",
-            "###    ###",
-        ],
-    },
-    51: {
-        'name': 'bridge_vertical',
-        'small': [
-            "#####",
-            "#####",
-            "  #  ",
-            "#####",
-            "#####",
-        ],
-        'medium': [
-            "#######",
-            "#######",
-            "#######",
-            "  ###  ",
-            "#######",
-            "#######",
-            "#######",
-        ],
-        'large': [
-            "########",
-            "########",
-            "########",
-            "  ####  ",
-            "  ####  ",
-            "########",
-            "########",
-            "########",
-        ],
-    },
-    52: {
-        'name': 'three_islands',
-        'small': [
-            "  #  ",
-            "     ",
-            "#   #",
-        ],
-        'medium': [
-            "  ###  ",
-            "  ###  ",
-            "       ",
-            "##   ##",
-            "##   ##",
-        ],
-        'large': [
-            "  ####  ",
-            "  ####  ",
-            "        ",
-            "###  ###",
-            "###  ###",
-        ],
-    },
-    53: {
-        'name': 'four_islands',
-        'small': [
-            "# #",
-            "   ",
-            "# #",
-        ],
-        'medium': [
-            "##   ##",
-            "##   ##",
-            "       ",
-            "       ",
-            "##   ##",
-            "##   ##",
-        ],
-        'large': [
-            "###  ###",
-            "###  ###",
-            "        ",
-            "        ",
-            "        ",
-            "###  ###",
-            "###  ###",
-        ],
-    },
-    54: {
-        'name': 'archipelago',
-        'small': [
-            "# # #",
-            "     ",
-            "# # #",
-        ],
-        'medium': [
-            "##    ##",
-            "        ",
-            "   ##   ",
-            "        ",
-            "##    ##",
-        ],
-        'large': [
-            "##      ##",
-            "          ",
-            "   ####   ",
-            "          ",
-            "   ####   ",
-            "          ",
-            "##      ##",
-        ],
-    },
-    55: {
-        'name': 'hub_and_spokes',
-        'small': [
-            "  #  ",
-            "  #  ",
-            "#####",
-            "  #  ",
-            "  #  ",
-        ],
-        'medium': [
-            "   #   ",
-            "   #   ",
-            "  ###  ",
-            "#######",
-            "  ###  ",
-            "   #   ",
-            "   #   ",
-        ],
-        'large': [
-            "   ##   ",
-            "   ##   ",
-            "  ####  ",
-            "########",
-            "########",
-            "  ####  ",
-            "   ##   ",
-            "   ##   ",
-        ],
-    },
+    def __len__(self) -> int:
+        return len(self._load())
 
-    # =========================================================================
-    # Category 9: GBoost Human-Designed Patterns (56-63)
-    # =========================================================================
-    56: {
-        'name': 'gboost_corner_blocks',
-        'small': [
-            "## ##",
-            "## ##",
-            "     ",
-            "## ##",
-            "## ##",
-        ],
-        'medium': [
-            "###  ###",
-            "###  ###",
-            "###  ###",
-            "        ",
-            "###  ###",
-            "###  ###",
-            "###  ###",
-        ],
-        'large': [
-            "###   ###",
-            "###   ###",
-            "###   ###",
-            "         ",
-            "         ",
-            "###   ###",
-            "###   ###",
-            "###   ###",
-        ],
-    },
-    57: {
-        'name': 'gboost_octagon_ring',
-        'small': [
-            " ### ",
-            "#   #",
-            "#   #",
-            "#   #",
-            " ### ",
-        ],
-        'medium': [
-            " ##### ",
-            "#     #",
-            "#     #",
-            "#     #",
-            "#     #",
-            "#     #",
-            " ##### ",
-        ],
-        'large': [
-            " ###### ",
-            "#      #",
-            "#      #",
-            "#      #",
-            "#      #",
-            "#      #",
-            "#      #",
-            " ###### ",
-        ],
-    },
-    58: {
-        'name': 'gboost_diagonal_staircase',
-        'small': [
-            "#    ",
-            "##   ",
-            "###  ",
-            " ### ",
-            "  ###",
-        ],
-        'medium': [
-            "##      ",
-            "###     ",
-            "####    ",
-            " ####   ",
-            "  ####  ",
-            "   #### ",
-            "    ####",
-        ],
-        'large': [
-            "##       ",
-            "###      ",
-            "####     ",
-            " ####    ",
-            "  ####   ",
-            "   ####  ",
-            "    #### ",
-            "     ####",
-        ],
-    },
-    59: {
-        'name': 'gboost_symmetric_wings',
-        'small': [
-            "#   #",
-            "## ##",
-            "#####",
-            "## ##",
-            "#   #",
-        ],
-        'medium': [
-            "##   ##",
-            "### ###",
-            "#######",
-            "#######",
-            "#######",
-            "### ###",
-            "##   ##",
-        ],
-        'large': [
-            "##    ##",
-            "###  ###",
-            "########",
-            "########",
-            "########",
-            "########",
-            "###  ###",
-            "##    ##",
-        ],
-    },
-    60: {
-        'name': 'gboost_scattered_clusters',
-        'small': [
-            "##   ",
-            "##   ",
-            "  ## ",
-            "   ##",
-            "   ##",
-        ],
-        'medium': [
-            "###     ",
-            "###     ",
-            "   ###  ",
-            "   ###  ",
-            "      ##",
-            "      ##",
-        ],
-        'large': [
-            "###      ",
-            "###      ",
-            "   ###   ",
-            "   ###   ",
-            "      ###",
-            "      ###",
-        ],
-    },
-    61: {
-        'name': 'gboost_cross_bridge',
-        'small': [
-            "  #  ",
-            "  #  ",
-            "#####",
-            "  #  ",
-            "  #  ",
-        ],
-        'medium': [
-            "   #   ",
-            "   #   ",
-            "   #   ",
-            "#######",
-            "   #   ",
-            "   #   ",
-            "   #   ",
-        ],
-        'large': [
-            "   ##   ",
-            "   ##   ",
-            "   ##   ",
-            "########",
-            "########",
-            "   ##   ",
-            "   ##   ",
-            "   ##   ",
-        ],
-    },
-    62: {
-        'name': 'gboost_triple_bar',
-        'small': [
-            "#####",
-            "     ",
-            "#####",
-            "     ",
-            "#####",
-        ],
-        'medium': [
-            "#######",
-            "#######",
-            "       ",
-            "#######",
-            "#######",
-            "       ",
-            "#######",
-        ],
-        'large': [
-            "########",
-            "########",
-            "        ",
-            "########",
-            "########",
-            "        ",
-            "########",
-            "########",
-        ],
-    },
-    63: {
-        'name': 'gboost_frame_center',
-        'small': [
-            "#####",
-            "#   #",
-            "# # #",
-            "#   #",
-            "#####",
-        ],
-        'medium': [
-            "#######",
-            "#     #",
-            "#     #",
-            "#  #  #",
-            "#     #",
-            "#     #",
-            "#######",
-        ],
-        'large': [
-            "########",
-            "#      #",
-            "#      #",
-            "#  ##  #",
-            "#  ##  #",
-            "#      #",
-            "#      #",
-            "########",
-        ],
-    },
 
-    # =========================================================================
-    # Category 10: Layered Patterns (64+) - Different pattern per layer
-    # =========================================================================
-    64: {
-        'name': 'nested_frames',
-        'description': 'Concentric square frames - larger at top layer, smaller at bottom',
-        'is_layered': True,  # Special flag for per-layer patterns
-        # Layer 0 (top): 7x7 frame
-        'layer_0': [
-            "#######",
-            "#     #",
-            "#     #",
-            "#     #",
-            "#     #",
-            "#     #",
-            "#######",
-        ],
-        # Layer 1: 6x6 frame (centered)
-        'layer_1': [
-            "######",
-            "#    #",
-            "#    #",
-            "#    #",
-            "#    #",
-            "######",
-        ],
-        # Layer 2: 5x5 frame (centered)
-        'layer_2': [
-            "#####",
-            "#   #",
-            "#   #",
-            "#   #",
-            "#####",
-        ],
-        # Layer 3 (bottom): 4x4 frame (centered)
-        'layer_3': [
-            "####",
-            "#  #",
-            "#  #",
-            "####",
-        ],
-        # Fallback for standard template lookup
-        'small': [
-            "#####",
-            "#   #",
-            "#   #",
-            "#   #",
-            "#####",
-        ],
-        'medium': [
-            "#######",
-            "#     #",
-            "#     #",
-            "#     #",
-            "#     #",
-            "#     #",
-            "#######",
-        ],
-        'large': [
-            "#######",
-            "#     #",
-            "#     #",
-            "#     #",
-            "#     #",
-            "#     #",
-            "#######",
-        ],
-    },
-}
+PATTERN_TEMPLATES: Mapping = _LazyPatternTemplates(PATTERN_TEMPLATES_PATH)
 
 
 # =============================================================================
@@ -0,0 +1,234 @@
+"""
+Compact Replay Format
+=====================
+Delta encoding for visual simulation move records.
+
+A full ``VisualBotMove`` repeats every gimmick state map (bomb, ice, chain,
+grass, curtain, link, teleport, overrides) after every move, which makes
+``/api/simulate/visual`` responses for big levels several megabytes. The
+compact format stores each move as the changes relative to the previous
+move of the same bot, with all strings (tile keys, tile types, decision
+reasons) interned once in a shared table.
+
+Layout (version 1)::
+
+    {
+      "format": "tilematch-replay",
+      "version": 1,
+      "strings": ["0_3_4", "t1", ...],        # interned strings
+      "bots": [
+        {
+          "profile": "novice", "profile_display": "...", "cleared": false,
+          "total_moves": 12, "final_score": 90.0, "goals_completed": {...},
+          "moves": [{"t": 0, "y": 1, "r": 2, "d": [1, 1], ...}, ...]
+        }
+      ]
+    }
+
+Move keys (omitted when empty / unchanged):
+    t  picked tile key id ("layerIdx_x_y")   y  tile type id
+    r  decision reason id                     d  dock type ids after move
+    n  move number (only if not sequential)   c  tiles cleared
+    s  score gained                           l  linked tile key ids
+    m  matched tile key ids                   f  frog key ids (when changed)
+    k  teleport click count (when changed)
+    g, B, C, I, H, G, L, T, o  map deltas for goals, bomb, curtain, ice,
+       chain, grass, link, teleport and tile type overrides:
+       {"+": {key_id: value}, "-": [key_id, ...]}
+
+The initial board is not part of the replay; it is sent once alongside it
+as ``initial_state``.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+REPLAY_FORMAT = "tilematch-replay"
+REPLAY_VERSION = 1
+
+# (move field, compact key) for per-move state maps encoded as deltas
+_STATE_MAPS: Tuple[Tuple[str, str], ...] = (
+    ("goals_after", "g"),
+    ("bomb_states_after", "B"),
+    ("curtain_states_after", "C"),
+    ("ice_states_after", "I"),
+    ("chain_states_after", "H"),
+    ("grass_states_after", "G"),
+    ("link_states_after", "L"),
+    ("teleport_states_after", "T"),
+    ("tile_type_overrides", "o"),
+)
+
+_BOT_HEADER_FIELDS = ("profile", "profile_display", "cleared", "total_moves", "final_score", "goals_completed")
+
+
+class _StringTable:
+    """Assigns stable integer ids to strings in first-seen order."""
+
+    def __init__(self):
+        self.strings: List[str] = []
+        self._ids: Dict[str, int] = {}
+
+    def id(self, value: str) -> int:
+        idx = self._ids.get(value)
+        if idx is None:
+            idx = len(self.strings)
+            self._ids[value] = idx
+            self.strings.append(value)
+        return idx
+
+    def ids(self, values: List[str]) -> List[int]:
+        return [self.id(v) for v in values]
+
+
+def _encode_map_delta(
+    table: _StringTable, previous: Dict[str, Any], current: Dict[str, Any]
+) -> Optional[Dict[str, Any]]:
+    changed = {
+        str(table.id(key)): value
+        for key, value in current.items()
+        if key not in previous or previous[key] != value
+    }
+    removed = [table.id(key) for key in previous if key not in current]
+    if not changed and not removed:
+        return None
+    delta: Dict[str, Any] = {}
+    if changed:
+        delta["+"] = changed
+    if removed:
+        delta["-"] = removed
+    return delta
+
+
+def _apply_map_delta(
+    strings: List[str], previous: Dict[str, Any], delta: Optional[Dict[str, Any]]
+) -> Dict[str, Any]:
+    current = dict(previous)
+    if not delta:
+        return current
+    for key_id in delta.get("-", ()):
+        current.pop(strings[key_id], None)
+    for key_id, value in delta.get("+", {}).items():
+        current[strings[int(key_id)]] = value
+    return current
+
+
+def encode_replay(bot_results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Encode visual bot results into the compact replay format.
+
+    Args:
+        bot_results: ``VisualBotResult`` dicts (e.g. from ``model_dump()``)
+
+    Returns:
+        Versioned compact replay dict (JSON-serializable)
+    """
+    table = _StringTable()
+    bots = []
+
+    for result in bot_results:
+        previous_maps: Dict[str, Dict[str, Any]] = {field: {} for field, _ in _STATE_MAPS}
+        previous_frogs: List[str] = []
+        previous_clicks = 0
+        moves = []
+
+        for i, move in enumerate(result.get("moves", [])):
+            encoded: Dict[str, Any] = {
+                "t": table.id(f"{move['layer_idx']}_{move['position']}"),
+                "y": table.id(move["tile_type"]),
+                "r": table.id(move.get("decision_reason", "")),
+                "d": table.ids(move.get("dock_after", [])),
+            }
+            if move["move_number"] != i + 1:
+                encoded["n"] = move["move_number"]
+            if move.get("tiles_cleared", 0):
+                encoded["c"] = move["tiles_cleared"]
+            if move.get("score_gained", 0):
+                encoded["s"] = move["score_gained"]
+            if move.get("linked_positions"):
+                encoded["l"] = table.ids(move["linked_positions"])
+            if move.get("matched_positions"):
+                encoded["m"] = table.ids(move["matched_positions"])
+
+            frogs = move.get("frog_positions_after", [])
+            if frogs != previous_frogs:
+                encoded["f"] = table.ids(frogs)
+                previous_frogs = frogs
+
+            clicks = move.get("teleport_click_count_after", 0)
+            if clicks != previous_clicks:
+                encoded["k"] = clicks
+                previous_clicks = clicks
+
+            for field, key in _STATE_MAPS:
+                current = move.get(field, {})
+                delta = _encode_map_delta(table, previous_maps[field], current)
+                if delta is not None:
+                    encoded[key] = delta
+                previous_maps[field] = current
+
+            moves.append(encoded)
+
+        bot = {field: result[field] for field in _BOT_HEADER_FIELDS if field in result}
+        bot["moves"] = moves
+        bots.append(bot)
+
+    return {
+        "format": REPLAY_FORMAT,
+        "version": REPLAY_VERSION,
+        "strings": table.strings,
+        "bots": bots,
+    }
+
+
+def decode_replay(replay: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Decode a compact replay back into full ``VisualBotResult`` dicts.
+
+    Raises:
+        ValueError: If the replay format or version is not supported
+    """
+    if replay.get("format") != REPLAY_FORMAT:
+        raise ValueError(f"Not a replay: format={replay.get('format')!r}")
+    if replay.get("version") != REPLAY_VERSION:
+        raise ValueError(f"Unsupported replay version: {replay.get('version')!r}")
+
+    strings: List[str] = replay["strings"]
+    results = []
+
+    for bot in replay["bots"]:
+        maps: Dict[str, Dict[str, Any]] = {field: {} for field, _ in _STATE_MAPS}
+        frogs: List[str] = []
+        clicks = 0
+        moves = []
+
+        for i, encoded in enumerate(bot["moves"]):
+            layer_idx, position = strings[encoded["t"]].split("_", 1)
+            if "f" in encoded:
+                frogs = [strings[idx] for idx in encoded["f"]]
+            clicks = encoded.get("k", clicks)
+            for field, key in _STATE_MAPS:
+                maps[field] = _apply_map_delta(strings, maps[field], encoded.get(key))
+
+            move = {
+                "move_number": encoded.get("n", i + 1),
+                "layer_idx": int(layer_idx),
+                "position": position,
+                "tile_type": strings[encoded["y"]],
+                "linked_positions": [strings[idx] for idx in encoded.get("l", ())],
+                "matched_positions": [strings[idx] for idx in encoded.get("m", ())],
+                "tiles_cleared": encoded.get("c", 0),
+                "score_gained": encoded.get("s", 0),
+                "decision_reason": strings[encoded["r"]],
+                "dock_after": [strings[idx] for idx in encoded["d"]],
+                "frog_positions_after": list(frogs),
+                "teleport_click_count_after": clicks,
+            }
+            for field, _ in _STATE_MAPS:
+                move[field] = dict(maps[field])
+            moves.append(move)
+
+        result = {field: bot[field] for field in _BOT_HEADER_FIELDS if field in bot}
+        result["moves"] = moves
+        results.append(result)
+
+    return results
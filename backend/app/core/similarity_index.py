@@ -0,0 +1,291 @@
+"""
+Level Similarity Index
+======================
+MinHash/LSH index for near-duplicate level detection.
+
+Each level is reduced to a token set: one token per occupied
+(layer, position) cell plus coarse tile-count features (total tiles, tiles
+per layer, layer count). A MinHash signature of that set is split into
+bands; levels that share a band bucket become candidates, and candidates
+are then scored with the exact layout similarity (``layout_similarity``,
+the metric behind ``LevelGenerator.calculate_level_similarity``).
+
+Insert and query only touch the level's own buckets, so deduplicating a
+set of N levels costs about N signatures plus a few exact comparisons per
+level instead of N²/2 exact comparisons. LSH is approximate: pairs whose
+token sets overlap little can be missed, but every reported match has
+passed the exact similarity check.
+"""
+
+import random
+import zlib
+from typing import Any, Dict, FrozenSet, Hashable, Iterator, List, Optional, Set, Tuple
+
+# Levels more similar than this are considered duplicates
+# (same value as LevelGenerator.SIMILARITY_THRESHOLD)
+DEFAULT_SIMILARITY_THRESHOLD = 0.75
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_TOTAL_COUNT_BUCKET = 6
+_LAYER_COUNT_BUCKET = 3
+
+LayerPositions = Dict[int, FrozenSet[str]]
+
+
+def extract_layer_positions(level: Dict[str, Any]) -> LayerPositions:
+    """Occupied positions per layer.
+
+    Accepts both the generator/simulator format (``layer_N`` with ``tiles``)
+    and the game server format (``layerN`` with ``position``, optionally
+    wrapped in ``map``). Empty layers are kept: they count towards the
+    layer structure.
+    """
+    level_map = level.get("map", level)
+    layers: Dict[int, FrozenSet[str]] = {}
+    for key, value in level_map.items():
+        if not key.startswith("layer") or not isinstance(value, dict):
+            continue
+        suffix = key[len("layer"):].lstrip("_")
+        if not suffix.isdigit():
+            continue
+        positions = value.get("tiles", value.get("position", {}))
+        layers[int(suffix)] = frozenset(positions.keys())
+    return layers
+
+
+def layout_similarity(layers1: LayerPositions, layers2: LayerPositions) -> float:
+    """Similarity of two layouts from 0.0 (completely different) to 1.0 (identical).
+
+    Compares:
+    - Tile positions per layer (Jaccard, higher layers weighted more)
+    - Layer structure
+    - Total tile count
+    """
+    if not layers1 or not layers2:
+        return 0.0
+
+    all_layers = set(layers1) | set(layers2)
+    layer_count_sim = 1.0 - abs(len(layers1) - len(layers2)) / max(len(all_layers), 1)
+
+    weighted_sum = 0
+    weight_sum = 0
+    empty: FrozenSet[str] = frozenset()
+    for layer_idx in all_layers:
+        pos1 = layers1.get(layer_idx, empty)
+        pos2 = layers2.get(layer_idx, empty)
+
+        if not pos1 and not pos2:
+            continue
+
+        intersection = len(pos1 & pos2)
+        union = len(pos1) + len(pos2) - intersection
+        jaccard = intersection / union if union > 0 else 0.0
+
+        # Higher layers (more visible) weighted more
+        weight = 1.0 + layer_idx * 0.2
+        weighted_sum += jaccard * weight
+        weight_sum += weight
+
+    if not weight_sum:
+        return layer_count_sim * 0.5
+
+    weighted_pos_sim = weighted_sum / weight_sum
+
+    total1 = sum(map(len, layers1.values()))
+    total2 = sum(map(len, layers2.values()))
+    count_sim = 1.0 - abs(total1 - total2) / max(total1, total2, 1)
+
+    similarity = (
+        weighted_pos_sim * 0.6 +  # Position similarity most important
+        layer_count_sim * 0.2 +   # Layer structure
+        count_sim * 0.2           # Total count
+    )
+
+    return min(1.0, max(0.0, similarity))
+
+
+def level_tokens(layers: LayerPositions) -> Set[str]:
+    """Token set hashed into the MinHash signature."""
+    tokens = {f"{layer_idx}:{pos}" for layer_idx, positions in layers.items() for pos in positions}
+    total = 0
+    for layer_idx, positions in layers.items():
+        tokens.add(f"#L{layer_idx}:{len(positions) // _LAYER_COUNT_BUCKET}")
+        total += len(positions)
+    tokens.add(f"#total:{total // _TOTAL_COUNT_BUCKET}")
+    tokens.add(f"#layers:{len(layers)}")
+    return tokens
+
+
+class LevelSimilarityIndex:
+    """Near-duplicate index over level layouts.
+
+    Example:
+        index = LevelSimilarityIndex()
+        for level_id, level in levels:
+            match = index.add_if_unique(level_id, level)
+            if match is not None:
+                print(level_id, "duplicates", match)
+    """
+
+    def __init__(self, num_perm: int = 96, bands: int = 32, seed: int = 1):
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be a multiple of bands ({bands})")
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self.bands = bands
+        self._rows = num_perm // bands
+        self._perms = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+        # token -> its hash under every permutation (tokens repeat across levels)
+        self._token_hashes: Dict[str, Tuple[int, ...]] = {}
+        self._buckets: List[Dict[Tuple[int, ...], Set[Hashable]]] = [{} for _ in range(bands)]
+        self._layers: Dict[Hashable, LayerPositions] = {}
+        self._band_keys: Dict[Hashable, List[Tuple[int, ...]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._layers)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._layers
+
+    def _hash_token(self, token: str) -> Tuple[int, ...]:
+        hashes = self._token_hashes.get(token)
+        if hashes is None:
+            x = zlib.crc32(token.encode())
+            hashes = tuple((a * x + b) % _MERSENNE_PRIME for a, b in self._perms)
+            self._token_hashes[token] = hashes
+        return hashes
+
+    def _band_keys_for(self, layers: LayerPositions) -> List[Tuple[int, ...]]:
+        token_hashes = [self._hash_token(token) for token in level_tokens(layers)]
+        signature = [min(column) for column in zip(*token_hashes)]
+        rows = self._rows
+        return [tuple(signature[i * rows:(i + 1) * rows]) for i in range(self.bands)]
+
+    def add(self, key: Hashable, level: Dict[str, Any]) -> None:
+        """Insert (or replace) a level under ``key``."""
+        layers = extract_layer_positions(level)
+        self._insert(key, layers, self._band_keys_for(layers))
+
+    def _insert(self, key: Hashable, layers: LayerPositions, band_keys: List[Tuple[int, ...]]) -> None:
+        if key in self._layers:
+            self.remove(key)
+        for buckets, band_key in zip(self._buckets, band_keys):
+            buckets.setdefault(band_key, set()).add(key)
+        self._layers[key] = layers
+        self._band_keys[key] = band_keys
+
+    def remove(self, key: Hashable) -> None:
+        """Remove a level; unknown keys are ignored."""
+        band_keys = self._band_keys.pop(key, None)
+        if band_keys is None:
+            return
+        del self._layers[key]
+        for buckets, band_key in zip(self._buckets, band_keys):
+            members = buckets[band_key]
+            members.discard(key)
+            if not members:
+                del buckets[band_key]
+
+    def _candidates(self, band_keys: List[Tuple[int, ...]]) -> Set[Hashable]:
+        candidates: Set[Hashable] = set()
+        for buckets, band_key in zip(self._buckets, band_keys):
+            members = buckets.get(band_key)
+            if members:
+                candidates |= members
+        return candidates
+
+    def _matches(
+        self,
+        layers: LayerPositions,
+        band_keys: List[Tuple[int, ...]],
+        threshold: float,
+        exclude: Optional[Hashable],
+    ) -> Iterator[Tuple[Hashable, float]]:
+        for key in self._candidates(band_keys):
+            if key == exclude:
+                continue
+            similarity = layout_similarity(layers, self._layers[key])
+            if similarity > threshold:
+                yield key, similarity
+
+    def _query_layers(
+        self,
+        layers: LayerPositions,
+        band_keys: List[Tuple[int, ...]],
+        threshold: float,
+        exclude: Optional[Hashable],
+    ) -> List[Tuple[Hashable, float]]:
+        matches = list(self._matches(layers, band_keys, threshold, exclude))
+        matches.sort(key=lambda m: m[1], reverse=True)
+        return matches
+
+    def query(
+        self,
+        level: Dict[str, Any],
+        threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        top_k: Optional[int] = None,
+        exclude: Optional[Hashable] = None,
+    ) -> List[Tuple[Hashable, float]]:
+        """Indexed levels more similar than ``threshold``, most similar first.
+
+        Args:
+            level: Level JSON to look up (not inserted)
+            threshold: Minimum exact similarity (exclusive)
+            top_k: Return at most this many matches
+            exclude: Key to skip (e.g. the level's own key)
+        """
+        layers = extract_layer_positions(level)
+        matches = self._query_layers(layers, self._band_keys_for(layers), threshold, exclude)
+        return matches[:top_k] if top_k is not None else matches
+
+    def query_key(
+        self, key: Hashable, threshold: float = DEFAULT_SIMILARITY_THRESHOLD
+    ) -> List[Tuple[Hashable, float]]:
+        """Other indexed levels more similar than ``threshold`` to an indexed level."""
+        return self._query_layers(self._layers[key], self._band_keys[key], threshold, key)
+
+    def is_duplicate(self, level: Dict[str, Any], threshold: float = DEFAULT_SIMILARITY_THRESHOLD) -> bool:
+        """Whether any indexed level is more similar than ``threshold``."""
+        layers = extract_layer_positions(level)
+        matches = self._matches(layers, self._band_keys_for(layers), threshold, None)
+        return next(matches, None) is not None
+
+    def add_if_unique(
+        self, key: Hashable, level: Dict[str, Any], threshold: float = DEFAULT_SIMILARITY_THRESHOLD
+    ) -> Optional[Tuple[Hashable, float]]:
+        """Insert a level unless it duplicates an indexed one.
+
+        Returns:
+            None if the level was inserted, else (key, similarity) of the
+            closest indexed level
+        """
+        layers = extract_layer_positions(level)
+        band_keys = self._band_keys_for(layers)
+        matches = self._query_layers(layers, band_keys, threshold, key)
+        if matches:
+            return matches[0]
+        self._insert(key, layers, band_keys)
+        return None
+
+    def find_duplicates(
+        self, threshold: float = DEFAULT_SIMILARITY_THRESHOLD
+    ) -> List[Tuple[Hashable, Hashable, float]]:
+        """All indexed pairs more similar than ``threshold``, most similar first.
+
+        Keys in each pair follow insertion order.
+        """
+        order = {key: i for i, key in enumerate(self._layers)}
+        pairs = []
+        for key, layers in self._layers.items():
+            # Each pair is scored once, from its earlier key
+            for other in self._candidates(self._band_keys[key]):
+                if order[other] <= order[key]:
+                    continue
+                similarity = layout_similarity(layers, self._layers[other])
+                if similarity > threshold:
+                    pairs.append((key, other, similarity))
+        pairs.sort(key=lambda p: p[2], reverse=True)
+        return pairs
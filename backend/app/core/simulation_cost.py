@@ -0,0 +1,366 @@
+"""
+Simulation Cost Model
+=====================
+Predicts how long one bot simulation iteration of a level takes, and
+divides a wall-clock budget across bots so that a request meets a latency
+target instead of running a fixed iteration count.
+
+Per-iteration cost varies by orders of magnitude with tile count, layer
+count, bot profile (lookahead) and gimmicks, so the model is one log-linear
+regression per bot profile over static cost drivers. Every simulation run
+through ``generate_validated_level`` or batch verification appends a timing
+sample (features, iterations, elapsed) to a JSONL log;
+``scripts/calibrate_simulation_cost.py`` fits the model on that log (or on
+fresh timings of the stored level sets) and stores it as JSON. A model
+calibrated on the stored level sets ships in ``data/`` and is used until a
+local calibration exists.
+
+``allocate_iterations`` then splits the budget: with clear rate p and
+per-iteration cost c, the 95% CI half-width of a bot's clear rate is
+z * sqrt(p(1-p)/n), and minimizing the weighted sum of half-widths under
+sum(c * n) <= budget gives n proportional to (w * sqrt(p(1-p)) / c)^(2/3).
+"""
+
+import math
+import os
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Hashable, List, Optional
+
+from .analyzer import LevelAnalyzer
+from .common_random_numbers import Z_95
+from .learned_model import (
+    CACHE_DIR,
+    MAX_LOG_SAMPLES,
+    ModelFileCache,
+    RidgeModel,
+    SampleLog,
+    ridge_gram,
+    ridge_weights,
+    standardize,
+)
+
+DEFAULT_MODEL_PATH = CACHE_DIR / "simulation_cost_model.json"
+DEFAULT_SAMPLES_PATH = CACHE_DIR / "simulation_cost_samples.jsonl"
+BUNDLED_MODEL_PATH = Path(__file__).parent / "data" / "simulation_cost_model.json"
+
+# Order matters: it is the column order of the stored weights
+COST_FEATURE_NAMES = (
+    "total_tiles",
+    "active_layers",
+    "layer_blocking",
+    "max_moves",
+    "play_volume",
+    "goal_amount",
+    "chain_count",
+    "frog_count",
+    "link_count",
+    "ice_count",
+    "grass_count",
+    "bomb_count",
+    "curtain_count",
+    "teleport_count",
+    "unknown_count",
+)
+
+MIN_CALIBRATION_SAMPLES = 20
+MIN_COST_MS = 0.2
+# Cost assumed for a profile the model has never been calibrated for
+FALLBACK_COST_MS = 50.0
+
+_analyzer = LevelAnalyzer()
+
+
+def cost_key(bot: str, fast_mode: bool = False) -> str:
+    """Model key of a bot profile (fast verification profiles cost less per turn)."""
+    return f"{bot}_fast" if fast_mode else bot
+
+
+def extract_cost_features(level_json: Dict[str, Any], max_moves: Optional[int] = None) -> Dict[str, float]:
+    """Static per-iteration cost drivers of a level."""
+    metrics = _analyzer._extract_metrics(level_json)
+    if max_moves is None:
+        max_moves = metrics.max_moves
+    return {
+        "total_tiles": float(metrics.total_tiles),
+        "active_layers": float(metrics.active_layers),
+        "layer_blocking": float(metrics.layer_blocking),
+        "max_moves": float(max_moves),
+        # Board size times the number of turns a game can last
+        "play_volume": metrics.total_tiles * min(max_moves, metrics.total_tiles) / 100.0,
+        "goal_amount": float(metrics.goal_amount),
+        "chain_count": float(metrics.chain_count),
+        "frog_count": float(metrics.frog_count),
+        "link_count": float(metrics.link_count),
+        "ice_count": float(metrics.ice_count),
+        "grass_count": float(metrics.grass_count),
+        "bomb_count": float(metrics.bomb_count),
+        "curtain_count": float(metrics.curtain_count),
+        "teleport_count": float(metrics.teleport_count),
+        "unknown_count": float(metrics.unknown_count),
+    }
+
+
+class SimulationCostModel(RidgeModel):
+    """Per-profile log-linear regression of milliseconds per simulation iteration."""
+
+    def __init__(
+        self,
+        weights: Dict[str, List[float]],
+        means: List[float],
+        scales: List[float],
+        feature_names=COST_FEATURE_NAMES,
+        metrics: Optional[Dict[str, Dict[str, float]]] = None,
+        trained_at: Optional[str] = None,
+        sample_count: int = 0,
+    ):
+        super().__init__(weights, means, scales, feature_names, metrics, trained_at, sample_count)
+
+    @classmethod
+    def fit(
+        cls,
+        samples: List[Dict[str, Any]],
+        ridge: float = 1.0,
+        holdout_every: int = 5,
+    ) -> "SimulationCostModel":
+        """Fit from timing samples ({"features", "bot", "iterations", "elapsed_ms"}).
+
+        Every ``holdout_every``-th sample of each profile is held out to
+        measure prediction error; the final weights are then refit on all
+        samples.
+        """
+        samples = [s for s in samples if s.get("iterations", 0) > 0 and s.get("elapsed_ms", 0) > 0]
+        if len(samples) < MIN_CALIBRATION_SAMPLES:
+            raise ValueError(
+                f"Need at least {MIN_CALIBRATION_SAMPLES} samples to calibrate, got {len(samples)}"
+            )
+
+        if holdout_every > 1:
+            # Count per profile: a level logs one sample per profile in a row
+            seen: Dict[str, int] = {}
+            train, holdout = [], []
+            for sample in samples:
+                index = seen[sample["bot"]] = seen.get(sample["bot"], -1) + 1
+                (train if index % holdout_every else holdout).append(sample)
+            metrics = cls._fit_weights(train, ridge).evaluate(holdout)
+        else:
+            metrics = {}
+
+        model = cls._fit_weights(samples, ridge)
+        model.metrics = metrics
+        model.trained_at = datetime.now().isoformat()
+        return model
+
+    @classmethod
+    def _fit_weights(cls, samples: List[Dict[str, Any]], ridge: float) -> "SimulationCostModel":
+        rows = [[float(s["features"].get(name, 0.0)) for name in COST_FEATURE_NAMES] for s in samples]
+        means, scales, design = standardize(rows)
+
+        by_bot: Dict[str, List[tuple]] = {}
+        for x, sample in zip(design, samples):
+            y = math.log(sample["elapsed_ms"] / sample["iterations"])
+            by_bot.setdefault(sample["bot"], []).append((x, y))
+
+        size = len(COST_FEATURE_NAMES) + 1
+        weights = {}
+        for bot, bot_samples in by_bot.items():
+            if len(bot_samples) < MIN_CALIBRATION_SAMPLES:
+                continue
+            gram = ridge_gram((x for x, _ in bot_samples), size, ridge)
+            weights[bot] = ridge_weights(gram, bot_samples)
+
+        return cls(weights, means, scales, sample_count=len(samples))
+
+    def predict_features(self, features: Dict[str, float], bots: Optional[List[str]] = None) -> Dict[str, float]:
+        """Predicted milliseconds per iteration per bot profile key."""
+        bots = list(bots if bots is not None else self.weights)
+        values = self.linear_predictions(features, bots)
+        # Clamp the exponent: extrapolating far outside the calibration set
+        # must not produce absurd costs
+        return {
+            bot: max(MIN_COST_MS, math.exp(min(values[bot], 12.0))) if bot in values else FALLBACK_COST_MS
+            for bot in bots
+        }
+
+    def predict(
+        self,
+        level_json: Dict[str, Any],
+        bots: Optional[List[str]] = None,
+        max_moves: Optional[int] = None,
+    ) -> Dict[str, float]:
+        """Predicted milliseconds per iteration per bot profile key for a level."""
+        return self.predict_features(extract_cost_features(level_json, max_moves), bots)
+
+    def evaluate(self, samples: List[Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
+        """Relative error of predicted per-iteration cost per bot profile."""
+        errors: Dict[str, List[float]] = {bot: [] for bot in self.weights}
+        for sample in samples:
+            bot = sample["bot"]
+            if bot not in errors:
+                continue
+            actual = sample["elapsed_ms"] / sample["iterations"]
+            predicted = self.predict_features(sample["features"], [bot])[bot]
+            errors[bot].append(abs(predicted - actual) / actual)
+        return {
+            bot: {
+                "mape": round(sum(e) / len(e), 4) if e else 0.0,
+                "p90_ape": round(sorted(e)[int(0.9 * (len(e) - 1))], 4) if e else 0.0,
+                "count": len(e),
+            }
+            for bot, e in errors.items()
+        }
+
+class CostSampleLog(SampleLog):
+    """JSONL log of simulation timing samples."""
+
+    required_keys = ("features", "bot", "iterations", "elapsed_ms")
+
+    def __init__(self, path: Path = DEFAULT_SAMPLES_PATH, max_samples: int = MAX_LOG_SAMPLES):
+        super().__init__(path, max_samples)
+
+    def append(
+        self,
+        level_json: Dict[str, Any],
+        timings: Dict[str, tuple],
+        max_moves: Optional[int] = None,
+    ) -> None:
+        """Log one level's timings: {bot profile key: (iterations, elapsed_ms)}."""
+        features = extract_cost_features(level_json, max_moves)
+        self.append_samples(
+            {
+                "features": features,
+                "bot": bot,
+                "iterations": iterations,
+                "elapsed_ms": round(elapsed_ms, 3),
+            }
+            for bot, (iterations, elapsed_ms) in timings.items()
+            if iterations > 0
+        )
+
+
+@dataclass
+class IterationPlan:
+    """Iterations per task chosen for a wall-clock budget."""
+    iterations: Dict[Hashable, int]
+    cost_ms: Dict[Hashable, float]
+    budget_ms: float
+    predicted_wall_ms: float
+    ci_half_width: Dict[Hashable, float] = field(default_factory=dict)
+
+    @property
+    def within_budget(self) -> bool:
+        return self.predicted_wall_ms <= self.budget_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "iterations": {str(k): v for k, v in self.iterations.items()},
+            "budget_ms": round(self.budget_ms, 1),
+            "predicted_wall_ms": round(self.predicted_wall_ms, 1),
+            "ci_half_width": {str(k): round(v, 4) for k, v in self.ci_half_width.items()},
+        }
+
+
+def effective_parallelism(workers: int) -> int:
+    """Tasks that really run at once on a pool of ``workers`` processes."""
+    return max(1, min(workers, os.cpu_count() or 1))
+
+
+def allocate_iterations(
+    cost_ms: Dict[Hashable, float],
+    budget_ms: float,
+    clear_rates: Optional[Dict[Hashable, float]] = None,
+    weights: Optional[Dict[Hashable, float]] = None,
+    parallelism: int = 1,
+    min_iterations: int = 5,
+    max_iterations: int = 500,
+) -> IterationPlan:
+    """
+    Split a wall-clock budget across simulation tasks (one per bot, or per
+    level and bot) to minimize the weighted sum of clear-rate CI widths.
+
+    Args:
+        cost_ms: Predicted milliseconds per iteration of each task.
+        budget_ms: Wall-clock budget.
+        clear_rates: Expected clear rate per task (default 0.5, the widest CI).
+        weights: Importance per task (default 1.0).
+        parallelism: Tasks running at once; each task still runs in one
+            process, so no single task may take longer than the budget.
+        min_iterations: Floor per task, kept even if it overruns the budget.
+        max_iterations: Cap per task.
+
+    Returns:
+        IterationPlan with iterations per task and the predicted wall time.
+    """
+    clear_rates = clear_rates or {}
+    weights = weights or {}
+    keys = list(cost_ms)
+    if not keys:
+        return IterationPlan(iterations={}, cost_ms={}, budget_ms=budget_ms, predicted_wall_ms=0.0)
+    parallelism = max(1, min(parallelism, len(keys)))
+
+    def wall_ms(iterations: Dict[Hashable, float]) -> float:
+        task_ms = [iterations[k] * cost_ms[k] for k in keys]
+        return max(max(task_ms), sum(task_ms) / parallelism)
+
+    # If the floors alone overrun the budget, the other tasks may use the
+    # time that overrun makes unavoidable
+    wall_budget = max(budget_ms, wall_ms({k: min_iterations for k in keys}))
+    capacity = wall_budget * parallelism
+
+    def sigma(key) -> float:
+        # Clear rates near 0/1 still need a few samples to be confirmed
+        p = min(0.95, max(0.05, clear_rates.get(key, 0.5)))
+        return math.sqrt(p * (1.0 - p))
+
+    def spread(key) -> float:
+        return weights.get(key, 1.0) * sigma(key)
+
+    def upper(key) -> float:
+        return max(float(min_iterations), min(float(max_iterations), wall_budget / cost_ms[key]))
+
+    # Water-filling: split the capacity by the optimal ratio, pin tasks that
+    # hit a bound (capped ones first) and re-split the rest over the others
+    allocation: Dict[Hashable, float] = {k: float(min_iterations) for k in keys if spread(k) <= 0}
+    free = [k for k in keys if k not in allocation]
+    remaining = capacity - sum(allocation[k] * cost_ms[k] for k in allocation)
+    while free:
+        shares = {k: (spread(k) / cost_ms[k]) ** (2.0 / 3.0) for k in free}
+        unit = max(0.0, remaining) / sum(shares[k] * cost_ms[k] for k in free)
+        capped = {k: upper(k) for k in free if shares[k] * unit > upper(k)}
+        pinned = capped or {k: float(min_iterations) for k in free if shares[k] * unit < min_iterations}
+        if not pinned:
+            allocation.update((k, shares[k] * unit) for k in free)
+            break
+        allocation.update(pinned)
+        free = [k for k in free if k not in pinned]
+        remaining -= sum(n * cost_ms[k] for k, n in pinned.items())
+
+    iterations = {k: max(min_iterations, int(allocation[k])) for k in keys}
+    return IterationPlan(
+        iterations=iterations,
+        cost_ms=dict(cost_ms),
+        budget_ms=budget_ms,
+        predicted_wall_ms=wall_ms(iterations),
+        ci_half_width={k: Z_95 * sigma(k) / math.sqrt(iterations[k]) for k in keys},
+    )
+
+
+_cost_model_file: ModelFileCache[SimulationCostModel] = ModelFileCache(SimulationCostModel.load)
+_cost_log: Optional[CostSampleLog] = None
+
+
+def get_simulation_cost_model() -> SimulationCostModel:
+    """Locally calibrated cost model if present (reloaded when it changes), else the bundled one."""
+    model = _cost_model_file.get(DEFAULT_MODEL_PATH, BUNDLED_MODEL_PATH)
+    if model is None:
+        raise FileNotFoundError(f"No simulation cost model at {DEFAULT_MODEL_PATH} or {BUNDLED_MODEL_PATH}")
+    return model
+
+
+def get_cost_sample_log() -> CostSampleLog:
+    """Get or create the timing sample log singleton."""
+    global _cost_log
+    if _cost_log is None:
+        _cost_log = CostSampleLog()
+    return _cost_log
@@ -1,4 +1,5 @@
 """Level simulation engine with dock-based matching system (Townpop rules)."""
+import math
 import random
 import statistics
 from typing import Dict, List, Any, Optional, Tuple, Set
@@ -36,6 +37,10 @@ class GameState:
     failed: bool = False  # Dock overflow
     max_moves: int = 30
     used_tile_types: List[str] = field(default_factory=list)  # t0 할당 시 사용할 타일 풀
+    rng: Any = random  # Random source for t0 assignment and random strategy
+    # Link relations of the initial board (shared between copies, never mutated)
+    link_targets: Dict[Tuple[int, str], Tuple[int, str]] = field(default_factory=dict)  # source -> target
+    link_sources: Dict[Tuple[int, str], List[Tuple[int, str]]] = field(default_factory=dict)  # target -> sources
 
 
 @dataclass
@@ -64,42 +69,146 @@ class LevelSimulator:
         "link_e": (1, 0),    # East = col+1
     }
 
+    # Iterations per batch between early termination checks / per pool task
+    BATCH_SIZE = 50
+    # Below this many iterations the process pool round-trip costs more than it saves
+    PARALLEL_MIN_ITERATIONS = 200
+    EARLY_TERM_MIN_ITERATIONS = 50
+    CONFIDENCE_Z = 1.96  # 95% Wilson score interval
+
     def simulate(
         self,
         level_json: Dict[str, Any],
         iterations: int = 500,
         strategy: str = "greedy",
         max_moves: int = 30,
+        seed: Optional[int] = None,
+        parallel: bool = False,
+        early_termination: bool = False,
+        ci_half_width: float = 0.05,
     ) -> SimulationResult:
         """
         Run Monte Carlo simulation on a level.
 
+        The level is parsed once; every iteration plays on a fast copy of that
+        base state with its own RNG seeded from ``seed + i``, so results for a
+        given seed do not depend on batching or on how many workers ran them.
+
         Args:
             level_json: Level data to simulate.
-            iterations: Number of simulation runs.
+            iterations: Number of simulation runs (upper bound with early termination).
             strategy: Strategy to use (random/greedy/optimal).
             max_moves: Maximum moves per simulation.
+            seed: Base random seed (random if None).
+            parallel: Split iterations across the shared worker process pool.
+            early_termination: Stop once the clear rate's 95% confidence
+                interval half-width is at most ``ci_half_width``.
+            ci_half_width: Target half-width for early termination.
 
         Returns:
             SimulationResult with statistics.
         """
-        results = []
-
-        for _ in range(iterations):
-            state = self._create_initial_state(level_json, max_moves)
-            result = self._play_game(state, SimulationStrategy(strategy))
-            results.append(result)
-
-        cleared_count = sum(1 for r in results if r.cleared)
-        moves_list = [r.moves_used for r in results]
+        strategy_enum = SimulationStrategy(strategy)
+        if seed is None:
+            seed = random.randrange(2 ** 31)
+
+        if parallel and iterations >= self.PARALLEL_MIN_ITERATIONS:
+            outcomes = self._run_parallel(
+                level_json, iterations, strategy_enum, max_moves, seed,
+                early_termination, ci_half_width,
+            )
+        else:
+            base_state = self._create_initial_state(level_json, max_moves)
+            outcomes = []
+            for start in range(0, iterations, self.BATCH_SIZE):
+                count = min(self.BATCH_SIZE, iterations - start)
+                outcomes.extend(self._run_batch(base_state, strategy_enum, seed, start, count))
+                if early_termination and self._should_terminate_early(outcomes, ci_half_width):
+                    break
+
+        return self._summarize(outcomes, iterations, strategy)
+
+    def _run_batch(
+        self,
+        base_state: GameState,
+        strategy: SimulationStrategy,
+        seed: int,
+        start: int,
+        count: int,
+    ) -> List[Tuple[bool, int]]:
+        """Play iterations ``start .. start+count-1`` and return (cleared, moves_used) pairs."""
+        outcomes = []
+        for i in range(start, start + count):
+            state = self._fast_copy_state(base_state, random.Random(seed + i))
+            result = self._play_game(state, strategy)
+            outcomes.append((result.cleared, result.moves_used))
+        return outcomes
+
+    def _run_parallel(
+        self,
+        level_json: Dict[str, Any],
+        iterations: int,
+        strategy: SimulationStrategy,
+        max_moves: int,
+        seed: int,
+        early_termination: bool,
+        ci_half_width: float,
+    ) -> List[Tuple[bool, int]]:
+        """Run iteration batches on the shared process pool, consuming them in order."""
+        from .bot_simulator import _get_process_pool
+
+        pool = _get_process_pool()
+        if early_termination:
+            chunk = self.BATCH_SIZE
+        else:
+            workers = getattr(pool, "_max_workers", 1) or 1
+            chunk = max(self.BATCH_SIZE, math.ceil(iterations / workers))
+
+        futures = [
+            pool.submit(
+                _simulate_chunk,
+                (level_json, strategy.value, max_moves, seed, start, min(chunk, iterations - start)),
+            )
+            for start in range(0, iterations, chunk)
+        ]
+
+        outcomes: List[Tuple[bool, int]] = []
+        try:
+            for future in futures:
+                outcomes.extend(future.result())
+                if early_termination and self._should_terminate_early(outcomes, ci_half_width):
+                    break
+        finally:
+            for future in futures:
+                future.cancel()
+        return outcomes
+
+    def _should_terminate_early(self, outcomes: List[Tuple[bool, int]], ci_half_width: float) -> bool:
+        """Check whether the clear rate's confidence interval is already tight enough."""
+        n = len(outcomes)
+        if n < self.EARLY_TERM_MIN_ITERATIONS:
+            return False
+        cleared = sum(1 for c, _ in outcomes if c)
+        low, high = wilson_interval(cleared, n, self.CONFIDENCE_Z)
+        return (high - low) / 2 <= ci_half_width
+
+    def _summarize(
+        self, outcomes: List[Tuple[bool, int]], iterations: int, strategy: str
+    ) -> SimulationResult:
+        """Aggregate per-iteration outcomes into a SimulationResult."""
+        n = len(outcomes)
+        cleared_count = sum(1 for c, _ in outcomes if c)
+        moves_list = [m for _, m in outcomes]
 
         return SimulationResult(
-            clear_rate=cleared_count / len(results),
+            clear_rate=cleared_count / n if n else 0.0,
             avg_moves=statistics.mean(moves_list) if moves_list else 0,
             min_moves=min(moves_list) if moves_list else 0,
             max_moves=max(moves_list) if moves_list else 0,
-            iterations=iterations,
+            iterations=n,
             strategy=strategy,
+            clear_rate_ci=wilson_interval(cleared_count, n, self.CONFIDENCE_Z) if n else None,
+            early_terminated=n < iterations,
         )
 
     def _create_initial_state(
@@ -142,6 +251,8 @@ class LevelSimulator:
                     used_types.add(tile_data[0])
         used_tile_types = sorted(used_types) if used_types else ["t1", "t2", "t3"]
 
+        link_targets, link_sources = self._build_link_maps(tiles)
+
         return GameState(
             tiles=tiles,
             goals_remaining=goals_remaining,
@@ -149,6 +260,55 @@ class LevelSimulator:
             dock=[],
             dock_max_size=7,
             used_tile_types=used_tile_types,
+            link_targets=link_targets,
+            link_sources=link_sources,
+        )
+
+    def _build_link_maps(
+        self, tiles: Dict[int, Dict[str, List[Any]]]
+    ) -> Tuple[Dict[Tuple[int, str], Tuple[int, str]], Dict[Tuple[int, str], List[Tuple[int, str]]]]:
+        """Precompute link source -> target and target -> sources maps.
+
+        Tiles are only ever removed during play, so the relations computed
+        from the initial board stay valid; lookups just check that both ends
+        are still present and accessible. Sources are listed in layer order,
+        matching the original per-move layer scan.
+        """
+        link_targets: Dict[Tuple[int, str], Tuple[int, str]] = {}
+        link_sources: Dict[Tuple[int, str], List[Tuple[int, str]]] = {}
+
+        for layer_idx, layer_tiles in tiles.items():
+            for pos, tile_data in layer_tiles.items():
+                if len(tile_data) < 2 or tile_data[1] not in self.LINK_DIRECTIONS:
+                    continue
+                try:
+                    col, row = map(int, pos.split('_'))
+                except ValueError:
+                    continue
+                delta_col, delta_row = self.LINK_DIRECTIONS[tile_data[1]]
+                source = (layer_idx, pos)
+                target = (layer_idx, f"{col + delta_col}_{row + delta_row}")
+                link_targets[source] = target
+                link_sources.setdefault(target, []).append(source)
+
+        return link_targets, link_sources
+
+    def _fast_copy_state(self, base: GameState, rng: Any = random) -> GameState:
+        """Copy a base state for a new play-through.
+
+        Tile lists are never mutated during play (tiles are only removed from
+        their layer dict), so only the per-layer dicts need copying.
+        """
+        return GameState(
+            tiles={layer_idx: dict(layer_tiles) for layer_idx, layer_tiles in base.tiles.items()},
+            goals_remaining=dict(base.goals_remaining),
+            max_moves=base.max_moves,
+            dock=[],
+            dock_max_size=base.dock_max_size,
+            used_tile_types=base.used_tile_types,
+            rng=rng,
+            link_targets=base.link_targets,
+            link_sources=base.link_sources,
         )
 
     def _play_game(self, state: GameState, strategy: SimulationStrategy) -> GameState:
@@ -160,7 +320,7 @@ class LevelSimulator:
                 break
 
             if strategy == SimulationStrategy.RANDOM:
-                move = random.choice(moves)
+                move = state.rng.choice(moves)
             elif strategy == SimulationStrategy.GREEDY:
                 move = self._select_greedy_move(moves, state)
             else:  # OPTIMAL - use simple lookahead
@@ -237,14 +397,15 @@ class LevelSimulator:
 
             # Case 1: This tile has a link attribute (source -> target)
             if attribute and attribute.startswith("link_"):
-                linked_tile = self._get_linked_tile_fast(state, layer_idx, pos, attribute, accessible_positions)
-                if linked_tile:
-                    linked_tiles.append(linked_tile)
+                target = state.link_targets.get((layer_idx, pos))
+                if target and target in accessible_positions:
+                    linked_tiles.append(target)
             else:
                 # Case 2: This tile might be a link target (reverse lookup: target -> source)
-                link_source = self._find_link_source_fast(state, layer_idx, pos, accessible_positions)
-                if link_source:
-                    linked_tiles.append(link_source)
+                for source in state.link_sources.get((layer_idx, pos), ()):
+                    if source in accessible_positions:
+                        linked_tiles.append(source)
+                        break
 
             moves.append(Move(
                 layer_idx=layer_idx,
@@ -256,192 +417,6 @@ class LevelSimulator:
 
         return moves
 
-    def _get_linked_tile_fast(
-        self, state: GameState, layer_idx: int, pos: str, link_attr: str,
-        accessible_positions: Set[Tuple[int, str]]
-    ) -> Optional[Tuple[int, str]]:
-        """Get the linked tile position for a link attribute (optimized with pre-computed positions).
-
-        IMPORTANT: The target tile must be accessible (not blocked by upper layers)
-        for the link pair to work together.
-        """
-        if link_attr not in self.LINK_DIRECTIONS:
-            return None
-
-        try:
-            col, row = map(int, pos.split('_'))
-        except:
-            return None
-
-        delta_col, delta_row = self.LINK_DIRECTIONS[link_attr]
-        target_col = col + delta_col
-        target_row = row + delta_row
-        target_pos = f"{target_col}_{target_row}"
-
-        # Check if target tile exists in the same layer
-        layer_tiles = state.tiles.get(layer_idx, {})
-        if target_pos in layer_tiles:
-            # Check if target tile is accessible (not blocked by upper layer)
-            if (layer_idx, target_pos) in accessible_positions:
-                return (layer_idx, target_pos)
-
-        return None
-
-    def _get_linked_tile(
-        self, state: GameState, layer_idx: int, pos: str, link_attr: str
-    ) -> Optional[Tuple[int, str]]:
-        """Get the linked tile position for a link attribute.
-
-        IMPORTANT: The target tile must be accessible (not blocked by upper layers)
-        for the link pair to work together.
-        """
-        if link_attr not in self.LINK_DIRECTIONS:
-            return None
-
-        try:
-            col, row = map(int, pos.split('_'))
-        except:
-            return None
-
-        delta_col, delta_row = self.LINK_DIRECTIONS[link_attr]
-        target_col = col + delta_col
-        target_row = row + delta_row
-        target_pos = f"{target_col}_{target_row}"
-
-        # Check if target tile exists in the same layer
-        layer_tiles = state.tiles.get(layer_idx, {})
-        if target_pos in layer_tiles:
-            # Check if target tile is accessible (not blocked by upper layer)
-            accessible_positions = self._get_accessible_positions(state)
-            if (layer_idx, target_pos) in accessible_positions:
-                return (layer_idx, target_pos)
-
-        return None
-
-    def _find_link_source_fast(
-        self, state: GameState, layer_idx: int, target_pos: str,
-        accessible_positions: Set[Tuple[int, str]]
-    ) -> Optional[Tuple[int, str]]:
-        """Find if any tile has a link attribute pointing TO this position (optimized).
-
-        This handles the case where a tile without a link attribute is selected,
-        but another tile has a link pointing to it - both should go to dock together.
-
-        IMPORTANT: The source tile must be accessible (not blocked by upper layers)
-        for the link pair to work.
-        """
-        try:
-            target_col, target_row = map(int, target_pos.split('_'))
-        except:
-            return None
-
-        layer_tiles = state.tiles.get(layer_idx, {})
-
-        # Check all tiles in the same layer for a link pointing to target_pos
-        for pos, tile_data in layer_tiles.items():
-            if pos == target_pos:
-                continue
-
-            if not isinstance(tile_data, list) or len(tile_data) < 2:
-                continue
-
-            attr = tile_data[1] if tile_data[1] else ""
-            if not attr.startswith("link_"):
-                continue
-
-            # This tile has a link attribute - check if it points to target_pos
-            if attr not in self.LINK_DIRECTIONS:
-                continue
-
-            try:
-                source_col, source_row = map(int, pos.split('_'))
-            except:
-                continue
-
-            delta_col, delta_row = self.LINK_DIRECTIONS[attr]
-            linked_col = source_col + delta_col
-            linked_row = source_row + delta_row
-
-            # If this tile's link points to target_pos, return this tile as the source
-            if linked_col == target_col and linked_row == target_row:
-                # Check if source tile is accessible (not blocked by upper layer)
-                if (layer_idx, pos) in accessible_positions:
-                    return (layer_idx, pos)
-
-        return None
-
-    def _find_link_source(
-        self, state: GameState, layer_idx: int, target_pos: str
-    ) -> Optional[Tuple[int, str]]:
-        """Find if any tile has a link attribute pointing TO this position (reverse lookup).
-
-        This handles the case where a tile without a link attribute is selected,
-        but another tile has a link pointing to it - both should go to dock together.
-
-        IMPORTANT: The source tile must be accessible (not blocked by upper layers)
-        for the link pair to work.
-        """
-        try:
-            target_col, target_row = map(int, target_pos.split('_'))
-        except:
-            return None
-
-        # Get all accessible positions to check if source is accessible
-        accessible_positions = self._get_accessible_positions(state)
-
-        layer_tiles = state.tiles.get(layer_idx, {})
-
-        # Check all tiles in the same layer for a link pointing to target_pos
-        for pos, tile_data in layer_tiles.items():
-            if pos == target_pos:
-                continue
-
-            if not isinstance(tile_data, list) or len(tile_data) < 2:
-                continue
-
-            attr = tile_data[1] if tile_data[1] else ""
-            if not attr.startswith("link_"):
-                continue
-
-            # This tile has a link attribute - check if it points to target_pos
-            if attr not in self.LINK_DIRECTIONS:
-                continue
-
-            try:
-                source_col, source_row = map(int, pos.split('_'))
-            except:
-                continue
-
-            delta_col, delta_row = self.LINK_DIRECTIONS[attr]
-            linked_col = source_col + delta_col
-            linked_row = source_row + delta_row
-
-            # If this tile's link points to target_pos, return this tile as the source
-            if linked_col == target_col and linked_row == target_row:
-                # Check if source tile is accessible (not blocked by upper layer)
-                if (layer_idx, pos) in accessible_positions:
-                    return (layer_idx, pos)
-
-        return None
-
-    def _get_accessible_positions(self, state: GameState) -> Set[Tuple[int, str]]:
-        """Get set of accessible (layer_idx, position) tuples."""
-        accessible = set()
-        occupied_positions: Set[str] = set()
-
-        # Start from top layer
-        sorted_layers = sorted(state.tiles.keys(), reverse=True)
-
-        for layer_idx in sorted_layers:
-            layer_tiles = state.tiles.get(layer_idx, {})
-
-            for pos in layer_tiles.keys():
-                if pos not in occupied_positions:
-                    accessible.add((layer_idx, pos))
-                    occupied_positions.add(pos)
-
-        return accessible
-
     def _get_accessible_tiles(
         self, state: GameState
     ) -> List[Tuple[int, str, List[Any]]]:
@@ -540,7 +515,7 @@ class LevelSimulator:
 
             # Handle t0 (random tile) - assign from level's actual tile types
             if tile_type == "t0":
-                tile_type = random.choice(state.used_tile_types if state.used_tile_types else ["t1", "t2", "t3"])
+                tile_type = state.rng.choice(state.used_tile_types if state.used_tile_types else ["t1", "t2", "t3"])
 
             tiles_to_add.append(DockTile(
                 tile_type=tile_type,
@@ -560,7 +535,7 @@ class LevelSimulator:
 
                 # Handle t0 (random tile) - assign from level's actual tile types
                 if linked_type == "t0":
-                    linked_type = random.choice(state.used_tile_types if state.used_tile_types else ["t1", "t2", "t3"])
+                    linked_type = state.rng.choice(state.used_tile_types if state.used_tile_types else ["t1", "t2", "t3"])
 
                 tiles_to_add.append(DockTile(
                     tile_type=linked_type,
@@ -643,6 +618,37 @@ class LevelSimulator:
                     i += count
 
 
+def wilson_interval(successes: int, n: int, z: float = 1.96) -> Tuple[float, float]:
+    """Wilson score interval for a binomial proportion."""
+    if n <= 0:
+        return (0.0, 1.0)
+    p = successes / n
+    denom = 1 + z * z / n
+    center = (p + z * z / (2 * n)) / denom
+    margin = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denom
+    # min/max guard against rounding at p = 0 or 1
+    return (max(0.0, min(p, center - margin)), min(1.0, max(p, center + margin)))
+
+
+def _simulate_chunk(args: Tuple[Dict[str, Any], str, int, int, int, int]) -> List[Tuple[bool, int]]:
+    """
+    Top-level function for ProcessPoolExecutor (must be picklable).
+    Plays one contiguous range of Monte Carlo iterations.
+
+    Args tuple:
+        level_json: Level data
+        strategy: Strategy value
+        max_moves: Maximum moves per simulation
+        seed: Base random seed
+        start: First iteration index
+        count: Number of iterations
+    """
+    level_json, strategy, max_moves, seed, start, count = args
+    simulator = get_simulator()
+    base_state = simulator._create_initial_state(level_json, max_moves)
+    return simulator._run_batch(base_state, SimulationStrategy(strategy), seed, start, count)
+
+
 # Singleton instance
 _simulator = None
 
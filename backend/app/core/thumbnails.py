@@ -0,0 +1,600 @@
+"""
+Level Thumbnails
+================
+Renders PNG thumbnails of levels from the tile sprites in frontend/public,
+for GBoost uploads and the batch thumbnail endpoint.
+
+Rendering is dominated by sprite work, so each process keeps a
+size-bounded LRU cache of sprites already resized for a tile size and
+already dimmed for a layer's brightness (or faded for an overlay); a
+sprite is resized and enhanced once per process instead of per tile.
+
+Finished thumbnails are stored on disk under
+``storage/cache/thumbnails/`` keyed by a hash of the level content, the
+output size and THUMBNAIL_VERSION, so an unchanged level is never
+re-rendered between uploads; the least recently used files are removed
+once the cache outgrows THUMBNAIL_CACHE_MAX_BYTES. ``render_thumbnails``
+serves a batch from that cache and renders the misses across a process pool.
+"""
+
+import hashlib
+import importlib.util
+import io
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, Optional, Tuple
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+# PIL is only needed for rendering; import it on first render, not at startup
+PIL_AVAILABLE = importlib.util.find_spec("PIL") is not None
+
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent / "storage" / "cache" / "thumbnails"
+
+# Bump when rendering changes so cached thumbnails are not served stale
+THUMBNAIL_VERSION = 1
+
+# Disk cache budget (PNG bytes); least recently used thumbnails are removed past it
+THUMBNAIL_CACHE_MAX_BYTES = 256 * 1024 * 1024
+# Eviction trims the disk cache to this fraction of its budget, not just under it
+_EVICT_TO = 0.8
+
+# Sprite cache budget per process (RGBA bytes); a 64px sprite is 16 KB
+SPRITE_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+# Processes for batch rendering
+THUMBNAIL_POOL_WORKERS = min(4, os.cpu_count() or 2)
+
+# Tile color mapping for thumbnail generation (fallback)
+TILE_COLORS = {
+    "t0": (148, 163, 184),   # slate
+    "t1": (248, 113, 113),   # red
+    "t2": (248, 113, 113),   # red
+    "t3": (74, 222, 128),    # green
+    "t4": (74, 222, 128),    # green
+    "t5": (96, 165, 250),    # blue
+    "t6": (192, 132, 252),   # purple
+    "t7": (120, 113, 108),   # stone
+    "t8": (120, 113, 108),   # stone
+    "t9": (87, 83, 78),      # stone dark
+    "t10": (250, 204, 21),   # yellow
+    "t11": (251, 146, 60),   # orange
+    "t12": (244, 114, 182),  # pink
+    "t13": (34, 211, 238),   # cyan
+    "t14": (34, 211, 238),   # cyan
+    "t15": (167, 139, 250),  # violet
+}
+
+# Tile image paths (relative to frontend/public)
+TILE_IMAGES = {
+    "t0": "tiles/skin0/s0_t0.png",
+    "t1": "tiles/skin0/s0_t1.png",
+    "t2": "tiles/skin0/s0_t2.png",
+    "t3": "tiles/skin0/s0_t3.png",
+    "t4": "tiles/skin0/s0_t4.png",
+    "t5": "tiles/skin0/s0_t5.png",
+    "t6": "tiles/skin0/s0_t6.png",
+    "t7": "tiles/skin0/s0_t7.png",
+    "t8": "tiles/skin0/s0_t8.png",
+    "t9": "tiles/skin0/s0_t9.png",
+    "t10": "tiles/skin0/s0_t10.png",
+    "t11": "tiles/skin0/s0_t11.png",
+    "t12": "tiles/skin0/s0_t12.png",
+    "t13": "tiles/skin0/s0_t13.png",
+    "t14": "tiles/skin0/s0_t14.png",
+    "t15": "tiles/skin0/s0_t15.png",
+    "craft_s": "tiles/special/tile_craft.png",
+    "craft_e": "tiles/special/tile_craft.png",
+    "craft_w": "tiles/special/tile_craft.png",
+    "craft_n": "tiles/special/tile_craft.png",
+    "stack_s": "tiles/special/stack_s.png",
+    "stack_e": "tiles/special/stack_e.png",
+    "stack_w": "tiles/special/stack_w.png",
+    "stack_n": "tiles/special/stack_n.png",
+    "stack_ne": "tiles/special/stack_ne.png",
+    "stack_nw": "tiles/special/stack_nw.png",
+    "stack_se": "tiles/special/stack_se.png",
+    "stack_sw": "tiles/special/stack_sw.png",
+}
+
+# Special attribute overlay images
+SPECIAL_IMAGES = {
+    "chain": "tiles/special/tile_chain.png",
+    "frog": "tiles/special/frog.png",
+    "link": "tiles/special/tile_link.png",
+    "link_n": "tiles/special/tile_link_n.png",
+    "link_s": "tiles/special/tile_link_s.png",
+    "link_e": "tiles/special/tile_link_e.png",
+    "link_w": "tiles/special/tile_link_w.png",
+    "ice_1": "tiles/special/tile_ice_1.png",
+    "ice_2": "tiles/special/tile_ice_2.png",
+    "ice_3": "tiles/special/tile_ice_3.png",
+    "ice": "tiles/special/tile_ice_1.png",
+    "grass": "tiles/special/tile_grass.png",
+    "grass_1": "tiles/special/tile_grass.png",
+    "grass_2": "tiles/special/tile_grass.png",
+    "bomb": "tiles/special/bomb.png",
+    "unknown": "tiles/special/tile_unknown.png",
+    "curtain": "tiles/special/curtain_close.png",
+    "curtain_open": "tiles/special/curtain_open.png",
+    "curtain_close": "tiles/special/curtain_close.png",
+    "teleport": "tiles/special/teleport.png",
+}
+
+
+def _get_tile_assets_path() -> Path:
+    """Get the path to tile assets (frontend/public)."""
+    backend_dir = Path(__file__).parent.parent.parent  # app/core -> backend
+    candidates = [
+        backend_dir.parent / "frontend" / "public",  # ../frontend/public
+        backend_dir.parent / "frontend" / "dist",    # ../frontend/dist (built)
+        Path("/Users/casualdev/TileMatchAutoLevel/frontend/public"),  # Absolute fallback
+    ]
+    for path in candidates:
+        if path.exists() and (path / "tiles").exists():
+            return path
+    return candidates[0]  # Default
+
+
+class SpriteCache:
+    """LRU cache of prepared sprites, bounded by their total pixel bytes."""
+
+    def __init__(self, max_bytes: int = SPRITE_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._entries: "OrderedDict[Tuple, Any]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Tuple) -> bool:
+        return key in self._entries
+
+    def get(self, key: Tuple) -> Any:
+        sprite = self._entries.get(key)
+        if sprite is not None or key in self._entries:
+            self._entries.move_to_end(key)
+        return sprite
+
+    def put(self, key: Tuple, sprite: Any) -> None:
+        # Missing images are cached as None so the file is not probed again
+        if key in self._entries:
+            return
+        self._entries[key] = sprite
+        self.bytes += self._size(sprite)
+        while self.bytes > self.max_bytes and len(self._entries) > 1:
+            _, evicted = self._entries.popitem(last=False)
+            self.bytes -= self._size(evicted)
+
+    @staticmethod
+    def _size(sprite: Any) -> int:
+        return sprite.width * sprite.height * 4 if sprite is not None else 0
+
+
+_sprite_cache = SpriteCache()
+
+
+def _load_sprite(
+    image_path: str, tile_size: int, brightness: float = 1.0, overlay: bool = False
+) -> Optional["Image.Image"]:
+    """Tile sprite resized to tile_size, dimmed to brightness or faded as an overlay.
+
+    Prepared sprites are cached per process; callers must not modify them.
+    """
+    key = (image_path, tile_size, brightness, overlay)
+    if key in _sprite_cache:
+        return _sprite_cache.get(key)
+
+    from PIL import Image, ImageEnhance
+
+    sprite = None
+    if brightness < 1.0 or overlay:
+        base = _load_sprite(image_path, tile_size)
+        if base is not None:
+            if overlay:
+                # Make overlay semi-transparent
+                sprite = base.copy()
+                sprite.putalpha(Image.eval(sprite.split()[3], lambda a: int(a * 0.8)))
+            else:
+                sprite = ImageEnhance.Brightness(base.copy()).enhance(brightness)
+    else:
+        full_path = _get_tile_assets_path() / image_path
+        if full_path.exists():
+            try:
+                sprite = Image.open(full_path).convert("RGBA")
+                sprite = sprite.resize((tile_size, tile_size), Image.Resampling.LANCZOS)
+            except Exception as e:
+                logger.warning(f"Failed to load tile image {image_path}: {e}")
+                return None
+
+    _sprite_cache.put(key, sprite)
+    return sprite
+
+
+def render_thumbnail(level_data: dict, size: int = 192) -> Optional[bytes]:
+    """
+    Generate a PNG thumbnail for the level using actual tile images.
+    Shows all layers with offset for depth effect.
+
+    Args:
+        level_data: Level JSON data.
+        size: Output image size (square).
+
+    Returns:
+        PNG bytes or None if generation fails.
+    """
+    if not PIL_AVAILABLE:
+        return None
+
+    from PIL import Image, ImageDraw
+
+    try:
+        # Calculate tile bounds (only render used area)
+        num_layers = level_data.get("layer", 8)
+        min_x, max_x = float('inf'), float('-inf')
+        min_y, max_y = float('inf'), float('-inf')
+
+        # Collect tiles from all layers with layer info
+        tiles_by_layer: list[list[tuple]] = [[] for _ in range(num_layers)]
+
+        for i in range(num_layers):
+            layer_key = f"layer_{i}"
+            layer_data = level_data.get(layer_key, {})
+            tiles = layer_data.get("tiles", {})
+
+            for pos, tile_data in tiles.items():
+                if not isinstance(tile_data, list) or len(tile_data) == 0:
+                    continue
+
+                parts = pos.split("_")
+                if len(parts) != 2:
+                    continue
+
+                try:
+                    y, x = int(parts[0]), int(parts[1])
+                    min_x = min(min_x, x)
+                    max_x = max(max_x, x)
+                    min_y = min(min_y, y)
+                    max_y = max(max_y, y)
+                    tiles_by_layer[i].append((x, y, tile_data, i))  # Include layer index
+                except ValueError:
+                    continue
+
+        if min_x == float('inf'):
+            return None
+
+        # Calculate dimensions with layer offset
+        used_width = max_x - min_x + 1
+        used_height = max_y - min_y + 1
+
+        # Layer offset for 3D stacking effect (pixels per layer)
+        layer_offset = 3
+
+        # Render at larger size for quality, then resize
+        render_size = max(size * 2, 256)
+        tile_size = render_size // max(used_width, used_height)
+
+        # Add extra space for layer offsets
+        total_offset = layer_offset * (num_layers - 1)
+        canvas_width = used_width * tile_size + total_offset
+        canvas_height = used_height * tile_size + total_offset
+
+        # Create RGBA image for proper alpha compositing
+        image = Image.new("RGBA", (canvas_width, canvas_height), (31, 41, 55, 255))  # gray-800
+
+        # Draw tiles layer by layer (lower layers first, with offset)
+        for layer_idx, layer_tiles in enumerate(tiles_by_layer):
+            # Calculate layer offset (lower layers offset more to bottom-right)
+            layer_x_offset = (num_layers - 1 - layer_idx) * layer_offset
+            layer_y_offset = (num_layers - 1 - layer_idx) * layer_offset
+
+            # Calculate brightness for this layer (lower = dimmer)
+            if num_layers > 1:
+                brightness = 0.5 + 0.5 * (layer_idx / (num_layers - 1))
+            else:
+                brightness = 1.0
+
+            for x, y, tile_data, _ in layer_tiles:
+                rel_x = x - min_x
+                rel_y = y - min_y
+                px = rel_x * tile_size + layer_x_offset
+                py = rel_y * tile_size + layer_y_offset
+
+                tile_type = tile_data[0] if len(tile_data) > 0 else ""
+                attribute = tile_data[1] if len(tile_data) > 1 else ""
+
+                # Draw t0 as background for non-t0 tiles (like the game does)
+                # t0 is the base tile background image
+                t0_bg = _load_sprite(TILE_IMAGES.get("t0", ""), tile_size, brightness)
+
+                if t0_bg and tile_type != "t0":
+                    image.paste(t0_bg, (px, py), t0_bg)
+                elif not t0_bg:
+                    # Fallback: draw colored rectangle if t0 image not available
+                    if tile_type.startswith("craft_"):
+                        bg_color = (16, 185, 129)  # emerald
+                    elif tile_type.startswith("stack_"):
+                        bg_color = (139, 92, 246)  # violet
+                    else:
+                        bg_color = TILE_COLORS.get(tile_type, (107, 114, 128))
+                    bg_color = tuple(int(c * brightness) for c in bg_color)
+                    draw = ImageDraw.Draw(image)
+                    draw.rectangle([px, py, px + tile_size - 1, py + tile_size - 1], fill=(*bg_color, 255))
+
+                # Try to load actual tile image
+                tile_img = None
+                if tile_type in TILE_IMAGES:
+                    tile_img = _load_sprite(TILE_IMAGES[tile_type], tile_size, brightness)
+
+                if tile_img:
+                    # Paste tile image with alpha
+                    image.paste(tile_img, (px, py), tile_img)
+
+                # Draw direction arrow for craft tiles
+                if tile_type.startswith("craft_"):
+                    direction = tile_type.split("_")[1] if "_" in tile_type else "s"
+                    draw = ImageDraw.Draw(image)
+
+                    # Arrow parameters - purple color, centered
+                    arrow_color = (180, 80, 255, 255)  # Purple
+                    outline_color = (120, 40, 180, 255)  # Dark purple outline
+                    center_x = px + tile_size // 2
+                    center_y = py + tile_size // 2
+                    arrow_size = tile_size // 4  # Smaller for better centering
+
+                    # Calculate arrow points based on direction (centered)
+                    if direction == "s":  # South (down)
+                        points = [
+                            (center_x, center_y + arrow_size),  # Tip
+                            (center_x - arrow_size, center_y - arrow_size // 2),
+                            (center_x + arrow_size, center_y - arrow_size // 2),
+                        ]
+                    elif direction == "n":  # North (up)
+                        points = [
+                            (center_x, center_y - arrow_size),  # Tip
+                            (center_x - arrow_size, center_y + arrow_size // 2),
+                            (center_x + arrow_size, center_y + arrow_size // 2),
+                        ]
+                    elif direction == "e":  # East (right)
+                        points = [
+                            (center_x + arrow_size, center_y),  # Tip
+                            (center_x - arrow_size // 2, center_y - arrow_size),
+                            (center_x - arrow_size // 2, center_y + arrow_size),
+                        ]
+                    elif direction == "w":  # West (left)
+                        points = [
+                            (center_x - arrow_size, center_y),  # Tip
+                            (center_x + arrow_size // 2, center_y - arrow_size),
+                            (center_x + arrow_size // 2, center_y + arrow_size),
+                        ]
+                    else:
+                        points = None
+
+                    if points:
+                        # Draw outline first
+                        draw.polygon(points, outline=outline_color)
+                        # Draw filled arrow
+                        draw.polygon(points, fill=arrow_color)
+
+                # Add attribute overlay if present
+                if attribute and attribute in SPECIAL_IMAGES:
+                    overlay = _load_sprite(SPECIAL_IMAGES[attribute], tile_size, overlay=True)
+                    if overlay:
+                        image.paste(overlay, (px, py), overlay)
+
+        # Resize to target size with high quality
+        final_image = Image.new("RGBA", (size, size), (31, 41, 55, 255))
+
+        # Scale and center
+        scale = min(size / canvas_width, size / canvas_height)
+        scaled_width = int(canvas_width * scale)
+        scaled_height = int(canvas_height * scale)
+        offset_x = (size - scaled_width) // 2
+        offset_y = (size - scaled_height) // 2
+
+        scaled = image.resize((scaled_width, scaled_height), Image.Resampling.LANCZOS)
+        final_image.paste(scaled, (offset_x, offset_y), scaled)
+
+        # Convert to RGB for PNG (no alpha needed for final output)
+        final_rgb = Image.new("RGB", (size, size), (31, 41, 55))
+        final_rgb.paste(final_image, mask=final_image.split()[3] if final_image.mode == 'RGBA' else None)
+
+        # Convert to PNG bytes
+        buffer = io.BytesIO()
+        final_rgb.save(buffer, format="PNG", optimize=True)
+        return buffer.getvalue()
+
+    except Exception as e:
+        logger.exception(f"Thumbnail generation error: {e}")
+        return None
+
+
+def thumbnail_key(level_data: Dict[str, Any], size: int = 192) -> str:
+    """Disk cache key: level content (key order does not matter), size and renderer version."""
+    canonical = json.dumps(level_data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    digest = hashlib.sha256(f"{THUMBNAIL_VERSION}:{size}:{canonical}".encode("utf-8"))
+    return digest.hexdigest()[:32]
+
+
+class ThumbnailCache:
+    """Rendered thumbnails on disk, one PNG per key, bounded by their total size.
+
+    A hit refreshes the file's mtime; once the cache outgrows ``max_bytes``
+    the least recently used files are removed until it is back under 80%
+    of the budget.
+    """
+
+    def __init__(self, cache_dir: Path = DEFAULT_CACHE_DIR, max_bytes: int = THUMBNAIL_CACHE_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._total_bytes: Optional[int] = None  # Measured on first put
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.png"
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            png = path.read_bytes()
+        except OSError:
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return png
+
+    def put(self, key: str, png: bytes) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(png)
+        os.replace(tmp_path, path)
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = sum(size for _, size, _ in self._entries())
+            else:
+                self._total_bytes += len(png)
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _entries(self) -> list:
+        """(mtime, size, path) of every cached thumbnail."""
+        entries = []
+        for path in self.cache_dir.glob("*/*.png"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _evict(self) -> None:
+        """Remove least recently used files down to _EVICT_TO of the budget (caller holds the lock)."""
+        entries = sorted(self._entries(), key=lambda entry: entry[0])
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * _EVICT_TO
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+        self._total_bytes = total
+
+
+_thumbnail_cache: Optional[ThumbnailCache] = None
+_thumbnail_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def get_thumbnail_cache() -> ThumbnailCache:
+    """Get or create the on-disk thumbnail cache singleton."""
+    global _thumbnail_cache
+    if _thumbnail_cache is None:
+        _thumbnail_cache = ThumbnailCache()
+    return _thumbnail_cache
+
+
+def _get_thumbnail_pool() -> ProcessPoolExecutor:
+    """Get or create the process pool for batch rendering."""
+    global _thumbnail_pool
+    with _pool_lock:
+        if _thumbnail_pool is None:
+            _thumbnail_pool = ProcessPoolExecutor(max_workers=THUMBNAIL_POOL_WORKERS)
+    return _thumbnail_pool
+
+
+def shutdown_thumbnail_pool() -> None:
+    """Shut down the batch rendering pool, if it was started."""
+    global _thumbnail_pool
+    with _pool_lock:
+        if _thumbnail_pool is not None:
+            _thumbnail_pool.shutdown(wait=False)
+            _thumbnail_pool = None
+
+
+def get_thumbnail(
+    level_data: Dict[str, Any], size: int = 192, cache: Optional[ThumbnailCache] = None
+) -> Optional[bytes]:
+    """Thumbnail from the disk cache, rendered and stored on a miss."""
+    cache = cache or get_thumbnail_cache()
+    key = thumbnail_key(level_data, size)
+    png = cache.get(key)
+    if png is None:
+        png = render_thumbnail(level_data, size)
+        if png is not None:
+            cache.put(key, png)
+    return png
+
+
+def _render_thumbnail_process(args: Tuple[dict, int]) -> Optional[bytes]:
+    """Top-level function for ProcessPoolExecutor (must be picklable)."""
+    level_data, size = args
+    return render_thumbnail(level_data, size)
+
+
+def render_thumbnails(
+    levels: Iterable[Tuple[str, Dict[str, Any]]],
+    size: int = 192,
+    cache: Optional[ThumbnailCache] = None,
+    parallel: bool = True,
+) -> Iterator[Tuple[str, Optional[bytes], bool]]:
+    """Thumbnails for many levels: cache hits first, then misses as they finish.
+
+    Args:
+        levels: (level_id, level_data) pairs
+        size: Output image size (square)
+        cache: Disk cache (default: storage/cache/thumbnails)
+        parallel: Render misses across the thumbnail process pool
+
+    Yields:
+        (level_id, png or None if rendering failed, whether it came from the cache)
+    """
+    cache = cache or get_thumbnail_cache()
+    misses = []
+    for level_id, level_data in levels:
+        key = thumbnail_key(level_data, size)
+        png = cache.get(key)
+        if png is not None:
+            yield level_id, png, True
+        else:
+            misses.append((level_id, key, level_data))
+
+    if not misses:
+        return
+
+    if not parallel or len(misses) == 1:
+        for level_id, key, level_data in misses:
+            png = render_thumbnail(level_data, size)
+            if png is not None:
+                cache.put(key, png)
+            yield level_id, png, False
+        return
+
+    pool = _get_thumbnail_pool()
+    futures = {
+        pool.submit(_render_thumbnail_process, (level_data, size)): (level_id, key)
+        for level_id, key, level_data in misses
+    }
+    for future in as_completed(futures):
+        level_id, key = futures[future]
+        try:
+            png = future.result()
+        except Exception as e:
+            logger.error(f"Thumbnail generation error for {level_id}: {e}")
+            png = None
+        if png is not None:
+            cache.put(key, png)
+        yield level_id, png, False
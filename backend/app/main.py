@@ -1,4 +1,6 @@
 """FastAPI application entry point."""
+import asyncio
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -55,12 +57,25 @@ async def root():
     }
 
 
+@app.on_event("startup")
+async def startup_event():
+    """Warm the benchmark dashboard in the background."""
+    from .core.benchmark_store import get_benchmark_store
+    if settings.benchmark_warmup and get_benchmark_store().get_dashboard() is None:
+        asyncio.ensure_future(simulate.refresh_benchmark_dashboard())
+
+
 @app.on_event("shutdown")
 async def shutdown_event():
-    """Cleanup ProcessPoolExecutor on shutdown."""
+    """Cleanup ProcessPoolExecutors on shutdown."""
     from .api.routes.generate import _bot_process_pool
+    from .core import bot_simulator
+    from .core.thumbnails import shutdown_thumbnail_pool
     if _bot_process_pool is not None:
         _bot_process_pool.shutdown(wait=False)
+    if bot_simulator._process_pool is not None:
+        bot_simulator._process_pool.shutdown(wait=False)
+    shutdown_thumbnail_pool()
 
 
 @app.get("/health")
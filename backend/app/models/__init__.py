@@ -1,80 +1,59 @@
 """Data models package.
 
 This package contains data models, schemas, and profiles for the application.
+
+Submodules are imported on first attribute access so that lightweight
+consumers (e.g. the bot simulator in a process-pool child) do not pay for
+the pydantic API schemas.
 """
-from .level import (
-    DifficultyGrade,
-    LevelMetrics,
-    DifficultyReport,
-    GenerationParams,
-    GenerationResult,
-    SimulationResult,
-    TILE_TYPES,
-    ATTRIBUTES,
-)
-from .bot_profile import (
-    BotType,
-    BotTeam,
-    BotProfile,
-    get_all_profiles,
-    get_profile,
-    create_custom_profile,
-    PREDEFINED_PROFILES,
-)
-from .schemas import (
-    AnalyzeRequest,
-    AnalyzeResponse,
-    GenerateRequest,
-    GenerateResponse,
-    SimulateRequest,
-    SimulateResponse,
-    MultiBotAssessRequest,
-    MultiBotAssessResponse,
-    BotResultItem,
-    ComprehensiveAssessRequest,
-    ComprehensiveAssessResponse,
-    BotProfileListResponse,
-    ErrorResponse,
-    # AutoPlay schemas
-    AutoPlayRequest,
-    AutoPlayResponse,
-    BotClearStats,
-)
+import importlib
 
-__all__ = [
-    # Level models
-    "DifficultyGrade",
-    "LevelMetrics",
-    "DifficultyReport",
-    "GenerationParams",
-    "GenerationResult",
-    "SimulationResult",
-    "TILE_TYPES",
-    "ATTRIBUTES",
-    # Bot profiles
-    "BotType",
-    "BotTeam",
-    "BotProfile",
-    "get_all_profiles",
-    "get_profile",
-    "create_custom_profile",
-    "PREDEFINED_PROFILES",
-    # API schemas
-    "AnalyzeRequest",
-    "AnalyzeResponse",
-    "GenerateRequest",
-    "GenerateResponse",
-    "SimulateRequest",
-    "SimulateResponse",
-    "MultiBotAssessRequest",
-    "MultiBotAssessResponse",
-    "BotResultItem",
-    "ComprehensiveAssessRequest",
-    "ComprehensiveAssessResponse",
-    "BotProfileListResponse",
-    "ErrorResponse",
+_LAZY_EXPORTS = {
+    "DifficultyGrade": ".level",
+    "LevelMetrics": ".level",
+    "DifficultyReport": ".level",
+    "GenerationParams": ".level",
+    "GenerationResult": ".level",
+    "SimulationResult": ".level",
+    "TILE_TYPES": ".level",
+    "ATTRIBUTES": ".level",
+    "BotType": ".bot_profile",
+    "BotTeam": ".bot_profile",
+    "BotProfile": ".bot_profile",
+    "get_all_profiles": ".bot_profile",
+    "get_profile": ".bot_profile",
+    "create_custom_profile": ".bot_profile",
+    "PREDEFINED_PROFILES": ".bot_profile",
+    "AnalyzeRequest": ".schemas",
+    "AnalyzeResponse": ".schemas",
+    "GenerateRequest": ".schemas",
+    "GenerateResponse": ".schemas",
+    "SimulateRequest": ".schemas",
+    "SimulateResponse": ".schemas",
+    "MultiBotAssessRequest": ".schemas",
+    "MultiBotAssessResponse": ".schemas",
+    "BotResultItem": ".schemas",
+    "ComprehensiveAssessRequest": ".schemas",
+    "ComprehensiveAssessResponse": ".schemas",
+    "BotProfileListResponse": ".schemas",
+    "ErrorResponse": ".schemas",
     # AutoPlay schemas
-    "AutoPlayRequest",
-    "AutoPlayResponse",
-    "BotClearStats",
-]
+    "AutoPlayRequest": ".schemas",
+    "AutoPlayResponse": ".schemas",
+    "BotClearStats": ".schemas",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
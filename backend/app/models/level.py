@@ -251,6 +251,8 @@ class SimulationResult:
     max_moves: int
     iterations: int
     strategy: str
+    clear_rate_ci: Optional[Tuple[float, float]] = None  # 95% Wilson interval
+    early_terminated: bool = False
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -261,6 +263,8 @@ class SimulationResult:
             "max_moves": self.max_moves,
             "iterations": self.iterations,
             "strategy": self.strategy,
+            "clear_rate_ci": [round(v, 3) for v in self.clear_rate_ci] if self.clear_rate_ci else None,
+            "early_terminated": self.early_terminated,
         }
 
 
@@ -149,6 +149,9 @@ class SimulateRequest(BaseModel):
     level_json: Dict[str, Any] = Field(..., description="Level JSON to simulate")
     iterations: int = Field(default=500, ge=10, le=10000, description="Number of simulation iterations")
     strategy: str = Field(default="greedy", description="Simulation strategy (random/greedy/optimal)")
+    seed: Optional[int] = Field(default=None, description="Base random seed for reproducible results")
+    early_termination: bool = Field(default=False, description="Stop once the clear rate confidence interval is narrow enough")
+    ci_half_width: float = Field(default=0.05, gt=0, le=0.5, description="Target 95% CI half-width for early termination")
 
 
 class SimulateResponse(BaseModel):
@@ -158,6 +161,9 @@ class SimulateResponse(BaseModel):
     min_moves: int = Field(..., description="Minimum moves used")
     max_moves: int = Field(..., description="Maximum moves used")
     difficulty_estimate: float = Field(..., description="Simulation-based difficulty estimate")
+    iterations: Optional[int] = Field(default=None, description="Iterations actually run")
+    clear_rate_ci: Optional[List[float]] = Field(default=None, description="95% confidence interval [low, high] for clear rate")
+    early_terminated: bool = Field(default=False, description="Whether early termination stopped before all iterations")
 
 
 class GBoostSaveRequest(BaseModel):
@@ -225,11 +231,38 @@ class UploadLocalToGBoostResponse(BaseModel):
     results: List[UploadProgressItem] = Field(default=[], description="Per-level results")
 
 
+class ThumbnailBatchRequest(BaseModel):
+    """Request schema for rendering thumbnails of many levels."""
+    set_id: Optional[str] = Field(default=None, description="Stored level set ID")
+    level_ids: List[str] = Field(default=[], description="Local level IDs (used when no set_id)")
+    size: int = Field(default=192, ge=16, le=1024, description="Thumbnail size in pixels (square)")
+    include_png: bool = Field(default=True, description="Return base64 PNG data per level")
+
+
+class ThumbnailBatchItem(BaseModel):
+    """Thumbnail of one level in a batch."""
+    level_id: str = Field(..., description="Level file ID (set level or local level)")
+    cached: bool = Field(default=False, description="Served from the on-disk thumbnail cache")
+    png_base64: Optional[str] = Field(default=None, description="Base64 PNG data")
+    error: Optional[str] = Field(default=None, description="Why no thumbnail was produced")
+
+
+class ThumbnailBatchResponse(BaseModel):
+    """Response schema for batch thumbnail rendering."""
+    total: int = Field(..., description="Levels requested")
+    rendered: int = Field(default=0, description="Thumbnails rendered now")
+    cached: int = Field(default=0, description="Thumbnails served from the cache")
+    failed: int = Field(default=0, description="Levels without a thumbnail")
+    elapsed_ms: float = Field(default=0.0, description="Wall time of the batch")
+    results: List[ThumbnailBatchItem] = Field(default=[], description="Per-level results in request order")
+
+
 class BatchAnalyzeRequest(BaseModel):
     """Request schema for batch analysis."""
     levels: Optional[List[Dict[str, Any]]] = Field(default=None, description="List of level JSONs")
     level_ids: Optional[List[str]] = Field(default=None, description="Level IDs to load from GBoost")
     board_id: Optional[str] = Field(default=None, description="GBoost board ID")
+    set_id: Optional[str] = Field(default=None, description="Stored level set ID")
 
 
 class BatchAnalyzeResultItem(BaseModel):
@@ -245,6 +278,15 @@ class BatchAnalyzeResponse(BaseModel):
     results: List[BatchAnalyzeResultItem] = Field(default=[], description="Analysis results")
 
 
+class BatchAnalyzeTableResponse(BaseModel):
+    """Response schema for columnar batch analysis of a level set."""
+    columns: List[str] = Field(..., description="Column names (level_id first)")
+    rows: List[List[Any]] = Field(default=[], description="One row per level, in column order")
+    grade_counts: Dict[str, int] = Field(default={}, description="Number of levels per grade")
+    errors: Dict[str, str] = Field(default={}, description="Errors by level_id for levels that failed")
+    execution_time_ms: int = Field(..., description="Execution time in milliseconds")
+
+
 class ErrorResponse(BaseModel):
     """Error response schema."""
     error: str = Field(..., description="Error message")
@@ -284,6 +326,10 @@ class MultiBotAssessRequest(BaseModel):
         default=False,
         description="Quick mode: fewer bots and iterations for faster results"
     )
+    common_random_numbers: bool = Field(
+        default=False,
+        description="Play iteration i of every bot with the same random draws and report paired clear-rate differences between neighbouring bots"
+    )
 
 
 class BotResultItem(BaseModel):
@@ -316,6 +362,10 @@ class MultiBotAssessResponse(BaseModel):
     # Analysis details
     difficulty_variance: float = Field(..., description="Variance in difficulty across bots")
     analysis_summary: Dict[str, Any] = Field(..., description="Detailed analysis summary")
+    paired_differences: Dict[str, Dict[str, Any]] = Field(
+        default={},
+        description="Paired clear-rate difference per neighbouring bot pair (e.g. 'casual_vs_novice'), only with common_random_numbers"
+    )
 
 
 class ComprehensiveAssessRequest(BaseModel):
@@ -357,6 +407,11 @@ class VisualSimulationRequest(BaseModel):
     )
     max_moves: int = Field(default=30, ge=10, le=100, description="Maximum moves")
     seed: Optional[int] = Field(default=None, description="Random seed for reproducibility")
+    replay_format: str = Field(
+        default="full",
+        pattern="^(full|compact)$",
+        description="'full' = per-move snapshots in bot_results, 'compact' = delta-encoded replay (bot_results left empty)"
+    )
 
 
 class VisualBotMove(BaseModel):
@@ -416,6 +471,10 @@ class VisualSimulationResponse(BaseModel):
     bot_results: List[VisualBotResult] = Field(..., description="Results for each bot")
     max_steps: int = Field(..., description="Maximum steps across all bots")
     metadata: Dict[str, Any] = Field(default={}, description="Additional metadata")
+    replay: Optional[Dict[str, Any]] = Field(
+        default=None,
+        description="Compact delta-encoded replay (see core/replay.py), set when replay_format='compact'"
+    )
 
 
 # ============================================================
@@ -530,6 +589,10 @@ class ValidatedGenerateRequest(BaseModel):
     use_best_match: bool = Field(default=True, description="Use best match strategy - always return best result after max_retries")
     use_core_bots_only: bool = Field(default=False, description="Use only 3 core bots (casual/average/expert) for faster validation - 40% speed boost")
     skip_deadlock_check: bool = Field(default=True, description="Skip internal deadlock checking for ultra-fast generation (use batch verify for post-validation)")
+    surrogate_candidates: int = Field(default=4, ge=1, le=20, description="Candidates generated per attempt and ranked by the clear-rate surrogate; only the best predicted one is simulated (1=no pre-screening, also skipped while no surrogate is trained)")
+    simulation_budget_ms: Optional[int] = Field(default=None, ge=100, le=600000, description="Wall-clock budget (ms) for bot simulation across all attempts. When set, iterations per bot come from the simulation cost model instead of difficulty bands, and retries stop once it is spent")
+    common_random_numbers: bool = Field(default=False, description="Simulate every candidate with the same random draws per iteration, so candidates are compared on paired outcomes instead of independent noisy estimates")
+    crn_seed: Optional[int] = Field(default=None, ge=1, description="Seed for common_random_numbers (random if omitted; pass the returned one to compare with a later request)")
 
 
 class ValidatedGenerateResponse(BaseModel):
@@ -550,6 +613,15 @@ class ValidatedGenerateResponse(BaseModel):
     max_gap: float = Field(default=0, description="Maximum gap from target (%)")
     match_score: float = Field(default=0, description="Match score (0-100%, higher is better)")
 
+    # Clear-rate surrogate pre-screening
+    predicted_clear_rates: Optional[Dict[str, float]] = Field(default=None, description="Surrogate-predicted clear rates for the returned level (None if no surrogate is trained)")
+    surrogate_error: Optional[float] = Field(default=None, description="Mean absolute error of the surrogate prediction against the simulated clear rates (0-1)")
+    surrogate_rejected: int = Field(default=0, description="Candidates rejected by the surrogate without simulation")
+
+    # Common random numbers
+    crn_seed: Optional[int] = Field(default=None, description="Seed the candidates were simulated with (None unless common_random_numbers)")
+    paired_differences: Optional[Dict[str, Dict[str, Any]]] = Field(default=None, description="Per bot, paired clear-rate difference between the returned level and the best candidate simulated before it")
+
 
 # ============================================================
 # Level Enhancement Schemas (Incremental difficulty adjustment)
@@ -588,12 +660,16 @@ class BatchVerifyLevelItem(BaseModel):
 
 class BatchVerifyRequest(BaseModel):
     """Request schema for batch level verification."""
-    levels: List[BatchVerifyLevelItem] = Field(..., description="List of levels to verify")
+    levels: List[BatchVerifyLevelItem] = Field(default=[], description="List of levels to verify")
+    set_id: Optional[str] = Field(default=None, description="Verify a stored level set instead of uploaded levels")
+    board_id: Optional[str] = Field(default=None, description="GBoost board ID (with level_ids) to verify board levels")
+    level_ids: Optional[List[str]] = Field(default=None, description="Level IDs to verify from the GBoost board")
     iterations: int = Field(default=20, ge=3, le=100, description="Simulation iterations per bot (default: 20 for balance of speed/accuracy)")
     tolerance: float = Field(default=15.0, ge=1.0, le=50.0, description="Acceptable gap percentage from target")
     use_core_bots_only: bool = Field(default=True, description="Use only 3 core bots (casual/average/expert) for faster verification")
     fast_mode: bool = Field(default=True, description="Use fast verification profiles with reduced lookahead depth")
     early_termination: bool = Field(default=True, description="Stop iterations early when results are conclusive (100% or 0% clear)")
+    simulation_budget_ms: Optional[int] = Field(default=None, ge=100, le=3600000, description="Wall-clock budget (ms) for the whole batch. When set, iterations per level and bot come from the simulation cost model instead of the fixed 'iterations'")
 
 
 class BatchVerifyResultItem(BaseModel):
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""Per-Turn Move Scoring Benchmark Script.
+
+Plays benchmark levels with each bot and, on every turn, scores all legal
+moves twice: once with a ScoringContext shared by the whole turn, and once
+with a context rebuilt for every move (what each call used to recompute).
+The RNG is rewound between the two passes so both produce the same scores,
+which the script checks, and the game continues exactly as it would have.
+
+Usage:
+    python benchmark_move_scoring.py [--tier TIER] [--iterations N] [--output FILE]
+"""
+
+import argparse
+import json
+import sys
+import time
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.bot_simulator import BotSimulator
+from app.models.bot_profile import BotType, get_profile
+from app.models.benchmark_level import DifficultyTier, get_tier_levels
+
+
+@dataclass
+class ScoringResult:
+    """Per-turn scoring cost for one bot across the benchmark levels."""
+    bot: str
+    turns: int
+    moves_scored: int
+    per_move_context_us_per_turn: float
+    shared_context_us_per_turn: float
+    speedup: float
+    identical_scores: bool
+
+
+@dataclass
+class ScoringSuite:
+    """Complete move scoring benchmark results."""
+    timestamp: str
+    tiers: List[str]
+    level_count: int
+    iterations: int
+    results: List[Dict]
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), indent=2, ensure_ascii=False)
+
+
+class _TurnTimer:
+    """Times both scoring variants each time the simulator selects a move."""
+
+    def __init__(self, simulator: BotSimulator):
+        self.simulator = simulator
+        self.select = simulator._select_move_with_profile
+        self.turns = 0
+        self.moves_scored = 0
+        self.per_move_seconds = 0.0
+        self.shared_seconds = 0.0
+        self.identical = True
+
+    def __call__(self, moves, state, profile):
+        sim = self.simulator
+        rng_state = sim._rng.getstate()
+
+        start = time.perf_counter()
+        per_move = [sim._score_move_with_profile(m, state, profile) for m in moves]
+        self.per_move_seconds += time.perf_counter() - start
+        sim._rng.setstate(rng_state)
+
+        start = time.perf_counter()
+        context = sim._build_scoring_context(state)
+        shared = [sim._score_move_with_profile(m, state, profile, context) for m in moves]
+        self.shared_seconds += time.perf_counter() - start
+        sim._rng.setstate(rng_state)
+
+        self.turns += 1
+        self.moves_scored += len(moves)
+        self.identical = self.identical and per_move == shared
+        return self.select(moves, state, profile)
+
+
+def benchmark_bot(levels: List[Dict], bot_type: BotType, iterations: int) -> ScoringResult:
+    """Measure per-turn scoring cost for one bot over every level."""
+    simulator = BotSimulator()
+    timer = _TurnTimer(simulator)
+    simulator._select_move_with_profile = timer
+    profile = get_profile(bot_type)
+
+    for level_json in levels:
+        simulator.simulate_with_profile(level_json, profile, iterations=iterations, seed=42)
+
+    turns = max(timer.turns, 1)
+    per_move_us = timer.per_move_seconds / turns * 1e6
+    shared_us = timer.shared_seconds / turns * 1e6
+    return ScoringResult(
+        bot=bot_type.value,
+        turns=timer.turns,
+        moves_scored=timer.moves_scored,
+        per_move_context_us_per_turn=per_move_us,
+        shared_context_us_per_turn=shared_us,
+        speedup=per_move_us / shared_us if shared_us else 0.0,
+        identical_scores=timer.identical,
+    )
+
+
+def run_scoring_suite(tiers: List[DifficultyTier], iterations: int = 3) -> ScoringSuite:
+    """Run the scoring benchmark for every bot."""
+    levels = [level.to_simulator_format() for tier in tiers for level in get_tier_levels(tier)]
+
+    print(f"\n{'='*60}")
+    print("Per-Turn Move Scoring Benchmark")
+    print(f"{'='*60}")
+    print(f"Tiers: {[t.value for t in tiers]}  Levels: {len(levels)}  Iterations: {iterations}")
+    print(f"{'='*60}\n")
+
+    results = []
+    for bot_type in BotType:
+        print(f"Measuring {bot_type.value}...", end=" ", flush=True)
+        result = benchmark_bot(levels, bot_type, iterations)
+        results.append(result)
+        print(f"{result.per_move_context_us_per_turn:8.1f}us -> {result.shared_context_us_per_turn:8.1f}us per turn"
+              f"  ({result.speedup:.2f}x, {result.turns} turns, "
+              f"{'identical' if result.identical_scores else 'MISMATCH'})")
+
+    return ScoringSuite(
+        timestamp=datetime.now().isoformat(),
+        tiers=[t.value for t in tiers],
+        level_count=len(levels),
+        iterations=iterations,
+        results=[asdict(r) for r in results],
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark per-turn move scoring cost")
+    parser.add_argument("--tier", "-t", type=str, default="all",
+                       choices=[t.value for t in DifficultyTier] + ["all"],
+                       help="Which tier(s) to play (default: all)")
+    parser.add_argument("--iterations", "-i", type=int, default=3,
+                       help="Games per level and bot (default: 3)")
+    parser.add_argument("--output", "-o", type=str, default=None,
+                       help="Output file for results (JSON)")
+
+    args = parser.parse_args()
+    tiers = list(DifficultyTier) if args.tier == "all" else [DifficultyTier(args.tier)]
+    suite = run_scoring_suite(tiers, iterations=args.iterations)
+
+    if args.output:
+        output_path = Path(args.output)
+        output_path.write_text(suite.to_json(), encoding="utf-8")
+        print(f"\nResults saved to: {output_path}")
+
+    if not all(r["identical_scores"] for r in suite.results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""Application Startup Benchmark Script.
+
+Measures what a fresh uvicorn worker or ProcessPoolExecutor child pays
+before it can do useful work: cold import time and peak RSS of the modules
+each process loads, plus spawn-to-first-result latency of a process pool.
+Every measurement runs in a fresh interpreter so module caches never leak
+between samples.
+
+Usage:
+    python benchmark_startup.py [--repeat N] [--output FILE]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+BACKEND_DIR = Path(__file__).parent.parent
+
+# (label, statement executed in a fresh interpreter)
+STARTUP_TARGETS = [
+    ("api_worker", "import app.main"),
+    ("pool_child", "import app.core.bot_simulator"),
+    ("generator", "import app.core.generator"),
+    ("benchmark_levels", "from app.models.benchmark_level import get_tier_levels, DifficultyTier; get_tier_levels(DifficultyTier.EASY)"),
+    ("pattern_templates", "from app.core.pattern_templates import PATTERN_TEMPLATES; len(PATTERN_TEMPLATES)"),
+]
+
+_PROBE = """
+import resource, sys, time
+t0 = time.perf_counter()
+exec(sys.argv[1])
+elapsed = (time.perf_counter() - t0) * 1000
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+if sys.platform == "darwin":
+    rss /= 1024
+print(f"{elapsed:.3f} {rss / 1024:.2f} {len(sys.modules)}")
+"""
+
+_POOL_PROBE = """
+import sys, time
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing as mp
+from app.core.bot_simulator import _simulate_single_bot
+
+LEVEL = {"layer": 1, "randSeed": 0, "useTileCount": 3,
+         "layer_0": {"col": 5, "tiles": {f"{x}_{y}": ["t0"] for x in range(3) for y in range(3)}}}
+
+if __name__ == "__main__":
+    t0 = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=1, mp_context=mp.get_context(sys.argv[1])) as pool:
+        pool.submit(_simulate_single_bot, ("average", LEVEL, 1, 30)).result()
+    print(f"{(time.perf_counter() - t0) * 1000:.3f}")
+"""
+
+
+@dataclass
+class StartupResult:
+    """Cold-start measurements for one import target."""
+    label: str
+    statement: str
+    import_ms_median: float
+    import_ms_min: float
+    peak_rss_mb: float
+    module_count: int
+
+
+@dataclass
+class StartupSuite:
+    """Complete startup benchmark results."""
+    timestamp: str
+    python: str
+    repeat: int
+    results: List[Dict]
+    pool_first_result_ms: Dict[str, float]
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), indent=2, ensure_ascii=False)
+
+
+def _run_probe(code: str, *argv: str) -> str:
+    completed = subprocess.run(
+        [sys.executable, "-c", code, *argv],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return completed.stdout.strip().splitlines()[-1]
+
+
+def measure_import(label: str, statement: str, repeat: int) -> StartupResult:
+    """Measure a statement's cold import cost over several fresh interpreters."""
+    times, rss, modules = [], [], 0
+    for _ in range(repeat):
+        elapsed, peak_mb, module_count = _run_probe(_PROBE, statement).split()
+        times.append(float(elapsed))
+        rss.append(float(peak_mb))
+        modules = int(module_count)
+    return StartupResult(
+        label=label,
+        statement=statement,
+        import_ms_median=statistics.median(times),
+        import_ms_min=min(times),
+        peak_rss_mb=max(rss),
+        module_count=modules,
+    )
+
+
+def measure_pool(start_method: str, repeat: int) -> Optional[float]:
+    """Median wall time to spawn a one-worker pool and get one bot result."""
+    try:
+        samples = [float(_run_probe(_POOL_PROBE, start_method)) for _ in range(repeat)]
+    except subprocess.CalledProcessError:
+        return None
+    return statistics.median(samples)
+
+
+def run_startup_suite(repeat: int = 5) -> StartupSuite:
+    """Run every startup measurement."""
+    print(f"\n{'='*60}")
+    print("Application Startup Benchmark")
+    print(f"{'='*60}")
+    print(f"Python: {sys.version.split()[0]}  Repeat: {repeat}")
+    print(f"{'='*60}\n")
+
+    results = []
+    for label, statement in STARTUP_TARGETS:
+        print(f"Measuring {label}...", end=" ", flush=True)
+        result = measure_import(label, statement, repeat)
+        results.append(result)
+        print(f"{result.import_ms_median:7.1f}ms  RSS {result.peak_rss_mb:6.1f}MB  modules {result.module_count}")
+
+    pool_times = {}
+    for method in ("fork", "spawn"):
+        print(f"Measuring process pool ({method})...", end=" ", flush=True)
+        elapsed = measure_pool(method, max(1, repeat // 2))
+        if elapsed is None:
+            print("unavailable")
+            continue
+        pool_times[method] = elapsed
+        print(f"{elapsed:7.1f}ms to first result")
+
+    return StartupSuite(
+        timestamp=datetime.now().isoformat(),
+        python=sys.version.split()[0],
+        repeat=repeat,
+        results=[asdict(r) for r in results],
+        pool_first_result_ms=pool_times,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark application startup cost")
+    parser.add_argument("--repeat", "-r", type=int, default=5,
+                       help="Fresh interpreters per measurement (default: 5)")
+    parser.add_argument("--output", "-o", type=str, default=None,
+                       help="Output file for results (JSON)")
+
+    args = parser.parse_args()
+    suite = run_startup_suite(repeat=args.repeat)
+
+    if args.output:
+        output_path = Path(args.output)
+        output_path.write_text(suite.to_json(), encoding="utf-8")
+        print(f"\nResults saved to: {output_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""Per-Iteration Game State Memory Benchmark Script.
+
+Measures what one simulation iteration allocates on the largest benchmark
+levels: the state copy every iteration starts from (_fast_copy_state of the
+level's base state) and the peak traced memory of playing one game from it.
+Concurrent assessments keep one such state per iteration in flight, so these
+numbers bound how many a worker can run before hitting its memory limit.
+
+Usage:
+    python benchmark_state_memory.py [--levels N] [--copies N] [--bot BOT] [--output FILE]
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.bot_simulator import BotSimulator
+from app.models.bot_profile import BotType, get_profile
+from app.models.benchmark_level import DifficultyTier, get_tier_levels
+
+
+@dataclass
+class MemoryResult:
+    """Per-iteration memory cost of one benchmark level."""
+    level_id: str
+    tiles: int
+    state_copy_kb: float
+    game_peak_kb: float
+    copy_us: float
+
+
+@dataclass
+class MemorySuite:
+    """Complete state memory benchmark results."""
+    timestamp: str
+    bot: str
+    copies: int
+    results: List[Dict]
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), indent=2, ensure_ascii=False)
+
+
+def largest_levels(count: int) -> List[Dict]:
+    """Benchmark levels with the most tiles, largest first."""
+    levels = []
+    for tier in DifficultyTier:
+        for level in get_tier_levels(tier):
+            level_json = level.to_simulator_format()
+            level_json["_id"] = level.id
+            levels.append(level_json)
+
+    def tile_count(level_json: Dict) -> int:
+        return sum(len(v.get("tiles", {})) for k, v in level_json.items() if k.startswith("layer_"))
+
+    levels.sort(key=tile_count, reverse=True)
+    for level_json in levels:
+        level_json["_tiles"] = tile_count(level_json)
+    return levels[:count]
+
+
+def measure_level(level_json: Dict, bot_type: BotType, copies: int) -> MemoryResult:
+    """Measure state copy size, game peak and copy time for one level."""
+    simulator = BotSimulator()
+    base_state = simulator._create_initial_state(level_json, level_json.get("max_moves", 50))
+    simulator._precompute_blocking_map(base_state)
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    states = [simulator._fast_copy_state(base_state) for _ in range(copies)]
+    state_copy_bytes = (tracemalloc.get_traced_memory()[0] - before) / copies
+    del states
+
+    simulator._rng.seed(42)
+    state = simulator._fast_copy_state(base_state)
+    tracemalloc.reset_peak()
+    before = tracemalloc.get_traced_memory()[0]
+    simulator._play_game(state, get_profile(bot_type))
+    game_peak_bytes = tracemalloc.get_traced_memory()[1] - before
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for _ in range(copies):
+        simulator._fast_copy_state(base_state)
+    copy_us = (time.perf_counter() - start) / copies * 1e6
+
+    return MemoryResult(
+        level_id=level_json["_id"],
+        tiles=level_json["_tiles"],
+        state_copy_kb=state_copy_bytes / 1024,
+        game_peak_kb=game_peak_bytes / 1024,
+        copy_us=copy_us,
+    )
+
+
+def run_memory_suite(level_count: int = 5, copies: int = 100, bot_type: BotType = BotType.OPTIMAL) -> MemorySuite:
+    """Run the memory benchmark on the largest benchmark levels."""
+    levels = largest_levels(level_count)
+
+    print(f"\n{'='*60}")
+    print("Per-Iteration Game State Memory Benchmark")
+    print(f"{'='*60}")
+    print(f"Levels: {len(levels)} largest  Copies: {copies}  Bot: {bot_type.value}")
+    print(f"{'='*60}\n")
+    print(f"{'Level':<14} {'Tiles':>6} {'Copy KB':>9} {'Game peak KB':>13} {'Copy us':>9}")
+
+    results = []
+    for level_json in levels:
+        result = measure_level(level_json, bot_type, copies)
+        results.append(result)
+        print(f"{result.level_id:<14} {result.tiles:>6} {result.state_copy_kb:>9.1f} "
+              f"{result.game_peak_kb:>13.1f} {result.copy_us:>9.0f}")
+
+    return MemorySuite(
+        timestamp=datetime.now().isoformat(),
+        bot=bot_type.value,
+        copies=copies,
+        results=[asdict(r) for r in results],
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark per-iteration game state memory")
+    parser.add_argument("--levels", "-l", type=int, default=5,
+                       help="Number of largest benchmark levels to measure (default: 5)")
+    parser.add_argument("--copies", "-c", type=int, default=100,
+                       help="State copies per level, i.e. iterations (default: 100)")
+    parser.add_argument("--bot", "-b", type=str, default=BotType.OPTIMAL.value,
+                       choices=[t.value for t in BotType],
+                       help="Bot that plays the measured game (default: optimal)")
+    parser.add_argument("--output", "-o", type=str, default=None,
+                       help="Output file for results (JSON)")
+
+    args = parser.parse_args()
+    suite = run_memory_suite(args.levels, args.copies, BotType(args.bot))
+
+    if args.output:
+        output_path = Path(args.output)
+        output_path.write_text(suite.to_json(), encoding="utf-8")
+        print(f"\nResults saved to: {output_path}")
+
+
+if __name__ == "__main__":
+    main()
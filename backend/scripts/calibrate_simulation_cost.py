@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Simulation Cost Model Calibration Script.
+
+Fits the per-iteration simulation cost model that validated generation and
+batch verification use to turn a wall-clock budget into iterations per bot.
+Samples come from the timing log both append to on every simulation;
+``--collect N`` adds samples by timing N stored levels with every bot
+profile first (in this process, one run at a time, so timings are not
+distorted by pool contention).
+
+Prints the held-out relative error per profile and saves the model, which
+the running server picks up on its next request. ``--bundle`` saves it as
+the default model shipped with the app instead.
+
+Usage:
+    python calibrate_simulation_cost.py [--collect N] [--iterations N] [--ridge R] [--bundle]
+"""
+
+import argparse
+import json
+import random
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.bot_simulator import BotSimulator
+from app.core.simulation_cost import (
+    BUNDLED_MODEL_PATH,
+    DEFAULT_MODEL_PATH,
+    DEFAULT_SAMPLES_PATH,
+    CostSampleLog,
+    SimulationCostModel,
+    cost_key,
+)
+from app.models.bot_profile import BotType, get_profile
+
+LEVEL_SETS_DIR = Path(__file__).parent.parent / "app" / "storage" / "level_sets"
+
+
+def collect_samples(log: CostSampleLog, count: int, iterations: int, seed: int) -> int:
+    """Time stored levels with every bot profile and append them to the timing log."""
+    level_files = sorted(LEVEL_SETS_DIR.glob("*/level_*.json"))
+    random.Random(seed).shuffle(level_files)
+
+    simulator = BotSimulator()
+    collected = 0
+    for level_file in level_files[:count]:
+        with open(level_file, encoding="utf-8") as f:
+            level_json = json.load(f)
+        max_moves = level_json.get("max_moves", 50)
+        timings = {}
+        for bot_type in BotType:
+            for fast_mode in (False, True):
+                result = simulator.simulate_with_profile(
+                    level_json, get_profile(bot_type, fast_mode=fast_mode),
+                    iterations=iterations, max_moves=max_moves,
+                )
+                timings[cost_key(bot_type.value, fast_mode)] = (result.iterations, result.elapsed_ms)
+        log.append(level_json, timings, max_moves)
+        collected += 1
+        print(f"  [{collected}/{count}] {level_file.parent.name}/{level_file.stem}: "
+              + " ".join(f"{bot}={ms / n:.1f}ms" for bot, (n, ms) in timings.items() if "_fast" not in bot))
+    return collected
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Calibrate the simulation cost model")
+    parser.add_argument("--collect", "-c", type=int, default=0,
+                       help="Time this many stored levels into the sample log first (default: 0)")
+    parser.add_argument("--iterations", "-i", type=int, default=3,
+                       help="Games per bot profile when collecting samples (default: 3)")
+    parser.add_argument("--seed", type=int, default=42,
+                       help="Seed for choosing stored levels to collect (default: 42)")
+    parser.add_argument("--ridge", "-r", type=float, default=1.0,
+                       help="Ridge regularization strength (default: 1.0)")
+    parser.add_argument("--holdout-every", type=int, default=5,
+                       help="Hold out every Nth sample to measure error (default: 5)")
+    parser.add_argument("--samples", type=str, default=str(DEFAULT_SAMPLES_PATH),
+                       help="Timing sample log (JSONL)")
+    parser.add_argument("--model", type=str, default=str(DEFAULT_MODEL_PATH),
+                       help="Where to save the calibrated model")
+    parser.add_argument("--bundle", action="store_true",
+                       help=f"Save as the bundled default model ({BUNDLED_MODEL_PATH.name})")
+
+    args = parser.parse_args()
+    log = CostSampleLog(Path(args.samples))
+
+    if args.collect:
+        print(f"\nTiming {args.collect} stored levels ({args.iterations} games per bot profile)...")
+        collect_samples(log, args.collect, args.iterations, args.seed)
+
+    samples = log.load()
+    print(f"\n{'='*60}")
+    print("Simulation Cost Model Calibration")
+    print(f"{'='*60}")
+    print(f"Samples: {len(samples)}  Ridge: {args.ridge}  Holdout: every {args.holdout_every}")
+    print(f"{'='*60}\n")
+
+    try:
+        model = SimulationCostModel.fit(samples, ridge=args.ridge, holdout_every=args.holdout_every)
+    except ValueError as e:
+        print(f"Calibration failed: {e}")
+        sys.exit(1)
+
+    print(f"{'Profile':<14} {'MAPE':>8} {'P90 APE':>8} {'Held out':>10}")
+    for bot, metrics in sorted(model.metrics.items()):
+        print(f"{bot:<14} {metrics['mape']:>8.1%} {metrics['p90_ape']:>8.1%} {metrics['count']:>10}")
+
+    model_path = BUNDLED_MODEL_PATH if args.bundle else Path(args.model)
+    model.save(model_path)
+    print(f"\nModel saved to: {model_path}")
+
+
+if __name__ == "__main__":
+    main()
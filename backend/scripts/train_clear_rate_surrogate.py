@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Clear Rate Surrogate Training Script.
+
+Retrains the clear-rate surrogate used by validated generation to
+pre-screen candidates. Samples come from the log that validated generation
+appends to on every simulated candidate; ``--collect N`` adds samples by
+simulating N stored levels with every bot first (useful to bootstrap an
+empty log).
+
+Prints the held-out prediction error per bot and saves the model, which the
+running server picks up on its next request.
+
+Usage:
+    python train_clear_rate_surrogate.py [--collect N] [--iterations N] [--ridge R] [--output FILE]
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.bot_simulator import _get_process_pool, _simulate_single_bot
+from app.core.clear_rate_surrogate import (
+    DEFAULT_MODEL_PATH,
+    DEFAULT_SAMPLES_PATH,
+    SURROGATE_BOTS,
+    ClearRateSurrogate,
+    SurrogateSampleLog,
+    extract_features,
+)
+
+LEVEL_SETS_DIR = Path(__file__).parent.parent / "app" / "storage" / "level_sets"
+
+
+def collect_samples(log: SurrogateSampleLog, count: int, iterations: int, seed: int) -> int:
+    """Simulate stored levels with every bot and append them to the sample log."""
+    level_files = sorted(LEVEL_SETS_DIR.glob("*/level_*.json"))
+    random.Random(seed).shuffle(level_files)
+
+    pool = _get_process_pool()
+    collected = 0
+    for level_file in level_files[:count]:
+        with open(level_file, encoding="utf-8") as f:
+            level_json = json.load(f)
+        max_moves = level_json.get("max_moves", 50)
+        args = [(bot, level_json, iterations, max_moves) for bot in SURROGATE_BOTS]
+        clear_rates = {bot: rate for bot, rate, _, _ in pool.map(_simulate_single_bot, args)}
+        log.append(level_json, clear_rates, iterations)
+        collected += 1
+        print(f"  [{collected}/{count}] {level_file.parent.name}/{level_file.stem}: "
+              + " ".join(f"{bot}={rate:.2f}" for bot, rate in clear_rates.items()))
+    return collected
+
+
+def prediction_time_us(model: ClearRateSurrogate, samples: List[Dict]) -> float:
+    """Average time of one prediction from already extracted features."""
+    features = [s["features"] for s in samples[:500]]
+    start = time.perf_counter()
+    for f in features:
+        model.predict_features(f)
+    return (time.perf_counter() - start) / max(len(features), 1) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train the clear-rate surrogate model")
+    parser.add_argument("--collect", "-c", type=int, default=0,
+                       help="Simulate this many stored levels into the sample log first (default: 0)")
+    parser.add_argument("--iterations", "-i", type=int, default=20,
+                       help="Games per bot when collecting samples (default: 20)")
+    parser.add_argument("--seed", type=int, default=42,
+                       help="Seed for choosing stored levels to collect (default: 42)")
+    parser.add_argument("--ridge", "-r", type=float, default=1.0,
+                       help="Ridge regularization strength (default: 1.0)")
+    parser.add_argument("--holdout-every", type=int, default=5,
+                       help="Hold out every Nth sample to measure error (default: 5)")
+    parser.add_argument("--samples", type=str, default=str(DEFAULT_SAMPLES_PATH),
+                       help="Sample log (JSONL)")
+    parser.add_argument("--model", type=str, default=str(DEFAULT_MODEL_PATH),
+                       help="Where to save the trained model")
+    parser.add_argument("--output", "-o", type=str, default=None,
+                       help="Output file for training metrics (JSON)")
+
+    args = parser.parse_args()
+    log = SurrogateSampleLog(Path(args.samples))
+
+    if args.collect:
+        print(f"\nCollecting {args.collect} stored levels ({args.iterations} games per bot)...")
+        collect_samples(log, args.collect, args.iterations, args.seed)
+
+    samples = log.load()
+    print(f"\n{'='*60}")
+    print("Clear Rate Surrogate Training")
+    print(f"{'='*60}")
+    print(f"Samples: {len(samples)}  Ridge: {args.ridge}  Holdout: every {args.holdout_every}")
+    print(f"{'='*60}\n")
+
+    try:
+        model = ClearRateSurrogate.fit(samples, ridge=args.ridge, holdout_every=args.holdout_every)
+    except ValueError as e:
+        print(f"Training failed: {e}")
+        sys.exit(1)
+
+    print(f"{'Bot':<10} {'MAE':>8} {'RMSE':>8} {'Held out':>10}")
+    for bot, metrics in model.metrics.items():
+        print(f"{bot:<10} {metrics['mae']:>8.3f} {metrics['rmse']:>8.3f} {metrics['count']:>10}")
+
+    level_files = sorted(LEVEL_SETS_DIR.glob("*/level_*.json"))[:50]
+    feature_start = time.perf_counter()
+    for level_file in level_files:
+        with open(level_file, encoding="utf-8") as f:
+            extract_features(json.load(f))
+    feature_us = (time.perf_counter() - feature_start) / max(len(level_files), 1) * 1e6
+    print(f"\nFeature extraction: {feature_us:.0f}us per level (incl. file load)")
+    print(f"Prediction:         {prediction_time_us(model, samples):.1f}us per level")
+
+    model.save(Path(args.model))
+    print(f"\nModel saved to: {args.model}")
+
+    if args.output:
+        output_path = Path(args.output)
+        output_path.write_text(json.dumps(model.to_dict(), indent=2), encoding="utf-8")
+        print(f"Metrics saved to: {output_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,13 @@
+"""Shared test fixtures."""
+import pytest
+
+from app.core import clear_rate_surrogate, simulation_cost
+
+
+@pytest.fixture(autouse=True)
+def isolated_sample_logs(tmp_path, monkeypatch):
+    """Keep simulations run by tests out of the real training/calibration sample logs."""
+    monkeypatch.setattr(clear_rate_surrogate, "_sample_log",
+                        clear_rate_surrogate.SurrogateSampleLog(tmp_path / "surrogate_samples.jsonl"))
+    monkeypatch.setattr(simulation_cost, "_cost_log",
+                        simulation_cost.CostSampleLog(tmp_path / "cost_samples.jsonl"))
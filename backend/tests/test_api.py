@@ -1,4 +1,6 @@
 """Tests for API endpoints."""
+import json
+
 import pytest
 from fastapi.testclient import TestClient
 from app.main import app
@@ -218,6 +220,63 @@ class TestGenerateEndpoint:
         data = response.json()
         assert 0 <= data["actual_difficulty"] <= 1
 
+    def test_validated_generation_common_random_numbers(self, client):
+        """Candidates are simulated with the requested CRN seed and compared pairwise."""
+        response = client.post("/api/generate/validated", json={
+            "target_difficulty": 0.3,
+            "simulation_iterations": 2,
+            "max_retries": 3,
+            "use_best_match": True,
+            "surrogate_candidates": 1,
+            "common_random_numbers": True,
+            "crn_seed": 9,
+        })
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["crn_seed"] == 9
+        for diff in (data["paired_differences"] or {}).values():
+            assert diff["n"] > 0 and -1 <= diff["mean_difference"] <= 1
+
+
+class TestSurrogateEndpoints:
+    """Tests for clear-rate surrogate pre-screening in validated generation."""
+
+    @pytest.fixture(autouse=True)
+    def isolated_surrogate(self, tmp_path, monkeypatch):
+        from app.core import clear_rate_surrogate
+        monkeypatch.setattr(clear_rate_surrogate, "DEFAULT_MODEL_PATH", tmp_path / "model.json")
+        return clear_rate_surrogate
+
+    def test_status_untrained(self, client):
+        data = client.get("/api/generate/surrogate").json()
+        assert data["trained"] is False
+
+    def test_validated_generation_prescreens(self, client, isolated_surrogate):
+        """Candidates are ranked by the surrogate and the simulated one is logged."""
+        samples = [
+            {"features": {"move_ratio": i / 40}, "clear_rates": {bot: 1 - i / 40 for bot in isolated_surrogate.SURROGATE_BOTS}}
+            for i in range(40)
+        ]
+        isolated_surrogate.ClearRateSurrogate.fit(samples).save(isolated_surrogate.DEFAULT_MODEL_PATH)
+
+        response = client.post("/api/generate/validated", json={
+            "target_difficulty": 0.3,
+            "simulation_iterations": 2,
+            "max_retries": 1,
+            "surrogate_candidates": 3,
+        })
+        assert response.status_code == 200
+        data = response.json()
+        assert set(data["predicted_clear_rates"]) >= set(data["bot_clear_rates"])
+        assert data["surrogate_error"] is not None
+        assert 0 <= data["surrogate_rejected"] <= 2
+
+        assert len(isolated_surrogate.get_surrogate_sample_log().load()) == 1
+        status = client.get("/api/generate/surrogate").json()
+        assert status["trained"] is True
+        assert sum(e["count"] for e in status["online_error"].values()) == len(data["bot_clear_rates"])
+
 
 class TestSimulateEndpoint:
     """Tests for simulate endpoint."""
@@ -271,6 +330,233 @@ class TestSimulateEndpoint:
 
             assert response.status_code == 200
 
+    def test_simulate_seeded_parallel(self, client, sample_level):
+        """Seeded runs are reproducible and report a confidence interval."""
+        request = {
+            "level_json": sample_level,
+            "iterations": 300,
+            "strategy": "random",
+            "seed": 11,
+        }
+        first = client.post("/api/simulate", json=request).json()
+        second = client.post("/api/simulate", json=request).json()
+
+        assert first == second
+        assert first["iterations"] == 300
+        low, high = first["clear_rate_ci"]
+        assert low <= first["clear_rate"] <= high
+
+
+class TestVisualSimulationEndpoint:
+    """Tests for visual simulation endpoints."""
+
+    def test_visual_stream_matches_buffered(self, client, sample_level):
+        """Streamed per-bot results equal the buffered /visual response."""
+        request = {"level_json": sample_level, "seed": 5, "bot_types": ["novice", "expert"]}
+        buffered = client.post("/api/simulate/visual", json=request)
+        assert buffered.status_code == 200
+        expected = buffered.json()
+
+        with client.stream("POST", "/api/simulate/visual/stream", json=request) as response:
+            assert response.status_code == 200
+            events = [json.loads(line) for line in response.iter_lines() if line]
+
+        types = [e["type"] for e in events]
+        assert types[0] == "meta"
+        assert types[1] == "initial_state"
+        assert types[-1] == "done"
+        assert types.count("bot_result") == 2
+        for event in events:
+            if event["type"] == "bot_result":
+                assert event["result"] == expected["bot_results"][event["index"]]
+        assert events[-1]["max_steps"] == expected["max_steps"]
+
+    def test_visual_compact_replay(self, client, sample_level):
+        """replay_format=compact decodes to the same bot results as full."""
+        from app.core.replay import decode_replay
+
+        request = {"level_json": sample_level, "seed": 3, "bot_types": ["casual", "optimal"]}
+        full = client.post("/api/simulate/visual", json=request).json()
+        compact = client.post("/api/simulate/visual", json={**request, "replay_format": "compact"}).json()
+
+        assert compact["bot_results"] == []
+        assert decode_replay(compact["replay"]) == full["bot_results"]
+        assert compact["initial_state"] == full["initial_state"]
+
+    def test_visual_stream_sse(self, client, sample_level):
+        """SSE format frames each event with an event name."""
+        response = client.post(
+            "/api/simulate/visual/stream?format=sse",
+            json={"level_json": sample_level, "bot_types": ["casual"]},
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert response.text.startswith("event: meta\ndata: ")
+        assert "event: done" in response.text
+
+    def test_visual_stream_invalid_bot(self, client, sample_level):
+        """Invalid bot types are rejected before streaming starts."""
+        response = client.post(
+            "/api/simulate/visual/stream",
+            json={"level_json": sample_level, "bot_types": ["robot"]},
+        )
+        assert response.status_code == 400
+
+
+class TestBenchmarkEndpoints:
+    """Tests for the cached benchmark dashboard and validation endpoints."""
+
+    @pytest.fixture(autouse=True)
+    def isolated_store(self, tmp_path, monkeypatch):
+        from app.core import benchmark_store
+        monkeypatch.setattr(benchmark_store, "_store", benchmark_store.BenchmarkResultStore(tmp_path / "results.json"))
+
+    def test_dashboard_served_from_store(self, client):
+        """The second request returns the stored dashboard without recomputing."""
+        first = client.get("/api/simulate/benchmark/dashboard/summary")
+        assert first.status_code == 200
+        data = first.json()
+        assert "computed_at" in data and "fingerprint" in data
+        sample = data["tiers"]["easy"]["sample_performance"]
+        assert 0 <= sample["optimal_clear_rate"] <= 1
+
+        second = client.get("/api/simulate/benchmark/dashboard/summary").json()
+        assert second["computed_at"] == data["computed_at"]
+
+    def test_validate_reuses_bot_results(self, client):
+        """Repeated validation of a level reuses the stored per-bot results."""
+        level_id = client.get("/api/simulate/benchmark/list").json()["easy"][0]["id"]
+        url = f"/api/simulate/benchmark/validate/{level_id}?iterations=5"
+
+        first = client.post(url)
+        assert first.status_code == 200
+        second = client.post(url)
+        assert [r["computed_at"] for r in second.json()["bot_results"]] == \
+            [r["computed_at"] for r in first.json()["bot_results"]]
+        assert second.json()["bot_results"] == first.json()["bot_results"]
+
+
+class TestLevelSetDuplicatesEndpoint:
+    """Tests for near-duplicate detection over stored level sets."""
+
+    @pytest.fixture(autouse=True)
+    def level_sets_dir(self, tmp_path, monkeypatch, sample_level):
+        from app.api.routes import simulate
+        monkeypatch.setattr(simulate, "LEVEL_SETS_DIR", tmp_path)
+
+        different = {"layer": 8, "layer_0": {"col": "9", "row": "9", "num": "2",
+                                             "tiles": {"0_0": ["t0", ""], "8_8": ["t0", ""]}}}
+        for set_id, levels in {"set_a": [sample_level, different], "set_b": [sample_level]}.items():
+            set_dir = tmp_path / set_id
+            set_dir.mkdir()
+            for i, level in enumerate(levels, 1):
+                (set_dir / f"level_{i:03d}.json").write_text(json.dumps(level), encoding="utf-8")
+
+    def test_duplicates_within_set(self, client):
+        response = client.get("/api/simulate/level-sets/set_a/duplicates")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["level_count"] == 2
+        assert data["duplicates"] == []
+
+    def test_duplicates_across_sets(self, client):
+        data = client.get("/api/simulate/level-sets/set_a/duplicates?include_other_sets=true").json()
+        assert data["compared_level_count"] == 3
+        assert [(d["level_a"], d["level_b"], d["similarity"]) for d in data["duplicates"]] == \
+            [("set_a/level_001", "set_b/level_001", 1.0)]
+
+    def test_unknown_set(self, client):
+        response = client.get("/api/simulate/level-sets/missing/duplicates")
+        assert response.status_code == 404
+
+
+class TestLevelSetStreaming:
+    """Tests for NDJSON streaming import/export of level sets."""
+
+    @pytest.fixture(autouse=True)
+    def storage_dirs(self, tmp_path, monkeypatch):
+        from app.api.routes import simulate
+        monkeypatch.setattr(simulate, "LEVEL_SETS_DIR", tmp_path / "level_sets")
+        monkeypatch.setattr(simulate, "LOCAL_LEVELS_DIR", tmp_path / "local_levels")
+        (tmp_path / "level_sets").mkdir()
+        (tmp_path / "local_levels").mkdir()
+        return tmp_path
+
+    @staticmethod
+    def ndjson(records):
+        return "".join(json.dumps(r) + "\n" for r in records).encode("utf-8")
+
+    def import_set(self, client, body, **params):
+        response = client.post("/api/simulate/level-sets/import-stream", content=body, params=params)
+        assert response.status_code == 200
+        return response.json()
+
+    def test_import_gzip_with_bad_line(self, client, sample_level, storage_dirs):
+        import gzip
+
+        body = self.ndjson([
+            {"type": "metadata", "name": "Streamed", "difficulty_profile": [0.1, 0.2]},
+            {"type": "level", "level": sample_level, "difficulty": 0.3, "grade": "A"},
+            sample_level,
+        ]) + b"not json\n" + self.ndjson([{"type": "level", "level": sample_level}])
+        data = self.import_set(client, gzip.compress(body))
+
+        assert data["level_count"] == 3 and data["error_count"] == 1
+        assert data["errors"][0]["line"] == 4
+        assert data["throughput"]["levels"] == 3
+        assert data["throughput"]["bytes_decoded"] == len(body)
+
+        metadata = client.get(f"/api/simulate/level-sets/{data['id']}").json()["metadata"]
+        assert metadata["name"] == "Streamed" and metadata["level_count"] == 3
+        assert metadata["actual_difficulties"] == [0.3, 0.5, 0.5]
+        assert metadata["grades"] == ["A", "B", "B"]
+        assert len(list((storage_dirs / "local_levels").glob(f"{data['id']}_level_*.json"))) == 3
+
+    def test_export_round_trip(self, client, sample_level):
+        levels = [dict(sample_level, max_moves=30 + i) for i in range(3)]
+        set_id = self.import_set(client, self.ndjson(levels), name="Source")["id"]
+
+        response = client.get(f"/api/simulate/level-sets/{set_id}/export")
+        assert response.status_code == 200
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [line["type"] for line in lines] == ["metadata", "level", "level", "level", "summary"]
+        assert [line["level"]["max_moves"] for line in lines[1:4]] == [30, 31, 32]
+        assert lines[-1]["levels"] == 3
+
+        packed = client.get(f"/api/simulate/level-sets/{set_id}/export?gzip=true").content
+        copy_id = self.import_set(client, packed, name="Copy")["id"]
+        copied = client.get(f"/api/simulate/level-sets/{copy_id}").json()
+        assert copied["levels"] == levels
+        assert copied["metadata"]["name"] == "Copy"
+
+    def test_empty_import_rejected(self, client, storage_dirs):
+        response = client.post("/api/simulate/level-sets/import-stream",
+                               content=self.ndjson([{"type": "metadata", "name": "Empty"}]))
+        assert response.status_code == 400
+        assert list((storage_dirs / "level_sets").iterdir()) == []
+
+    def test_level_files_in_numeric_order(self, storage_dirs):
+        from app.api.level_sets import level_files
+
+        set_dir = storage_dirs / "level_sets" / "big"
+        set_dir.mkdir()
+        for index in (999, 1000, 101):
+            (set_dir / f"level_{index:03d}.json").write_text("{}", encoding="utf-8")
+        assert [p.stem for p in level_files(set_dir)] == ["level_101", "level_999", "level_1000"]
+
+    def test_import_generated_stream(self, client, sample_level, storage_dirs):
+        body = self.ndjson([
+            {"config": {"level_id": "gen_001", "tier": "easy"}, "level_json": sample_level},
+            {"config": {}, "level_json": sample_level},
+        ])
+        response = client.post("/api/simulate/local/import-generated-stream", content=body)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["imported_count"] == 1 and data["error_count"] == 1
+        assert data["imported_levels"] == ["gen_001"]
+        saved = json.loads((storage_dirs / "local_levels" / "gen_001.json").read_text(encoding="utf-8"))
+        assert saved["level_data"] == sample_level and saved["metadata"]["source"] == "generated"
+
 
 class TestBatchAnalyzeEndpoint:
     """Tests for batch analyze endpoint."""
@@ -307,6 +593,62 @@ class TestBatchAnalyzeEndpoint:
         assert "metrics" in result
 
 
+class TestBatchVerifyEndpoint:
+    """Tests for process-parallel batch verification."""
+
+    def _request(self, levels, **overrides):
+        return {"levels": levels, "iterations": 3, "use_core_bots_only": True, **overrides}
+
+    def test_batch_verify_keeps_request_order(self, client, sample_level):
+        levels = [{"level_json": sample_level, "level_id": f"lv_{name}", "target_difficulty": 0.3}
+                  for name in ("b", "a", "c")]
+        response = client.post("/api/analyze/batch-verify", json=self._request(levels))
+        assert response.status_code == 200
+        data = response.json()
+        assert [r["level_id"] for r in data["results"]] == ["lv_b", "lv_a", "lv_c"]
+        assert data["total_levels"] == 3
+        assert set(data["results"][0]["bot_clear_rates"]) == {"casual", "average", "expert"}
+
+        from app.core.simulation_cost import get_cost_sample_log
+        # Timings go to the per-test log (see conftest), never the real calibration data
+        assert len(get_cost_sample_log().load()) == 9
+
+    def test_batch_verify_stream(self, client, sample_level):
+        levels = [{"level_json": sample_level, "level_id": f"lv_{i}"} for i in range(2)]
+        response = client.post("/api/analyze/batch-verify/stream", json=self._request(levels))
+        assert response.status_code == 200
+        events = [json.loads(line) for line in response.text.splitlines()]
+        assert [e["type"] for e in events] == ["result", "result", "summary"]
+        assert sorted(e["index"] for e in events[:2]) == [0, 1]
+        assert events[-1]["total_levels"] == 2
+
+    def test_batch_verify_level_set(self, client, sample_level, tmp_path, monkeypatch):
+        from app.api.routes import analyze
+        monkeypatch.setattr(analyze, "LEVEL_SETS_DIR", tmp_path)
+        set_dir = tmp_path / "set_x"
+        set_dir.mkdir()
+        for i in (10, 2):
+            (set_dir / f"level_{i}.json").write_text(
+                json.dumps({**sample_level, "target_difficulty": 0.4}), encoding="utf-8")
+
+        data = client.post("/api/analyze/batch-verify", json=self._request([], set_id="set_x")).json()
+        assert [r["level_id"] for r in data["results"]] == ["level_2", "level_10"]
+
+        missing = client.post("/api/analyze/batch-verify", json=self._request([], set_id="missing"))
+        assert missing.status_code == 404
+
+    def test_batch_verify_with_budget(self, client, sample_level):
+        levels = [{"level_json": sample_level, "level_id": f"lv_{i}", "target_difficulty": 0.3} for i in range(2)]
+        response = client.post("/api/analyze/batch-verify",
+                               json=self._request(levels, simulation_budget_ms=500))
+        assert response.status_code == 200
+        assert all(r["bot_clear_rates"] for r in response.json()["results"])
+
+    def test_batch_verify_requires_levels(self, client):
+        response = client.post("/api/analyze/batch-verify", json=self._request([]))
+        assert response.status_code == 400
+
+
 class TestGBoostEndpoints:
     """Tests for GBoost endpoints."""
 
@@ -0,0 +1,103 @@
+"""Tests for the batch analyzer."""
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.level_sets import LEVEL_SETS_DIR, level_files
+from app.core.analyzer import LevelAnalyzer
+from app.core.batch_analyzer import TABLE_COLUMNS, analyze_batch
+from app.main import app
+
+
+def load_stored_levels(limit=300):
+    files = sorted(LEVEL_SETS_DIR.glob("*/level_*.json"))[:limit]
+    return [json.loads(f.read_text(encoding="utf-8")) for f in files]
+
+
+def edge_levels():
+    return [
+        {
+            "layer": 4, "useTileCount": 6, "max_moves": 5, "unlockTile": 1,
+            "layer_1": {"col": "7", "row": "7", "tiles": {
+                "0_0": ["t0", "ice_2"], "1_0": ["t0", "bomb_3"], "2_0": ["t3", "link_e"],
+                "3_0": "broken", "4_0": ["t1"],
+            }},
+            "layer_3": {"col": "7", "row": "7", "tiles": {
+                "0_0": ["t1", "chain"], "1_0": ["craft_s", "", [6]], "5_5": ["stack_e", ""],
+            }},
+        },
+        {
+            "layer": 3, "timea": 60,
+            "layer_0": {"tiles": {"0_0": ["t9", "frog"], "1_1": ["t10", "curtain_close"]}},
+            "layer_2": {"tiles": {"0_0": ["t11", "teleport"], "1_1": ["t12", "unknown"]}},
+        },
+        {"layer": 2, "max_moves": 0},
+    ]
+
+
+class TestBatchAnalyzer:
+    """Test cases for analyze_batch."""
+
+    def test_reports_identical_to_analyze(self):
+        """Every report equals LevelAnalyzer.analyze on stored and edge-case levels."""
+        levels = load_stored_levels() + edge_levels()
+        analyzer = LevelAnalyzer()
+        batch = analyze_batch(levels)
+
+        assert len(batch) == len(levels) and not batch.errors
+        for i, level_json in enumerate(levels):
+            expected = analyzer.analyze(level_json)
+            report = batch.report(i, analyzer)
+            assert report.score == expected.score
+            assert report.grade == expected.grade
+            assert report.metrics == expected.metrics
+            assert report.recommendations == expected.recommendations
+
+    def test_failed_levels_reported(self):
+        levels = [edge_levels()[2], {"layer": "x"}, {"layer": 1, "useTileCount": "5",
+                                                      "layer_0": {"tiles": {"0_0": ["t0", ""]}}}]
+        batch = analyze_batch(levels, ["ok", "bad_layer", "bad_count"])
+
+        assert sorted(batch.errors) == [1, 2]
+        assert batch.grades == [batch.grades[0], "?", "?"]
+        with pytest.raises(ValueError):
+            batch.metrics(2)
+        assert batch.grade_counts()["?"] == 2
+
+    def test_table_layout(self):
+        levels = edge_levels()
+        table = analyze_batch(levels, ["a", "b", "c"]).to_table()
+
+        assert table["columns"] == ["level_id", *TABLE_COLUMNS]
+        row = dict(zip(table["columns"], table["rows"][0]))
+        assert row["level_id"] == "a"
+        assert (row["total_tiles"], row["active_layers"], row["goal_amount"]) == (6, 2, 7)
+        assert (row["ice_count"], row["bomb_count"], row["link_count"], row["chain_count"]) == (2, 3, 1, 1)
+        assert row["layer_tiles"] == [0, 3, 0, 3]
+        assert row["has_key_gimmick"] and not row["has_time_attack"]
+
+
+class TestBatchAnalyzeEndpoints:
+    """Test cases for the batch analysis routes."""
+
+    def test_table_for_stored_set(self):
+        set_id = sorted(p.name for p in LEVEL_SETS_DIR.iterdir() if p.is_dir())[0]
+        client = TestClient(app)
+        response = client.post("/api/levels/batch-analyze/table", json={"set_id": set_id})
+
+        assert response.status_code == 200
+        data = response.json()
+        files = level_files(LEVEL_SETS_DIR / set_id)
+        assert [row[0] for row in data["rows"]] == [f.stem for f in files]
+        assert sum(data["grade_counts"].values()) == len(files)
+
+    def test_batch_analyze_matches_single_analyze(self):
+        levels = edge_levels()
+        client = TestClient(app)
+        results = client.post("/api/levels/batch-analyze", json={"levels": levels}).json()["results"]
+
+        for level_json, result in zip(levels, results):
+            single = client.post("/api/analyze", json={"level_json": level_json}).json()
+            assert (round(result["score"], 2), result["grade"]) == (single["score"], single["grade"])
+            assert result["metrics"] == single["metrics"]
@@ -0,0 +1,39 @@
+"""Tests for benchmark level data loading."""
+import pytest
+from app.models import benchmark_level
+from app.models.benchmark_level import (
+    DifficultyTier,
+    get_benchmark_level_by_id,
+    get_benchmark_set,
+    get_tier_levels,
+)
+
+
+class TestBenchmarkLevelData:
+    """Test cases for lazily loaded benchmark levels."""
+
+    @pytest.mark.parametrize("tier", list(DifficultyTier))
+    def test_each_tier_has_ten_levels(self, tier):
+        """Every tier loads a full, correctly tagged set."""
+        levels = get_tier_levels(tier)
+        assert len(levels) == 10
+        assert all(level.difficulty_tier == tier for level in levels)
+        assert get_benchmark_set(tier).levels == levels
+
+    def test_legacy_module_attributes(self):
+        """EASY_LEVELS etc. still resolve as module attributes."""
+        from app.models.benchmark_level import HARD_LEVELS
+        assert HARD_LEVELS is get_tier_levels(DifficultyTier.HARD)
+        with pytest.raises(AttributeError):
+            benchmark_level.NOT_A_TIER_LEVELS
+
+    def test_layer_cols_keys_are_ints(self):
+        """layer_cols keys are restored to int layer indices."""
+        level = get_benchmark_level_by_id("medium_01")
+        assert all(isinstance(k, int) for k in level.level_json["layer_cols"])
+        assert level.to_simulator_format()["layer_0"]["tiles"]
+
+    def test_unknown_level_id(self):
+        """Unknown ids raise ValueError."""
+        with pytest.raises(ValueError):
+            get_benchmark_level_by_id("nope_99")
@@ -0,0 +1,59 @@
+"""Tests for the fingerprinted benchmark result store."""
+import pytest
+
+from app.core import benchmark_store
+from app.core.benchmark_store import BenchmarkResultStore, benchmark_fingerprint
+
+
+RESULT_ARGS = ("easy_01", "optimal", 10, 50, 42)
+
+
+@pytest.fixture
+def fingerprint_source(tmp_path, monkeypatch):
+    """Replace the fingerprint inputs with one editable file."""
+    source = tmp_path / "benchmark_levels.json"
+    source.write_text('{"tiers": {}}', encoding="utf-8")
+    monkeypatch.setattr(benchmark_store, "FINGERPRINT_SOURCES", (source,))
+    return source
+
+
+class TestBenchmarkResultStore:
+    """Test cases for BenchmarkResultStore."""
+
+    def test_bot_result_roundtrip(self, tmp_path, fingerprint_source):
+        """Stored results come back stamped with computed_at."""
+        store = BenchmarkResultStore(tmp_path / "results.json")
+        assert store.get_bot_result(*RESULT_ARGS) is None
+
+        entry = store.put_bot_result(*RESULT_ARGS, {"clear_rate": 0.9, "avg_moves": 31.0})
+        assert entry["clear_rate"] == 0.9
+        assert "computed_at" in entry
+        assert store.get_bot_result(*RESULT_ARGS) == entry
+        assert store.get_bot_result("easy_01", "optimal", 20, 50, 42) is None
+
+    def test_persisted_across_instances(self, tmp_path, fingerprint_source):
+        """A new store (restart or other worker) reads the saved results."""
+        path = tmp_path / "results.json"
+        entry = BenchmarkResultStore(path).put_dashboard({"tiers": {}})
+        assert entry["fingerprint"] == benchmark_fingerprint()
+
+        other = BenchmarkResultStore(path)
+        assert other.get_dashboard() == entry
+
+    def test_fingerprint_change_invalidates(self, tmp_path, fingerprint_source):
+        """Editing the benchmark data drops every stored result."""
+        store = BenchmarkResultStore(tmp_path / "results.json")
+        store.put_bot_result(*RESULT_ARGS, {"clear_rate": 0.9, "avg_moves": 31.0})
+        store.put_dashboard({"tiers": {}})
+        before = store.fingerprint
+
+        fingerprint_source.write_text('{"tiers": {"easy": []}}', encoding="utf-8")
+        assert store.fingerprint != before
+        assert store.get_bot_result(*RESULT_ARGS) is None
+        assert store.get_dashboard() is None
+
+    def test_memory_only_store(self, fingerprint_source):
+        """A store without a path keeps results in memory."""
+        store = BenchmarkResultStore(None)
+        store.put_bot_result(*RESULT_ARGS, {"clear_rate": 0.5, "avg_moves": 20.0})
+        assert store.get_bot_result(*RESULT_ARGS)["clear_rate"] == 0.5
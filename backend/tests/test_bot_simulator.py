@@ -13,7 +13,11 @@ from app.core.bot_simulator import (
     BotSimulator,
     get_bot_simulator,
     BotSimulationResult,
+    MoveRecorder,
     MultiBotAssessmentResult,
+    TileEffectType,
+    TileDistributor,
+    zWellRandom,
 )
 from app.core.difficulty_assessor import (
     DifficultyAssessor,
@@ -294,6 +298,456 @@ class TestBotSimulator:
         assert easy_result.overall_difficulty <= hard_result.overall_difficulty + 20
 
 
+SAMPLE_LEVEL_STACK_TELEPORT = {
+    "layer": 2,
+    "layer_0": {"col": "7", "row": "7", "tiles": {
+        f"{x}_{y}": ["t0", "teleporter" if (x + y) % 4 == 0 else ""]
+        for x in range(6) for y in range(4)
+    }, "num": "24"},
+    "layer_1": {"col": "8", "row": "8", "tiles": {
+        **{f"{x}_{y}": ["t0", ""] for x in range(1, 4) for y in range(1, 3)},
+        "5_5": ["stack_s", "", [6]],
+    }, "num": "7"},
+}
+
+
+def _scan_board_counters(simulator, state):
+    """Recount remaining/exposed tiles the slow way for comparison."""
+    remaining, by_type, exposed = 0, {}, {}
+    max_layer = max(state.tiles)
+    for layer_idx, layer_tiles in state.tiles.items():
+        for tile in layer_tiles.values():
+            if tile.picked:
+                continue
+            remaining += 1
+            by_type[tile.tile_type] = by_type.get(tile.tile_type, 0) + 1
+            covered = False
+            for upper_idx in range(layer_idx + 1, max_layer + 1):
+                if upper_idx % 2 == layer_idx % 2:
+                    offsets = simulator.BLOCKING_OFFSETS_SAME_PARITY
+                elif state.layer_cols.get(upper_idx, 7) > state.layer_cols.get(layer_idx, 7):
+                    offsets = simulator.BLOCKING_OFFSETS_UPPER_BIGGER
+                else:
+                    offsets = simulator.BLOCKING_OFFSETS_UPPER_SMALLER
+                for dx, dy in offsets:
+                    upper = state.tiles.get(upper_idx, {}).get(f"{tile.x_idx + dx}_{tile.y_idx + dy}")
+                    covered = covered or (upper is not None and not upper.picked)
+            if not covered:
+                exposed[tile.tile_type] = exposed.get(tile.tile_type, 0) + 1
+    return remaining, by_type, exposed
+
+
+class TestBoardCounters:
+    """Tests for incrementally maintained GameState tile counters."""
+
+    @pytest.mark.parametrize("level", [SAMPLE_LEVEL_EASY, SAMPLE_LEVEL_STACK_TELEPORT])
+    @pytest.mark.parametrize("bot_type", [BotType.NOVICE, BotType.OPTIMAL])
+    def test_counters_match_board_scan(self, level, bot_type):
+        """Counters equal a full board scan after every move."""
+        simulator = BotSimulator()
+        process_move_effects = simulator._process_move_effects
+        checked = []
+
+        def checked_effects(state, *args, **kwargs):
+            process_move_effects(state, *args, **kwargs)
+            counters = (state.remaining_tile_count, state.remaining_type_counts, state.exposed_type_counts)
+            assert counters == _scan_board_counters(simulator, state)
+            checked.append(state.moves_used)
+
+        simulator._process_move_effects = checked_effects
+        simulator.simulate_with_profile(level, get_profile(bot_type), iterations=3, max_moves=60, seed=3)
+        assert checked
+
+    def test_counters_initialized_lazily(self):
+        """States built without _create_initial_state get counters on first read."""
+        simulator = BotSimulator()
+        state = simulator._create_initial_state(SAMPLE_LEVEL_EASY, 30)
+        expected = state.remaining_tile_count
+        state._counters_ready = False
+        state.remaining_tile_count = 0
+        assert simulator._remaining_tile_count(state) == expected
+
+
+SAMPLE_LEVEL_GIMMICKS = {
+    "layer": 2,
+    "layer_0": {"col": "7", "row": "7", "tiles": {
+        f"{x}_{y}": ["t0", ["", "ice", "chain", "grass", "", "bomb", "curtain_close", "frog"][(x + 2 * y) % 8]]
+        for x in range(6) for y in range(5)
+    }, "num": "30"},
+    "layer_1": {"col": "8", "row": "8", "tiles": {
+        f"{x}_{y}": ["t0", ""] for x in range(2, 5) for y in range(1, 4)
+    }, "num": "9"},
+}
+
+
+def _scan_gimmick_frontier(simulator, state):
+    """Rebuild exposed/covered gimmick slots and stuck kinds from a board scan."""
+    state._blocking_cache.clear()
+    frontier = {kind: (set(), set()) for kind in simulator.GIMMICK_FRONTIER_KINDS.values()}
+    stuck = set()
+    for layer_idx, layer_tiles in state.tiles.items():
+        for pos, tile in layer_tiles.items():
+            kind = simulator.GIMMICK_FRONTIER_KINDS.get(tile.effect_type)
+            if tile.picked or kind is None:
+                continue
+            if kind in ("ice", "grass") and tile.remaining <= 0:
+                continue
+            if kind == "chain" and tile.unlocked:
+                continue
+            exposed, covered = frontier[kind]
+            (covered if simulator._is_blocked_by_upper(state, tile) else exposed).add((layer_idx, pos))
+
+            x, y = tile.x_idx, tile.y_idx
+            neighbors = [(x - 1, y), (x + 1, y)] if kind == "chain" else [(x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)]
+            unpicked = sum(
+                1 for nx, ny in neighbors
+                if layer_tiles.get(f"{nx}_{ny}") is not None and not layer_tiles[f"{nx}_{ny}"].picked
+            )
+            if (kind == "chain" and unpicked == 0) or (kind == "grass" and tile.remaining > unpicked):
+                stuck.add(kind)
+    return frontier, stuck
+
+
+class TestGimmickFrontier:
+    """Tests for the incrementally maintained exposed-gimmick frontier."""
+
+    @pytest.mark.parametrize("bot_type", [BotType.NOVICE, BotType.AVERAGE, BotType.OPTIMAL])
+    def test_frontier_matches_board_scan(self, bot_type):
+        """Frontier sets and stuck flags equal a full board scan after every move."""
+        simulator = BotSimulator()
+        process_move_effects = simulator._process_move_effects
+        checked = []
+
+        def checked_effects(state, *args, **kwargs):
+            process_move_effects(state, *args, **kwargs)
+            frontier, stuck = _scan_gimmick_frontier(simulator, state)
+            for kind, (exposed, covered) in frontier.items():
+                assert {state._gimmick_slots[i] for i in state.gimmick_exposed[kind]} == exposed
+                assert {state._gimmick_slots[i] for i in state.gimmick_covered[kind]} == covered
+            assert {kind for kind, ids in state.gimmick_stuck.items() if ids} == stuck
+            checked.append(state.moves_used)
+
+        simulator._process_move_effects = checked_effects
+        simulator.simulate_with_profile(SAMPLE_LEVEL_GIMMICKS, get_profile(bot_type), iterations=5, max_moves=60, seed=5)
+        assert checked
+
+    def test_capture_exposed_gimmicks(self):
+        """Captured bombs/curtains are exactly the uncovered ones."""
+        simulator = BotSimulator()
+        state = simulator._create_initial_state(SAMPLE_LEVEL_GIMMICKS, 30)
+        bombs, curtains = simulator._capture_exposed_gimmicks(state)
+        frontier, _ = _scan_gimmick_frontier(simulator, state)
+        assert bombs == {f"{layer_idx}_{pos}" for layer_idx, pos in frontier["bomb"][0]}
+        assert curtains == frontier["curtain"][0]
+        assert bombs and curtains
+        assert frontier["bomb"][1] and frontier["curtain"][1]
+
+    def test_chain_becomes_impossible_when_neighbors_picked(self):
+        """Picking both horizontal neighbors of a locked chain flags the level as lost."""
+        simulator = BotSimulator()
+        state = simulator._create_initial_state(SAMPLE_LEVEL_GIMMICKS, 30)
+        assert not simulator._check_chain_impossible(state)
+        for pos in ("1_0", "3_0"):
+            neighbor = state.tiles[0][pos]
+            neighbor.picked = True
+            simulator._on_tile_picked(state, neighbor)
+        assert state.tiles[0]["2_0"].effect_type == TileEffectType.CHAIN
+        assert simulator._check_chain_impossible(state)
+        assert simulator._is_game_over(state) and state.failed
+
+    def test_frog_targets_in_board_order(self):
+        """Frog targets are listed in board scan order like a full walk."""
+        simulator = BotSimulator()
+        state = simulator._create_initial_state(SAMPLE_LEVEL_GIMMICKS, 30)
+        targets = [(layer_idx, pos) for layer_idx, pos, _ in simulator._get_frog_movable_tiles(state)]
+        expected = [
+            (layer_idx, pos)
+            for layer_idx, layer_tiles in state.tiles.items()
+            for pos, tile in layer_tiles.items()
+            if tile.tile_type in simulator.MATCHABLE_TYPES and tile.can_pick()
+            and not simulator._is_blocked_by_upper(state, tile)
+        ]
+        assert targets == expected and targets
+
+
+SAMPLE_LEVEL_LINK = {
+    "layer": 2,
+    "layer_0": {"col": "7", "row": "7", "tiles": {
+        f"{x}_{y}": ["t0", "link_e" if x % 3 == 0 and y % 2 == 0 else ("curtain_open" if x == 5 else "")]
+        for x in range(6) for y in range(5)
+    }, "num": "30"},
+    "layer_1": {"col": "8", "row": "8", "tiles": {
+        f"{x}_{y}": ["t0", "frog" if (x, y) == (3, 2) else ""] for x in range(1, 5) for y in range(2, 4)
+    }, "num": "8"},
+}
+
+
+def _scan_available_moves(simulator, state):
+    """Rebuild (layer, position, linked tiles) of every legal move from a full scan."""
+    state._blocking_cache.clear()
+    moves = []
+    for layer_idx in sorted(state.tiles, reverse=True):
+        for pos, tile in state.tiles[layer_idx].items():
+            if not simulator._can_pick_tile(state, tile):
+                continue
+            linked = []
+            if tile.effect_type in simulator.LINK_EFFECT_TYPES:
+                partner = state.tiles[layer_idx].get(tile.linked_pos)
+                if partner is not None and not partner.picked:
+                    linked.append((layer_idx, tile.linked_pos))
+            else:
+                for source_pos, source in state.tiles[layer_idx].items():
+                    if (not source.picked and source.effect_type in simulator.LINK_EFFECT_TYPES
+                            and source.linked_pos == pos):
+                        if simulator._is_blocked_by_upper(state, source):
+                            linked = None
+                        else:
+                            linked.append((layer_idx, source_pos))
+                        break
+            if linked is not None:
+                moves.append((layer_idx, pos, linked))
+    return moves
+
+
+class TestPickableFrontier:
+    """Tests for the maintained pickable-move frontier."""
+
+    @pytest.mark.parametrize("level", [SAMPLE_LEVEL_LINK, SAMPLE_LEVEL_GIMMICKS, SAMPLE_LEVEL_STACK_TELEPORT])
+    @pytest.mark.parametrize("bot_type", [BotType.NOVICE, BotType.OPTIMAL])
+    def test_moves_match_full_scan(self, level, bot_type):
+        """Generated moves equal a full board scan, in the same order, every turn."""
+        simulator = BotSimulator()
+        get_available_moves = simulator._get_available_moves
+        checked = []
+
+        def checked_moves(state):
+            moves = get_available_moves(state)
+            assert [(m.layer_idx, m.position, m.linked_tiles) for m in moves] == \
+                _scan_available_moves(simulator, state)
+            checked.append(len(moves))
+            return moves
+
+        simulator._get_available_moves = checked_moves
+        simulator.simulate_with_profile(level, get_profile(bot_type), iterations=3, max_moves=60, seed=11)
+        assert checked
+
+    def test_link_partners_precomputed(self):
+        """Link targets resolve their source through the precomputed index."""
+        simulator = BotSimulator()
+        state = simulator._create_initial_state(SAMPLE_LEVEL_LINK, 30)
+        assert (0, "0_0") in state._link_slots
+        assert state._link_sources[(0, "1_0")] == ["0_0"]
+        target = state.tiles[0]["1_0"]
+        assert simulator._find_link_source(state, target) is state.tiles[0]["0_0"]
+        assert simulator._find_linked_tiles(state, target) == [(0, "0_0")]
+
+
+class TestScoringContext:
+    """Tests for the per-turn scoring context."""
+
+    @pytest.mark.parametrize("level", [SAMPLE_LEVEL_GIMMICKS, SAMPLE_LEVEL_LINK, SAMPLE_LEVEL_STACK_TELEPORT])
+    @pytest.mark.parametrize("bot_type", [BotType.NOVICE, BotType.AVERAGE, BotType.OPTIMAL])
+    def test_shared_context_scores_identical(self, level, bot_type):
+        """Scores from one shared context equal scores from a fresh context per move."""
+        simulator = BotSimulator()
+        select = simulator._select_move_with_profile
+        checked = []
+
+        def checked_select(moves, state, profile):
+            rng_state = simulator._rng.getstate()
+            per_move = [simulator._score_move_with_profile(m, state, profile) for m in moves]
+            simulator._rng.setstate(rng_state)
+            context = simulator._build_scoring_context(state)
+            shared = [simulator._score_move_with_profile(m, state, profile, context) for m in moves]
+            simulator._rng.setstate(rng_state)
+            assert shared == per_move
+            checked.append(len(moves))
+            return select(moves, state, profile)
+
+        simulator._select_move_with_profile = checked_select
+        simulator.simulate_with_profile(level, get_profile(bot_type), iterations=3, max_moves=60, seed=11)
+        assert checked
+
+    def test_gimmick_section_filled_on_demand(self):
+        """Only blocking-aware profiles trigger the gimmick scans."""
+        simulator = BotSimulator()
+        state = simulator._create_initial_state(SAMPLE_LEVEL_GIMMICKS, 30)
+        move = simulator._get_available_moves(state)[0]
+
+        context = simulator._build_scoring_context(state)
+        simulator._score_move_with_profile(move, state, get_profile(BotType.NOVICE), context)
+        assert not context.gimmicks_ready
+
+        simulator._score_move_with_profile(move, state, get_profile(BotType.OPTIMAL), context)
+        assert context.gimmicks_ready
+        assert context.accessible_count == state.remaining_tile_count
+
+
+def _state_snapshot(state):
+    """Tile types, stack contents and type counters of a state, in board order."""
+    tiles = [(layer_idx, pos, tile.tile_type, tile.is_stack_tile)
+             for layer_idx, layer_tiles in state.tiles.items() for pos, tile in layer_tiles.items()]
+    stacked = [(key, tile.tile_type) for key, tile in state.stacked_tiles.items()]
+    counters = (state.all_tile_type_counts, state.remaining_type_counts,
+                state.exposed_type_counts, state._exposed_slots)
+    return tiles, stacked, [list(c.items()) for c in counters]
+
+
+class TestSeedTemplate:
+    """Tests for per-seed t0 assignment on a cached level layout."""
+
+    def test_rand_sequence_matches_generator(self):
+        """rand_sequence draws the same sequence as a fresh zWellRandom."""
+        for seed in (1, 42, 777, 999999):
+            rng = zWellRandom(seed)
+            expected = [rng.rand(0, 26) for _ in range(60)]
+            assert zWellRandom.rand_sequence(seed, 60, 0, 26) == expected
+
+    def test_shuffle_for_seed_matches_assignment(self):
+        settings = dict(use_tile_count=6, type_imbalance=4, unlock_tile=1, existing_tile_counts={"t2": 4})
+        unshuffled = TileDistributor.unshuffled_t0_tiles(45, **settings)
+        for seed in (5, 1234, 98765):
+            expected = TileDistributor.assign_t0_tiles(t0_count=45, shuffle_tile=3, rand_seed=seed, **settings)
+            assert TileDistributor.shuffle_for_seed(unshuffled, seed, 45 + 3) == expected
+
+    @pytest.mark.parametrize("level", [SAMPLE_LEVEL_HARD, SAMPLE_LEVEL_STACK_TELEPORT, SAMPLE_LEVEL_GIMMICKS])
+    def test_seeded_state_matches_fresh_state(self, level):
+        """Retyping the template equals parsing the level with that randSeed."""
+        simulator = BotSimulator()
+        template = simulator._create_seed_template(level, 30)
+        for seed in (3, 4242, 999999):
+            fresh = simulator._create_initial_state({**level, "randSeed": seed}, 30)
+            seeded = simulator._create_seeded_state(template, seed)
+            assert _state_snapshot(seeded) == _state_snapshot(fresh)
+
+    def test_random_seed_simulation_reproducible(self):
+        simulator = BotSimulator()
+        level = {**SAMPLE_LEVEL_HARD, "randSeed": 0}
+        runs = [
+            simulator.simulate_with_profile(level, get_profile(BotType.AVERAGE), iterations=4,
+                                            max_moves=60, seed=8, honor_zero_seed=True)
+            for _ in range(2)
+        ]
+        assert runs[0].to_dict() == runs[1].to_dict()
+
+
+class TestStateCopy:
+    """Tests for per-iteration state copies."""
+
+    def test_copy_shares_layout_and_isolates_tiles(self):
+        simulator = BotSimulator()
+        base = simulator._create_initial_state(SAMPLE_LEVEL_HARD, 30)
+        simulator._precompute_blocking_map(base)
+        copy = simulator._fast_copy_state(base)
+
+        assert copy._blocking_map is base._blocking_map
+        assert copy.craft_boxes is base.craft_boxes
+        assert not hasattr(copy.tiles[7]["0_0"], "__dict__")
+
+        tile = copy.tiles[5]["2_0"]
+        tile.picked = True
+        tile.on_frog = False
+        assert not base.tiles[5]["2_0"].picked
+        assert base.tiles[5]["2_0"].on_frog
+        assert copy.stacked_tiles.keys() == base.stacked_tiles.keys()
+        assert all(copy.stacked_tiles[k] is not t for k, t in base.stacked_tiles.items())
+
+
+class TestSimulateMany:
+    """Tests for multi-level throughput simulation."""
+
+    def test_chunks_match_single_run(self):
+        """Seeded chunks across processes reproduce one simulate_with_profile call."""
+        simulator = BotSimulator()
+        profiles = [get_profile(BotType.CASUAL), get_profile(BotType.AVERAGE)]
+        levels = [SAMPLE_LEVEL_EASY, SAMPLE_LEVEL_HARD]
+        results = list(simulator.simulate_many(
+            iter(levels), profiles, iterations=7, max_moves=40, seed=5, chunk_iterations=3, workers=2,
+        ))
+
+        assert sorted(r.index for r in results) == [0, 1]
+        for result in results:
+            assert result.error is None
+            for profile, merged in zip(profiles, result.bot_results):
+                single = simulator.simulate_with_profile(levels[result.index], profile, 7, 40, seed=5)
+                assert merged.bot_type == profile.bot_type
+                assert merged.cleared_runs == single.cleared_runs
+                assert merged.to_dict() == single.to_dict()
+
+    def test_levels_read_lazily(self):
+        consumed = []
+
+        def levels():
+            for i in range(20):
+                consumed.append(i)
+                yield SAMPLE_LEVEL_EASY
+
+        stream = BotSimulator().simulate_many(
+            levels(), [get_profile(BotType.NOVICE)], iterations=2, max_moves=30, chunk_iterations=1, workers=1,
+        )
+        first = next(stream)
+        stream.close()
+        assert first.bot_results[0].iterations == 2
+        assert len(consumed) < 20
+
+    def test_failed_level_reported(self):
+        broken = {"layer": 8, "layer_0": "not a layer"}
+        results = {
+            r.index: r for r in BotSimulator().simulate_many(
+                [SAMPLE_LEVEL_EASY, broken], [get_profile(BotType.NOVICE)], iterations=2, max_moves=30, workers=1,
+            )
+        }
+        assert results[0].error is None and len(results[0].bot_results) == 1
+        assert results[1].error and results[1].bot_results == []
+
+    def test_worker_import_stays_lean(self):
+        """Pool workers import bot_simulator; the cost model (and analyzer) is loaded lazily."""
+        import subprocess
+        import sys
+
+        code = "import sys, app.core.bot_simulator; print('app.core.simulation_cost' in sys.modules)"
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+        assert output.strip() == "False"
+
+    def test_serial_mode_in_order(self):
+        results = list(BotSimulator().simulate_many(
+            [SAMPLE_LEVEL_EASY] * 3, [get_profile(BotType.NOVICE)], iterations=2, max_moves=30, parallel=False,
+        ))
+        assert [r.index for r in results] == [0, 1, 2]
+        assert all(r.bot_results[0].iterations == 2 for r in results)
+
+
+class TestMoveObserver:
+    """Tests for recording moves through the game loop hooks."""
+
+    def test_recorder_does_not_change_results(self):
+        simulator = BotSimulator()
+        profile = get_profile(BotType.AVERAGE)
+        recorder = MoveRecorder()
+        recorded = simulator.simulate_with_profile(SAMPLE_LEVEL_EASY, profile, 5, 40, seed=3, observer=recorder)
+        plain = simulator.simulate_with_profile(SAMPLE_LEVEL_EASY, profile, 5, 40, seed=3)
+
+        assert recorded.to_dict() == plain.to_dict()
+        assert [game.cleared for game in recorder.games] == recorded.cleared_runs
+        assert all(len(game.moves) == game.moves_used > 0 for game in recorder.games)
+
+    def test_visual_simulator_plays_engine_game(self):
+        """Visual playback records exactly the game BotSimulator plays."""
+        from app.api.routes.simulate import VisualSimulator
+
+        result, _, _ = VisualSimulator().simulate_bot(SAMPLE_LEVEL_HARD, "casual", 40, seed=4, initial_state_seed=9)
+
+        simulator = BotSimulator()
+        simulator._rng.seed(9)
+        state = simulator._create_initial_state(SAMPLE_LEVEL_HARD, 40)
+        simulator._precompute_blocking_map(state)
+        recorder = MoveRecorder()
+        state = simulator._play_game(state, get_profile(BotType.CASUAL), recorder)
+
+        assert [(m.layer_idx, m.position, m.tile_type) for m in result.moves] == recorder.games[0].moves
+        assert (result.cleared, result.total_moves) == (state.cleared, state.moves_used)
+
+
 class TestDifficultyAssessor:
     """Tests for comprehensive difficulty assessor."""
 
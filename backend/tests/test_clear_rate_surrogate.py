@@ -0,0 +1,110 @@
+"""Tests for the clear-rate surrogate model."""
+import random
+
+import pytest
+
+from app.core import clear_rate_surrogate
+from app.core.clear_rate_surrogate import (
+    FEATURE_NAMES,
+    ClearRateSurrogate,
+    SurrogateSampleLog,
+    extract_features,
+)
+
+
+@pytest.fixture
+def sample_level():
+    return {
+        "layer": 8,
+        "useTileCount": 4,
+        "max_moves": 30,
+        "layer_0": {"col": "8", "row": "8", "num": "3",
+                    "tiles": {"1_1": ["t1", ""], "2_1": ["t1", "chain"], "3_1": ["t1", "ice_2"]}},
+        "layer_1": {"col": "7", "row": "7", "num": "3",
+                    "tiles": {"1_1": ["t2", ""], "2_1": ["t2", ""], "3_1": ["craft_s", "", [3]]}},
+    }
+
+
+def make_samples(count=200, seed=3):
+    """Samples whose clear rates depend linearly on move budget and gimmicks."""
+    rng = random.Random(seed)
+    samples = []
+    for _ in range(count):
+        features = {name: rng.uniform(0, 10) for name in FEATURE_NAMES}
+        features["move_ratio"] = rng.uniform(0.6, 1.0)
+        rates = {
+            "casual": 1.4 - features["move_ratio"] - 0.02 * features["chain_count"],
+            "expert": 1.6 - features["move_ratio"] - 0.01 * features["ice_count"],
+        }
+        samples.append({"features": features, "clear_rates": rates})
+    return samples
+
+
+class TestFeatures:
+    """Test cases for static feature extraction."""
+
+    def test_extract_features(self, sample_level):
+        features = extract_features(sample_level)
+        assert set(features) == set(FEATURE_NAMES)
+        assert features["total_tiles"] == 6
+        assert features["chain_count"] == 1
+        assert features["ice_count"] == 2
+        assert features["goal_amount"] == 3
+        assert features["use_tile_count"] == 4
+        assert features["move_ratio"] == pytest.approx(6 / 30)
+
+
+class TestClearRateSurrogate:
+    """Test cases for ClearRateSurrogate."""
+
+    def test_fit_recovers_linear_relationship(self):
+        """Held-out error is small when clear rates are linear in the features."""
+        model = ClearRateSurrogate.fit(make_samples(), ridge=0.1)
+        assert set(model.weights) == {"casual", "expert"}
+        assert model.metrics["casual"]["mae"] < 0.02
+        assert model.metrics["expert"]["count"] == 40
+
+        predicted = model.predict_features(make_samples(1, seed=9)[0]["features"])
+        assert all(0.0 <= rate <= 1.0 for rate in predicted.values())
+
+    def test_fit_requires_samples(self):
+        with pytest.raises(ValueError):
+            ClearRateSurrogate.fit(make_samples(5))
+
+    def test_save_load_roundtrip(self, tmp_path, sample_level):
+        model = ClearRateSurrogate.fit(make_samples())
+        path = tmp_path / "model.json"
+        model.save(path)
+        loaded = ClearRateSurrogate.load(path)
+        assert loaded.predict(sample_level) == model.predict(sample_level)
+        assert loaded.metrics == model.metrics
+
+    def test_online_error(self):
+        model = ClearRateSurrogate.fit(make_samples())
+        error = model.record_outcome({"casual": 0.5, "expert": 0.9}, {"casual": 0.3, "expert": 1.0})
+        assert error == pytest.approx(0.15)
+        assert model.online_error()["casual"] == {"mae": 0.2, "count": 1}
+
+    def test_reloads_when_model_changes(self, tmp_path, monkeypatch):
+        path = tmp_path / "model.json"
+        monkeypatch.setattr(clear_rate_surrogate, "DEFAULT_MODEL_PATH", path)
+        assert clear_rate_surrogate.get_clear_rate_surrogate() is None
+
+        ClearRateSurrogate.fit(make_samples()).save(path)
+        assert clear_rate_surrogate.get_clear_rate_surrogate() is not None
+
+
+class TestSurrogateSampleLog:
+    """Test cases for the training sample log."""
+
+    def test_append_and_load(self, tmp_path, sample_level):
+        log = SurrogateSampleLog(tmp_path / "samples.jsonl")
+        log.append(sample_level, {"casual": 0.4}, iterations=10, predicted={"casual": 0.45})
+        with open(log.path, "a", encoding="utf-8") as f:
+            f.write("not json\n")
+        log.append(sample_level, {"casual": 0.6}, iterations=10)
+
+        samples = log.load()
+        assert [s["clear_rates"]["casual"] for s in samples] == [0.4, 0.6]
+        assert samples[0]["predicted"] == {"casual": 0.45}
+        assert samples[0]["features"] == extract_features(sample_level)
@@ -0,0 +1,117 @@
+"""Tests for common random numbers and paired clear-rate differences."""
+import copy
+import json
+
+from fastapi.testclient import TestClient
+
+from app.api.level_sets import LEVEL_SETS_DIR
+from app.core.bot_simulator import BotSimulator, _simulate_single_bot
+from app.core.common_random_numbers import paired_difference
+from app.main import app
+from app.models.bot_profile import BotTeam, BotType, get_profile
+
+
+def stored_level(index=0):
+    level_file = sorted(LEVEL_SETS_DIR.glob("*/level_*.json"))[index]
+    return json.loads(level_file.read_text(encoding="utf-8"))
+
+
+def without_first_gimmick(level_json):
+    """Nearby candidate: the same level with one tile's gimmick removed."""
+    level_json = copy.deepcopy(level_json)
+    for i in range(level_json.get("layer", 8)):
+        for tile in level_json.get(f"layer_{i}", {}).get("tiles", {}).values():
+            if isinstance(tile, list) and len(tile) > 1 and tile[1] and str(tile[0]).startswith("t"):
+                tile[1] = ""
+                return level_json
+    return level_json
+
+
+class TestPairedDifference:
+    """Test cases for paired_difference."""
+
+    def test_discordant_pairs(self):
+        a = [True] * 30 + [False] * 30
+        b = [True] * 20 + [False] * 40
+        diff = paired_difference(a, b)
+
+        assert diff.n == 60 and (diff.only_a, diff.only_b) == (10, 0)
+        assert abs(diff.mean_difference - 1 / 6) < 1e-9
+        assert diff.ci_low < diff.mean_difference < diff.ci_high
+        assert diff.significant
+        # Nested outcomes are what CRN aims for: far tighter than independent runs
+        assert diff.std_error < diff.unpaired_std_error
+        assert diff.variance_reduction > 3
+
+    def test_uses_common_prefix(self):
+        diff = paired_difference([True, False, True, True], [True, False])
+        assert diff.n == 2 and diff.mean_difference == 0 and diff.std_error == 0
+        assert not diff.significant
+
+    def test_empty_runs(self):
+        diff = paired_difference([], [True])
+        assert diff.n == 0 and (diff.ci_low, diff.ci_high) == (-1.0, 1.0)
+
+
+class TestCommonRandomNumbers:
+    """Test cases for CRN mode of BotSimulator."""
+
+    def test_crn_runs_reproducible_across_simulators(self):
+        level_json = stored_level()
+        profile = get_profile(BotType.CASUAL)
+        first = BotSimulator().simulate_with_profile(level_json, profile, 20, crn_seed=7, seed=1)
+        second = BotSimulator().simulate_with_profile(level_json, profile, 20, crn_seed=7, seed=2)
+
+        assert first.cleared_runs == second.cleared_runs
+        assert len(first.cleared_runs) == first.iterations == 20
+        assert paired_difference(first.cleared_runs, second.cleared_runs).std_error == 0
+
+    def test_streams_rejoined_after_crn_run(self):
+        simulator = BotSimulator()
+        simulator.simulate_with_profile(stored_level(), get_profile(BotType.NOVICE), 3, crn_seed=7)
+
+        assert simulator._rng_mistake is simulator._rng
+        assert simulator._rng_frog is simulator._rng
+
+    def test_single_bot_worker_pairs_candidates(self):
+        level_json = stored_level(1)
+        candidate = without_first_gimmick(level_json)
+        max_moves = level_json.get("max_moves", 50)
+
+        _, rate_a, _, runs_a = _simulate_single_bot(("average", level_json, 30, max_moves, 11))
+        _, rate_b, _, runs_b = _simulate_single_bot(("average", candidate, 30, max_moves, 11))
+        diff = paired_difference(runs_a, runs_b)
+
+        assert diff.n == 30
+        assert abs(diff.mean_difference - (rate_a - rate_b)) < 1e-9
+        assert diff.std_error <= diff.unpaired_std_error
+
+    def test_assess_difficulty_paired_differences(self):
+        simulator = BotSimulator()
+        team = BotTeam.casual_team(iterations_per_bot=10)
+        result = simulator.assess_difficulty(
+            stored_level(), team=team, max_moves=50, parallel=False,
+            seed=5, common_random_numbers=True,
+        )
+
+        assert list(result.paired_differences) == ["casual_vs_novice", "average_vs_casual"]
+        assert all(d["n"] == 10 for d in result.paired_differences.values())
+        assert result.to_dict()["paired_differences"] == result.paired_differences
+
+        independent = simulator.assess_difficulty(
+            stored_level(), team=team, max_moves=50, parallel=False, seed=5,
+        )
+        assert independent.paired_differences == {}
+
+    def test_multibot_endpoint(self):
+        client = TestClient(app)
+        response = client.post("/api/assess/multibot", json={
+            "level_json": stored_level(),
+            "bot_types": ["casual", "expert"],
+            "iterations_per_bot": 10,
+            "max_moves": 50,
+            "common_random_numbers": True,
+        })
+
+        assert response.status_code == 200
+        assert list(response.json()["paired_differences"]) == ["expert_vs_casual"]
@@ -0,0 +1,93 @@
+"""Tests for the shared coverage graph."""
+import random
+
+from app.core.bot_simulator import BotSimulator
+from app.core.coverage_graph import CoverageGraph, blocking_offsets
+from app.core.generator import LevelGenerator
+
+
+def make_level(seed, num_layers=6):
+    """Random layout with alternating 7/8-column layers."""
+    rng = random.Random(seed)
+    level = {"layer": num_layers, "useTileCount": 4, "max_moves": 50}
+    for i in range(num_layers):
+        cols = 8 if i % 2 == 0 else 7
+        positions = [f"{x}_{y}" for x in range(cols) for y in range(cols)]
+        chosen = rng.sample(positions, rng.randint(0, 20))
+        level[f"layer_{i}"] = {
+            "col": str(cols), "row": str(cols), "num": str(len(chosen)),
+            "tiles": {pos: [f"t{rng.randint(1, 4)}", ""] for pos in chosen},
+        }
+    return level
+
+
+class TestCoverageGraph:
+    """Test cases for CoverageGraph."""
+
+    def test_matches_generator_scan(self):
+        """Graph lookups agree with the per-query upper-layer scan on every slot."""
+        generator = LevelGenerator()
+        for seed in range(20):
+            level = make_level(seed)
+            graph = CoverageGraph.from_level(level)
+            for layer_idx in range(level["layer"]):
+                for x in range(-1, 9):
+                    for y in range(-1, 9):
+                        assert graph.is_covered(layer_idx, x, y) == \
+                            generator._is_position_covered_by_upper(level, layer_idx, x, y)
+
+    def test_incremental_updates_match_rebuild(self):
+        level = make_level(3)
+        graph = CoverageGraph.from_level(level)
+        rng = random.Random(5)
+        for _ in range(200):
+            layer_idx = rng.randrange(level["layer"])
+            x, y = rng.randrange(8), rng.randrange(8)
+            tiles = level[f"layer_{layer_idx}"]["tiles"]
+            if f"{x}_{y}" in tiles:
+                del tiles[f"{x}_{y}"]
+                graph.remove(layer_idx, x, y)
+            else:
+                tiles[f"{x}_{y}"] = ["t1", ""]
+                graph.add(layer_idx, x, y)
+
+        rebuilt = CoverageGraph.from_level(level)
+        assert graph._blockers == rebuilt._blockers
+        assert len(graph) == len(rebuilt)
+
+    def test_blockers_and_depth(self):
+        graph = CoverageGraph({0: 8, 1: 7, 2: 8})
+        graph.add(0, 3, 3)
+        graph.add(1, 3, 3)  # smaller odd layer covers (3,3),(4,3),(3,4),(4,4) below
+        graph.add(2, 3, 3)
+
+        assert graph.blockers(0, 3, 3) == {(1, 3, 3), (2, 3, 3)}
+        assert graph.blockers(1, 3, 3) == {(2, 3, 3)}
+        assert graph.covered_tiles(2, 3, 3) == [(0, 3, 3), (1, 3, 3)]
+        assert graph.is_covered(0, 4, 4) and not graph.is_covered(0, 2, 2)
+        assert graph.blocking_layers(0, 3, 3) == 2
+        assert [graph.depth(i, 3, 3) for i in range(3)] == [2, 1, 0]
+
+        graph.remove(1, 3, 3)
+        assert graph.depth(0, 3, 3) == 1
+        assert not graph.is_covered(0, 4, 4)
+
+    def test_blocking_offsets(self):
+        assert blocking_offsets(0, 2, 8, 8) == ((0, 0),)
+        assert (1, 1) in blocking_offsets(1, 2, 7, 8)
+        assert (-1, -1) in blocking_offsets(0, 1, 8, 7)
+
+    def test_simulator_blocking_map(self):
+        """The simulator's precomputed map lists exactly the graph's blockers."""
+        level = make_level(7)
+        simulator = BotSimulator()
+        state = simulator._create_initial_state(level, 50)
+        simulator._precompute_blocking_map(state)
+        graph = CoverageGraph.from_level(level)
+
+        for layer_idx, layer in state.tiles.items():
+            for tile in layer.values():
+                expected = {f"{l}_{x}_{y}" for l, x, y in graph.blockers(layer_idx, tile.x_idx, tile.y_idx)}
+                assert state._blocking_map[tile.full_key] == expected
+                for blocker in expected:
+                    assert tile.full_key in state._reverse_blocking_map[blocker]
@@ -0,0 +1,96 @@
+"""Tests for the exact endgame solver and forced-move detection."""
+import pytest
+
+from app.core.bot_simulator import BotSimulator, Move
+from app.core.endgame_solver import solve_endgame
+from app.models.bot_profile import BotType, get_profile
+
+
+def plain_level():
+    """Twelve plain tiles on two layers, small enough to solve from the first turn."""
+    lower = {f"{x}_{y}": [f"t{1 + (x + 3 * y) % 3}", ""] for x in range(3) for y in range(3)}
+    return {
+        "layer": 2, "max_moves": 30, "randSeed": 1, "useTileCount": 4,
+        "layer_0": {"col": "7", "row": "7", "tiles": lower, "num": "9"},
+        "layer_1": {"col": "8", "row": "8", "tiles": {
+            "1_1": ["t4", ""], "2_1": ["t4", ""], "1_2": ["t4", ""],
+        }, "num": "3"},
+    }
+
+
+def prepared_state(simulator, level_json):
+    state = simulator._create_initial_state(level_json, level_json["max_moves"])
+    simulator._precompute_blocking_map(state)
+    return state
+
+
+class TestSolveEndgame:
+    """Test cases for solve_endgame."""
+
+    def test_winning_line(self):
+        # Three of each type, every tile free: any line of whole triples wins
+        solution = solve_endgame([0, 1, 0, 1, 0, 1], [0] * 6, [0, 0], dock_slots=3)
+        assert solution.winnable is True
+        assert sorted(solution.line) == list(range(6))
+
+    def test_forced_overflow_is_lost(self):
+        # Each tile is covered by the next, so picks alternate types and overflow two slots
+        blockers = [1 << (i + 1) for i in range(5)] + [0]
+        solution = solve_endgame([0, 1, 0, 1, 0, 1], blockers, [0, 0], dock_slots=2)
+        assert solution.winnable is False
+
+    def test_incomplete_triple_is_lost(self):
+        assert solve_endgame([0, 0], [0, 0], [0], dock_slots=7).winnable is False
+        assert solve_endgame([0, 0], [0, 0], [1], dock_slots=7).winnable is True
+
+    def test_root_moves_restrict_first_pick(self):
+        solution = solve_endgame([0, 0, 0, 1, 1, 1], [0] * 6, [0, 0], dock_slots=7, root_moves=[4])
+        assert solution.line[0] == 4
+
+    def test_budget_exceeded(self):
+        solution = solve_endgame([i % 6 for i in range(18)], [0] * 18, [0] * 6, dock_slots=2, max_nodes=5)
+        assert solution.winnable is None
+
+
+class TestEndgameInSimulator:
+    """Test cases for the endgame solver inside BotSimulator."""
+
+    def test_solved_line_clears_in_engine(self):
+        """Replaying the solver's line with the real game rules clears the level."""
+        simulator = BotSimulator()
+        state = prepared_state(simulator, plain_level())
+        tiles, tile_types, blockers, dock_counts = simulator._plain_endgame(state)
+        solution = solve_endgame(tile_types, blockers, dock_counts, state.max_dock_slots)
+        assert solution.winnable is True
+
+        for index in solution.line:
+            slot = (tiles[index].layer_idx, tiles[index].position_key)
+            move = next(m for m in simulator._get_available_moves(state) if (m.layer_idx, m.position) == slot)
+            exposed = simulator._capture_exposed_gimmicks(state)
+            simulator._apply_move(state, move)
+            state.moves_used += 1
+            simulator._process_move_effects(state, *exposed)
+        assert simulator._is_game_over(state) and state.cleared
+
+    def test_gimmicks_are_not_plain(self):
+        simulator = BotSimulator()
+        level_json = plain_level()
+        level_json["layer_0"]["tiles"]["0_0"] = ["t1", "ice_1"]
+        assert simulator._plain_endgame(prepared_state(simulator, level_json)) is None
+
+    def test_optimal_bot_follows_solution(self):
+        simulator = BotSimulator()
+        result = simulator.simulate_with_profile(plain_level(), get_profile(BotType.OPTIMAL), iterations=5, seed=1)
+        assert result.clear_rate == 1.0
+
+    def test_forced_move_skips_lookahead(self, monkeypatch):
+        """With one tile type among the candidates, the expert bot does not run lookahead."""
+        simulator = BotSimulator()
+        state = prepared_state(simulator, plain_level())
+        monkeypatch.setattr(simulator, "_estimate_future_score",
+                            lambda *args: pytest.fail("lookahead on a forced move"))
+        moves = [Move(layer_idx=0, position=f"{x}_0", tile_type="t4", score=10.0 - x) for x in range(3)]
+
+        expert = get_profile(BotType.EXPERT)
+        monkeypatch.setattr(simulator._rng_mistake, "random", lambda: 1.0)
+        assert simulator._select_move_with_profile(moves, state, expert) is moves[0]
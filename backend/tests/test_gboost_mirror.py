@@ -0,0 +1,201 @@
+"""Tests for the local GBoost board mirror, against a fake GBoost server."""
+import json
+import threading
+
+import httpx
+import pytest
+from aiohttp import web
+
+from app.api.deps import get_gboost_board_mirror
+from app.clients.gboost import GBoostClient
+from app.clients.gboost_mirror import GBoostMirror
+from app.main import app
+
+
+def make_level(index):
+    return {
+        "layer": 8,
+        "useTileCount": 3,
+        "difficulty": str(10 * index),
+        "layer_7": {"col": "7", "row": "7", "num": "3",
+                    "tiles": {"0_0": ["t1", ""], "1_0": ["t1", ""], "2_0": ["t1", ""]}},
+    }
+
+
+class FakeGBoost:
+    """real_array.php look-alike keeping boards in memory and counting requests."""
+
+    def __init__(self):
+        self.boards = {"board": {}}
+        self.clock = 1_700_000_000
+        self.board_loads = 0
+        self.level_loads = 0
+        for i in range(1, 6):
+            self.put("board", f"level_{i}", make_level(i))
+
+    def put(self, board_id, level_id, level_data):
+        self.clock += 1
+        self.boards.setdefault(board_id, {})[level_id] = {**level_data, "etime": str(self.clock)}
+
+    def compressed(self, levels):
+        keys = ["id"] + sorted({key for level in levels.values() for key in level})
+        return {
+            "__keys": keys,
+            "__vals": [[level_id] + [level.get(key, "") for key in keys[1:]]
+                       for level_id, level in levels.items()],
+        }
+
+    async def handle(self, request):
+        if request.method == "POST":
+            form = await request.post()
+            for level_id, level_data in json.loads(form["json"]).items():
+                if level_data is None:
+                    self.boards[form["bid"]].pop(level_id, None)
+                else:
+                    self.put(form["bid"], level_id, level_data)
+            return web.Response(text="ok")
+
+        board = self.boards.get(request.query["bid"], {})
+        level_id = request.query.get("id", "")
+        if not level_id:
+            self.board_loads += 1
+            return web.json_response(self.compressed(board) if board else {})
+        self.level_loads += 1
+        if level_id not in board:
+            return web.json_response({})
+        return web.json_response(self.compressed({level_id: board[level_id]}))
+
+
+@pytest.fixture
+async def fake_gboost():
+    fake = FakeGBoost()
+    server = web.Application()
+    server.router.add_route("*", "/real_array.php", fake.handle)
+    runner = web.AppRunner(server)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    fake.url = f"http://127.0.0.1:{runner.addresses[0][1]}"
+    yield fake
+    await runner.cleanup()
+
+
+@pytest.fixture
+def mirror(fake_gboost, tmp_path):
+    client = GBoostClient(base_url=fake_gboost.url, project_id="test")
+    return GBoostMirror(client, root=tmp_path, max_age=3600)
+
+
+class TestGBoostMirror:
+    """Test cases for GBoostMirror."""
+
+    async def test_list_and_load_served_from_mirror(self, fake_gboost, mirror):
+        levels = await mirror.list_levels("board")
+        assert [level["id"] for level in levels] == [f"level_{i}" for i in range(1, 6)]
+        assert levels[1]["difficulty"] == pytest.approx(0.2)
+
+        result = await mirror.load_level("board", "level_3")
+        assert result["level_json"]["layer_7"]["tiles"]["0_0"] == ["t1", ""]
+        assert result["level_json"]["etime"] == fake_gboost.boards["board"]["level_3"]["etime"]
+        await mirror.list_levels("board", limit=2)
+        assert (fake_gboost.board_loads, fake_gboost.level_loads) == (1, 0)
+
+        assert levels == await mirror.client.list_levels("board")
+
+    async def test_incremental_sync(self, fake_gboost, mirror, tmp_path):
+        stats = await mirror.sync_board("board")
+        assert (stats["levels"], stats["updated"]) == (5, 5)
+        objects = tmp_path / "test" / "board" / "objects"
+        # Every level has its own difficulty, so each is stored as its own object
+        assert len(list(objects.glob("*.json"))) == 5
+
+        stats = await mirror.sync_board("board")
+        assert (stats["unchanged"], stats["updated"], stats["removed"]) == (5, 0, 0)
+
+        fake_gboost.put("board", "level_2", {**make_level(2), "useTileCount": 4})
+        fake_gboost.put("board", "level_6", make_level(6))
+        del fake_gboost.boards["board"]["level_5"]
+        stats = await mirror.sync_board("board")
+        assert (stats["unchanged"], stats["updated"], stats["removed"]) == (3, 2, 1)
+        assert len(list(objects.glob("*.json"))) == 5
+
+        result = await mirror.load_level("board", "level_2")
+        assert result["level_json"]["useTileCount"] == 4
+        assert await mirror.load_level("board", "level_5") is None
+
+    async def test_listing_after_save_and_delete(self, fake_gboost, mirror):
+        await mirror.list_levels("board")
+        for level_id in ("level_2", "level_9"):
+            assert (await mirror.client.save_level("board", level_id, make_level(9)))["success"]
+            await mirror.invalidate("board", level_id)
+        assert await mirror.client.delete_level("board", "level_4")
+        await mirror.invalidate("board", "level_4")
+
+        levels = await mirror.list_levels("board")
+        assert [level["id"] for level in levels] == ["level_1", "level_2", "level_3", "level_5", "level_9"]
+        assert levels[1]["difficulty"] == pytest.approx(0.9)
+        assert fake_gboost.board_loads == 2
+
+    async def test_disk_writes_stay_off_event_loop(self, fake_gboost, mirror, monkeypatch):
+        loop_thread = threading.get_ident()
+        writer_threads = set()
+        write_object = mirror._write_object
+
+        def recording_write_object(*args):
+            writer_threads.add(threading.get_ident())
+            return write_object(*args)
+
+        monkeypatch.setattr(mirror, "_write_object", recording_write_object)
+        await mirror.sync_board("board")
+        mirror.max_age = 0
+        await mirror.load_level("board", "level_1")
+        assert writer_threads and loop_thread not in writer_threads
+
+    async def test_content_hash_dedupes_unchanged_resave(self, fake_gboost, mirror):
+        await mirror.sync_board("board")
+        fake_gboost.put("board", "level_1", make_level(1))  # same data, new etime
+        stats = await mirror.sync_board("board")
+        assert (stats["unchanged"], stats["updated"]) == (5, 0)
+
+    async def test_get_levels_fetches_misses_concurrently(self, fake_gboost, mirror):
+        mirror.max_age = 0  # never fresh: every level must be fetched
+        levels = await mirror.get_levels("board", ["level_1", "level_4", "missing"])
+        assert levels["level_4"]["difficulty"] == "40"
+        assert levels["missing"] is None
+        assert (fake_gboost.board_loads, fake_gboost.level_loads) == (0, 3)
+
+        mirror.max_age = 3600
+        await mirror.sync_board("board")
+        await mirror.get_levels("board", ["level_1", "level_4"])
+        assert fake_gboost.level_loads == 3
+
+    async def test_get_levels_syncs_for_many_misses(self, fake_gboost, mirror):
+        for i in range(6, 20):
+            fake_gboost.put("board", f"level_{i}", make_level(i))
+        ids = [f"level_{i}" for i in range(1, 20)]
+        levels = await mirror.get_levels("board", ids)
+        assert all(levels[level_id] is not None for level_id in ids)
+        assert (fake_gboost.board_loads, fake_gboost.level_loads) == (1, 0)
+
+    async def test_unreachable_server_serves_stale_mirror(self, mirror):
+        await mirror.sync_board("board")
+        mirror.client.base_url = "http://127.0.0.1:9"
+        mirror.max_age = 0
+        assert len(await mirror.list_levels("board")) == 5
+
+    async def test_batch_analyze_board_levels(self, fake_gboost, mirror):
+        app.dependency_overrides[get_gboost_board_mirror] = lambda: mirror
+        try:
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                response = await client.post("/api/levels/batch-analyze", json={
+                    "board_id": "board", "level_ids": ["level_2", "level_1", "missing"],
+                })
+        finally:
+            app.dependency_overrides.pop(get_gboost_board_mirror, None)
+
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert [r["level_id"] for r in results] == ["level_2", "level_1", "missing"]
+        assert results[0]["grade"] != "?"
+        assert results[2]["grade"] == "?"
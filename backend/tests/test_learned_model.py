@@ -0,0 +1,61 @@
+"""Tests for the shared plumbing of the learned models."""
+import os
+
+import pytest
+
+from app.core.learned_model import ModelFileCache, RidgeModel, SampleLog, solve_linear
+
+
+class TestSampleLog:
+    """Test cases for SampleLog."""
+
+    def test_capped_to_newest_samples(self, tmp_path):
+        log = SampleLog(tmp_path / "samples.jsonl", max_samples=8)
+        for i in range(30):
+            log.append_samples([{"i": i}])
+
+        samples = [s["i"] for s in log.load()]
+        assert 8 <= len(samples) <= 10
+        assert samples == list(range(30 - len(samples), 30))
+
+    def test_required_keys(self, tmp_path):
+        class KeyedLog(SampleLog):
+            required_keys = ("x",)
+
+        log = KeyedLog(tmp_path / "samples.jsonl")
+        log.append_samples([{"x": 1}, {"y": 2}])
+        with open(log.path, "a", encoding="utf-8") as f:
+            f.write("not json\n")
+        assert log.load() == [{"x": 1}]
+
+
+class TestModelFileCache:
+    """Test cases for ModelFileCache."""
+
+    def test_reload_and_fallback(self, tmp_path):
+        local, bundled = tmp_path / "local.json", tmp_path / "bundled.json"
+        cache = ModelFileCache(RidgeModel.load)
+        assert cache.get(local, bundled) is None
+
+        RidgeModel({"a": [1.0]}, [], [], ()).save(bundled)
+        assert cache.get(local, bundled).weights == {"a": [1.0]}
+
+        RidgeModel({"a": [2.0]}, [], [], ()).save(local)
+        assert cache.get(local, bundled).weights == {"a": [2.0]}
+        first = cache.get(local, bundled)
+        assert cache.get(local, bundled) is first
+
+        RidgeModel({"a": [3.0]}, [], [], ()).save(local)
+        os.utime(local, (0, 0))
+        assert cache.get(local, bundled).weights == {"a": [3.0]}
+
+
+class TestSolveLinear:
+    """Test cases for solve_linear."""
+
+    def test_solves_system(self):
+        assert solve_linear([[2.0, 1.0], [1.0, 3.0]], [3.0, 5.0]) == pytest.approx([0.8, 1.4])
+
+    def test_singular(self):
+        with pytest.raises(ValueError):
+            solve_linear([[1.0, 2.0], [2.0, 4.0]], [1.0, 2.0])
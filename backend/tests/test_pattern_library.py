@@ -0,0 +1,52 @@
+"""Tests for the precompiled pattern library."""
+import pytest
+from app.core import pattern_templates
+from app.core.pattern_library import (
+    compile_pattern,
+    compile_layered_pattern,
+    get_pattern_positions,
+    get_layered_pattern_positions,
+)
+
+
+GRID_SIZES = [(5, 5), (6, 6), (7, 7), (8, 8), (9, 9), (7, 10)]
+
+
+class TestPatternLibrary:
+    """Test cases for compiled pattern lookups."""
+
+    @pytest.mark.parametrize("cols,rows", GRID_SIZES)
+    def test_matches_template_scan(self, cols, rows):
+        """Compiled positions are identical to scanning the template."""
+        for idx in pattern_templates.PATTERN_TEMPLATES:
+            assert get_pattern_positions(idx, cols, rows) == \
+                pattern_templates.get_pattern_positions(idx, cols, rows)
+            for layer in range(4):
+                assert get_layered_pattern_positions(idx, layer, cols, rows) == \
+                    pattern_templates.get_layered_pattern_positions(idx, layer, cols, rows)
+
+    def test_compiled_stats(self):
+        """Count, density and centroid agree with the positions."""
+        for idx in pattern_templates.PATTERN_TEMPLATES:
+            compiled = compile_pattern(idx, 8, 8)
+            assert compiled.count == len(compiled.positions)
+            assert compiled.density == pytest.approx(compiled.count / 64)
+            if compiled.count:
+                cx = sum(x for x, _ in compiled.coords) / compiled.count
+                assert compiled.centroid[0] == pytest.approx(cx)
+
+    def test_compile_is_cached(self):
+        """Repeated lookups return the same compiled object."""
+        assert compile_pattern(3, 7, 7) is compile_pattern(3, 7, 7)
+        assert compile_layered_pattern(0, 1, 7, 7) is compile_layered_pattern(0, 1, 7, 7)
+
+    def test_returned_positions_are_copies(self):
+        """Mutating a returned list must not corrupt the library."""
+        positions = get_pattern_positions(0, 7, 7)
+        positions.clear()
+        assert get_pattern_positions(0, 7, 7)
+
+    def test_unknown_pattern(self):
+        """Unknown pattern indices compile to nothing."""
+        assert compile_pattern(999, 7, 7) is None
+        assert get_pattern_positions(999, 7, 7) == []
@@ -0,0 +1,60 @@
+"""Tests for the compact replay format."""
+import json
+
+import pytest
+from app.api.routes.simulate import VisualSimulator
+from app.core.replay import REPLAY_VERSION, decode_replay, encode_replay
+
+
+def _gimmick_level():
+    """Two-layer level exercising every per-move state map."""
+    attributes = ["ice", "chain", "grass", "link_e", "", "frog", "bomb", "curtain_close", "teleport",
+                  "", "teleport", "", "ice", "", "", "", "", "", "", "", "", "", "", "", "", "", ""]
+    bottom = {}
+    i = 0
+    for y in range(6):
+        for x in range(6):
+            if i < 27:
+                attr = attributes[i]
+                bottom[f"{x}_{y}"] = ["t0", attr] if attr else ["t0"]
+                i += 1
+    top = {f"{x}_{y}": ["t0"] for x in range(1, 4) for y in range(1, 4)}
+    return {
+        "layer": 2,
+        "randSeed": 11,
+        "useTileCount": 4,
+        "layer_0": {"col": 7, "row": 7, "tiles": bottom},
+        "layer_1": {"col": 8, "row": 8, "tiles": top},
+    }
+
+
+@pytest.fixture(scope="module")
+def bot_results():
+    level = _gimmick_level()
+    return [
+        VisualSimulator().simulate_bot(level, bot, 60, seed=11 + i, initial_state_seed=11)[0].model_dump()
+        for i, bot in enumerate(["novice", "average", "optimal"])
+    ]
+
+
+class TestReplay:
+    """Test cases for replay encoding."""
+
+    def test_round_trip_is_exact(self, bot_results):
+        """Decoding the JSON-serialized replay reproduces the move records."""
+        replay = json.loads(json.dumps(encode_replay(bot_results)))
+        assert decode_replay(replay) == json.loads(json.dumps(bot_results))
+
+    def test_replay_is_smaller(self, bot_results):
+        """Delta encoding is much smaller than full snapshots."""
+        full = len(json.dumps(bot_results))
+        compact = len(json.dumps(encode_replay(bot_results)))
+        assert compact * 2 < full
+
+    def test_empty_and_versioning(self):
+        """Empty input round-trips; unknown versions are rejected."""
+        replay = encode_replay([])
+        assert replay["version"] == REPLAY_VERSION
+        assert decode_replay(replay) == []
+        with pytest.raises(ValueError):
+            decode_replay({**replay, "version": REPLAY_VERSION + 1})
@@ -0,0 +1,126 @@
+"""Tests for the near-duplicate level similarity index."""
+import random
+
+import pytest
+
+from app.core.generator import LevelGenerator
+from app.core.similarity_index import (
+    LevelSimilarityIndex,
+    extract_layer_positions,
+    layout_similarity,
+)
+
+
+def make_level(rng, layers=4, grid=7, fill=0.6):
+    """Generator-format level with random occupied positions."""
+    level = {"layer": layers}
+    for layer_idx in range(layers):
+        tiles = {
+            f"{x}_{y}": ["t0", ""]
+            for x in range(grid) for y in range(grid)
+            if rng.random() < fill
+        }
+        level[f"layer_{layer_idx}"] = {
+            "col": str(grid), "row": str(grid), "tiles": tiles, "num": str(len(tiles)),
+        }
+    return level
+
+
+def perturb(level, rng, changes=2):
+    """Copy of a level with a few tiles removed from each layer."""
+    copy = {"layer": level["layer"]}
+    for key, value in level.items():
+        if not key.startswith("layer_"):
+            continue
+        tiles = dict(value["tiles"])
+        for pos in rng.sample(sorted(tiles), min(changes, len(tiles))):
+            del tiles[pos]
+        copy[key] = {**value, "tiles": tiles, "num": str(len(tiles))}
+    return copy
+
+
+def to_server_format(level):
+    """Game server format (``layerN`` with ``position``) of a generator-format level."""
+    return {"map": {
+        f"layer{key[len('layer_'):]}": {"position": value["tiles"]}
+        for key, value in level.items() if key.startswith("layer_")
+    }}
+
+
+@pytest.fixture
+def levels():
+    rng = random.Random(7)
+    base = [make_level(rng, layers=rng.randint(3, 6), fill=rng.uniform(0.3, 0.8)) for _ in range(30)]
+    return base + [perturb(level, rng) for level in base[:10]]
+
+
+class TestLayoutSimilarity:
+    """Test cases for layout extraction and similarity."""
+
+    def test_matches_generator_similarity(self, levels):
+        """Index similarity equals LevelGenerator.calculate_level_similarity."""
+        for a, b in zip(levels, levels[1:]):
+            expected = LevelGenerator.calculate_level_similarity(to_server_format(a), to_server_format(b))
+            assert layout_similarity(extract_layer_positions(a), extract_layer_positions(b)) == expected
+
+    def test_both_level_formats(self, levels):
+        """Generator and server formats extract the same layout."""
+        level = levels[0]
+        assert extract_layer_positions(level) == extract_layer_positions(to_server_format(level))
+        assert LevelGenerator.calculate_level_similarity(level, level) == 1.0
+
+
+class TestLevelSimilarityIndex:
+    """Test cases for LevelSimilarityIndex."""
+
+    def test_finds_near_duplicate(self, levels):
+        """A slightly modified level is found, unrelated levels are not."""
+        index = LevelSimilarityIndex()
+        for i, level in enumerate(levels[:30]):
+            index.add(i, level)
+
+        matches = index.query(levels[30])
+        assert matches[0][0] == 0
+        assert index.is_duplicate(levels[30])
+
+        unrelated = make_level(random.Random(99), layers=2, grid=9, fill=0.2)
+        assert index.query(unrelated) == []
+        assert not index.is_duplicate(unrelated)
+
+    def test_add_if_unique_and_remove(self, levels):
+        """Duplicates are rejected until the original is removed."""
+        index = LevelSimilarityIndex()
+        assert index.add_if_unique("a", levels[0]) is None
+        match = index.add_if_unique("b", levels[30])
+        assert match is not None and match[0] == "a"
+        assert "b" not in index
+
+        index.remove("a")
+        assert len(index) == 0
+        assert index.add_if_unique("b", levels[30]) is None
+
+    def test_find_duplicates_matches_brute_force(self, levels):
+        """Every reported pair is exact, and the planted duplicates are found."""
+        index = LevelSimilarityIndex()
+        for i, level in enumerate(levels):
+            index.add(i, level)
+        layouts = [extract_layer_positions(level) for level in levels]
+
+        brute_force = {
+            (i, j)
+            for i in range(len(levels)) for j in range(i + 1, len(levels))
+            if layout_similarity(layouts[i], layouts[j]) > 0.75
+        }
+        found = {(a, b) for a, b, _ in index.find_duplicates()}
+
+        assert found <= brute_force
+        assert {(i, i + 30) for i in range(10)} <= found
+
+    def test_is_too_similar_with_index(self, levels):
+        """The generator check accepts an index in place of a level list."""
+        index = LevelSimilarityIndex()
+        for i, level in enumerate(levels[:30]):
+            index.add(i, level)
+
+        assert LevelGenerator.is_too_similar(levels[30], index)
+        assert LevelGenerator.is_too_similar(levels[30], levels[:30])
@@ -0,0 +1,87 @@
+"""Tests for the simulation cost model and the iteration budget allocator."""
+import math
+import random
+
+import pytest
+
+from app.core.common_random_numbers import Z_95
+from app.core.simulation_cost import (
+    COST_FEATURE_NAMES,
+    CostSampleLog,
+    SimulationCostModel,
+    allocate_iterations,
+    get_simulation_cost_model,
+)
+
+
+def make_level(tiles, layers=3, attribute=""):
+    level = {"layer": layers, "useTileCount": 4, "max_moves": tiles + 2}
+    per_layer = tiles // layers
+    for i in range(layers):
+        level[f"layer_{i}"] = {"col": "7", "row": "7", "tiles": {
+            f"{n % 7}_{n // 7}": [f"t{n % 4 + 1}", attribute] for n in range(per_layer)
+        }}
+    return level
+
+
+class TestAllocateIterations:
+    """Test cases for allocate_iterations."""
+
+    def test_optimal_ratio_within_budget(self):
+        """Iterations follow (sqrt(p(1-p)) / c)^(2/3) and fill the budget."""
+        cost_ms = {"a": 5.0, "b": 20.0, "c": 20.0}
+        rates = {"a": 0.5, "b": 0.5, "c": 0.9}
+        plan = allocate_iterations(cost_ms, 2000, clear_rates=rates, min_iterations=1, max_iterations=10_000)
+
+        assert plan.within_budget and plan.predicted_wall_ms > 1900
+        assert plan.iterations["a"] / plan.iterations["b"] == pytest.approx(4 ** (2 / 3), rel=0.05)
+        assert plan.iterations["c"] / plan.iterations["b"] == pytest.approx(0.6 ** (2 / 3), rel=0.05)
+        assert plan.ci_half_width["b"] == pytest.approx(Z_95 * 0.5 / math.sqrt(plan.iterations["b"]))
+
+    def test_parallel_tasks_capped_by_wall_clock(self):
+        plan = allocate_iterations({"a": 10.0, "b": 10.0, "c": 10.0}, 1000, parallelism=3)
+        assert plan.iterations == {"a": 100, "b": 100, "c": 100}
+
+        # b's floor alone overruns the budget; a may use that unavoidable time
+        plan = allocate_iterations({"a": 10.0, "b": 1000.0}, 1000, parallelism=2, max_iterations=200)
+        assert plan.iterations == {"a": 200, "b": 5}
+        assert not plan.within_budget
+
+    def test_zero_weight_gets_floor(self):
+        plan = allocate_iterations({"a": 10.0, "b": 10.0}, 1000, weights={"b": 0.0}, min_iterations=3)
+        assert plan.iterations == {"a": 97, "b": 3}
+
+
+class TestSimulationCostModel:
+    """Test cases for SimulationCostModel."""
+
+    def test_fit_recovers_cost_function(self, tmp_path):
+        """Timings logged from a known log-linear cost are predicted back."""
+        rng = random.Random(3)
+        log = CostSampleLog(tmp_path / "samples.jsonl")
+        for _ in range(60):
+            attribute = rng.choice(["", "frog", "chain"])
+            level = make_level(rng.randrange(12, 120, 3), rng.randint(1, 6), attribute)
+            tiles = sum(len(level[f"layer_{i}"]["tiles"]) for i in range(level["layer"]))
+            frogs = tiles if attribute == "frog" else 0
+            ms = math.exp(1.0 + 0.02 * tiles + 0.01 * frogs)
+            log.append(level, {"average": (10, 10 * ms), "novice": (10, 2 * ms)})
+
+        model = SimulationCostModel.fit(log.load(), ridge=0.01)
+        assert set(model.weights) == {"average", "novice"}
+        assert all(m["mape"] < 0.05 for m in model.metrics.values())
+
+        costs = model.predict(make_level(90), ["average", "novice", "unknown_profile"])
+        assert costs["average"] == pytest.approx(math.exp(1.0 + 0.02 * 90), rel=0.1)
+        assert costs["novice"] == pytest.approx(costs["average"] / 5, rel=0.1)
+        assert costs["unknown_profile"] > 0
+
+        model.save(tmp_path / "model.json")
+        assert SimulationCostModel.load(tmp_path / "model.json").predict(make_level(90)) == model.predict(make_level(90))
+
+    def test_bundled_model(self):
+        model = get_simulation_cost_model()
+        assert tuple(model.feature_names) == COST_FEATURE_NAMES
+        small, large = model.predict(make_level(30)), model.predict(make_level(120, 6))
+        for profile in ("novice", "average", "expert_fast"):
+            assert small[profile] < large[profile]
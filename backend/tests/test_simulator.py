@@ -0,0 +1,86 @@
+"""Tests for the Monte Carlo level simulator."""
+import random
+
+import pytest
+from app.core.simulator import LevelSimulator, SimulationStrategy, wilson_interval
+
+
+def _link_level():
+    """Two-layer level mixing t0 tiles and link pairs."""
+    return {
+        "layer": 2,
+        "layer_0": {"col": 6, "tiles": {
+            f"{x}_{y}": ["t1", "link_e" if x < 5 else ""] if (x + y) % 3 == 0 else ["t0"]
+            for x in range(6) for y in range(6)
+        }},
+        "layer_1": {"col": 6, "tiles": {
+            f"{x}_{y}": ["t2", "link_s" if y < 2 else ""]
+            for x in range(3) for y in range(3)
+        }},
+    }
+
+
+class TestLevelSimulator:
+    """Test cases for LevelSimulator."""
+
+    @pytest.fixture
+    def simulator(self):
+        return LevelSimulator()
+
+    @pytest.mark.parametrize("strategy", ["random", "greedy", "optimal"])
+    def test_fast_copy_matches_fresh_state(self, simulator, strategy):
+        """Playing on a fast copy gives the same outcome as re-parsing the level."""
+        level = _link_level()
+        base = simulator._create_initial_state(level, 30)
+        fast = simulator._run_batch(base, SimulationStrategy(strategy), 7, 0, 40)
+
+        fresh = []
+        for i in range(40):
+            state = simulator._create_initial_state(level, 30)
+            state.rng = random.Random(7 + i)
+            result = simulator._play_game(state, SimulationStrategy(strategy))
+            fresh.append((result.cleared, result.moves_used))
+
+        assert fast == fresh
+
+    def test_link_maps(self, simulator):
+        """Link sources and targets are precomputed in both directions."""
+        state = simulator._create_initial_state(_link_level(), 30)
+        assert state.link_targets[(1, "0_0")] == (1, "0_1")
+        assert state.link_sources[(1, "0_1")] == [(1, "0_0")]
+        assert (0, "5_1") not in state.link_targets  # link_e only set when x < 5
+
+    def test_base_state_not_mutated(self, simulator):
+        """Simulating leaves the shared base state intact."""
+        base = simulator._create_initial_state(_link_level(), 30)
+        sizes = {layer: len(tiles) for layer, tiles in base.tiles.items()}
+        simulator._run_batch(base, SimulationStrategy.GREEDY, 1, 0, 5)
+        assert {layer: len(tiles) for layer, tiles in base.tiles.items()} == sizes
+
+    def test_parallel_matches_sequential(self, simulator):
+        """Results for a seed do not depend on splitting across the pool."""
+        level = _link_level()
+        sequential = simulator.simulate(level, iterations=200, strategy="random", seed=3)
+        parallel = simulator.simulate(level, iterations=200, strategy="random", seed=3, parallel=True)
+        assert sequential == parallel
+
+    def test_early_termination(self, simulator):
+        """Early termination stops at a batch boundary once the CI is narrow."""
+        result = simulator.simulate(
+            _link_level(), iterations=2000, strategy="greedy", seed=0,
+            early_termination=True, ci_half_width=0.1,
+        )
+        assert result.early_terminated
+        assert result.iterations < 2000
+        assert result.iterations % LevelSimulator.BATCH_SIZE == 0
+        low, high = result.clear_rate_ci
+        assert (high - low) / 2 <= 0.1
+
+    def test_wilson_interval(self):
+        """Wilson interval stays inside [0, 1] and contains the point estimate."""
+        assert wilson_interval(0, 0) == (0.0, 1.0)
+        low, high = wilson_interval(0, 50)
+        assert low == 0.0 and 0 < high < 0.1
+        low, high = wilson_interval(30, 60)
+        assert low < 0.5 < high
+        assert high - 0.5 == pytest.approx(0.5 - low)
@@ -0,0 +1,136 @@
+"""Tests for level thumbnails, the sprite cache and batch rendering."""
+import base64
+import json
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core import thumbnails
+from app.core.thumbnails import (
+    SpriteCache,
+    ThumbnailCache,
+    get_thumbnail,
+    render_thumbnail,
+    render_thumbnails,
+    thumbnail_key,
+)
+from app.main import app
+
+pytest.importorskip("PIL")
+
+
+def level(tile_type="t1", attribute=""):
+    return {
+        "layer": 2,
+        "layer_0": {"col": "7", "row": "7", "num": "2", "tiles": {"0_0": ["t2", ""], "0_1": ["t3", "chain"]}},
+        "layer_1": {"col": "8", "row": "8", "num": "1", "tiles": {"1_1": [tile_type, attribute]}},
+    }
+
+
+class FakeSprite:
+    def __init__(self, side):
+        self.width = self.height = side
+
+
+class TestSpriteCache:
+    """Test cases for the size-bounded sprite cache."""
+
+    def test_evicts_least_recently_used(self):
+        cache = SpriteCache(max_bytes=3 * 10 * 10 * 4)
+        for name in "abc":
+            cache.put((name,), FakeSprite(10))
+        cache.get(("a",))
+        cache.put(("d",), FakeSprite(10))
+
+        assert ("b",) not in cache
+        assert ("a",) in cache and ("d",) in cache
+        assert cache.bytes == 3 * 10 * 10 * 4
+
+    def test_missing_image_cached_as_none(self):
+        cache = SpriteCache()
+        cache.put(("missing",), None)
+        assert ("missing",) in cache and cache.get(("missing",)) is None and cache.bytes == 0
+
+    def test_render_reuses_prepared_sprites(self, monkeypatch):
+        monkeypatch.setattr(thumbnails, "_sprite_cache", SpriteCache())
+        first = render_thumbnail(level(attribute="ice_1"))
+        prepared = len(thumbnails._sprite_cache)
+        assert first and prepared
+
+        assert render_thumbnail(level(attribute="ice_1")) == first
+        assert len(thumbnails._sprite_cache) == prepared
+
+
+class TestThumbnailCache:
+    """Test cases for the on-disk thumbnail cache."""
+
+    def test_key_ignores_key_order(self):
+        reordered = dict(reversed(list(level().items())))
+        assert thumbnail_key(reordered) == thumbnail_key(level())
+        assert thumbnail_key(level(), 128) != thumbnail_key(level(), 192)
+        assert thumbnail_key(level("t4")) != thumbnail_key(level())
+
+    def test_unchanged_level_not_rerendered(self, tmp_path, monkeypatch):
+        cache = ThumbnailCache(tmp_path)
+        png = get_thumbnail(level(), cache=cache)
+        assert png and cache.get(thumbnail_key(level())) == png
+
+        monkeypatch.setattr(thumbnails, "render_thumbnail", lambda *args: pytest.fail("re-rendered"))
+        assert get_thumbnail(level(), cache=cache) == png
+
+    def test_evicts_least_recently_used_files(self, tmp_path):
+        cache = ThumbnailCache(tmp_path, max_bytes=250)
+        for age, key in enumerate(["aa_old", "bb_older"]):
+            cache.put(key, b"x" * 100)
+            os.utime(cache._path(key), (100 - age, 100 - age))
+        assert cache.get("aa_old")  # A hit makes it the most recently used
+
+        cache.put("cc_new", b"x" * 100)
+        assert cache.get("bb_older") is None
+        assert cache.get("aa_old") and cache.get("cc_new")
+
+    def test_batch_renders_misses_across_pool(self, tmp_path):
+        cache = ThumbnailCache(tmp_path)
+        levels = [("a", level("t1")), ("b", level("t5")), ("c", level("t9"))]
+        first = {level_id: (png, cached) for level_id, png, cached in render_thumbnails(levels, cache=cache)}
+
+        assert set(first) == {"a", "b", "c"}
+        assert all(png and not cached for png, cached in first.values())
+        assert first["a"][0] == render_thumbnail(level("t1"))
+
+        second = list(render_thumbnails(levels, cache=cache))
+        assert all(cached for _, _, cached in second)
+
+
+class TestThumbnailBatchEndpoint:
+    """Test cases for POST /api/gboost/thumbnail-batch."""
+
+    @pytest.fixture(autouse=True)
+    def storage(self, tmp_path, monkeypatch):
+        from app.api.routes import gboost
+        monkeypatch.setattr(gboost, "LEVEL_SETS_DIR", tmp_path / "level_sets")
+        monkeypatch.setattr(thumbnails, "_thumbnail_cache", ThumbnailCache(tmp_path / "thumbs"))
+        set_dir = tmp_path / "level_sets" / "set_a"
+        set_dir.mkdir(parents=True)
+        (set_dir / "metadata.json").write_text("{}", encoding="utf-8")
+        for i, tile_type in enumerate(["t1", "t6"], 1):
+            (set_dir / f"level_{i:03d}.json").write_text(json.dumps(level(tile_type)), encoding="utf-8")
+        (set_dir / "level_003.json").write_text(json.dumps({"layer": 1}), encoding="utf-8")
+
+    def test_renders_then_serves_from_cache(self):
+        client = TestClient(app)
+        data = client.post("/api/gboost/thumbnail-batch", json={"set_id": "set_a"}).json()
+
+        assert [item["level_id"] for item in data["results"]] == ["level_001", "level_002", "level_003"]
+        assert (data["rendered"], data["cached"], data["failed"]) == (2, 0, 1)
+        png = base64.b64decode(data["results"][0]["png_base64"])
+        assert png.startswith(b"\x89PNG")
+
+        again = client.post("/api/gboost/thumbnail-batch", json={"set_id": "set_a", "include_png": False}).json()
+        assert (again["rendered"], again["cached"]) == (0, 2)
+        assert again["results"][0]["png_base64"] is None
+
+    def test_unknown_set(self):
+        response = TestClient(app).post("/api/gboost/thumbnail-batch", json={"set_id": "missing"})
+        assert response.status_code == 404
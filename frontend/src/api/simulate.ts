@@ -1,6 +1,11 @@
 import apiClient from './client';
 import type { LevelJSON } from '../types';
-import type { VisualSimulationResponse, BotProfile } from '../types/simulation';
+import type {
+  VisualSimulationResponse,
+  VisualBotResult,
+  VisualGameState,
+  BotProfile,
+} from '../types/simulation';
 
 /**
  * Run visual simulation for a level with multiple bots.
@@ -24,6 +29,86 @@ export async function simulateVisual(
   return response.data;
 }
 
+export interface VisualStreamHandlers {
+  /** Called whenever another bot finishes; `partial.bot_results` is in request order. */
+  onProgress?: (partial: VisualSimulationResponse) => void;
+}
+
+/**
+ * Streamed variant of simulateVisual.
+ * Bots run concurrently on the server and each result arrives as soon as it
+ * finishes (NDJSON), so playback can start before the slowest bot is done.
+ * Resolves with the complete response once the stream ends.
+ */
+export async function simulateVisualStream(
+  levelJson: LevelJSON,
+  botTypes?: BotProfile[],
+  maxMoves?: number,
+  seed?: number,
+  handlers: VisualStreamHandlers = {}
+): Promise<VisualSimulationResponse> {
+  const response = await fetch(`${apiClient.defaults.baseURL}/simulate/visual/stream`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({
+      level_json: levelJson,
+      bot_types: botTypes,
+      max_moves: maxMoves,
+      seed: seed,
+    }),
+  });
+  if (!response.ok || !response.body) {
+    throw new Error(`Simulation stream failed (${response.status})`);
+  }
+
+  const slots: (VisualBotResult | undefined)[] = [];
+  let initialState: VisualGameState | null = null;
+  let metadata: Record<string, unknown> = {};
+  let maxSteps = 0;
+
+  const snapshot = (): VisualSimulationResponse => ({
+    initial_state: initialState as VisualGameState,
+    bot_results: slots.filter((r): r is VisualBotResult => r !== undefined),
+    max_steps: maxSteps,
+    metadata,
+  });
+
+  const handleEvent = (event: Record<string, unknown>) => {
+    const { type, ...data } = event;
+    if (type === 'meta') {
+      metadata = data;
+    } else if (type === 'initial_state') {
+      initialState = data as unknown as VisualGameState;
+    } else if (type === 'bot_result') {
+      const result = data.result as VisualBotResult;
+      slots[data.index as number] = result;
+      maxSteps = Math.max(maxSteps, result.moves.length);
+      handlers.onProgress?.(snapshot());
+    } else if (type === 'done') {
+      metadata = { ...metadata, elapsed_ms: data.elapsed_ms, bot_count: slots.length };
+    } else if (type === 'error') {
+      throw new Error(String(data.detail));
+    }
+  };
+
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+  for (;;) {
+    const { done, value } = await reader.read();
+    buffer += decoder.decode(value, { stream: !done });
+    const lines = buffer.split('\n');
+    buffer = lines.pop() ?? '';
+    for (const line of lines) {
+      if (line.trim()) handleEvent(JSON.parse(line));
+    }
+    if (done) break;
+  }
+  if (buffer.trim()) handleEvent(JSON.parse(buffer));
+
+  return snapshot();
+}
+
 /**
  * List all locally saved levels.
  */
@@ -5,7 +5,7 @@ import type {
   BotProfile,
   PlaybackSpeed,
 } from '../types/simulation';
-import { simulateVisual } from '../api/simulate';
+import { simulateVisual, simulateVisualStream } from '../api/simulate';
 
 interface SimulationState {
   // Simulation result data
@@ -52,13 +52,36 @@ export const useSimulationStore = create<SimulationState>((set, get) => ({
     set({ isLoading: true, error: null });
 
     try {
-      const results = await simulateVisual(levelJson, botTypes, maxMoves, seed);
-      set({
-        results,
-        isLoading: false,
-        currentStep: 0,
-        isPlaying: false,
-      });
+      let results: VisualSimulationResponse;
+      let started = false;
+      try {
+        // Show the board as soon as the first bot finishes; later bots fill in
+        results = await simulateVisualStream(levelJson, botTypes, maxMoves, seed, {
+          onProgress: (partial) => {
+            if (!started) {
+              started = true;
+              set({ results: partial, isLoading: false, currentStep: 0, isPlaying: false });
+            } else {
+              set({ results: partial });
+            }
+          },
+        });
+      } catch (streamErr) {
+        if (started) throw streamErr;
+        // Older backend without the streaming endpoint
+        results = await simulateVisual(levelJson, botTypes, maxMoves, seed);
+      }
+      if (started) {
+        // Playback may already be running; keep the current step
+        set({ results, isLoading: false });
+      } else {
+        set({
+          results,
+          isLoading: false,
+          currentStep: 0,
+          isPlaying: false,
+        });
+      }
     } catch (err) {
       const errorMessage = err instanceof Error ? err.message : 'Simulation failed';
       set({
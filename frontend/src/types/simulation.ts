@@ -65,6 +65,7 @@ export interface VisualSimulationResponse {
   bot_results: VisualBotResult[];
   max_steps: number;
   metadata: Record<string, unknown>;
+  replay?: Record<string, unknown> | null; // Delta-encoded replay when replay_format='compact'
 }
 
 // API request
@@ -73,6 +74,7 @@ export interface VisualSimulationRequest {
   bot_types?: BotProfile[];
   max_moves?: number;
   seed?: number;
+  replay_format?: 'full' | 'compact';
 }
 
 // Bot display info
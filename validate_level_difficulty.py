@@ -19,6 +19,7 @@ Examples:
     python3 validate_level_difficulty.py medium  # Test all MEDIUM tier
 """
 
+import os
 import sys
 import argparse
 from typing import Dict, List, Optional
@@ -26,7 +27,7 @@ from dataclasses import dataclass
 
 sys.path.insert(0, '/Users/casualdev/TileMatchAutoLevel/backend')
 
-from app.core.bot_simulator import BotSimulator
+from app.core.bot_simulator import BotSimulationResult, BotSimulator
 from app.models.bot_profile import BotType, get_profile
 from app.models.benchmark_level import (
     DifficultyTier,
@@ -36,6 +37,9 @@ from app.models.benchmark_level import (
 )
 
 
+VALIDATION_BOT_TYPES = [BotType.NOVICE, BotType.CASUAL, BotType.AVERAGE, BotType.EXPERT, BotType.OPTIMAL]
+
+
 @dataclass
 class ValidationResult:
     """Result of validating a single level."""
@@ -65,6 +69,7 @@ def validate_level(
     iterations: int = 100,
     tolerance: float = 15.0,
     seed: int = 42,
+    sim_results: Optional[Dict[BotType, BotSimulationResult]] = None,
 ) -> LevelValidationSummary:
     """
     Validate a single level by testing all bot types.
@@ -74,6 +79,8 @@ def validate_level(
         iterations: Number of test iterations per bot
         tolerance: Acceptable deviation in percentage points (e.g., 15 = ±15%)
         seed: Random seed for reproducibility
+        sim_results: Simulation results per bot type already run (validate_tier);
+                     simulated here if not given
 
     Returns:
         LevelValidationSummary with validation results
@@ -90,20 +97,21 @@ def validate_level(
     warnings = 0
     failures = 0
 
-    bot_types = [BotType.NOVICE, BotType.CASUAL, BotType.AVERAGE, BotType.EXPERT, BotType.OPTIMAL]
-
-    for bot_type in bot_types:
+    for bot_type in VALIDATION_BOT_TYPES:
         profile = get_profile(bot_type)
         expected_rate = level.expected_clear_rates.get(bot_type.value, 0.0)
 
         # Run simulation
-        result = simulator.simulate_with_profile(
-            level_data,
-            profile,
-            iterations=iterations,
-            max_moves=max_moves,
-            seed=seed,
-        )
+        if sim_results is not None:
+            result = sim_results[bot_type]
+        else:
+            result = simulator.simulate_with_profile(
+                level_data,
+                profile,
+                iterations=iterations,
+                max_moves=max_moves,
+                seed=seed,
+            )
 
         actual_rate = result.clear_rate
         deviation = abs(actual_rate - expected_rate) * 100  # Convert to percentage points
@@ -187,11 +195,23 @@ def validate_tier(
         print(f"\n❌ Error: {e}")
         return []
 
-    summaries: List[LevelValidationSummary] = []
-
-    for level in benchmark_set.levels:
-        summary = validate_level(level, iterations, tolerance, seed)
-        summaries.append(summary)
+    # Simulate the whole tier at once on every core; levels are reported as they finish
+    levels = benchmark_set.levels
+    profiles = [get_profile(bot_type) for bot_type in VALIDATION_BOT_TYPES]
+    level_data = (
+        dict(level.to_simulator_format(), max_moves=level.level_json.get("max_moves", 50))
+        for level in levels
+    )
+    by_index: Dict[int, LevelValidationSummary] = {}
+    for sim in BotSimulator().simulate_many(
+        level_data, profiles, iterations=iterations, seed=seed, workers=os.cpu_count(),
+    ):
+        if sim.error:
+            print(f"\n❌ Error simulating {levels[sim.index].id}: {sim.error}")
+            continue
+        sim_results = {result.bot_type: result for result in sim.bot_results}
+        by_index[sim.index] = validate_level(levels[sim.index], iterations, tolerance, seed, sim_results)
+    summaries: List[LevelValidationSummary] = [by_index[i] for i in sorted(by_index)]
 
     # Print overall tier summary
     print(f"\n{'='*80}")